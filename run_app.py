@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import os
 import sys
 import traceback
@@ -101,4 +102,6 @@ def run():
 
 
 if __name__ == "__main__":
+    # Wymagane przez pulę procesów miniaturek w zbudowanej aplikacji
+    multiprocessing.freeze_support()
     sys.exit(run())
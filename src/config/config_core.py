@@ -39,10 +39,25 @@ class AppConfig:
         "max_thumbnail_size": "max_thumbnail_size",
         "scanner_max_cache_entries": "scanner_max_cache_entries",
         "scanner_max_cache_age_seconds": "scanner_max_cache_age_seconds",
+        "scanner_use_directory_snapshot": "scanner_use_directory_snapshot",
+        "scanner_walk_workers": "scanner_walk_workers",
+        "bulk_operation_workers": "bulk_operation_workers",
+        "bulk_operation_device_limit": "bulk_operation_device_limit",
+        "delete_to_trash": "delete_to_trash",
+        "cross_folder_pairing_folders": "cross_folder_pairing_folders",
+        "directory_watcher_enabled": "directory_watcher_enabled",
+        "directory_watcher_debounce_ms": "directory_watcher_debounce_ms",
         "thumbnail_cache_max_entries": "thumbnail_cache_max_entries",
         "thumbnail_cache_max_memory_mb": "thumbnail_cache_max_memory_mb",
         "thumbnail_cache_enable_disk": "thumbnail_cache_enable_disk",
+        "thumbnail_cache_disk_max_mb": "thumbnail_cache_disk_max_mb",
+        "thumbnail_cache_disk_dir": "thumbnail_cache_disk_dir",
         "thumbnail_cache_cleanup_threshold": ("thumbnail_cache_cleanup_threshold"),
+        "thumbnail_decode_backend": "thumbnail_decode_backend",
+        "thumbnail_process_pool_enabled": "thumbnail_process_pool_enabled",
+        "thumbnail_process_pool_workers": "thumbnail_process_pool_workers",
+        "gallery_view_mode": "gallery_view_mode",
+        "thumbnail_prefetch_rows": "thumbnail_prefetch_rows",
         "window_min_width": "window_min_width",
         "window_min_height": "window_min_height",
         "resize_timer_delay_ms": "resize_timer_delay_ms",
@@ -211,6 +226,10 @@ class AppConfig:
             logger.error(f"Błąd resetowania konfiguracji: {e}")
             return False
 
+    def get_app_data_dir(self) -> str:
+        """Pobiera katalog danych aplikacji (konfiguracja, cache)."""
+        return self._config_io.get_app_data_dir()
+
     # --- Essential properties (explicit properties zamiast delegacji) ---
 
     @property
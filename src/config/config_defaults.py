@@ -54,16 +54,36 @@ class ConfigDefaults:
         # Parametry cache dla scanera
         "scanner_max_cache_entries": 500,
         "scanner_max_cache_age_seconds": 3600,  # 1 godzina
+        "scanner_use_directory_snapshot": True,  # Inkrementalne skanowanie po mtime
+        "scanner_walk_workers": 8,  # Równoległe listowanie katalogów (1 = sekwencyjnie)
+        # Masowe przenoszenie/usuwanie plików
+        "bulk_operation_workers": 8,
+        "bulk_operation_device_limit": 4,  # Jednoczesne operacje na jeden dysk
+        "delete_to_trash": True,  # Usuwanie do kosza systemowego zamiast trwale
+        # Foldery podglądów parowane z archiwami z katalogu nadrzędnego lub
+        # równoległego (np. modele/x.zip + previews/x.jpg); pusta lista = wyłączone
+        "cross_folder_pairing_folders": ["previews", "preview", "renders", "render"],
+        # Odświeżanie galerii na żywo po zmianach w folderze roboczym
+        "directory_watcher_enabled": True,
+        "directory_watcher_debounce_ms": 500,  # Łączenie serii zdarzeń w jedno skanowanie
         # Parametry cache dla miniaturek
         "thumbnail_cache_max_entries": 2000,
         "thumbnail_cache_max_memory_mb": 500,
         "thumbnail_cache_enable_disk": False,
+        "thumbnail_cache_disk_max_mb": 1024,  # Limit dyskowego cache miniatur
+        "thumbnail_cache_disk_dir": "",  # Pusty = <katalog aplikacji>/thumbnail_cache
         "thumbnail_cache_cleanup_threshold": 0.8,
         # Thumbnail format settings - NOWE
         "thumbnail_format": "WEBP",  # WEBP, JPEG, PNG
         "thumbnail_quality": 80,  # 1-100 dla lossy formatów
         "thumbnail_webp_method": 6,  # 0-6, wyższa wartość = lepsza kompresja
         "thumbnail_preserve_transparency": True,  # Przezroczystość WebP/PNG
+        "thumbnail_decode_backend": "pillow",  # pillow, qt (dekodowanie w zmniejszonym rozmiarze)
+        "thumbnail_process_pool_enabled": False,  # Generowanie miniatur w osobnych procesach
+        "thumbnail_process_pool_workers": 0,  # 0 = liczba rdzeni CPU
+        # Tryb galerii: widgets (kafelki QWidget), item_view (QListView + delegat)
+        "gallery_view_mode": "widgets",
+        "thumbnail_prefetch_rows": 2,  # Wiersze miniatur ładowane z wyprzedzeniem
         # Parametry okna i timerów
         "window_min_width": 800,  # Minimalna szerokość okna
         "window_min_height": 600,  # Minimalna wysokość okna
@@ -209,6 +209,15 @@ class ConfigIO:
         """
         return self._config_file_path
 
+    def get_app_data_dir(self) -> str:
+        """
+        Pobiera katalog danych aplikacji.
+        
+        Returns:
+            Ścieżka do katalogu danych aplikacji
+        """
+        return normalize_path(self._app_data_dir)
+
     def config_file_exists(self) -> bool:
         """
         Sprawdza czy plik konfiguracji istnieje.
@@ -54,6 +54,39 @@ class ConfigValidator:
                 "minimum": 60,
                 "maximum": 86400,
             },
+            "scanner_use_directory_snapshot": {"type": "boolean"},
+            "scanner_walk_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 64,
+            },
+            "bulk_operation_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 64,
+            },
+            "bulk_operation_device_limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 64,
+            },
+            "delete_to_trash": {"type": "boolean"},
+            "cross_folder_pairing_folders": {
+                "type": "array",
+                "items": {"type": "string", "pattern": r"^[^/\\]+$"},
+            },
+            "directory_watcher_enabled": {"type": "boolean"},
+            "directory_watcher_debounce_ms": {
+                "type": "integer",
+                "minimum": 50,
+                "maximum": 10000,
+            },
+            "gallery_view_mode": {"type": "string", "pattern": r"^(widgets|item_view)$"},
+            "thumbnail_prefetch_rows": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 20,
+            },
             "thumbnail_cache_max_entries": {
                 "type": "integer",
                 "minimum": 1,
@@ -65,6 +98,12 @@ class ConfigValidator:
                 "maximum": 1000,
             },
             "thumbnail_cache_enable_disk": {"type": "boolean"},
+            "thumbnail_cache_disk_max_mb": {
+                "type": "integer",
+                "minimum": 16,
+                "maximum": 102400,
+            },
+            "thumbnail_cache_disk_dir": {"type": "string"},
             "thumbnail_cache_cleanup_threshold": {
                 "type": "number",
                 "minimum": 0.1,
@@ -96,6 +135,13 @@ class ConfigValidator:
             "thumbnail_quality": {"type": "integer", "minimum": 1, "maximum": 100},
             "thumbnail_webp_method": {"type": "integer", "minimum": 0, "maximum": 6},
             "thumbnail_preserve_transparency": {"type": "boolean"},
+            "thumbnail_decode_backend": {"type": "string", "pattern": r"^(pillow|qt)$"},
+            "thumbnail_process_pool_enabled": {"type": "boolean"},
+            "thumbnail_process_pool_workers": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 64,
+            },
         },
         "additionalProperties": True,
     }
@@ -6,7 +6,7 @@ Centralny punkt dla wszystkich operacji galerii w aplikacji.
 import logging
 from typing import List, Dict, Any
 
-from src.logic.filter_logic import filter_file_pairs
+from src.logic.filter_logic import filter_appended_file_pairs, filter_file_pairs
 from src.models.file_pair import FilePair
 from src.services.scanning_service import ScanningService
 
@@ -58,6 +58,32 @@ class GalleryController:
             logger.error(f"Błąd podczas filtrowania plików: {e}")
             return all_file_pairs  # Zwróć wszystkie pliki w przypadku błędu
     
+    def apply_filters_to_appended(
+        self,
+        all_file_pairs: List[FilePair],
+        appended_count: int,
+        filter_criteria: Dict[str, Any],
+    ) -> List[FilePair]:
+        """
+        Aplikuje filtry tylko do par dopisanych na końcu listy.
+
+        Args:
+            all_file_pairs: Lista wszystkich par plików
+            appended_count: Liczba par dopisanych na końcu listy
+            filter_criteria: Kryteria filtrowania
+
+        Returns:
+            Lista przefiltrowanych par spośród dopisanych
+        """
+        try:
+            self._active_filters = filter_criteria
+            return filter_appended_file_pairs(
+                all_file_pairs, appended_count, filter_criteria
+            )
+        except Exception as e:
+            logger.error(f"Błąd podczas filtrowania dopisanych plików: {e}")
+            return all_file_pairs[len(all_file_pairs) - appended_count :]
+
     def get_current_files(self) -> List[FilePair]:
         """
         Zwraca aktualne pliki galerii.
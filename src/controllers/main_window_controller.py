@@ -13,9 +13,14 @@ from PyQt6.QtWidgets import QMessageBox
 from src.controllers.scan_result_processor import ScanResultProcessor
 from src.controllers.selection_manager import SelectionManager
 from src.controllers.special_folders_manager import SpecialFoldersManager
+from src.logic.filter_logic import clear_filter_index
+from src.logic.metadata_manager import MetadataManager
+from src.logic.scan_delta import ScanDelta, compute_scan_delta
 from src.models.file_pair import FilePair
+from src.services.directory_watch_service import DirectoryWatchService
 from src.services.file_operations_service import FileOperationsService
 from src.services.scanning_service import ScanningService, ScanResult
+from src.utils.path_utils import normalize_path
 
 
 class MainWindowController:
@@ -43,12 +48,20 @@ class MainWindowController:
         self.selection_manager = SelectionManager()
         self.scan_processor = ScanResultProcessor()
 
+        # Odświeżanie na żywo po zmianach w folderze roboczym
+        self.directory_watcher = DirectoryWatchService()
+        self.directory_watcher.directory_rescanned.connect(
+            self.apply_rescan_result
+        )
+
         # Stan aplikacji
         self.current_directory: Optional[str] = None
         self.current_file_pairs: List[FilePair] = []
         self.unpaired_archives: List[str] = []
         self.unpaired_previews: List[str] = []
         self.special_folders: List = []
+        # Czy galeria pokazuje już pary z trwającego skanowania folderu
+        self._receiving_streamed_pairs = False
 
     def handle_folder_selection(self, directory_path: str):
         """
@@ -61,6 +74,7 @@ class MainWindowController:
                 self.view.show_error_message("Błąd folderu", error_msg)
                 return
 
+            self._receiving_streamed_pairs = False
             self.view.worker_manager.start_directory_scan_worker(directory_path)
 
         except Exception as e:
@@ -69,11 +83,40 @@ class MainWindowController:
             self.view.show_error_message("Błąd Krytyczny", error_msg)
             self.view._hide_progress()
 
+    def add_streamed_pairs(self, directory_path: str, pairs_batch: List[FilePair]):
+        """
+        Pokazuje w galerii pary zwrócone przez ScanDirectoryWorker, zanim
+        skanowanie folderu się zakończy.
+
+        Pierwsza partia skanowania zastępuje wyświetlane pary, kolejne są
+        filtrowane i dokładane na końcu galerii bez przebudowy widoku.
+        Pełne filtrowanie, metadane, niesparowane pliki i foldery specjalne
+        nakłada _on_scan_worker_finished.
+        """
+        if not self._receiving_streamed_pairs:
+            self._receiving_streamed_pairs = True
+            self.current_directory = normalize_path(directory_path)
+            self.current_file_pairs = list(pairs_batch)
+            self.selection_manager.clear_selection()
+            self.view.gallery_manager.clear_gallery()
+            self.view.data_manager.apply_filters_and_update_view()
+            return
+        self.current_file_pairs.extend(pairs_batch)
+        self.view.data_manager.append_pairs_to_view(len(pairs_batch))
+
+    def finish_streamed_pairs(self):
+        """
+        Kończy przyjmowanie partii bieżącego skanowania - następna partia
+        (nowego skanowania) zastąpi wyświetlane pary.
+        """
+        self._receiving_streamed_pairs = False
+
     def _on_scan_worker_finished(self, scan_result: ScanResult):
         """
         Callback wywoływany po zakończeniu pracy przez ScanDirectoryWorker.
         ZREFAKTORYZOWANY - używa nowych managerów.
         """
+        self._receiving_streamed_pairs = False
         if scan_result.error_message:
             self.view.show_error_message("Błąd skanowania", scan_result.error_message)
             self.view._hide_progress()
@@ -98,6 +141,8 @@ class MainWindowController:
             )
             if metadata_folders:
                 self.special_folders.extend(metadata_folders)
+            # ScanDirectoryWorker skanuje rekursywnie (max_depth=-1)
+            self.watch_directory(self.current_directory, max_depth=-1)
 
         # Powiadom UI
         self.view.update_scan_results(scan_result)
@@ -111,6 +156,94 @@ class MainWindowController:
             f"{len(self.special_folders)} specjalnych folderów"
         )
 
+    def watch_directory(self, directory_path: str, max_depth: int = -1):
+        """
+        Włącza odświeżanie na żywo dla folderu roboczego.
+
+        Args:
+            directory_path: Folder roboczy
+            max_depth: Głębokość skanowania, które dało bieżące pary - ponowne
+                skanowanie musi objąć ten sam zakres, inaczej delta uzna pary
+                z nieprzeskanowanych podfolderów za usunięte
+        """
+        self.directory_watcher.watch(directory_path, max_depth=max_depth)
+
+    def apply_rescan_result(self, directory_path: str, scan_result):
+        """
+        Nakłada na stan i UI tylko zmiany ponownego skanowania względem
+        aktualnie wyświetlanych danych (obserwator folderu, nawigacja
+        z wynikiem z cache).
+        """
+        if not self.current_directory or normalize_path(
+            self.current_directory
+        ) != normalize_path(directory_path):
+            return
+
+        # Rekordy plików mogły się zmienić także bez zmian w parach
+        self.refresh_file_records(directory_path)
+
+        file_pairs, unpaired_archives, unpaired_previews, _ = scan_result
+        delta = compute_scan_delta(
+            self.current_file_pairs,
+            self.unpaired_archives,
+            self.unpaired_previews,
+            file_pairs,
+            unpaired_archives,
+            unpaired_previews,
+        )
+        if delta.is_empty():
+            return
+
+        self.apply_scan_delta(delta)
+
+    def refresh_file_records(self, directory_path: str):
+        """
+        Przekazuje widokowi rekordy plików z ostatniego skanowania folderu
+        (klucze dyskowego cache miniatur bez wywołań os.stat).
+        """
+        file_records, snapshot_directories = self.scan_service.get_file_records(
+            directory_path
+        )
+        self.view.update_file_records(file_records, snapshot_directories)
+
+    def apply_scan_delta(self, delta: ScanDelta):
+        """
+        Aktualizuje stan aplikacji o deltę skanowania i powiadamia UI.
+
+        Args:
+            delta: Dodane/usunięte pary i niesparowane pliki
+        """
+        if delta.added_pairs and self.current_directory:
+            MetadataManager.get_instance(
+                self.current_directory
+            ).apply_metadata_to_file_pairs(delta.added_pairs)
+
+        if delta.removed_pairs:
+            removed_ids = {id(pair) for pair in delta.removed_pairs}
+            self.current_file_pairs[:] = [
+                pair for pair in self.current_file_pairs if id(pair) not in removed_ids
+            ]
+            self.selection_manager.remove_pairs_from_selection(delta.removed_pairs)
+        self.current_file_pairs.extend(delta.added_pairs)
+
+        removed_archives = set(delta.removed_unpaired_archives)
+        removed_previews = set(delta.removed_unpaired_previews)
+        self.unpaired_archives = [
+            path for path in self.unpaired_archives if path not in removed_archives
+        ] + delta.added_unpaired_archives
+        self.unpaired_previews = [
+            path for path in self.unpaired_previews if path not in removed_previews
+        ] + delta.added_unpaired_previews
+
+        self.logger.info(
+            f"Zmiany w folderze: +{len(delta.added_pairs)}/-{len(delta.removed_pairs)} "
+            f"par, +{len(delta.added_unpaired_archives)}/"
+            f"-{len(delta.removed_unpaired_archives)} archiwów, "
+            f"+{len(delta.added_unpaired_previews)}/"
+            f"-{len(delta.removed_unpaired_previews)} podglądów"
+        )
+        self.view.apply_scan_delta(delta)
+
     def handle_bulk_delete(self, selected_pairs: List[FilePair]) -> bool:
         """
         Obsługuje masowe usuwanie plików.
@@ -353,6 +486,8 @@ class MainWindowController:
         self.unpaired_archives = []
         self.unpaired_previews = []
         self.special_folders = []
+        self.directory_watcher.stop()
+        clear_filter_index()
 
         # Wyczyść selekcję przez SelectionManager
         self.selection_manager.clear_selection()
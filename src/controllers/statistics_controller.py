@@ -7,7 +7,8 @@ import logging
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 
-from src.models.file_pair import FilePair
+from src.models.file_pair import FILE_SIZE_ERROR, FilePair
+from src.models.file_record import FileRecord
 from src.services.scanning_service import ScanningService
 from src.utils.path_validator import PathValidator
 
@@ -93,7 +94,8 @@ class StatisticsController:
             # Oblicz rozmiar plików
             stats.total_size_bytes = self._calculate_total_size(scan_result.file_pairs, 
                                                                scan_result.unpaired_archives,
-                                                               scan_result.unpaired_previews)
+                                                               scan_result.unpaired_previews,
+                                                               scan_result.file_records)
             
             # Zapisz do cache
             self._stats_cache[normalized_path] = stats
@@ -107,37 +109,46 @@ class StatisticsController:
     
     def _calculate_total_size(self, file_pairs: List[FilePair], 
                             unpaired_archives: List[str],
-                            unpaired_previews: List[str]) -> int:
-        """Oblicza całkowity rozmiar plików w bajtach."""
+                            unpaired_previews: List[str],
+                            file_records: Optional[Dict[str, FileRecord]] = None) -> int:
+        """
+        Oblicza całkowity rozmiar plików w bajtach.
+
+        Rozmiary pochodzą z par (wypełnionych rekordami skanera) i z rekordów
+        plików; stat wykonywany jest tylko dla plików bez rekordu.
+        """
         import os
+        file_records = file_records or {}
         total_size = 0
         
-        # Rozmiar par plików
+        # Rozmiar par plików (pliki niedostępne są pomijane i logowane)
+        unreadable_count = 0
         for pair in file_pairs:
-            try:
-                if pair.archive_path and os.path.exists(pair.archive_path):
-                    total_size += os.path.getsize(pair.archive_path)
-                if pair.preview_path and os.path.exists(pair.preview_path):
-                    total_size += os.path.getsize(pair.preview_path)
-            except OSError:
-                continue
+            sizes = [pair.get_archive_size()]
+            if pair.preview_path:
+                sizes.append(pair.get_preview_size())
+            for size in sizes:
+                if size == FILE_SIZE_ERROR:
+                    unreadable_count += 1
+                else:
+                    total_size += size
         
-        # Rozmiar niesprarowanych archiwów
-        for archive_path in unpaired_archives:
-            try:
-                if os.path.exists(archive_path):
-                    total_size += os.path.getsize(archive_path)
-            except OSError:
+        # Rozmiar niesparowanych archiwów i podglądów
+        for file_path in (*unpaired_archives, *unpaired_previews):
+            record = file_records.get(file_path)
+            if record is not None:
+                total_size += record.size
                 continue
-        
-        # Rozmiar niesparowanych podglądów
-        for preview_path in unpaired_previews:
             try:
-                if os.path.exists(preview_path):
-                    total_size += os.path.getsize(preview_path)
+                total_size += os.path.getsize(file_path)
             except OSError:
-                continue
-        
+                unreadable_count += 1
+
+        if unreadable_count:
+            logger.warning(
+                f"Nie można odczytać rozmiaru {unreadable_count} plików - "
+                f"pominięto je w sumie rozmiaru"
+            )
         return total_size
     
     def get_multiple_folder_statistics(self, folder_paths: List[str]) -> Dict[str, FolderStats]:
@@ -0,0 +1,675 @@
+"""
+Silnik masowych operacji na plikach (przenoszenie, usuwanie).
+
+Operacje są wykonywane równolegle w puli wątków, z limitem jednoczesnych
+operacji na urządzenie (st_dev katalogu źródłowego i docelowego) - dysk
+lub udział sieciowy nie dostaje więcej żądań, niż sensownie obsłuży.
+Przeniesienie w obrębie jednego systemu plików to os.rename; między
+urządzeniami plik jest kopiowany porcjami do pliku tymczasowego, zapisywany
+na dysk (fsync), podmieniany atomowo, a dopiero potem usuwany ze źródła.
+
+Plan operacji i postęp są zapisywane w dzienniku (JSON Lines), więc
+przerwaną operację można dokończyć (resume) albo cofnąć (rollback).
+Dziennik zostaje tylko po przerwaniu (przez użytkownika lub awarię); po
+operacji zakończonej - także z błędami pojedynczych plików, zgłaszanymi
+w wyniku - jest usuwany. Przy starcie aplikacji BulkOperationsManager
+proponuje dokończenie, cofnięcie lub odrzucenie pozostawionych dzienników.
+"""
+
+import errno
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from src.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+OPERATION_MOVE = "move"
+OPERATION_DELETE = "delete"
+
+JOURNAL_DIR_NAME = "bulk_journal"
+JOURNAL_SUFFIX = ".journal"
+PART_SUFFIX = ".cfab-part"  # Plik tymczasowy kopii między urządzeniami
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+_JOURNAL_PLAN = "plan"
+_JOURNAL_START = "start"
+_JOURNAL_DONE = "done"
+_JOURNAL_SKIP = "skip"
+
+# Wyniki pojedynczej operacji
+_STATUS_DONE = "done"
+_STATUS_SKIPPED = "skipped"
+_STATUS_MISSING = "missing"
+_STATUS_ERROR = "error"
+_STATUS_INTERRUPTED = "interrupted"
+
+# Tolerancja porównania czasu modyfikacji kopii (precyzja znaczników czasu
+# różnych systemów plików, np. 2 s na FAT)
+_MTIME_TOLERANCE_NS = 2_000_000_000
+
+
+class FileOperation(NamedTuple):
+    """Pojedyncza operacja: przeniesienie (z target) lub usunięcie (bez)."""
+
+    source: str
+    target: Optional[str] = None
+    tag: Any = None  # Dane wywołującego, zwracane razem z wynikiem
+
+
+@dataclass
+class BulkOperationResult:
+    """Wynik masowej operacji; listy operacji w kolejności wejściowej."""
+
+    completed: List[FileOperation] = field(default_factory=list)
+    skipped: List[Dict[str, str]] = field(default_factory=list)
+    missing: List[FileOperation] = field(default_factory=list)
+    errors: List[Dict[str, str]] = field(default_factory=list)
+    interrupted: bool = False
+    # Dziennik przerwanej operacji, do wznowienia lub cofnięcia
+    journal_path: Optional[str] = None
+
+
+class _OperationInterrupted(Exception):
+    """Kopiowanie przerwane na żądanie użytkownika."""
+
+
+def get_journal_dir() -> str:
+    """Domyślny katalog dzienników operacji masowych."""
+    return os.path.join(AppConfig.get_instance().get_app_data_dir(), JOURNAL_DIR_NAME)
+
+
+def find_pending_journals(journal_dir: Optional[str] = None) -> List[str]:
+    """Zwraca dzienniki niedokończonych operacji (od najstarszego)."""
+    journal_dir = journal_dir or get_journal_dir()
+    try:
+        names = sorted(
+            name for name in os.listdir(journal_dir) if name.endswith(JOURNAL_SUFFIX)
+        )
+    except OSError:
+        return []
+    return [os.path.join(journal_dir, name) for name in names]
+
+
+def read_journal_kind(journal_path: str) -> Optional[str]:
+    """
+    Zwraca rodzaj operacji z nagłówka dziennika (OPERATION_MOVE lub
+    OPERATION_DELETE) albo None, jeśli dziennika nie da się odczytać.
+    """
+    try:
+        with open(journal_path, "r", encoding="utf-8") as journal_file:
+            kind = json.loads(journal_file.readline()).get("kind")
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning("Nie można odczytać dziennika %s: %s", journal_path, e)
+        return None
+    return kind if kind in (OPERATION_MOVE, OPERATION_DELETE) else None
+
+
+def discard_journal(journal_path: str):
+    """Usuwa dziennik przerwanej operacji bez zmian w plikach."""
+    try:
+        os.remove(journal_path)
+    except OSError as e:
+        logger.warning("Nie można usunąć dziennika %s: %s", journal_path, e)
+
+
+class BulkOperationJournal:
+    """
+    Dziennik masowej operacji (JSON Lines).
+
+    Pierwsza linia opisuje operację, kolejne to plan (źródło, cel) oraz
+    identyfikatory operacji wykonanych lub pominiętych - dopisywane partiami
+    z fsync. Przed zmianą nazwy lub kopiowaniem przenoszenia dopisywany jest
+    wpis "start" z tożsamością pliku źródłowego (urządzenie, i-węzeł,
+    rozmiar, czas modyfikacji) - tylko dla takich operacji wznowienie może
+    uznać istniejący plik docelowy za wynik przerwanego przeniesienia.
+    Operacje zakończone błędem nie są oznaczane, więc wznowienie ponawia je
+    razem z niewykonanymi.
+    """
+
+    def __init__(self, path: str, kind: str):
+        self.path = path
+        self.kind = kind
+        self._file = None
+        # Wpisy "start" dopisują wątki puli
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls, journal_dir: str, kind: str, operations: List[FileOperation]
+    ) -> "BulkOperationJournal":
+        os.makedirs(journal_dir, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{kind}-{uuid.uuid4().hex[:8]}"
+        journal = cls(os.path.join(journal_dir, name + JOURNAL_SUFFIX), kind)
+        lines = [json.dumps({"kind": kind, "created": time.time()})]
+        lines.extend(
+            json.dumps(
+                {
+                    "op": _JOURNAL_PLAN,
+                    "id": op_id,
+                    "source": op.source,
+                    "target": op.target,
+                },
+                ensure_ascii=False,
+            )
+            for op_id, op in enumerate(operations)
+        )
+        journal._file = open(journal.path, "w", encoding="utf-8")
+        journal._write_lines(lines)
+        return journal
+
+    @classmethod
+    def load(
+        cls, path: str
+    ) -> Tuple[
+        "BulkOperationJournal",
+        List[FileOperation],
+        Set[int],
+        Set[int],
+        Dict[int, Tuple[int, ...]],
+    ]:
+        """
+        Wczytuje dziennik.
+
+        Returns:
+            (dziennik, plan operacji, id wykonanych, id pominiętych,
+            tożsamość źródła rozpoczętych przeniesień wg id)
+        """
+        operations: List[FileOperation] = []
+        done_ids: Set[int] = set()
+        skipped_ids: Set[int] = set()
+        started: Dict[int, Tuple[int, ...]] = {}
+        with open(path, "r", encoding="utf-8") as journal_file:
+            header = json.loads(journal_file.readline())
+            for line_number, line in enumerate(journal_file, start=2):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Niedokończona linia po awarii - dalszych wpisów nie ma
+                    logger.warning(
+                        "Pominięto uszkodzony wpis dziennika %s:%d", path, line_number
+                    )
+                    break
+                if entry["op"] == _JOURNAL_PLAN:
+                    operations.append(FileOperation(entry["source"], entry["target"]))
+                elif entry["op"] == _JOURNAL_DONE:
+                    done_ids.add(entry["id"])
+                elif entry["op"] == _JOURNAL_SKIP:
+                    skipped_ids.add(entry["id"])
+                elif entry["op"] == _JOURNAL_START:
+                    started[entry["id"]] = tuple(entry["identity"])
+        journal = cls(path, header["kind"])
+        journal._file = open(path, "a", encoding="utf-8")
+        return journal, operations, done_ids, skipped_ids, started
+
+    def record(self, done_ids: Iterable[int], skipped_ids: Iterable[int] = ()):
+        lines = [json.dumps({"op": _JOURNAL_DONE, "id": op_id}) for op_id in done_ids]
+        lines.extend(
+            json.dumps({"op": _JOURNAL_SKIP, "id": op_id}) for op_id in skipped_ids
+        )
+        if lines:
+            self._write_lines(lines)
+
+    def record_start(self, op_id: int, identity: Tuple[int, ...]):
+        """
+        Zapisuje rozpoczęcie przeniesienia (wywoływane z wątków puli).
+
+        Bez fsync - wpis utracony przy awarii systemu oznacza jedynie, że
+        wznowienie potraktuje plik docelowy jak istniejący wcześniej.
+        """
+        line = json.dumps(
+            {"op": _JOURNAL_START, "id": op_id, "identity": list(identity)}
+        )
+        self._write_lines([line], sync=False)
+
+    def _write_lines(self, lines: List[str], sync: bool = True):
+        with self._lock:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+
+    def close(self, remove: bool = False):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                logger.warning("Nie można usunąć dziennika %s: %s", self.path, e)
+
+
+def _fsync_directory(directory: str):
+    """Utrwala wpis katalogu po podmianie pliku (tylko POSIX)."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Nie każdy system plików (np. udziały sieciowe) to obsługuje
+    finally:
+        os.close(fd)
+
+
+class BulkFileEngine:
+    """
+    Równoległe przenoszenie i usuwanie plików z dziennikiem operacji.
+
+    progress_callback jest wywoływany w wątku wywołującym move()/delete().
+    interrupt_check jest sprawdzany także w wątkach puli (między porcjami
+    kopiowania między urządzeniami), więc musi być bezpieczny wątkowo -
+    np. odczyt flagi albo threading.Event.is_set.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        device_limit: Optional[int] = None,
+        journal_dir: Optional[str] = None,
+        interrupt_check: Optional[Callable[[], bool]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Args:
+            max_workers: Liczba wątków puli (domyślnie bulk_operation_workers)
+            device_limit: Maksymalna liczba jednoczesnych operacji na jedno
+                urządzenie (domyślnie bulk_operation_device_limit)
+            journal_dir: Katalog dzienników; None = bez dziennika
+            interrupt_check: Funkcja sprawdzająca czy przerwać operację
+                (wywoływana również z wątków puli)
+            progress_callback: Funkcja (przetworzone, wszystkie)
+        """
+        config = AppConfig.get_instance()
+        self.max_workers = max_workers or config.get("bulk_operation_workers", 8)
+        self.device_limit = device_limit or config.get(
+            "bulk_operation_device_limit", 4
+        )
+        self.journal_dir = journal_dir
+        self.interrupt_check = interrupt_check
+        self.progress_callback = progress_callback
+        self._device_semaphores: Dict[int, threading.BoundedSemaphore] = {}
+        self._directory_devices: Dict[str, Optional[int]] = {}
+
+    # --- API ---
+
+    def move(self, operations: Iterable[FileOperation]) -> BulkOperationResult:
+        """Przenosi pliki; istniejące pliki docelowe nie są nadpisywane."""
+        return self._run(OPERATION_MOVE, list(operations))
+
+    def delete(self, operations: Iterable[FileOperation]) -> BulkOperationResult:
+        """Usuwa pliki (source każdej operacji)."""
+        return self._run(OPERATION_DELETE, list(operations))
+
+    def resume(self, journal_path: str) -> BulkOperationResult:
+        """Dokańcza operację z dziennika (niewykonane i zakończone błędem)."""
+        journal, operations, done_ids, skipped_ids, started = (
+            BulkOperationJournal.load(journal_path)
+        )
+        finished = done_ids | skipped_ids
+        pending = [
+            (op_id, op) for op_id, op in enumerate(operations) if op_id not in finished
+        ]
+        logger.info(
+            "Wznawianie operacji %s: %d z %d pozostało (%s)",
+            journal.kind,
+            len(pending),
+            len(operations),
+            journal_path,
+        )
+        return self._execute(journal.kind, pending, journal, started=started)
+
+    def rollback(self, journal_path: str) -> BulkOperationResult:
+        """
+        Cofa przeniesienia zapisane w dzienniku (cel -> źródło).
+
+        Raises:
+            ValueError: Dla operacji usuwania, której nie da się cofnąć
+        """
+        journal, operations, done_ids, skipped_ids, started = (
+            BulkOperationJournal.load(journal_path)
+        )
+        journal.close()
+        if journal.kind != OPERATION_MOVE:
+            raise ValueError(f"Operacji {journal.kind} nie można cofnąć")
+
+        reverse_operations = []
+        for op_id, op in enumerate(operations):
+            # Przeniesienie sprzed awarii może nie mieć jeszcze wpisu "done"
+            moved = op_id in done_ids or (
+                op_id in started
+                and op_id not in skipped_ids
+                and not os.path.lexists(op.source)
+                and self._is_moved_copy(op.target, started[op_id])
+            )
+            if moved:
+                reverse_operations.append(FileOperation(op.target, op.source))
+        logger.info(
+            "Cofanie operacji z %s: %d przeniesień",
+            journal_path,
+            len(reverse_operations),
+        )
+
+        result = self._execute(
+            OPERATION_MOVE, list(enumerate(reverse_operations)), None
+        )
+        if result.interrupted:
+            result.journal_path = journal_path
+        else:
+            journal.close(remove=True)
+        return result
+
+    # --- Wykonanie ---
+
+    def _run(self, kind: str, operations: List[FileOperation]) -> BulkOperationResult:
+        journal = None
+        if self.journal_dir and operations:
+            journal = BulkOperationJournal.create(self.journal_dir, kind, operations)
+        return self._execute(kind, list(enumerate(operations)), journal)
+
+    def _execute(
+        self,
+        kind: str,
+        pending: List[Tuple[int, FileOperation]],
+        journal: Optional[BulkOperationJournal],
+        started: Optional[Dict[int, Tuple[int, ...]]] = None,
+    ) -> BulkOperationResult:
+        """
+        Args:
+            started: Przy wznawianiu - tożsamość źródła przeniesień, które
+                dziennik oznaczył jako rozpoczęte
+        """
+        started = started or {}
+        result = BulkOperationResult()
+        total = len(pending)
+        completed: List[Tuple[int, FileOperation]] = []
+        missing: List[Tuple[int, FileOperation]] = []
+        processed = 0
+
+        # Dwie operacje z tym samym celem - druga jest pomijana bez
+        # sięgania do dysku (wyścig między wątkami puli)
+        claimed_targets: Set[str] = set()
+        queue: List[Tuple[int, FileOperation, Tuple[int, ...]]] = []
+        journal_skips = []
+        for op_id, op in pending:
+            if kind == OPERATION_MOVE:
+                target_key = os.path.normcase(op.target)
+                if target_key in claimed_targets:
+                    result.skipped.append(self._skip_entry(op, "Plik już istnieje"))
+                    journal_skips.append(op_id)
+                    processed += 1
+                    continue
+                claimed_targets.add(target_key)
+            queue.append((op_id, op, self._devices_for(op)))
+        if journal is not None:
+            journal.record((), journal_skips)
+
+        window = self.max_workers * 4
+        next_index = 0
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bulk_ops"
+        ) as executor:
+            futures = {}
+            while futures or (next_index < len(queue) and not result.interrupted):
+                while (
+                    next_index < len(queue)
+                    and len(futures) < window
+                    and not self._is_interrupted()
+                ):
+                    op_id, op, devices = queue[next_index]
+                    next_index += 1
+                    future = executor.submit(
+                        self._perform,
+                        kind,
+                        op_id,
+                        op,
+                        devices,
+                        journal,
+                        started.get(op_id),
+                    )
+                    futures[future] = (op_id, op)
+                if self._is_interrupted():
+                    result.interrupted = True
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                done_ids, skipped_ids = [], []
+                for future in done:
+                    op_id, op = futures.pop(future)
+                    status, detail = future.result()
+                    if status == _STATUS_DONE:
+                        completed.append((op_id, op))
+                        done_ids.append(op_id)
+                    elif status == _STATUS_SKIPPED:
+                        result.skipped.append(self._skip_entry(op, detail))
+                        skipped_ids.append(op_id)
+                    elif status == _STATUS_MISSING:
+                        missing.append((op_id, op))
+                        skipped_ids.append(op_id)
+                    elif status == _STATUS_ERROR:
+                        error, error_type = detail
+                        result.errors.append(
+                            {
+                                "file_path": op.source,
+                                "error": error,
+                                "error_type": error_type,
+                            }
+                        )
+                    else:
+                        result.interrupted = True
+                        continue  # Operacja pozostaje do wznowienia
+                    processed += 1
+                if journal is not None:
+                    journal.record(done_ids, skipped_ids)
+                if self.progress_callback:
+                    self.progress_callback(processed, total)
+
+        completed.sort(key=lambda item: item[0])
+        missing.sort(key=lambda item: item[0])
+        result.completed = [op for _, op in completed]
+        result.missing = [op for _, op in missing]
+
+        if journal is not None:
+            # Błędy pojedynczych plików trafiają do wyniku; dziennik
+            # zostaje tylko do wznowienia przerwanej operacji
+            journal.close(remove=not result.interrupted)
+            if result.interrupted:
+                result.journal_path = journal.path
+        logger.info(
+            "Operacja %s: %d wykonano, %d pominięto, %d brak plików, %d błędów%s",
+            kind,
+            len(result.completed),
+            len(result.skipped),
+            len(result.missing),
+            len(result.errors),
+            " (przerwano)" if result.interrupted else "",
+        )
+        return result
+
+    def _is_interrupted(self) -> bool:
+        return bool(self.interrupt_check and self.interrupt_check())
+
+    @staticmethod
+    def _skip_entry(op: FileOperation, reason: str) -> Dict[str, str]:
+        return {"file_path": op.source, "target_path": op.target, "reason": reason}
+
+    # --- Urządzenia ---
+
+    def _device_of(self, directory: str) -> Optional[int]:
+        if directory not in self._directory_devices:
+            try:
+                self._directory_devices[directory] = os.stat(directory).st_dev
+            except OSError:
+                self._directory_devices[directory] = None
+        return self._directory_devices[directory]
+
+    def _devices_for(self, op: FileOperation) -> Tuple[int, ...]:
+        """Urządzenia operacji (posortowane - stała kolejność blokad)."""
+        devices = {self._device_of(os.path.dirname(op.source))}
+        if op.target is not None:
+            devices.add(self._device_of(os.path.dirname(op.target)))
+        devices.discard(None)
+        for device in devices:
+            if device not in self._device_semaphores:
+                self._device_semaphores[device] = threading.BoundedSemaphore(
+                    self.device_limit
+                )
+        return tuple(sorted(devices))
+
+    # --- Operacje w wątkach puli ---
+
+    def _perform(
+        self,
+        kind: str,
+        op_id: int,
+        op: FileOperation,
+        devices: Tuple[int, ...],
+        journal: Optional[BulkOperationJournal],
+        started_identity: Optional[Tuple[int, ...]],
+    ) -> Tuple[str, Any]:
+        semaphores = [self._device_semaphores[device] for device in devices]
+        for semaphore in semaphores:
+            semaphore.acquire()
+        try:
+            if kind == OPERATION_DELETE:
+                os.remove(op.source)
+                return _STATUS_DONE, None
+            return self._move(
+                op_id, op, len(devices) <= 1, journal, started_identity
+            )
+        except _OperationInterrupted:
+            return _STATUS_INTERRUPTED, None
+        except FileNotFoundError as e:
+            if os.path.lexists(op.source):
+                # Brak katalogu docelowego, a nie pliku źródłowego
+                logger.error("Błąd operacji na %s: %s", op.source, e)
+                return _STATUS_ERROR, (str(e), "UNKNOWN_ERROR")
+            logger.warning("Plik nie istnieje: %s", op.source)
+            return _STATUS_MISSING, None
+        except PermissionError as e:
+            logger.error("Brak uprawnień do %s: %s", op.source, e)
+            return _STATUS_ERROR, (f"Brak uprawnień: {e}", "PERMISSION_ERROR")
+        except Exception as e:
+            logger.error("Błąd operacji na %s: %s", op.source, e, exc_info=True)
+            return _STATUS_ERROR, (str(e), "UNKNOWN_ERROR")
+        finally:
+            for semaphore in reversed(semaphores):
+                semaphore.release()
+
+    def _move(
+        self,
+        op_id: int,
+        op: FileOperation,
+        same_device: bool,
+        journal: Optional[BulkOperationJournal],
+        started_identity: Optional[Tuple[int, ...]],
+    ):
+        if os.path.lexists(op.target):
+            if started_identity is not None and self._recover_interrupted_move(
+                op, started_identity
+            ):
+                return _STATUS_DONE, None
+            return _STATUS_SKIPPED, "Plik już istnieje"
+
+        source_stat = os.stat(op.source)
+        if journal is not None:
+            journal.record_start(op_id, self._identity(source_stat))
+
+        if same_device:
+            try:
+                os.rename(op.source, op.target)
+                return _STATUS_DONE, None
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Ten sam st_dev, ale różne punkty montowania - kopiowanie
+        self._copy_and_remove(op.source, op.target)
+        return _STATUS_DONE, None
+
+    @staticmethod
+    def _identity(stat_result: os.stat_result) -> Tuple[int, ...]:
+        """Tożsamość pliku zapisywana we wpisie "start" dziennika."""
+        return (
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        )
+
+    @staticmethod
+    def _is_moved_copy(path: str, identity: Tuple[int, ...]) -> bool:
+        """
+        Sprawdza, czy plik jest wynikiem przeniesienia pliku o danej
+        tożsamości: ten sam i-węzeł po zmianie nazwy albo kopia o tym samym
+        rozmiarze i czasie modyfikacji (copystat).
+        """
+        device, inode, size, mtime_ns = identity
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return False
+        if (stat_result.st_dev, stat_result.st_ino) == (device, inode):
+            return True
+        return (
+            stat_result.st_size == size
+            and abs(stat_result.st_mtime_ns - mtime_ns) <= _MTIME_TOLERANCE_NS
+        )
+
+    def _recover_interrupted_move(
+        self, op: FileOperation, identity: Tuple[int, ...]
+    ) -> bool:
+        """
+        Rozpoznaje rozpoczęte przeniesienie przerwane przed wpisem "done":
+        plik docelowy musi pochodzić ze źródła (zmiana nazwy albo kompletna
+        kopia); jeśli źródło nadal istnieje i się nie zmieniło, jest usuwane.
+        """
+        if not self._is_moved_copy(op.target, identity):
+            return False
+        try:
+            source_stat = os.stat(op.source)
+        except FileNotFoundError:
+            return True
+        if self._identity(source_stat) != identity:
+            return False
+        os.remove(op.source)
+        return True
+
+    def _copy_and_remove(self, source: str, target: str):
+        """Kopiuje plik porcjami z fsync, podmienia atomowo i usuwa źródło."""
+        part_path = target + PART_SUFFIX
+        buffer = bytearray(COPY_CHUNK_SIZE)
+        view = memoryview(buffer)
+        try:
+            with open(source, "rb") as src, open(part_path, "wb") as dst:
+                while True:
+                    if self._is_interrupted():
+                        raise _OperationInterrupted()
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    dst.write(view[:read])
+                dst.flush()
+                os.fsync(dst.fileno())
+            shutil.copystat(source, part_path)
+            os.replace(part_path, target)
+        except BaseException:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            raise
+        _fsync_directory(os.path.dirname(target))
+        os.remove(source)
@@ -5,13 +5,16 @@ Ten moduł zawiera funkcje do tworzenia par plików (archiwum + podgląd)
 oraz identyfikowania niesparowanych plików.
 """
 
+import bisect
+import heapq
 import logging
 import os
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from src import app_config
 from src.models.file_pair import FilePair
+from src.models.file_record import FileRecord
 
 # Konfiguracja loggera
 logger = logging.getLogger(__name__)
@@ -20,11 +23,155 @@ logger = logging.getLogger(__name__)
 ARCHIVE_EXTENSIONS = set(app_config.SUPPORTED_ARCHIVE_EXTENSIONS)
 PREVIEW_EXTENSIONS = set(app_config.SUPPORTED_PREVIEW_EXTENSIONS)
 
+# Preferowane rozszerzenia podglądu (od najbardziej preferowanego) i ich
+# punktacja dla strategii "best_match"
+PREVIEW_PREFERENCE = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff")
+PREVIEW_PREFERENCE_SCORES = {
+    ext: (len(PREVIEW_PREFERENCE) - i) * 10 for i, ext in enumerate(PREVIEW_PREFERENCE)
+}
+
+# Punktacja dopasowania nazw i limit kandydatów częściowych
+EXACT_MATCH_SCORE = 1000
+PARTIAL_MATCH_SCORE = 500
+MAX_PARTIAL_MATCHES = 20
+
+
+class _PreviewNameIndex:
+    """
+    Indeks nazw bazowych podglądów dla strategii "best_match".
+
+    Słownik nazwa -> podglądy obsługuje dokładne dopasowania, a posortowana
+    tablica nazw pozwala znaleźć nazwy zaczynające się od nazwy archiwum
+    przez bisect (zamiast przeglądania wszystkich nazw dla każdego archiwum).
+    """
+
+    def __init__(self, preview_files: List[str]):
+        self.previews_by_name: Dict[str, List[str]] = defaultdict(list)
+        for preview in preview_files:
+            preview_base_name = os.path.splitext(os.path.basename(preview))[0].lower()
+            self.previews_by_name[preview_base_name].append(preview)
+
+        # Kolejność wstawienia rozstrzyga remisy długości (jak wcześniej)
+        self._order = {name: i for i, name in enumerate(self.previews_by_name)}
+        self._sorted_names = sorted(self.previews_by_name)
+
+    def partial_matches(self, base_name: str, limit: int) -> List[str]:
+        """
+        Zwraca do `limit` najdłuższych nazw, które są prefiksem `base_name`
+        lub zaczynają się od `base_name`.
+        """
+        matches = {
+            base_name[:length]
+            for length in range(len(base_name) + 1)
+            if base_name[:length] in self.previews_by_name
+        }
+
+        names = self._sorted_names
+        i = bisect.bisect_left(names, base_name)
+        while i < len(names) and names[i].startswith(base_name):
+            matches.add(names[i])
+            i += 1
+
+        return heapq.nsmallest(
+            limit, matches, key=lambda name: (-len(name), self._order[name])
+        )
+
+
+def _pair_best_match(
+    archive_files: List[str],
+    preview_files: List[str],
+    base_directory: str,
+    file_records: Optional[Dict[str, FileRecord]] = None,
+) -> Tuple[List[FilePair], Set[str]]:
+    """
+    Paruje archiwa z najlepiej pasującymi podglądami (strategia "best_match").
+
+    Dokładna zgodność nazwy ma pierwszeństwo; w przeciwnym razie brane są
+    nazwy o wspólnym prefiksie. Remisy rozstrzyga preferowane rozszerzenie,
+    a następnie nowszy plik.
+    """
+    found_pairs: List[FilePair] = []
+    processed_files: Set[str] = set()
+    index = _PreviewNameIndex(preview_files)
+    preview_scores: Dict[str, float] = {}
+
+    def preview_score(preview: str) -> float:
+        # Punkty zależne tylko od podglądu liczone raz na plik
+        score = preview_scores.get(preview)
+        if score is None:
+            score = PREVIEW_PREFERENCE_SCORES.get(
+                os.path.splitext(preview)[1].lower(), 0
+            )
+            # Mały bonus za nowsze pliki
+            record = file_records.get(preview) if file_records else None
+            try:
+                mtime = (
+                    record.mtime if record is not None else os.path.getmtime(preview)
+                )
+                score += mtime / 10000000
+            except OSError:
+                pass  # Ignorujemy błędy przy sprawdzaniu czasu modyfikacji
+            preview_scores[preview] = score
+        return score
+
+    for archive in archive_files:
+        archive_base_name = os.path.splitext(os.path.basename(archive))[0].lower()
+
+        exact_previews = index.previews_by_name.get(archive_base_name)
+        if exact_previews:
+            candidates = [(p, EXACT_MATCH_SCORE) for p in exact_previews]
+        else:
+            candidates = [
+                (p, PARTIAL_MATCH_SCORE)
+                for name in index.partial_matches(
+                    archive_base_name, MAX_PARTIAL_MATCHES
+                )
+                for p in index.previews_by_name[name]
+            ]
+
+        best_preview = None
+        best_score = -1
+        for preview, base_score in candidates:
+            score = base_score + preview_score(preview)
+            if score > best_score:
+                best_score = score
+                best_preview = preview
+
+        if best_preview and best_score > 0:
+            try:
+                pair = FilePair(archive, best_preview, base_directory)
+                found_pairs.append(pair)
+                processed_files.add(archive)
+                processed_files.add(best_preview)
+            except ValueError as e:
+                logger.error(
+                    f"Błąd tworzenia FilePair dla '{archive}' i '{best_preview}': {e}"
+                )
+
+    return found_pairs, processed_files
+
+
+def apply_file_records(
+    file_pairs: Iterable[FilePair], file_records: Optional[Dict[str, FileRecord]]
+):
+    """Przepisuje rozmiary plików z rekordów skanera do par (bez wywołań stat)."""
+    if not file_records:
+        return
+    for pair in file_pairs:
+        archive_record = file_records.get(pair.archive_path)
+        if archive_record is not None:
+            pair.archive_size_bytes = archive_record.size
+        if pair.preview_path:
+            preview_record = file_records.get(pair.preview_path)
+            if preview_record is not None:
+                pair.preview_size_bytes = preview_record.size
+
 
 def create_file_pairs(
     file_map: Dict[str, List[str]],
     base_directory: str,
     pair_strategy: str = "first_match",
+    file_records: Optional[Dict[str, FileRecord]] = None,
 ) -> Tuple[List[FilePair], Set[str]]:
     """
     Tworzy pary plików na podstawie zebranych danych.
@@ -36,6 +183,8 @@ def create_file_pairs(
                          "first_match": tylko pierwsza znaleziona para.
                          "all_combinations": wszystkie możliwe kombinacje archiwum-podgląd.
                          "best_match": inteligentne parowanie po nazwach.
+        file_records: Opcjonalne rekordy plików ze skanera (ścieżka -> FileRecord);
+            dostarczają mtime dla "best_match" i rozmiary plików dla par.
 
     Returns:
         Krotka zawierająca listę utworzonych par oraz zbiór przetworzonych plików
@@ -79,90 +228,84 @@ def create_file_pairs(
                             f"Błąd tworzenia FilePair dla '{archive}' i '{preview}': {e}"
                         )
         elif pair_strategy == "best_match":
-            # Zoptymalizowany algorytm używający hashmaps - złożoność O(n+m)
+            found, paired = _pair_best_match(
+                archive_files, preview_files, base_directory, file_records
+            )
+            found_pairs.extend(found)
+            processed_files.update(paired)
+        else:
+            logger.error(f"Nieznana strategia parowania: {pair_strategy}")
 
-            # Preferowane rozszerzenia podglądu (od najbardziej preferowanego)
-            preview_preference = [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"]
+    apply_file_records(found_pairs, file_records)
+    return found_pairs, processed_files
 
-            # Budujemy hash mapę podglądów według nazw bazowych - O(m)
-            preview_map = defaultdict(list)
-            for preview in preview_files:
-                preview_name = os.path.basename(preview)
-                preview_base_name = os.path.splitext(preview_name)[0].lower()
-                preview_map[preview_base_name].append(preview)
 
-            # Dla każdego archiwum szukamy najlepszego podglądu - O(n)
-            for archive in archive_files:
-                archive_name = os.path.basename(archive)
-                archive_base_name = os.path.splitext(archive_name)[0].lower()
-                best_preview = None
-                best_score = -1
-
-                # Szukamy kandydatów podglądów - O(1) dzięki hash mapie
-                candidates = []
-
-                # 1. Dokładna zgodność nazwy (najlepsze dopasowanie)
-                if archive_base_name in preview_map:
-                    candidates.extend(
-                        [(p, 1000) for p in preview_map[archive_base_name]]
-                    )
-                else:
-                    # 2. Częściowa zgodność - OPTYMALIZACJA: tylko gdy nie ma dokładnego dopasowania
-                    # Ograniczamy sprawdzanie prefiksów do 20 najdłuższych
-                    matching_keys = []
-                    for preview_base_name in preview_map.keys():
-                        if preview_base_name.startswith(
-                            archive_base_name
-                        ) or archive_base_name.startswith(preview_base_name):
-                            matching_keys.append(preview_base_name)
-
-                    # Sortowanie po długości (zaczynając od najdłuższych)
-                    matching_keys.sort(key=len, reverse=True)
-                    for preview_base_name in matching_keys[
-                        :20
-                    ]:  # Limit do 20 najdłuższych
-                        candidates.extend(
-                            [(p, 500) for p in preview_map[preview_base_name]]
-                        )
-
-                # Oceniamy tylko znalezionych kandydatów
-                for preview, base_score in candidates:
-                    score = base_score
-                    preview_ext = os.path.splitext(preview)[1].lower()
+def pair_across_folders(
+    archive_files: Iterable[str],
+    preview_files: Iterable[str],
+    base_directory: str,
+    preview_folders: Iterable[str],
+    file_records: Optional[Dict[str, FileRecord]] = None,
+) -> Tuple[List[FilePair], Set[str]]:
+    """
+    Paruje archiwa z podglądami o tej samej nazwie bazowej z folderów podglądów.
 
-                    # Dodajemy punkty za preferowane rozszerzenie
-                    if preview_ext in preview_preference:
-                        score += (
-                            len(preview_preference)
-                            - preview_preference.index(preview_ext)
-                        ) * 10
+    Dla archiwum w katalogu D podgląd jest szukany w D/<folder> (podfolder),
+    a następnie w ../<folder> (folder równoległy), gdzie <folder> to jedna
+    z nazw `preview_folders` (np. "previews", "renders"). Indeks podglądów
+    jest słownikiem (katalog nadrzędny, nazwa bazowa), więc parowanie ma
+    złożoność O(n + m).
 
-                    # Dodajemy mały bonus za nowsze pliki
-                    try:
-                        mtime = os.path.getmtime(preview)
-                        score += mtime / 10000000  # Dodaje mały ułamek do punktacji
-                    except (OSError, PermissionError):
-                        pass  # Ignorujemy błędy przy sprawdzaniu czasu modyfikacji
-
-                    # Aktualizujemy najlepszy podgląd
-                    if score > best_score:
-                        best_score = score
-                        best_preview = preview
-
-                # Jeśli znaleźliśmy pasujący podgląd, tworzymy parę
-                if best_preview and best_score > 0:
-                    try:
-                        pair = FilePair(archive, best_preview, base_directory)
-                        found_pairs.append(pair)
-                        processed_files.add(archive)
-                        processed_files.add(best_preview)
-                    except ValueError as e:
-                        logger.error(
-                            f"Błąd tworzenia FilePair dla '{archive}' i '{best_preview}': {e}"
-                        )
-        else:
-            logger.error(f"Nieznana strategia parowania: {pair_strategy}")
+    Returns:
+        Krotka zawierająca listę utworzonych par oraz zbiór sparowanych plików
+    """
+    folder_names = {name.lower() for name in preview_folders}
+    found_pairs: List[FilePair] = []
+    processed_files: Set[str] = set()
+    if not folder_names:
+        return found_pairs, processed_files
+
+    # (katalog nadrzędny folderu podglądów, nazwa bazowa) -> podglądy
+    preview_index: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for preview in preview_files:
+        preview_dir = os.path.dirname(preview)
+        if os.path.basename(preview_dir).lower() not in folder_names:
+            continue
+        preview_base_name = os.path.splitext(os.path.basename(preview))[0].lower()
+        preview_index[(os.path.dirname(preview_dir), preview_base_name)].append(
+            preview
+        )
+    if not preview_index:
+        return found_pairs, processed_files
+
+    for archive in archive_files:
+        archive_dir = os.path.dirname(archive)
+        archive_base_name = os.path.splitext(os.path.basename(archive))[0].lower()
+        for anchor_dir in (archive_dir, os.path.dirname(archive_dir)):
+            candidates = [
+                p
+                for p in preview_index.get((anchor_dir, archive_base_name), ())
+                if p not in processed_files
+            ]
+            if not candidates:
+                continue
+            preview = max(
+                candidates,
+                key=lambda p: PREVIEW_PREFERENCE_SCORES.get(
+                    os.path.splitext(p)[1].lower(), 0
+                ),
+            )
+            try:
+                found_pairs.append(FilePair(archive, preview, base_directory))
+                processed_files.add(archive)
+                processed_files.add(preview)
+            except ValueError as e:
+                logger.error(
+                    f"Błąd tworzenia FilePair dla '{archive}' i '{preview}': {e}"
+                )
+            break
 
+    apply_file_records(found_pairs, file_records)
     return found_pairs, processed_files
 
 
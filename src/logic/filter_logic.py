@@ -3,15 +3,24 @@ Moduł odpowiedzialny za logikę filtrowania listy par plików.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from bisect import bisect_left
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from src.models.file_pair import FilePair
 from src.utils.path_utils import normalize_path
 
+logger = logging.getLogger(__name__)
+
 # Stałe dla specjalnych wartości filtrów
 COLOR_FILTER_ALL = "ALL"  # Brak filtrowania kolorów
 COLOR_FILTER_NONE = "__NONE__"  # Tylko elementy bez koloru
 
+# Górna granica zakresu ścieżek z danym prefiksem w posortowanej liście
+_PREFIX_RANGE_END = "\U0010ffff"
+# Maksymalna liczba zapamiętanych masek prefiksów ścieżek
+_PREFIX_CACHE_SIZE = 32
+
 
 def _validate_filter_criteria(filter_criteria: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -58,30 +67,353 @@ def _validate_filter_criteria(filter_criteria: Dict[str, Any]) -> Dict[str, Any]
     return validated_criteria
 
 
-def _check_color_match(pair_color_tag: Optional[str], required_color_tag: str) -> bool:
+def _mask_from_positions(positions: Sequence[int], size: int) -> int:
     """
-    Sprawdza, czy tag koloru pary pasuje do wymaganego tagu koloru.
+    Buduje maskę bitową z listy pozycji.
 
-    Args:
-        pair_color_tag: Tag koloru pary plików (może być None).
-        required_color_tag: Wymagany tag koloru z kryteriów filtrowania.
+    Każda para zajmuje jeden bajt maski (wartość 1 lub 0), dzięki czemu
+    wynik koniunkcji masek można zamienić na bajty i przekazać wprost
+    do itertools.compress.
+    """
+    flags = bytearray(size)
+    for position in positions:
+        flags[position] = 1
+    return int.from_bytes(flags, "little")
 
-    Returns:
-        True jeśli tagi są zgodne, False w przeciwnym przypadku.
+
+def _color_key(color_tag: Optional[str]) -> Optional[str]:
+    """Zwraca klucz kubełka koloru (porównanie niewrażliwe na wielkość liter)."""
+    return None if color_tag is None else color_tag.strip().lower()
+
+
+class FilePairFilterIndex:
+    """
+    Indeks par plików przyspieszający filtrowanie.
+
+    Budowany raz dla listy par (po skanowaniu), przechowuje kubełki gwiazdek
+    i tagów kolorów jako maski bitowe (int) oraz posortowaną listę ścieżek,
+    w której zakres prefiksu wyznacza bisect. Zapytanie to koniunkcja kilku
+    masek zamiast przejścia po wszystkich parach z normalizacją ścieżek
+    i tagów. Zmiany gwiazdek, kolorów i ścieżek wykrywane są przez
+    FilePair.metadata_revision, a dziennik FilePair.get_changed_pairs wskazuje
+    pary zmienione od ostatniego zapytania - aktualizowane są tylko ich
+    kubełki. Pary dopisywane w trakcie skanowania dokładane są
+    przez extend() bez przebudowy indeksu.
     """
-    # Przypadek: brak filtrowania kolorów
-    if required_color_tag == COLOR_FILTER_ALL:
-        return True
 
-    # Przypadek: filtrowanie tylko elementów bez koloru
-    if required_color_tag == COLOR_FILTER_NONE:
-        return pair_color_tag is None or pair_color_tag == ""
+    def __init__(self, file_pairs: Sequence[FilePair]):
+        self._source = file_pairs
+        self._pairs: List[FilePair] = list(file_pairs)
+        self._size = len(self._pairs)
+        self._all_mask = int.from_bytes(b"\x01" * self._size, "little")
+        self._revision = FilePair.metadata_revision
+
+        self._stars = [pair.get_stars() for pair in self._pairs]
+        self._colors = [pair.get_color_tag() for pair in self._pairs]
+        self._paths = [normalize_path(pair.get_archive_path()) for pair in self._pairs]
+        # id(pary) -> pozycja dla par z dziennika zmian
+        self._positions: Dict[int, int] = {
+            id(pair): position for position, pair in enumerate(self._pairs)
+        }
+
+        star_positions: Dict[int, List[int]] = {}
+        color_positions: Dict[str, List[int]] = {}
+        no_color_positions: List[int] = []
+        for position, (stars, color_tag) in enumerate(zip(self._stars, self._colors)):
+            star_positions.setdefault(stars, []).append(position)
+            if not color_tag:
+                no_color_positions.append(position)
+            if color_tag is not None:
+                color_positions.setdefault(_color_key(color_tag), []).append(position)
+
+        self._star_masks: Dict[int, int] = {
+            stars: _mask_from_positions(positions, self._size)
+            for stars, positions in star_positions.items()
+        }
+        self._color_masks: Dict[str, int] = {
+            key: _mask_from_positions(positions, self._size)
+            for key, positions in color_positions.items()
+        }
+        self._no_color_mask = _mask_from_positions(no_color_positions, self._size)
+        self._build_path_index()
+
+    def _build_path_index(self):
+        order = sorted(range(self._size), key=self._paths.__getitem__)
+        self._sorted_paths = [self._paths[position] for position in order]
+        self._sorted_positions = order
+        self._prefix_masks: Dict[str, int] = {}
+
+    def matches(self, file_pairs: Sequence[FilePair]) -> bool:
+        """
+        Sprawdza, czy indeks został zbudowany dla tej samej listy par.
+
+        Porównywana jest tożsamość listy, jej długość i ostatnia para
+        (pary dodane przez delty trafiają na koniec listy), a nie wszystkie
+        elementy.
+        """
+        if file_pairs is not self._source or len(file_pairs) != self._size:
+            return False
+        return self._size == 0 or file_pairs[-1] is self._pairs[-1]
+
+    def is_prefix_of(self, file_pairs: Sequence[FilePair]) -> bool:
+        """
+        Sprawdza (po długości i ostatniej parze), czy lista par to lista
+        indeksu z parami dopisanymi na końcu.
+        """
+        if len(file_pairs) < self._size:
+            return False
+        return self._size == 0 or file_pairs[self._size - 1] is self._pairs[-1]
+
+    def extend(self, file_pairs_list: Sequence[FilePair]):
+        """
+        Dopisuje pary listy leżące za ostatnią pozycją indeksu (kubełki tylko
+        dla nowych pozycji); lista staje się listą źródłową indeksu.
+        """
+        self._source = file_pairs_list
+        file_pairs = file_pairs_list[self._size :]
+        if not file_pairs:
+            return
+        offset = self._size
+        count = len(file_pairs)
+        shift = 8 * offset
+
+        star_positions: Dict[int, List[int]] = {}
+        color_positions: Dict[str, List[int]] = {}
+        no_color_positions: List[int] = []
+        for position, pair in enumerate(file_pairs):
+            stars = pair.get_stars()
+            color_tag = pair.get_color_tag()
+            self._pairs.append(pair)
+            self._stars.append(stars)
+            self._colors.append(color_tag)
+            self._paths.append(normalize_path(pair.get_archive_path()))
+            self._positions[id(pair)] = offset + position
+            star_positions.setdefault(stars, []).append(position)
+            if not color_tag:
+                no_color_positions.append(position)
+            if color_tag is not None:
+                color_positions.setdefault(_color_key(color_tag), []).append(position)
+
+        for stars, positions in star_positions.items():
+            self._star_masks[stars] = self._star_masks.get(stars, 0) | (
+                _mask_from_positions(positions, count) << shift
+            )
+        for key, positions in color_positions.items():
+            self._color_masks[key] = self._color_masks.get(key, 0) | (
+                _mask_from_positions(positions, count) << shift
+            )
+        self._no_color_mask |= _mask_from_positions(no_color_positions, count) << shift
+        self._all_mask |= int.from_bytes(b"\x01" * count, "little") << shift
+        self._size += count
+        # Indeks ścieżek jest przebudowywany przy najbliższym zapytaniu o prefiks
+        self._sorted_paths = None
+        self._prefix_masks = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    # --- Aktualizacja przyrostowa ---
+
+    def _sync(self):
+        """Uwzględnia zmiany metadanych i ścieżek od ostatniego zapytania."""
+        if self._revision == FilePair.metadata_revision:
+            return
+
+        changed_pairs = FilePair.get_changed_pairs(self._revision)
+        if changed_pairs is None:
+            # Dziennik zmian nie sięga rewizji indeksu - sprawdzamy wszystkie pary
+            positions: Iterable[int] = range(self._size)
+        else:
+            positions = {
+                self._positions[id(pair)]
+                for pair in changed_pairs
+                if id(pair) in self._positions
+            }
+
+        paths_changed = False
+        for position in positions:
+            pair = self._pairs[position]
+            stars = pair.get_stars()
+            if stars != self._stars[position]:
+                self._move_star(position, self._stars[position], stars)
+            color_tag = pair.get_color_tag()
+            if color_tag != self._colors[position]:
+                self._move_color(position, self._colors[position], color_tag)
+            archive_path = pair.get_archive_path()
+            if archive_path != self._paths[position]:
+                normalized_path = normalize_path(archive_path)
+                if normalized_path != self._paths[position]:
+                    self._paths[position] = normalized_path
+                    paths_changed = True
+
+        if paths_changed:
+            self._sorted_paths = None
+        self._revision = FilePair.metadata_revision
+
+    def _move_star(self, position: int, old_stars: int, new_stars: int):
+        bit = 1 << (8 * position)
+        self._star_masks[old_stars] &= ~bit
+        self._star_masks[new_stars] = self._star_masks.get(new_stars, 0) | bit
+        self._stars[position] = new_stars
+
+    def _move_color(
+        self, position: int, old_tag: Optional[str], new_tag: Optional[str]
+    ):
+        bit = 1 << (8 * position)
+        if old_tag is not None:
+            key = _color_key(old_tag)
+            self._color_masks[key] &= ~bit
+        if new_tag is not None:
+            key = _color_key(new_tag)
+            self._color_masks[key] = self._color_masks.get(key, 0) | bit
+        if new_tag:
+            self._no_color_mask &= ~bit
+        else:
+            self._no_color_mask |= bit
+        self._colors[position] = new_tag
+
+    # --- Zapytania ---
+
+    def _min_stars_mask(self, min_stars: int) -> int:
+        mask = 0
+        for stars, stars_mask in self._star_masks.items():
+            if stars >= min_stars:
+                mask |= stars_mask
+        return mask
+
+    def _color_mask(self, required_color_tag: str) -> int:
+        if required_color_tag == COLOR_FILTER_NONE:
+            return self._no_color_mask
+        return self._color_masks.get(_color_key(required_color_tag), 0)
+
+    def _path_prefix_mask(self, normalized_path_prefix: str) -> int:
+        if self._sorted_paths is None:
+            self._build_path_index()
+        mask = self._prefix_masks.get(normalized_path_prefix)
+        if mask is None:
+            start = bisect_left(self._sorted_paths, normalized_path_prefix)
+            end = bisect_left(
+                self._sorted_paths,
+                normalized_path_prefix + _PREFIX_RANGE_END,
+                lo=start,
+            )
+            mask = _mask_from_positions(self._sorted_positions[start:end], self._size)
+            if len(self._prefix_masks) >= _PREFIX_CACHE_SIZE:
+                self._prefix_masks.clear()
+            self._prefix_masks[normalized_path_prefix] = mask
+        return mask
+
+    def query(
+        self,
+        min_stars: int = 0,
+        required_color_tag: str = COLOR_FILTER_ALL,
+        normalized_path_prefix: Optional[str] = None,
+        start: int = 0,
+    ) -> List[FilePair]:
+        """
+        Zwraca pary spełniające kryteria, w kolejności listy źródłowej.
+
+        Args:
+            min_stars: Minimalna liczba gwiazdek (0 = brak filtra).
+            required_color_tag: Wymagany tag koloru, COLOR_FILTER_ALL
+                lub COLOR_FILTER_NONE.
+            normalized_path_prefix: Znormalizowany prefiks ścieżki archiwum.
+            start: Pierwsza sprawdzana pozycja listy (np. dopisane pary).
+
+        Returns:
+            Nowa lista pasujących par.
+        """
+        self._sync()
+
+        mask = self._all_mask
+        if normalized_path_prefix:
+            mask &= self._path_prefix_mask(normalized_path_prefix)
+        if min_stars > 0:
+            mask &= self._min_stars_mask(min_stars)
+        if required_color_tag != COLOR_FILTER_ALL:
+            mask &= self._color_mask(required_color_tag)
+
+        if start:
+            shift = 8 * start
+            mask >>= shift
+            all_mask = self._all_mask >> shift
+            pairs = self._pairs[start:]
+        else:
+            all_mask = self._all_mask
+            pairs = self._pairs
+
+        if mask == all_mask:
+            return list(pairs)
+        if not mask:
+            return []
+        return list(compress(pairs, mask.to_bytes(len(pairs), "little")))
 
-    # Przypadek: konkretny kolor - porównanie niewrażliwe na wielkość liter
-    if pair_color_tag is None:
-        return False
 
-    return pair_color_tag.strip().lower() == required_color_tag.strip().lower()
+_filter_index: Optional[FilePairFilterIndex] = None
+
+
+def get_filter_index(file_pairs_list: Sequence[FilePair]) -> FilePairFilterIndex:
+    """
+    Zwraca indeks filtrowania dla listy par, budując go przy zmianie listy.
+
+    Indeks jest przebudowywany tylko wtedy, gdy zmienił się skład listy
+    (np. po skanowaniu lub przeniesieniu plików). Zmiany metadanych par
+    są uwzględniane przyrostowo przy kolejnym zapytaniu.
+    """
+    global _filter_index
+    index = _filter_index
+    if index is None or not index.matches(file_pairs_list):
+        index = FilePairFilterIndex(file_pairs_list)
+        _filter_index = index
+        logger.debug("Zbudowano indeks filtrowania dla %d par.", len(index))
+    return index
+
+
+def clear_filter_index():
+    """
+    Zwalnia indeks filtrowania (i referencje do par poprzedniego skanowania).
+
+    Wywoływane przy czyszczeniu danych i zmianie folderu roboczego.
+    """
+    global _filter_index
+    _filter_index = None
+
+
+def filter_appended_file_pairs(
+    file_pairs_list: List[FilePair],
+    appended_count: int,
+    filter_criteria: Dict[str, Any],
+) -> List[FilePair]:
+    """
+    Filtruje tylko `appended_count` par dopisanych na końcu listy (partie
+    strumieniowego skanowania).
+
+    Indeks filtrowania poprzedniej wersji listy jest rozszerzany o nowe pary
+    zamiast budowania go od nowa, więc koszt partii zależy od jej rozmiaru.
+
+    Returns:
+        Nowa lista pasujących par spośród dopisanych.
+    """
+    start = len(file_pairs_list) - appended_count
+    if not filter_criteria:
+        return file_pairs_list[start:]
+
+    index = _filter_index
+    if index is not None and len(index) == start and index.is_prefix_of(
+        file_pairs_list
+    ):
+        index.extend(file_pairs_list)
+    else:
+        index = get_filter_index(file_pairs_list)
+
+    validated_criteria = _validate_filter_criteria(filter_criteria)
+    path_prefix = validated_criteria["path_prefix"]
+    return index.query(
+        validated_criteria["min_stars"],
+        validated_criteria["required_color_tag"],
+        normalize_path(path_prefix) if path_prefix else None,
+        start=start,
+    )
 
 
 def filter_file_pairs(
@@ -106,57 +438,36 @@ def filter_file_pairs(
         List[FilePair]: Nowa lista obiektów FilePair spełniających kryteria.
     """
     if not filter_criteria:
-        logging.debug("Brak kryteriów filtrowania, zwracam oryginał.")
+        logger.debug("Brak kryteriów filtrowania, zwracam oryginał.")
         return file_pairs_list
 
     # Walidacja kryteriów filtrowania
     validated_criteria = _validate_filter_criteria(filter_criteria)
 
-    filtered_list: List[FilePair] = []
     min_stars = validated_criteria["min_stars"]
     required_color_tag = validated_criteria["required_color_tag"]
     path_prefix = validated_criteria["path_prefix"]
-
-    # Optymalizacja: normalizacja path_prefix przed pętlą
     normalized_path_prefix = normalize_path(path_prefix) if path_prefix else None
 
-    logging.debug(f"Filter run: {len(file_pairs_list)} pairs.")
-    logging.debug(
-        f"Crit: S>={min_stars}, " f"C='{required_color_tag}', Path='{path_prefix}'"
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Filter run: %d pairs.", len(file_pairs_list))
+        logger.debug(
+            "Crit: S>=%s, C='%s', Path='%s'",
+            min_stars,
+            required_color_tag,
+            path_prefix,
+        )
+
+    filtered_list = get_filter_index(file_pairs_list).query(
+        min_stars, required_color_tag, normalized_path_prefix
     )
 
-    rejected_count = 0
-
-    for i, pair in enumerate(file_pairs_list):
-        # Wybieramy krótszą nazwę do logowania
-        fp_name = pair.get_base_name()[:20]
-
-        # Sprawdzenie warunku ścieżki (optymalizacja)
-        if normalized_path_prefix:
-            pair_path = normalize_path(pair.get_archive_path())
-            if not pair_path.startswith(normalized_path_prefix):
-                rejected_count += 1
-                continue
-
-        # Sprawdzenie warunku minimalnej liczby gwiazdek
-        pair_stars = pair.get_stars()
-        if min_stars > 0 and pair_stars < min_stars:
-            rejected_count += 1
-            continue
-
-        # Sprawdzenie warunku tagu kolorystycznego
-        pair_color_tag = pair.get_color_tag()
-        if not _check_color_match(pair_color_tag, required_color_tag):
-            rejected_count += 1
-            continue
-
-        # Logowanie tylko dla co 100. elementu lub dla małych zbiorów danych
-        if i < 10 or i % 100 == 0:
-            logging.debug(f"  P#{i}({fp_name}): PASS")
-
-        filtered_list.append(pair)
-
-    logging.debug(
-        f"Filter end. Total: {len(file_pairs_list)}, Matches: {len(filtered_list)}, Rejected: {rejected_count}"
-    )
+    if debug_enabled:
+        logger.debug(
+            "Filter end. Total: %d, Matches: %d, Rejected: %d",
+            len(file_pairs_list),
+            len(filtered_list),
+            len(file_pairs_list) - len(filtered_list),
+        )
     return filtered_list
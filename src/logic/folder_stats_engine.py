@@ -0,0 +1,242 @@
+"""
+Wspólny silnik statystyk drzewa katalogów.
+
+Jedno równoległe przejście po drzewie liczy dla każdego katalogu jego własny
+rozmiar, liczbę plików i par, a następnie agreguje je od liści w górę.
+Wcześniej każdy widoczny folder miał własny os.walk, więc liście głębokiego
+drzewa były odczytywane tyle razy, ile mają przodków.
+
+Wyniki per katalog są zapamiętywane razem z mtime katalogu - przy kolejnym
+przeliczeniu katalog, którego mtime się nie zmienił, kosztuje jeden stat.
+Nadpisanie pliku w miejscu nie zmienia mtime katalogu, więc zmiana samego
+rozmiaru istniejącego pliku jest widoczna dopiero po invalidate().
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src import app_config
+from src.logic.scanner_core import should_ignore_folder
+from src.utils.path_utils import normalize_path
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = frozenset(app_config.SUPPORTED_ARCHIVE_EXTENSIONS)
+PREVIEW_EXTENSIONS = frozenset(app_config.SUPPORTED_PREVIEW_EXTENSIONS)
+
+
+class _DirectoryRecord(NamedTuple):
+    """Zawartość pojedynczego katalogu (bez podfolderów) z chwili listowania."""
+
+    mtime_ns: int
+    size: int
+    files: int
+    pairs: int
+    subdirs: Tuple[str, ...]
+
+
+@dataclass
+class DirectoryStats:
+    """Statystyki katalogu: własne pliki oraz suma z całym poddrzewem."""
+
+    size: int = 0
+    files: int = 0
+    pairs: int = 0
+    total_size: int = 0
+    total_files: int = 0
+    total_pairs: int = 0
+
+
+def _read_directory(path: str, cached: Optional[_DirectoryRecord]) -> _DirectoryRecord:
+    """Zwraca rekord katalogu - z pamięci, gdy mtime się nie zmienił."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+
+    size = 0
+    files = 0
+    subdirs = []
+    archive_names = set()
+    preview_names = set()
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                if entry.is_file():
+                    size += entry.stat().st_size
+                    files += 1
+                    base_name, ext = os.path.splitext(entry.name.lower())
+                    if ext in ARCHIVE_EXTENSIONS:
+                        archive_names.add(base_name)
+                    elif ext in PREVIEW_EXTENSIONS:
+                        preview_names.add(base_name)
+                elif entry.is_dir(follow_symlinks=False) and not should_ignore_folder(
+                    entry.name
+                ):
+                    subdirs.append(entry.name)
+            except OSError:
+                continue
+
+    return _DirectoryRecord(
+        mtime_ns, size, files, len(archive_names & preview_names), tuple(subdirs)
+    )
+
+
+class FolderStatsEngine:
+    """
+    Liczy statystyki całego drzewa katalogów w jednym przejściu.
+
+    Bezpieczny wątkowo; współdzielona instancja (get_instance) obsługuje
+    drzewo folderów i rozmiary folderów specjalnych.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or 1
+        self._records: Dict[str, _DirectoryRecord] = {}
+        self._stats: Dict[str, DirectoryStats] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_instance(cls) -> "FolderStatsEngine":
+        """Zwraca współdzielony silnik (liczba wątków jak przy skanowaniu)."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from src.config import AppConfig
+
+                workers = AppConfig.get_instance().get("scanner_walk_workers", 1)
+                cls._instance = cls(max_workers=workers)
+            return cls._instance
+
+    def scan(
+        self,
+        root: str,
+        interrupt_check: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Dict[str, DirectoryStats]]:
+        """
+        Przelicza statystyki drzewa zaczynającego się w root.
+
+        Returns:
+            Słownik ścieżka katalogu -> DirectoryStats dla całego drzewa
+            albo None, jeśli przeliczanie zostało przerwane
+        """
+        root = normalize_path(root)
+        records = self._read_tree(root, interrupt_check)
+        if records is None:
+            return None
+
+        stats = self._aggregate(root, records)
+        with self._lock:
+            self._forget_subtree(root)
+            self._records.update(records)
+            self._stats.update(stats)
+        logger.debug(f"Statystyki drzewa {root}: {len(stats)} folderów")
+        return stats
+
+    def get_stats(self, path: str) -> Optional[DirectoryStats]:
+        """Zwraca ostatnio policzone statystyki katalogu (bez odczytu dysku)."""
+        with self._lock:
+            return self._stats.get(normalize_path(path))
+
+    def get_total_size(self, path: str) -> int:
+        """Zwraca rozmiar katalogu z podfolderami, przeliczając go inkrementalnie."""
+        stats = (self.scan(path) or {}).get(normalize_path(path))
+        return stats.total_size if stats else 0
+
+    def invalidate(self, path: str):
+        """Zapomina katalog i jego poddrzewo - następny scan odczyta je od nowa."""
+        with self._lock:
+            self._forget_subtree(normalize_path(path))
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._stats.clear()
+
+    # --- Wewnętrzne ---
+
+    def _forget_subtree(self, root: str):
+        prefix = root.rstrip("/") + "/"
+        for cache in (self._records, self._stats):
+            for path in [p for p in cache if p == root or p.startswith(prefix)]:
+                del cache[path]
+
+    def _read_tree(
+        self, root: str, interrupt_check: Optional[Callable[[], bool]]
+    ) -> Optional[Dict[str, _DirectoryRecord]]:
+        """Równolegle odczytuje rekordy wszystkich katalogów drzewa."""
+        with self._lock:
+            previous = dict(self._records)
+
+        records: Dict[str, _DirectoryRecord] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="FolderStats"
+        ) as executor:
+            pending = {}
+
+            def submit(path: str):
+                future = executor.submit(_read_directory, path, previous.get(path))
+                pending[future] = path
+
+            submit(root)
+            while pending:
+                if interrupt_check and interrupt_check():
+                    for future in pending:
+                        future.cancel()
+                    return None
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        record = future.result()
+                    except OSError as e:
+                        logger.debug(f"Pominięto folder w statystykach {path}: {e}")
+                        continue
+                    records[path] = record
+                    for name in record.subdirs:
+                        submit(normalize_path(os.path.join(path, name)))
+        return records
+
+    @staticmethod
+    def _aggregate(
+        root: str, records: Dict[str, _DirectoryRecord]
+    ) -> Dict[str, DirectoryStats]:
+        """Sumuje statystyki od liści w górę (kolejność post-order, bez rekurencji)."""
+        if root not in records:
+            return {}
+
+        order: List[str] = []
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            order.append(path)
+            for name in records[path].subdirs:
+                child = normalize_path(os.path.join(path, name))
+                if child in records:
+                    stack.append(child)
+
+        stats: Dict[str, DirectoryStats] = {}
+        for path in reversed(order):
+            record = records[path]
+            item = DirectoryStats(
+                size=record.size,
+                files=record.files,
+                pairs=record.pairs,
+                total_size=record.size,
+                total_files=record.files,
+                total_pairs=record.pairs,
+            )
+            for name in record.subdirs:
+                child = stats.get(normalize_path(os.path.join(path, name)))
+                if child is not None:
+                    item.total_size += child.total_size
+                    item.total_files += child.total_files
+                    item.total_pairs += child.total_pairs
+            stats[path] = item
+        return stats
@@ -14,7 +14,7 @@ from src.utils.path_utils import normalize_path
 
 # Import komponentów
 from .metadata_cache import MetadataCache
-from .metadata_io import MetadataIO
+from .metadata_io import JOURNAL_OP_REMOVE, JOURNAL_OP_SET, MetadataIO
 from .metadata_operations import MetadataOperations
 from .metadata_validator import MetadataValidator
 
@@ -25,6 +25,11 @@ class MetadataBufferManager:
     """
     NOWY KOMPONENT: Zarządza buforem zmian metadanych.
     Rozdzielenie odpowiedzialności z głównej klasy MetadataManager.
+
+    Bufor trzyma dwa rodzaje zmian: pełną migawkę metadanych (zapisywaną
+    przez flush callback) oraz wpisy dziennika dla pojedynczych par
+    (zapisywane przez journal callback; dla danej ścieżki liczy się
+    tylko ostatni wpis).
     """
 
     def __init__(self, save_delay: int = 500, max_buffer_age: int = 5000):
@@ -32,20 +37,34 @@ class MetadataBufferManager:
         self._max_buffer_age = max_buffer_age  # ms
         self._last_save_time = 0
         self._changes_buffer = {}
+        self._journal_buffer: Dict[str, Dict[str, Any]] = {}
         self._buffer_lock = threading.RLock()
         self._save_timer = None
         self._flush_callback: Optional[Callable] = None
+        self._journal_callback: Optional[Callable] = None
 
     def set_flush_callback(self, callback: Callable[[Dict], bool]):
         """Ustawia callback do wykonania flush operacji."""
         self._flush_callback = callback
 
+    def set_journal_callback(self, callback: Callable[[List[Dict]], bool]):
+        """Ustawia callback zapisujący wpisy dziennika zmian."""
+        self._journal_callback = callback
+
     def add_changes(self, changes: Dict[str, Any]):
         """Dodaje zmiany do bufora thread-safe."""
         with self._buffer_lock:
             self._changes_buffer.update(changes)
             self._schedule_save()
 
+    def add_journal_entry(self, key: str, entry: Dict[str, Any]):
+        """Dodaje wpis dziennika do bufora (zastępuje wcześniejszy dla klucza)."""
+        with self._buffer_lock:
+            # Przeniesienie na koniec zachowuje kolejność ostatnich zmian
+            self._journal_buffer.pop(key, None)
+            self._journal_buffer[key] = entry
+            self._schedule_save()
+
     def _schedule_save(self):
         """Planuje zapis z uwzględnieniem max_buffer_age."""
         current_time = time.time() * 1000  # ms
@@ -71,11 +90,12 @@ class MetadataBufferManager:
     def _flush_now(self):
         """Wykonuje natychmiastowy flush bufora."""
         with self._buffer_lock:
-            if not self._changes_buffer:
+            if not self._changes_buffer and not self._journal_buffer:
                 logger.debug("Buffer pusty - pomijam flush")
                 return
 
-            if self._flush_callback:
+            # Migawka przed dziennikiem - wpisy dziennika są nowsze lub równe
+            if self._changes_buffer and self._flush_callback:
                 try:
                     success = self._flush_callback(self._changes_buffer.copy())
                     if success:
@@ -85,6 +105,16 @@ class MetadataBufferManager:
                 except Exception as e:
                     logger.error(f"Błąd podczas flush bufora: {e}", exc_info=True)
 
+            if self._journal_buffer and self._journal_callback:
+                try:
+                    success = self._journal_callback(list(self._journal_buffer.values()))
+                    if success:
+                        self._journal_buffer.clear()
+                        self._last_save_time = time.time()
+                        logger.debug("Dziennik zmian został pomyślnie zapisany")
+                except Exception as e:
+                    logger.error(f"Błąd podczas zapisu dziennika: {e}", exc_info=True)
+
             if self._save_timer:
                 self._save_timer.cancel()
                 self._save_timer = None
@@ -104,6 +134,7 @@ class MetadataBufferManager:
                 self._save_timer.cancel()
                 self._save_timer = None
             self._changes_buffer.clear()
+            self._journal_buffer.clear()
 
 
 class MetadataRegistry:
@@ -211,6 +242,7 @@ class MetadataManager:
         # NOWY: Wydzielony buffer manager
         self.buffer_manager = MetadataBufferManager(save_delay=500, max_buffer_age=5000)
         self.buffer_manager.set_flush_callback(self._atomic_write_callback)
+        self.buffer_manager.set_journal_callback(self._journal_write_callback)
 
         # Thread safety
         self._operation_lock = threading.RLock()
@@ -227,6 +259,18 @@ class MetadataManager:
             logger.error(f"Błąd atomic write: {e}", exc_info=True)
             return False
 
+    def _journal_write_callback(self, entries: List[Dict[str, Any]]) -> bool:
+        """Callback dla buffer manager dopisujący zmiany pojedynczych par."""
+        try:
+            success = self.io.append_journal(entries)
+            if success:
+                self.cache.invalidate()
+                logger.debug(f"Dopisano {len(entries)} zmian do dziennika metadanych")
+            return success
+        except Exception as e:
+            logger.error(f"Błąd zapisu dziennika: {e}", exc_info=True)
+            return False
+
     @classmethod
     def get_instance(cls, working_directory: str) -> "MetadataManager":
         """
@@ -299,50 +343,21 @@ class MetadataManager:
 
     def remove_metadata_for_file(self, relative_archive_path: str) -> bool:
         """
-        OPTYMALIZACJA: Incremental update zamiast full reload.
-        Usuwa metadane dla pliku z thread-safe access.
+        Usuwa metadane dla pliku - wpis "remove" w dzienniku zmian.
+
+        Nie wczytuje ani nie kopiuje pełnych metadanych, koszt jest stały.
         """
         with self._operation_lock:
             try:
-                current_metadata = self.load_metadata()
-
-                if (
-                    "file_pairs" in current_metadata
-                    and isinstance(current_metadata.get("file_pairs"), dict)
-                    and relative_archive_path in current_metadata["file_pairs"]
-                ):
-                    # OPTYMALIZACJA: Shallow copy zamiast deep copy
-                    file_pairs_metadata = current_metadata["file_pairs"].copy()
-                    del file_pairs_metadata[relative_archive_path]
-
-                    # Użyj buffer manager
-                    changes = {
-                        "file_pairs": file_pairs_metadata,
-                        "unpaired_archives": current_metadata.get(
-                            "unpaired_archives", []
-                        ),
-                        "unpaired_previews": current_metadata.get(
-                            "unpaired_previews", []
-                        ),
-                        "has_special_folders": current_metadata.get(
-                            "has_special_folders", False
-                        ),
-                        "special_folders": current_metadata.get("special_folders", []),
-                        "timestamp": time.time(),
-                    }
-
-                    self.buffer_manager.add_changes(changes)
-
-                    logger.debug(
-                        "Zaplanowano usunięcie metadanych dla: %s",
-                        relative_archive_path,
-                    )
-                    return True
-                else:
-                    logger.debug(
-                        "Brak metadanych do usunięcia dla: %s", relative_archive_path
-                    )
-                    return True
+                self.buffer_manager.add_journal_entry(
+                    relative_archive_path,
+                    {"op": JOURNAL_OP_REMOVE, "path": relative_archive_path},
+                )
+                logger.debug(
+                    "Zaplanowano usunięcie metadanych dla: %s",
+                    relative_archive_path,
+                )
+                return True
 
             except Exception as e:
                 logger.error(
@@ -413,8 +428,10 @@ class MetadataManager:
 
     def save_file_pair_metadata(self, file_pair, working_directory: str = None) -> bool:
         """
-        OPTYMALIZACJA: Single file update przez buffer manager.
         Zapisuje metadane dla pojedynczej pary plików.
+
+        Zmiana trafia do dziennika zmian (jedna linia JSON), więc koszt
+        nie zależy od liczby par w katalogu.
         """
         with self._operation_lock:
             try:
@@ -427,25 +444,15 @@ class MetadataManager:
                     )
                     return False
 
-                # OPTYMALIZACJA: Incremental update
-                current_metadata = self.load_metadata()
-                file_pairs_metadata = current_metadata.get("file_pairs", {}).copy()
-
-                # Aktualizuj tylko tę konkretną parę
-                file_pairs_metadata[relative_archive_path] = {
-                    "stars": file_pair.get_stars(),
-                    "color_tag": file_pair.get_color_tag(),
-                }
-
-                # Użyj buffer manager
-                changes = {
-                    "file_pairs": file_pairs_metadata,
-                    "unpaired_archives": current_metadata.get("unpaired_archives", []),
-                    "unpaired_previews": current_metadata.get("unpaired_previews", []),
-                    "timestamp": time.time(),
-                }
-
-                self.buffer_manager.add_changes(changes)
+                self.buffer_manager.add_journal_entry(
+                    relative_archive_path,
+                    {
+                        "op": JOURNAL_OP_SET,
+                        "path": relative_archive_path,
+                        "stars": file_pair.get_stars(),
+                        "color_tag": file_pair.get_color_tag(),
+                    },
+                )
 
                 logger.debug(
                     f"Zaplanowano zapis metadanych dla: {relative_archive_path}"
@@ -471,6 +478,27 @@ class MetadataManager:
         """Tworzy kopię zapasową pliku metadanych."""
         return self.io.backup_metadata_file(backup_suffix)
 
+    def compact_metadata(self) -> bool:
+        """Zapisuje oczekujące zmiany i scala dziennik zmian z metadata.json."""
+        self.force_save()
+        with self._operation_lock:
+            success = self.io.compact_journal()
+            self.cache.invalidate()
+            return success
+
+    def export_metadata_json(self, export_path: str) -> bool:
+        """Eksportuje aktualne metadane do pojedynczego pliku JSON."""
+        self.force_save()
+        return self.io.export_to_json(export_path)
+
+    def import_metadata_json(self, import_path: str) -> bool:
+        """Importuje metadane z pliku JSON (format metadata.json)."""
+        self.force_save()
+        with self._operation_lock:
+            success = self.io.import_from_json(import_path)
+            self.cache.invalidate()
+            return success
+
     def cleanup(self):
         """
         NOWY: Cleanup resources.
@@ -1,6 +1,12 @@
 """
 Komponent I/O metadanych CFAB_3DHUB.
 🚀 ETAP 3: Refaktoryzacja MetadataManager - operacje I/O
+
+Metadane składają się z migawki (metadata.json, zwykły JSON czytelny dla
+starszych wersji) i dziennika zmian (metadata.journal, JSON Lines). Zmiana
+pojedynczej pary to dopisanie jednej linii do dziennika; dziennik jest
+scalany z migawką (kompaktowany) po przekroczeniu JOURNAL_COMPACT_BYTES
+oraz przy każdym pełnym zapisie migawki.
 """
 
 import json
@@ -8,7 +14,7 @@ import logging
 import os
 import shutil
 import tempfile
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 
 from filelock import FileLock, Timeout
 
@@ -20,8 +26,21 @@ from .metadata_validator import MetadataValidator
 # Stałe związane z metadanymi
 METADATA_DIR_NAME = ".app_metadata"
 METADATA_FILE_NAME = "metadata.json"
+JOURNAL_FILE_NAME = "metadata.journal"
 LOCK_FILE_NAME = "metadata.lock"
 LOCK_TIMEOUT = 0.5  # Czas oczekiwania na blokadę w sekundach
+JOURNAL_COMPACT_BYTES = 512 * 1024  # Rozmiar dziennika wymuszający kompaktowanie
+
+# Operacje dziennika zmian
+JOURNAL_OP_SET = "set"
+JOURNAL_OP_REMOVE = "remove"
+
+REQUIRED_METADATA_KEYS = (
+    "file_pairs",
+    "unpaired_archives",
+    "unpaired_previews",
+    "has_special_folders",
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +60,28 @@ class MetadataIO:
         """
         self.working_directory = normalize_path(working_directory)
         self.validator = MetadataValidator()
+        self._file_lock: Optional[FileLock] = None
+
+    def _get_lock(self) -> FileLock:
+        """
+        Zwraca blokadę pliku metadanych.
+
+        Jedna instancja na komponent - FileLock jest reentrant dla tego samego
+        obiektu, więc kompaktowanie może wywołać zapis migawki pod tą samą
+        blokadą.
+        """
+        if self._file_lock is None:
+            self._file_lock = FileLock(self.get_lock_path(), timeout=LOCK_TIMEOUT)
+        return self._file_lock
+
+    @staticmethod
+    def _default_metadata() -> Dict[str, Any]:
+        return {
+            "file_pairs": {},
+            "unpaired_archives": [],
+            "unpaired_previews": [],
+            "has_special_folders": False,
+        }
 
     def get_metadata_path(self) -> str:
         """Zwraca ścieżkę do pliku metadanych."""
@@ -52,6 +93,139 @@ class MetadataIO:
         metadata_dir = os.path.join(self.working_directory, METADATA_DIR_NAME)
         return normalize_path(os.path.join(metadata_dir, LOCK_FILE_NAME))
 
+    def get_journal_path(self) -> str:
+        """Zwraca ścieżkę do dziennika zmian metadanych."""
+        metadata_dir = os.path.join(self.working_directory, METADATA_DIR_NAME)
+        return normalize_path(os.path.join(metadata_dir, JOURNAL_FILE_NAME))
+
+    def _replay_journal(self, metadata: Dict[str, Any]) -> int:
+        """
+        Nakłada wpisy dziennika zmian na metadane (wywoływane pod blokadą).
+
+        Niekompletna ostatnia linia (przerwany zapis) jest pomijana.
+
+        Returns:
+            int: Liczba zastosowanych wpisów
+        """
+        journal_path = self.get_journal_path()
+        if not os.path.exists(journal_path):
+            return 0
+
+        file_pairs = metadata.setdefault("file_pairs", {})
+        applied = 0
+        with open(journal_path, "r", encoding="utf-8") as journal:
+            for line_number, line in enumerate(journal, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    op = entry["op"]
+                    relative_path = entry["path"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(
+                        f"Pominięto uszkodzony wpis dziennika {journal_path}:{line_number}"
+                    )
+                    continue
+
+                if op == JOURNAL_OP_SET:
+                    file_pairs[relative_path] = {
+                        "stars": entry.get("stars", 0),
+                        "color_tag": entry.get("color_tag"),
+                    }
+                elif op == JOURNAL_OP_REMOVE:
+                    file_pairs.pop(relative_path, None)
+                else:
+                    logger.warning(f"Nieznana operacja dziennika metadanych: {op}")
+                    continue
+                applied += 1
+
+        if applied:
+            logger.debug(f"Zastosowano {applied} wpisów dziennika z {journal_path}")
+        return applied
+
+    def append_journal(self, entries: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Dopisuje wpisy do dziennika zmian (koszt zależny tylko od liczby wpisów).
+
+        Args:
+            entries: Wpisy {"op": "set"|"remove", "path": ścieżka względna, ...}
+
+        Returns:
+            bool: True jeśli zapis się powiódł
+        """
+        lines = "".join(
+            json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for entry in entries
+        )
+        if not lines:
+            return True
+
+        journal_path = self.get_journal_path()
+        os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+
+        try:
+            with self._get_lock():
+                with open(journal_path, "a", encoding="utf-8") as journal:
+                    journal.write(lines)
+                    journal.flush()
+                    os.fsync(journal.fileno())
+                journal_size = os.path.getsize(journal_path)
+                logger.debug(
+                    f"Dopisano do dziennika metadanych {journal_path} "
+                    f"(rozmiar: {journal_size} bajtów)"
+                )
+                if journal_size >= JOURNAL_COMPACT_BYTES:
+                    self.compact_journal()
+                return True
+        except Timeout:
+            logger.error(
+                f"Nie można uzyskać blokady dla {self.get_lock_path()} w ciągu {LOCK_TIMEOUT}s"
+            )
+            return False
+        except Exception as e:
+            logger.error(f"Błąd zapisu dziennika metadanych: {e}", exc_info=True)
+            return False
+
+    def compact_journal(self) -> bool:
+        """
+        Scala dziennik zmian z migawką metadata.json i usuwa dziennik.
+
+        Returns:
+            bool: True jeśli kompaktowanie się powiodło (lub nie było potrzebne)
+        """
+        if not os.path.exists(self.get_journal_path()):
+            return True
+
+        metadata_path = self.get_metadata_path()
+        try:
+            with self._get_lock():
+                metadata = self._default_metadata()
+                if os.path.exists(metadata_path):
+                    # Błąd parsowania przerywa kompaktowanie - dziennik zostaje
+                    with open(metadata_path, "r", encoding="utf-8") as file:
+                        metadata = json.load(file)
+                    for key, value in self._default_metadata().items():
+                        metadata.setdefault(key, value)
+                self._replay_journal(metadata)
+                logger.info(f"Kompaktowanie dziennika metadanych: {metadata_path}")
+                return self.atomic_write(metadata)
+        except Timeout:
+            logger.error(
+                f"Nie można uzyskać blokady dla {self.get_lock_path()} w ciągu {LOCK_TIMEOUT}s"
+            )
+            return False
+        except Exception as e:
+            logger.error(f"Błąd kompaktowania dziennika metadanych: {e}", exc_info=True)
+            return False
+
+    def _remove_journal(self):
+        """Usuwa dziennik po zapisie migawki, która go zawiera."""
+        journal_path = self.get_journal_path()
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+            logger.debug(f"Usunięto scalony dziennik metadanych: {journal_path}")
+
     def load_metadata_from_file(self) -> Dict[str, Any]:
         """
         Wczytuje metadane z pliku z obsługą blokady.
@@ -62,37 +236,36 @@ class MetadataIO:
         metadata_path = self.get_metadata_path()
         lock_path = self.get_lock_path()
 
-        default_metadata = {
-            "file_pairs": {},
-            "unpaired_archives": [],
-            "unpaired_previews": [],
-            "has_special_folders": False,
-        }
+        default_metadata = self._default_metadata()
 
         logger.debug(f"Próba wczytania metadanych z: {metadata_path}")
 
-        if not os.path.exists(metadata_path):
+        if not os.path.exists(metadata_path) and not os.path.exists(
+            self.get_journal_path()
+        ):
             logger.debug(
                 f"Plik metadanych nie istnieje: {metadata_path}. Zwracam domyślne metadane."
             )
             return default_metadata
 
-        lock = FileLock(lock_path, timeout=LOCK_TIMEOUT)
-
         try:
-            with lock:
-                with open(metadata_path, "r", encoding="utf-8") as file:
-                    metadata = json.load(file)
+            with self._get_lock():
+                if os.path.exists(metadata_path):
+                    with open(metadata_path, "r", encoding="utf-8") as file:
+                        metadata = json.load(file)
 
-                logger.debug(f"Pomyślnie wczytano metadane z {metadata_path}")
+                    logger.debug(f"Pomyślnie wczytano metadane z {metadata_path}")
 
-                # Walidacja struktury
-                if not self.validator.validate_metadata_structure(metadata):
-                    logger.warning(
-                        "Struktura metadanych jest niepoprawna. Zwracam domyślne metadane."
-                    )
-                    return default_metadata
+                    # Walidacja struktury
+                    if not self.validator.validate_metadata_structure(metadata):
+                        logger.warning(
+                            "Struktura metadanych jest niepoprawna. Zwracam domyślne metadane."
+                        )
+                        return default_metadata
+                else:
+                    metadata = default_metadata
 
+                self._replay_journal(metadata)
                 return metadata
 
         except Timeout:
@@ -116,6 +289,9 @@ class MetadataIO:
         """
         Atomic write z file locking i proper error handling.
 
+        Zapisuje pełną migawkę metadanych - dziennik zmian jest po zapisie
+        usuwany, bo migawka jest pełnym, aktualnym stanem.
+
         Args:
             metadata_dict: Dictionary containing metadata to write
 
@@ -129,8 +305,6 @@ class MetadataIO:
         # Ensure directory exists
         os.makedirs(metadata_dir, exist_ok=True)
 
-        # Use file lock with shorter timeout
-        lock = FileLock(lock_path, timeout=LOCK_TIMEOUT)
         temp_file_path = None
 
         try:
@@ -142,20 +316,14 @@ class MetadataIO:
                 return False
 
             # Sprawdź czy zawiera wymagane klucze
-            required_keys = [
-                "file_pairs",
-                "unpaired_archives",
-                "unpaired_previews",
-                "has_special_folders",
-            ]
-            for key in required_keys:
+            for key in REQUIRED_METADATA_KEYS:
                 if key not in metadata_dict:
                     logger.error(
                         f"Brak wymaganego klucza '{key}' w metadanych do zapisu"
                     )
                     return False
 
-            with lock:
+            with self._get_lock():
                 logger.info(f"Uzyskano blokadę dla {lock_path}")
 
                 with tempfile.NamedTemporaryFile(
@@ -184,6 +352,7 @@ class MetadataIO:
 
                 # Sprawdź czy plik został faktycznie utworzony
                 if os.path.exists(metadata_path):
+                    self._remove_journal()
                     file_size = os.path.getsize(metadata_path)
                     logger.info(
                         f"Pomyślnie zapisano metadane do {metadata_path} (rozmiar: {file_size} bajtów)"
@@ -213,14 +382,60 @@ class MetadataIO:
                         f"Nie można usunąć tymczasowego pliku {temp_file_path}: {e}"
                     )
 
+    def export_to_json(self, export_path: str) -> bool:
+        """
+        Eksportuje pełne metadane (migawka + dziennik) do pliku JSON.
+
+        Args:
+            export_path: Ścieżka pliku docelowego
+
+        Returns:
+            bool: True jeśli eksport się powiódł
+        """
+        metadata = self.load_metadata_from_file()
+        try:
+            with open(export_path, "w", encoding="utf-8") as file:
+                json.dump(metadata, file, ensure_ascii=False, indent=2)
+            logger.info(f"Wyeksportowano metadane do {export_path}")
+            return True
+        except OSError as e:
+            logger.error(f"Błąd eksportu metadanych do {export_path}: {e}")
+            return False
+
+    def import_from_json(self, import_path: str) -> bool:
+        """
+        Importuje metadane z pliku JSON, zastępując migawkę i dziennik.
+
+        Args:
+            import_path: Ścieżka pliku w formacie metadata.json
+
+        Returns:
+            bool: True jeśli import się powiódł
+        """
+        try:
+            with open(import_path, "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Błąd odczytu metadanych z {import_path}: {e}")
+            return False
+
+        if not self.validator.validate_metadata_structure(metadata):
+            logger.error(f"Niepoprawna struktura importowanych metadanych: {import_path}")
+            return False
+
+        metadata.setdefault("has_special_folders", False)
+        return self.atomic_write(metadata)
+
     def file_exists(self) -> bool:
         """
-        Sprawdza czy plik metadanych istnieje.
+        Sprawdza czy plik metadanych (migawka lub dziennik) istnieje.
 
         Returns:
             bool: True jeśli plik istnieje
         """
-        return os.path.exists(self.get_metadata_path())
+        return os.path.exists(self.get_metadata_path()) or os.path.exists(
+            self.get_journal_path()
+        )
 
     def get_file_size(self) -> int:
         """
@@ -254,9 +469,12 @@ class MetadataIO:
             return True
 
         backup_path = metadata_path + backup_suffix
+        journal_path = self.get_journal_path()
 
         try:
             shutil.copy2(metadata_path, backup_path)
+            if os.path.exists(journal_path):
+                shutil.copy2(journal_path, journal_path + backup_suffix)
             logger.debug(f"Utworzono kopię zapasową: {backup_path}")
             return True
         except Exception as e:
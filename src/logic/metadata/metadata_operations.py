@@ -66,9 +66,11 @@ class MetadataOperations:
 
             total_files = len(file_pairs_list)
             batch_size = 50
+            # Komunikaty per para tylko przy włączonym DEBUG
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             for i, file_pair in enumerate(file_pairs_list):
-                if i % batch_size == 0:
+                if debug_enabled and i % batch_size == 0:
                     logger.debug(
                         "Przetwarzanie metadanych: %s/%s plików...",
                         i,
@@ -109,11 +111,12 @@ class MetadataOperations:
                         try:
                             stars_value = int(pair_metadata["stars"])
                             file_pair.set_stars(stars_value)
-                            logger.debug(
-                                "Ustawiono %s gwiazdek dla %s",
-                                stars_value,
-                                relative_archive_path,
-                            )
+                            if debug_enabled:
+                                logger.debug(
+                                    "Ustawiono %s gwiazdek dla %s",
+                                    stars_value,
+                                    relative_archive_path,
+                                )
                         except (ValueError, TypeError) as e:
                             logger.warning(
                                 "Invalid stars value for %s: %s - %s",
@@ -125,11 +128,12 @@ class MetadataOperations:
                     if "color_tag" in pair_metadata:
                         color_tag = pair_metadata["color_tag"]
                         file_pair.set_color_tag(color_tag)
-                        logger.debug(
-                            "Ustawiono tag koloru '%s' dla %s",
-                            color_tag,
-                            relative_archive_path,
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                "Ustawiono tag koloru '%s' dla %s",
+                                color_tag,
+                                relative_archive_path,
+                            )
 
                     applied_count += 1
 
@@ -0,0 +1,78 @@
+"""
+Różnica między dwoma wynikami skanowania tego samego folderu.
+
+Używana przy odświeżaniu na żywo (obserwator systemu plików): zamiast
+przebudowywać galerię i listy niesparowanych plików od zera, UI dostaje
+tylko dodane/usunięte pary i pliki.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+from src.models.file_pair import FilePair
+
+
+def _pair_key(pair: FilePair) -> Tuple[str, str]:
+    return pair.get_archive_path(), pair.get_preview_path() or ""
+
+
+@dataclass
+class ScanDelta:
+    """Zmiany w parach i niesparowanych plikach folderu."""
+
+    added_pairs: List[FilePair] = field(default_factory=list)
+    removed_pairs: List[FilePair] = field(default_factory=list)
+    added_unpaired_archives: List[str] = field(default_factory=list)
+    removed_unpaired_archives: List[str] = field(default_factory=list)
+    added_unpaired_previews: List[str] = field(default_factory=list)
+    removed_unpaired_previews: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_pairs
+            or self.removed_pairs
+            or self.added_unpaired_archives
+            or self.removed_unpaired_archives
+            or self.added_unpaired_previews
+            or self.removed_unpaired_previews
+        )
+
+
+def _diff_paths(old: Iterable[str], new: Iterable[str]) -> Tuple[List[str], List[str]]:
+    old_set = set(old)
+    new_set = set(new)
+    return (
+        [path for path in new if path not in old_set],
+        [path for path in old if path not in new_set],
+    )
+
+
+def compute_scan_delta(
+    old_pairs: List[FilePair],
+    old_unpaired_archives: List[str],
+    old_unpaired_previews: List[str],
+    new_pairs: List[FilePair],
+    new_unpaired_archives: List[str],
+    new_unpaired_previews: List[str],
+) -> ScanDelta:
+    """
+    Wylicza różnicę między wynikami skanowania.
+
+    Pary porównywane są po ścieżkach (archiwum, podgląd), więc para obecna
+    w obu wynikach nie trafia do delty - w stanie aplikacji zostaje stary
+    obiekt FilePair razem z jego metadanymi (gwiazdki, kolor).
+    """
+    old_keys = {_pair_key(pair) for pair in old_pairs}
+    new_keys = {_pair_key(pair) for pair in new_pairs}
+
+    delta = ScanDelta(
+        added_pairs=[pair for pair in new_pairs if _pair_key(pair) not in old_keys],
+        removed_pairs=[pair for pair in old_pairs if _pair_key(pair) not in new_keys],
+    )
+    delta.added_unpaired_archives, delta.removed_unpaired_archives = _diff_paths(
+        old_unpaired_archives, new_unpaired_archives
+    )
+    delta.added_unpaired_previews, delta.removed_unpaired_previews = _diff_paths(
+        old_unpaired_previews, new_unpaired_previews
+    )
+    return delta
@@ -12,17 +12,19 @@ UWAGA: Ten moduł jest fasadą publicznego API. Implementacja podzielona na:
 
 import logging
 from functools import wraps
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.logic.file_pairing import ARCHIVE_EXTENSIONS, PREVIEW_EXTENSIONS
 from src.logic.file_pairing import create_file_pairs as _create_file_pairs
 from src.logic.file_pairing import identify_unpaired_files as _identify_unpaired_files
+from src.logic.scanner_cache import cache as _cache
 from src.logic.scanner_cache import clear_cache as _clear_cache
 from src.logic.scanner_core import ScanningInterrupted
 from src.logic.scanner_core import collect_files_streaming as _collect_files_streaming
 from src.logic.scanner_core import get_scan_statistics as _get_scan_statistics
 from src.logic.scanner_core import scan_folder_for_pairs as _scan_folder_for_pairs
 from src.models.file_pair import FilePair
+from src.models.file_record import FileRecord
 
 __all__ = [
     "collect_files_streaming",
@@ -32,6 +34,8 @@ __all__ = [
     "scan_folder_for_pairs",
     "clear_cache",
     "get_scan_statistics",
+    "get_file_records",
+    "get_snapshot_record_directories",
     "ARCHIVE_EXTENSIONS",
     "PREVIEW_EXTENSIONS",
     "ScanningInterrupted",
@@ -67,6 +71,7 @@ def collect_files_streaming(
     interrupt_check: Optional[Callable[[], bool]] = None,
     force_refresh: bool = False,
     progress_callback: Optional[Callable[[int, str], None]] = None,
+    file_records: Optional[Dict[str, FileRecord]] = None,
 ) -> Dict[str, List[str]]:
     """
     Zbiera wszystkie pliki w katalogu z streaming progress.
@@ -77,6 +82,7 @@ def collect_files_streaming(
         interrupt_check: Funkcja sprawdzająca czy przerwać skanowanie
         force_refresh: Czy wymusić odświeżenie cache
         progress_callback: Callback dla raportowania postępu
+        file_records: Opcjonalny słownik uzupełniany rekordami plików (stat)
 
     Returns:
         Dict[str, List[str]]: Mapa rozszerzeń na listy plików
@@ -91,6 +97,7 @@ def collect_files_streaming(
         interrupt_check=interrupt_check,
         force_refresh=force_refresh,
         progress_callback=progress_callback,
+        file_records=file_records,
     )
 
 
@@ -103,6 +110,7 @@ def create_file_pairs(
     file_map: Dict[str, List[str]],
     base_directory: str,
     pair_strategy: str = "first_match",
+    file_records: Optional[Dict[str, FileRecord]] = None,
 ) -> Tuple[List[FilePair], Set[str]]:
     """
     Tworzy pary plików na podstawie zebranych danych.
@@ -111,6 +119,7 @@ def create_file_pairs(
         file_map: Mapa rozszerzeń na listy plików
         base_directory: Bazowy katalog dla par
         pair_strategy: Strategia parowania ("first_match", "best_match")
+        file_records: Opcjonalne rekordy plików (mtime i rozmiary bez stat)
 
     Returns:
         Tuple[List[FilePair], Set[str]]: Pary plików i zestaw przetworzonych plików
@@ -122,6 +131,7 @@ def create_file_pairs(
         file_map=file_map,
         base_directory=base_directory,
         pair_strategy=pair_strategy,
+        file_records=file_records,
     )
 
 
@@ -197,3 +207,24 @@ def get_scan_statistics() -> Dict[str, float]:
     Zwraca statystyki dotyczące bieżącego stanu cache.
     """
     return _get_scan_statistics()
+
+
+def get_file_records(directory: str) -> Dict[str, FileRecord]:
+    """
+    Zwraca rekordy plików (ścieżka -> FileRecord) z ostatniego skanowania katalogu.
+
+    Rekordy plików z katalogów odczytanych ze snapshotu pochodzą z ostatniego
+    listowania katalogu (patrz get_snapshot_record_directories).
+    """
+    return _cache.get_file_records(directory) or {}
+
+
+def get_snapshot_record_directories(directory: str) -> FrozenSet[str]:
+    """
+    Zwraca katalogi, których rekordy plików pochodzą ze snapshotu.
+
+    Nadpisanie pliku nie zmienia mtime katalogu, więc mtime takich rekordów
+    może być nieaktualny - nie nadają się do unieważniania cache zależnych
+    od zawartości pliku (np. miniatur).
+    """
+    return _cache.get_snapshot_record_directories(directory)
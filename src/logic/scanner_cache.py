@@ -5,16 +5,21 @@ Ten moduł zawiera implementację thread-safe cache dla wyników skanowania
 folderów i parowania plików.
 """
 
+import hashlib
+import json
 import logging
 import os
+import tempfile
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from threading import RLock
-from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import Dict, FrozenSet, Generic, List, Optional, Set, Tuple, TypeVar
 
 from src import app_config
+from src.config import AppConfig
 from src.models.file_pair import FilePair
+from src.models.file_record import FileRecord
 from src.models.special_folder import SpecialFolder
 from src.utils.path_utils import normalize_path
 
@@ -25,6 +30,14 @@ logger = logging.getLogger(__name__)
 MAX_CACHE_ENTRIES = app_config.SCANNER_MAX_CACHE_ENTRIES
 MAX_CACHE_AGE_SECONDS = app_config.SCANNER_MAX_CACHE_AGE_SECONDS
 
+# Trwały snapshot katalogów (per folder roboczy, w katalogu danych aplikacji)
+SNAPSHOT_DIR_NAME = "scan_snapshots"
+SNAPSHOT_FILE_SUFFIX = ".json"
+SNAPSHOT_FORMAT_VERSION = 2
+# Katalogi zmodyfikowane w tym oknie przed listowaniem nie są zaufane
+# (granulacja mtime systemu plików) - zostaną wylistowane ponownie
+SNAPSHOT_RACY_WINDOW_NS = 2_000_000_000
+
 K = TypeVar("K")
 V = TypeVar("V")
 
@@ -101,6 +114,200 @@ def get_directory_modification_time(directory: str) -> float:
     return max_mtime
 
 
+def get_snapshot_dir() -> str:
+    """Domyślny katalog snapshotów katalogów."""
+    return os.path.join(AppConfig.get_instance().get_app_data_dir(), SNAPSHOT_DIR_NAME)
+
+
+@dataclass
+class DirectorySnapshotEntry:
+    """Zawartość pojedynczego katalogu zapamiętana w snapshocie."""
+
+    mtime_ns: int
+    files: List[str]  # nazwy plików archiwów i podglądów
+    subdirs: List[str]  # nazwy podfolderów (bez ignorowanych)
+    file_count: int  # liczba wszystkich plików w katalogu
+    # (rozmiar, mtime) plików z `files` z chwili listowania; zapisywane
+    # w snapshocie, ale mogą być nieaktualne (nadpisanie pliku nie zmienia
+    # mtime katalogu) - wystarczają do statystyk rozmiaru
+    file_stats: Optional[List[Tuple[int, float]]] = None
+
+
+class DirectorySnapshot:
+    """
+    Trwały snapshot drzewa katalogów: per katalog (mtime, wpisy).
+
+    Pozwala na inkrementalne skanowanie - katalog, którego mtime nie zmienił
+    się od ostatniego skanowania, nie jest ponownie listowany (wystarczy
+    jeden stat). Snapshot jest zapisywany w katalogu danych aplikacji, w pliku
+    nazwanym skrótem ścieżki folderu roboczego - skanowane foldery nie są
+    modyfikowane.
+    """
+
+    def __init__(self, root_directory: str):
+        self.root_directory = normalize_path(root_directory)
+        self._root_prefix = (
+            self.root_directory
+            if self.root_directory.endswith("/")
+            else self.root_directory + "/"
+        )
+        self._entries: Dict[str, DirectorySnapshotEntry] = {}
+        self._lock = RLock()
+        self._dirty = False
+        self.load()
+
+    def get_snapshot_path(self) -> str:
+        """Zwraca ścieżkę do pliku snapshotu."""
+        root_hash = hashlib.sha1(self.root_directory.encode("utf-8")).hexdigest()
+        return normalize_path(
+            os.path.join(get_snapshot_dir(), root_hash + SNAPSHOT_FILE_SUFFIX)
+        )
+
+    def _relative_key(self, directory: str) -> str:
+        normalized = normalize_path(directory)
+        if normalized == self.root_directory:
+            return "."
+        if normalized.startswith(self._root_prefix):
+            return normalized[len(self._root_prefix) :]
+        return normalized
+
+    def get(self, directory: str, mtime_ns: int) -> Optional[DirectorySnapshotEntry]:
+        """Zwraca wpis katalogu jeśli jest aktualny dla podanego mtime."""
+        with self._lock:
+            entry = self._entries.get(self._relative_key(directory))
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry
+        return None
+
+    def get_any(self, directory: str) -> Optional[DirectorySnapshotEntry]:
+        """Zwraca wpis katalogu bez sprawdzania aktualności."""
+        with self._lock:
+            return self._entries.get(self._relative_key(directory))
+
+    def set(self, directory: str, entry: DirectorySnapshotEntry):
+        """Zapisuje wpis katalogu."""
+        mtime_ns = entry.mtime_ns
+        if time.time_ns() - mtime_ns < SNAPSHOT_RACY_WINDOW_NS:
+            # Katalog mógł zmienić się w tym samym "ticku" mtime - nie ufamy mu
+            mtime_ns = -1
+        entry = DirectorySnapshotEntry(
+            mtime_ns, entry.files, entry.subdirs, entry.file_count, entry.file_stats
+        )
+        with self._lock:
+            self._entries[self._relative_key(directory)] = entry
+            self._dirty = True
+
+    def get_directories(self, max_depth: int = -1) -> List[str]:
+        """
+        Zwraca katalogi drzewa, które odwiedza skanowanie o podanej głębokości.
+
+        Podfoldery katalogu bez plików są pomijane - tak samo jak w
+        collect_files_streaming.
+        """
+        directories = []
+        with self._lock:
+            stack = [(".", 0)]
+            while stack:
+                key, depth = stack.pop()
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                directories.append(
+                    self.root_directory if key == "." else self._root_prefix + key
+                )
+                if entry.file_count == 0 or (0 <= max_depth <= depth):
+                    continue
+                for name in entry.subdirs:
+                    child = name if key == "." else f"{key}/{name}"
+                    stack.append((child, depth + 1))
+        return directories
+
+    def prune(self, visited_directories: Set[str]):
+        """Usuwa wpisy katalogów, których nie ma już w drzewie."""
+        visited_keys = {self._relative_key(d) for d in visited_directories}
+        with self._lock:
+            stale_keys = [k for k in self._entries if k not in visited_keys]
+            for key in stale_keys:
+                del self._entries[key]
+            if stale_keys:
+                self._dirty = True
+
+    def load(self):
+        """Wczytuje snapshot z pliku."""
+        snapshot_path = self.get_snapshot_path()
+        if not os.path.exists(snapshot_path):
+            return
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SNAPSHOT_FORMAT_VERSION:
+                logger.debug(f"Pomijam snapshot w nieobsługiwanej wersji: {snapshot_path}")
+                return
+            if data.get("root") != self.root_directory:
+                logger.debug(f"Pomijam snapshot innego folderu: {snapshot_path}")
+                return
+            entries = {
+                key: DirectorySnapshotEntry(*value)
+                for key, value in data.get("directories", {}).items()
+            }
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Nie można wczytać snapshotu katalogów {snapshot_path}: {e}")
+            return
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+        logger.debug(f"Wczytano snapshot {len(entries)} katalogów z {snapshot_path}")
+
+    def save(self) -> bool:
+        """Atomowo zapisuje snapshot (tylko jeśli się zmienił)."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            payload = {
+                "version": SNAPSHOT_FORMAT_VERSION,
+                "root": self.root_directory,
+                "directories": {
+                    key: [e.mtime_ns, e.files, e.subdirs, e.file_count, e.file_stats]
+                    for key, e in self._entries.items()
+                },
+            }
+            self._dirty = False
+
+        snapshot_path = self.get_snapshot_path()
+        snapshot_dir = os.path.dirname(snapshot_path)
+        temp_path = None
+        try:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                delete=False,
+                encoding="utf-8",
+                dir=snapshot_dir,
+                suffix=".tmp",
+                prefix="scan_snapshot_",
+            ) as temp_file:
+                json.dump(payload, temp_file, ensure_ascii=False, separators=(",", ":"))
+                temp_path = temp_file.name
+            os.replace(temp_path, snapshot_path)
+            temp_path = None
+            return True
+        except OSError as e:
+            # Np. brak miejsca na dysku - snapshot jest tylko optymalizacją
+            logger.warning(f"Nie można zapisać snapshotu katalogów {snapshot_path}: {e}")
+            with self._lock:
+                self._dirty = True
+            return False
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class Cache(Generic[K, V]):
     """Prosty cache LRU (Least Recently Used) z limitem czasowym."""
 
@@ -134,6 +341,12 @@ class Cache(Generic[K, V]):
             self.cache_hits += 1
             return value
 
+    def peek(self, key: K) -> Optional[V]:
+        """Pobiera wartość bez sprawdzania wieku i bez liczenia statystyk."""
+        with self.lock:
+            item = self.cache.get(key)
+            return item[1] if item is not None else None
+
     def set(self, key: K, value: V):
         """Ustawia wartość w cache, usuwając najstarszy wpis, jeśli to konieczne."""
         with self.lock:
@@ -167,6 +380,15 @@ class ThreadSafeCache:
                     cls._instance.scan_result_cache = Cache(
                         max_entries=MAX_CACHE_ENTRIES
                     )
+                    # Baza dla inkrementalnego łatania wyników (file_map + wynik)
+                    cls._instance.incremental_base_cache = Cache(
+                        max_entries=MAX_CACHE_ENTRIES
+                    )
+                    # Rekordy plików (rozmiar, mtime) zebrane razem z mapą plików
+                    cls._instance.file_records_cache = Cache(
+                        max_entries=MAX_CACHE_ENTRIES
+                    )
+                    cls._instance.snapshots = {}
         return cls._instance
 
     def _get_cache_key(self, directory: str, strategy: Optional[str] = None) -> str:
@@ -186,6 +408,34 @@ class ThreadSafeCache:
         key = self._get_cache_key(directory)
         self.file_map_cache.set(key, file_map)
 
+    def get_file_records(self, directory: str) -> Optional[Dict[str, FileRecord]]:
+        """Pobiera rekordy plików (ścieżka -> FileRecord) z ostatniego zbierania."""
+        key = self._get_cache_key(directory)
+        return self.file_records_cache.get(key)
+
+    def set_file_records(
+        self,
+        directory: str,
+        file_records: Dict[str, FileRecord],
+        snapshot_directories: FrozenSet[str] = frozenset(),
+    ):
+        """
+        Zapisuje rekordy plików zebrane razem z mapą plików.
+
+        Args:
+            snapshot_directories: Katalogi, których rekordy pochodzą ze
+                snapshotu (bez listowania - stat plików może być nieaktualny)
+        """
+        self.file_records_cache.set(self._get_cache_key(directory), file_records)
+        self.file_records_cache.set(
+            self._get_cache_key(directory, "snapshot_dirs"), snapshot_directories
+        )
+
+    def get_snapshot_record_directories(self, directory: str) -> FrozenSet[str]:
+        """Zwraca katalogi, których rekordy plików pochodzą ze snapshotu."""
+        key = self._get_cache_key(directory, "snapshot_dirs")
+        return self.file_records_cache.get(key) or frozenset()
+
     def get_scan_result(
         self, directory: str, strategy: str
     ) -> Optional[Tuple[List[FilePair], List[str], List[str], List[SpecialFolder]]]:
@@ -203,10 +453,46 @@ class ThreadSafeCache:
         key = self._get_cache_key(directory, strategy)
         self.scan_result_cache.set(key, result)
 
+    def get_directory_snapshot(self, root_directory: str) -> DirectorySnapshot:
+        """Pobiera (i w razie potrzeby wczytuje z dysku) snapshot katalogów."""
+        key = self._get_cache_key(root_directory)
+        with self._lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is None:
+                snapshot = DirectorySnapshot(key)
+                self.snapshots[key] = snapshot
+            return snapshot
+
+    def get_incremental_base(
+        self, directory: str, strategy: str, max_depth: int
+    ) -> Optional[Tuple[Dict[str, List[str]], Tuple]]:
+        """Pobiera poprzednią mapę plików i wynik skanowania (bez limitu wieku)."""
+        key = self._get_cache_key(directory, f"{strategy}@{max_depth}")
+        return self.incremental_base_cache.peek(key)
+
+    def set_incremental_base(
+        self,
+        directory: str,
+        strategy: str,
+        max_depth: int,
+        file_map: Dict[str, List[str]],
+        result: Tuple,
+    ):
+        """Zapamiętuje mapę plików i wynik jako bazę do inkrementalnego łatania."""
+        key = self._get_cache_key(directory, f"{strategy}@{max_depth}")
+        self.incremental_base_cache.set(key, (file_map, result))
+
     def clear(self):
-        """Czyści cały cache."""
+        """
+        Czyści cały cache.
+
+        Snapshoty katalogów i baza inkrementalna są zachowywane - są walidowane
+        przez mtime katalogów i porównanie mapy plików, więc kolejne skanowanie
+        nadal listuje tylko zmienione katalogi.
+        """
         with self._lock:
             self.file_map_cache.clear()
+            self.file_records_cache.clear()
             self.scan_result_cache.clear()
         logger.info("Wyczyszczono cache skanowania")
 
@@ -217,6 +503,10 @@ class ThreadSafeCache:
             if normalized_dir in self.file_map_cache.cache:
                 del self.file_map_cache.cache[normalized_dir]
                 logger.debug(f"Usunięto wpis cache: {directory}")
+            self.file_records_cache.cache.pop(normalized_dir, None)
+            self.file_records_cache.cache.pop(
+                self._get_cache_key(normalized_dir, "snapshot_dirs"), None
+            )
             if normalized_dir in self.scan_result_cache.cache:
                 del self.scan_result_cache.cache[normalized_dir]
                 logger.debug(f"Usunięto wpis cache: {directory}")
@@ -229,6 +519,9 @@ class ThreadSafeCache:
         self._cleanup_cache_by_age_and_size(
             self.file_map_cache, current_time, "file_map"
         )
+        self._cleanup_cache_by_age_and_size(
+            self.file_records_cache, current_time, "file_records"
+        )
         
         # Pojedyncze przejście dla scan_result_cache
         self._cleanup_cache_by_age_and_size(
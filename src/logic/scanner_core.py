@@ -7,8 +7,10 @@ oraz koordynowania procesu skanowania.
 
 import logging
 import os
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional, Tuple
 
 from src import app_config
@@ -16,12 +18,15 @@ from src.config import AppConfig
 from src.logic.file_pairing import (
     ARCHIVE_EXTENSIONS,
     PREVIEW_EXTENSIONS,
+    apply_file_records,
     create_file_pairs,
     identify_unpaired_files,
+    pair_across_folders,
 )
 from src.logic.metadata_manager import MetadataManager
-from src.logic.scanner_cache import cache
+from src.logic.scanner_cache import DirectorySnapshot, DirectorySnapshotEntry, cache
 from src.models.file_pair import FilePair
+from src.models.file_record import FileRecord, create_file_record, get_extension_id
 from src.models.special_folder import SpecialFolder
 from src.utils.path_utils import normalize_path, path_exists
 
@@ -63,12 +68,193 @@ class ScanningInterrupted(Exception):
     pass
 
 
+def _get_directory_identity(directory: str, dir_stat: os.stat_result):
+    """
+    Zwraca identyfikator katalogu do wykrywania pętli symlinków.
+
+    Używa (st_dev, st_ino) z już wykonanego stat - bez dodatkowych wywołań
+    systemowych. Fallback na realpath gdy system plików nie podaje inode.
+    """
+    if dir_stat.st_ino:
+        return (dir_stat.st_dev, dir_stat.st_ino)
+    return os.path.realpath(directory)
+
+
+def _list_directory(
+    current_dir: str,
+    mtime_ns: int,
+    interrupt_check: Optional[Callable[[], bool]] = None,
+) -> DirectorySnapshotEntry:
+    """
+    Listuje zawartość pojedynczego katalogu (jedno wywołanie scandir).
+
+    Returns:
+        Wpis snapshotu z nazwami pasujących plików i podfolderów
+
+    Raises:
+        ScanningInterrupted: Jeśli skanowanie zostało przerwane
+    """
+    with os.scandir(current_dir) as iterator:
+        entries = list(iterator)
+
+    # Sprawdzenie przerwania po liście folderów
+    if interrupt_check and interrupt_check():
+        logger.warning("Skanowanie przerwane podczas odczytu zawartości folderu")
+        raise ScanningInterrupted(
+            "Skanowanie przerwane podczas odczytu zawartości folderu"
+        )
+
+    files = []
+    file_stats = []
+    subdirs = []
+    file_count = 0
+    for entry in entries:
+        if entry.is_file():
+            file_count += 1
+
+            # Sprawdzenie co 10 plików w folderze
+            if file_count % 10 == 0 and interrupt_check and interrupt_check():
+                msg = (
+                    "Skanowanie przerwane podczas przetwarzania "
+                    f"plików w {current_dir}"
+                )
+                logger.warning(msg)
+                raise ScanningInterrupted(msg)
+
+            ext_lower = os.path.splitext(entry.name)[1].lower()
+            if ext_lower in ARCHIVE_EXTENSIONS or ext_lower in PREVIEW_EXTENSIONS:
+                files.append(entry.name)
+                # DirEntry buforuje stat (na Windows pochodzi z samego listowania)
+                try:
+                    entry_stat = entry.stat()
+                    file_stats.append((entry_stat.st_size, entry_stat.st_mtime))
+                except OSError:
+                    file_stats.append(None)
+        elif entry.is_dir():
+            # Ignoruj ukryte foldery i foldery systemowe
+            if should_ignore_folder(entry.name):
+                logger.debug("Pomijam ignorowany folder: %s", entry.name)
+                continue
+            subdirs.append(entry.name)
+
+    return DirectorySnapshotEntry(mtime_ns, files, subdirs, file_count, file_stats)
+
+
+def _read_directory(
+    current_dir: str,
+    snapshot: Optional[DirectorySnapshot],
+    interrupt_check: Optional[Callable[[], bool]] = None,
+) -> Tuple[os.stat_result, DirectorySnapshotEntry, bool]:
+    """
+    Odczytuje katalog: stat + snapshot lub scandir gdy mtime się zmienił.
+
+    Bezpieczne do wywołania z wątków roboczych (snapshot ma własny lock).
+
+    Returns:
+        Krotka (stat katalogu, wpis z zawartością, czy katalog był listowany)
+    """
+    dir_stat = os.stat(current_dir)
+    listing = (
+        snapshot.get(current_dir, dir_stat.st_mtime_ns)
+        if snapshot is not None
+        else None
+    )
+    if listing is not None:
+        return dir_stat, listing, False
+
+    listing = _list_directory(current_dir, dir_stat.st_mtime_ns, interrupt_check)
+    if snapshot is not None:
+        snapshot.set(current_dir, listing)
+    return dir_stat, listing, True
+
+
+class _DirectoryPrefetcher:
+    """
+    Równoległe listowanie drzewa katalogów pulą wątków.
+
+    Na udziałach sieciowych (SMB/NFS) każdy scandir to osobny round trip,
+    więc listowanie wielu katalogów naraz skraca skanowanie. Po odczycie
+    katalogu jego podfoldery są od razu zlecane puli (callback zakończenia
+    zadania), a sekwencyjny walker odbiera wyniki przez take() w swojej
+    kolejności - czeka tylko na katalog, który właśnie przetwarza, więc
+    pliki i pary są przekazywane dalej w trakcie listowania reszty drzewa.
+
+    Pętle symlinków są wykrywane po identyfikatorach przodków danej ścieżki,
+    dzięki czemu planowanie nie zależy od kolejności zakończenia zadań -
+    właściwy file_map (z visited_dirs) składa walker.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        max_depth: int,
+        snapshot: Optional[DirectorySnapshot],
+        interrupt_check: Optional[Callable[[], bool]] = None,
+    ):
+        self._executor = executor
+        self._max_depth = max_depth
+        self._snapshot = snapshot
+        self._interrupt_check = interrupt_check
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, path: str, depth: int = 0, ancestors: frozenset = frozenset()):
+        """Zleca odczyt katalogu (i po nim - jego podfolderów)."""
+        with self._lock:
+            if self._closed or path in self._futures:
+                return
+            future = self._executor.submit(
+                _read_directory, path, self._snapshot, self._interrupt_check
+            )
+            self._futures[path] = future
+        future.add_done_callback(
+            lambda done: self._submit_subdirs(path, depth, ancestors, done)
+        )
+
+    def take(self, path: str) -> Optional[Future]:
+        """Zwraca zadanie odczytu katalogu albo None, jeśli nie był zlecony."""
+        with self._lock:
+            return self._futures.pop(path, None)
+
+    def close(self):
+        """Anuluje niepobrane zadania; kolejne podfoldery nie są zlecane."""
+        with self._lock:
+            self._closed = True
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            future.cancel()
+
+    def _submit_subdirs(
+        self, current_dir: str, depth: int, ancestors: frozenset, future: Future
+    ):
+        if future.cancelled() or future.exception() is not None:
+            return  # Błąd dostępu zgłosi walker przy odbiorze wyniku
+        dir_stat, listing, _ = future.result()
+        dir_identity = _get_directory_identity(current_dir, dir_stat)
+        if dir_identity in ancestors:
+            return  # Pętla - zgłosi ją walker
+        if listing.file_count == 0:
+            return
+        if self._max_depth >= 0 and depth + 1 > self._max_depth:
+            return
+
+        child_ancestors = ancestors | {dir_identity}
+        for name in listing.subdirs:
+            self.submit(os.path.join(current_dir, name), depth + 1, child_ancestors)
+
+
 def collect_files_streaming(
     directory: str,
     max_depth: int = -1,
     interrupt_check: Optional[Callable[[], bool]] = None,
     force_refresh: bool = False,
     progress_callback: Optional[Callable[[int, str], None]] = None,
+    file_records: Optional[Dict[str, FileRecord]] = None,
+    directory_callback: Optional[
+        Callable[[Dict[str, List[str]], Dict[str, FileRecord]], None]
+    ] = None,
 ) -> Dict[str, List[str]]:
     """
     Zbiera wszystkie pliki w katalogu z streaming progress.
@@ -79,6 +265,12 @@ def collect_files_streaming(
         interrupt_check: Opcjonalna funkcja sprawdzająca czy przerwać skanowanie
         force_refresh: Czy wymusić odświeżenie cache (ignoruje cache)
         progress_callback: Opcjonalna funkcja do raportowania postępu (procent, wiadomość)
+        file_records: Opcjonalny słownik uzupełniany rekordami plików
+            (rozmiar, mtime). Rekordy plików z katalogów odczytanych ze
+            snapshotu pochodzą z ostatniego listowania katalogu.
+        directory_callback: Opcjonalna funkcja wywoływana po odczycie każdego
+            katalogu z fragmentem mapy plików tego katalogu i zebranymi dotąd
+            rekordami plików. Przy trafieniu w cache wywoływana raz z całą mapą.
 
     Returns:
         Słownik zmapowanych plików, gdzie kluczem jest nazwa bazowa (bez rozszerzenia),
@@ -92,10 +284,18 @@ def collect_files_streaming(
     # Sprawdź cache
     if not force_refresh:
         cached_file_map = cache.get_file_map(normalized_dir)
+        if cached_file_map is not None and file_records is not None:
+            cached_records = cache.get_file_records(normalized_dir)
+            if cached_records is None:
+                cached_file_map = None  # Brak rekordów - przeskanuj ponownie
+            else:
+                file_records.update(cached_records)
         if cached_file_map is not None:
             logger.debug(f"CACHE HIT: używam buforowanych plików dla {normalized_dir}")
             if progress_callback:
                 progress_callback(100, f"Używam cache dla {normalized_dir}")
+            if directory_callback:
+                directory_callback(cached_file_map, file_records or {})
             return cached_file_map
 
     # Jeśli katalog nie istnieje lub nie jest katalogiem, zwróć pusty słownik
@@ -110,28 +310,48 @@ def collect_files_streaming(
         progress_callback(0, f"Rozpoczynam streaming skanowanie: {normalized_dir}")
 
     file_map = defaultdict(list)
+    collected_records: Dict[str, FileRecord] = {}
+    # Katalogi odczytane ze snapshotu - ich rekordy mogą być nieaktualne
+    snapshot_record_dirs = set()
     total_folders_scanned = 0
     total_files_found = 0
+    folders_listed = 0
     start_time = time.time()
 
+    # Snapshot katalogów - niezmienione katalogi nie są ponownie listowane
+    snapshot = (
+        cache.get_directory_snapshot(normalized_dir)
+        if AppConfig.get_instance().get("scanner_use_directory_snapshot", True)
+        else None
+    )
+    visited_paths = set()
+
+    # Równoległe listowanie katalogów (istotne na udziałach sieciowych)
+    walk_workers = AppConfig.get_instance().get("scanner_walk_workers", 1)
+    executor = None
+    prefetcher = None
+    if walk_workers > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=walk_workers, thread_name_prefix="ScannerWalker"
+        )
+        prefetcher = _DirectoryPrefetcher(
+            executor, max_depth, snapshot, interrupt_check
+        )
+        prefetcher.submit(normalized_dir)
+
     # Zestaw odwiedzonych katalogów (do obsługi pętli symbolicznych)
     visited_dirs = set()
+    # Komunikaty per katalog są budowane tylko przy włączonym DEBUG
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     def _walk_directory_streaming(current_dir: str, depth: int = 0):
-        nonlocal total_folders_scanned, total_files_found
+        nonlocal total_folders_scanned, total_files_found, folders_listed
 
         # Sprawdzenie czy należy przerwać skanowanie
         if interrupt_check and interrupt_check():
             logger.warning("Skanowanie przerwane przez użytkownika")
             raise ScanningInterrupted("Skanowanie przerwane przez użytkownika")
 
-        # Sprawdzanie co każde 50 plików dla responsywności
-        if total_files_found % 50 == 0 and interrupt_check and interrupt_check():
-            logger.warning(
-                "Skanowanie przerwane przez użytkownika podczas " "przetwarzania plików"
-            )
-            raise ScanningInterrupted("Skanowanie przerwane przez użytkownika")
-
         # Obsługa limitu głębokości
         if max_depth >= 0 and depth > max_depth:
             return
@@ -147,95 +367,80 @@ def collect_files_streaming(
                 f"({total_files_found} plików, {total_folders_scanned} folderów)",
             )
 
-        # Zabezpieczenie przed zapętleniem (symlinki)
-        normalized_current = os.path.realpath(current_dir)
-        if normalized_current in visited_dirs:
-            logger.warning(f"Wykryto pętlę w katalogach: {normalized_current}")
-            return
-        visited_dirs.add(normalized_current)
-
-        # Skanowanie folderu
         try:
-            total_folders_scanned += 1
-            entries = list(os.scandir(current_dir))
+            future = prefetcher.take(current_dir) if prefetcher is not None else None
+            if future is not None:
+                # Czeka tylko na ten katalog - reszta drzewa listuje się dalej
+                record = future.result()
+            else:
+                record = _read_directory(current_dir, snapshot, interrupt_check)
+            dir_stat, listing, listed = record
 
-            # Sprawdzenie przerwania po liście folderów
-            if interrupt_check and interrupt_check():
-                logger.warning(
-                    "Skanowanie przerwane podczas odczytu zawartości folderu"
-                )
-                raise ScanningInterrupted(
-                    "Skanowanie przerwane podczas odczytu zawartości folderu"
-                )
+            # Zabezpieczenie przed zapętleniem (symlinki)
+            dir_identity = _get_directory_identity(current_dir, dir_stat)
+            if dir_identity in visited_dirs:
+                logger.warning(f"Wykryto pętlę w katalogach: {current_dir}")
+                return
+            visited_dirs.add(dir_identity)
 
-            # Najpierw przetwarzamy pliki
-            files_processed_in_folder = 0
-            for entry in entries:
-                if entry.is_file():
-                    total_files_found += 1
-                    files_processed_in_folder += 1
+            # Skanowanie folderu (lub odczyt ze snapshotu gdy mtime bez zmian)
+            total_folders_scanned += 1
+            if listed:
+                folders_listed += 1
+            visited_paths.add(current_dir)
+
+            total_files_found += listing.file_count
+            normalized_current = normalize_path(current_dir)
+            # Stat ze snapshotu może być nieaktualny (nadpisanie pliku nie
+            # zmienia mtime katalogu) - wystarcza do rozmiarów, ale katalog
+            # jest oznaczany dla konsumentów wymagających aktualnego mtime
+            file_stats = listing.file_stats
+            if not listed and file_stats:
+                snapshot_record_dirs.add(normalized_current)
+            directory_file_map = defaultdict(list)
+            for index, name in enumerate(listing.files):
+                base_name = os.path.splitext(name)[0]
+                map_key = os.path.join(normalized_current, base_name.lower())
+                file_path = normalize_path(os.path.join(current_dir, name))
+                directory_file_map[map_key].append(file_path)
+                if file_stats and file_stats[index] is not None:
+                    size, mtime = file_stats[index]
+                    collected_records[file_path] = FileRecord(
+                        file_path, size, mtime, get_extension_id(name)
+                    )
+            # Klucze mapy zawierają katalog - wpisy katalogu są rozłączne
+            # z już zebranymi, więc kolejność mapy odpowiada kolejności walk
+            file_map.update(directory_file_map)
+            if directory_callback and directory_file_map:
+                directory_callback(directory_file_map, collected_records)
+
+            if debug_enabled:
+                logger.debug(
+                    "Skanowanie: %s -> %d plików", current_dir, listing.file_count
+                )
 
-                    # Sprawdzenie co 10 plików w folderze
+            if listing.file_count > 0:
+                for subfolders_processed, name in enumerate(listing.subdirs, 1):
+                    # Sprawdzenie co 5 podfolderów
                     if (
-                        files_processed_in_folder % 10 == 0
+                        subfolders_processed % 5 == 0
                         and interrupt_check
                         and interrupt_check()
                     ):
                         msg = (
-                            "Skanowanie przerwane podczas przetwarzania "
-                            f"plików w {current_dir}"
+                            "Skanowanie przerwane podczas rekursywnego "
+                            f"skanowania w {current_dir}"
                         )
                         logger.warning(msg)
                         raise ScanningInterrupted(msg)
 
-                    name = entry.name
-                    base_name, ext = os.path.splitext(name)
-                    ext_lower = ext.lower()
-
-                    if (
-                        ext_lower in ARCHIVE_EXTENSIONS
-                        or ext_lower in PREVIEW_EXTENSIONS
-                    ):
-                        map_key = os.path.join(
-                            normalize_path(current_dir), base_name.lower()
-                        )
-                        full_file_path = normalize_path(os.path.join(current_dir, name))
-                        file_map[map_key].append(full_file_path)
-
-            should_scan_subfolders = files_processed_in_folder > 0
-
-            logger.debug(
-                f"Skanowanie: {current_dir} -> {files_processed_in_folder} plików"
-            )
-
-            if should_scan_subfolders:
-                subfolders_processed = 0
-                for entry in entries:
-                    if entry.is_dir():
-                        # Ignoruj ukryte foldery i foldery systemowe
-                        if should_ignore_folder(entry.name):
-                            logger.debug(f"Pomijam ignorowany folder: {entry.name}")
-                            continue
-
-                        subfolders_processed += 1
-
-                        # Sprawdzenie co 5 podfolderów
-                        if (
-                            subfolders_processed % 5 == 0
-                            and interrupt_check
-                            and interrupt_check()
-                        ):
-                            msg = (
-                                "Skanowanie przerwane podczas rekursywnego "
-                                f"skanowania w {current_dir}"
-                            )
-                            logger.warning(msg)
-                            raise ScanningInterrupted(msg)
-
-                        # Normalny rekursywny skan (tylko gdy folder ma pliki)
-                        _walk_directory_streaming(entry.path, depth + 1)
+                    # Normalny rekursywny skan (tylko gdy folder ma pliki)
+                    _walk_directory_streaming(
+                        os.path.join(current_dir, name), depth + 1
+                    )
             else:
-                logger.debug(f"Pomijam podfoldery: {current_dir} (brak plików)")
+                if debug_enabled:
+                    logger.debug("Pomijam podfoldery: %s (brak plików)", current_dir)
 
         except (PermissionError, OSError) as e:
             logger.warning(f"Błąd dostępu do katalogu {current_dir}: {e}")
@@ -245,17 +450,35 @@ def collect_files_streaming(
 
     try:
         _walk_directory_streaming(normalized_dir)
-    except ScanningInterrupted:
-        raise
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+            executor.shutdown(wait=True)
+
+    if snapshot is not None:
+        # Przy ograniczonej głębokości nie znamy stanu głębszych katalogów
+        if max_depth < 0:
+            snapshot.prune(visited_paths)
+        snapshot.save()
+        logger.debug(
+            f"Snapshot katalogów: wylistowano {folders_listed} z "
+            f"{total_folders_scanned} folderów"
+        )
 
     elapsed_time = time.time() - start_time
     logger.info(
         f"Zakończono streaming zbieranie plików w {elapsed_time:.2f}s. Znaleziono {total_files_found} plików w {total_folders_scanned} folderach."
     )
 
-    # Zapisz mapę plików w cache
+    # Zapisz mapę plików w cache; rekordy zawsze odpowiadają ostatniemu
+    # zbieraniu (także wymuszonemu odświeżeniu przez obserwatora folderu)
     if not force_refresh:
         cache.set_file_map(normalized_dir, file_map)
+    cache.set_file_records(
+        normalized_dir, collected_records, frozenset(snapshot_record_dirs)
+    )
+    if file_records is not None:
+        file_records.update(collected_records)
 
     if progress_callback:
         progress_callback(100, "Zakończono zbieranie plików")
@@ -263,6 +486,197 @@ def collect_files_streaming(
     return file_map
 
 
+def _load_incremental_base(
+    base_directory: str, pair_strategy: str, max_depth: int
+) -> Optional[Tuple[Dict[str, List[str]], Dict[str, List[FilePair]]]]:
+    """
+    Zwraca mapę plików i pary poprzedniego skanowania pogrupowane
+    po kluczu mapy plików albo None, jeśli folder nie był skanowany.
+    """
+    previous = cache.get_incremental_base(base_directory, pair_strategy, max_depth)
+    if previous is None:
+        return None
+
+    previous_file_map, previous_result = previous
+    previous_pairs_by_key = defaultdict(list)
+    for pair in previous_result[0]:
+        archive_path = pair.get_archive_path()
+        preview_path = pair.get_preview_path()
+        if preview_path and os.path.dirname(preview_path) != os.path.dirname(
+            archive_path
+        ):
+            continue  # Pary między folderami są tworzone od nowa
+        map_key = os.path.join(
+            os.path.dirname(archive_path),
+            os.path.splitext(os.path.basename(archive_path))[0].lower(),
+        )
+        previous_pairs_by_key[map_key].append(pair)
+    return previous_file_map, previous_pairs_by_key
+
+
+def _pair_file_map(
+    file_map: Dict[str, List[str]],
+    incremental_base,
+    base_directory: str,
+    pair_strategy: str,
+    file_records: Optional[Dict[str, FileRecord]] = None,
+) -> Tuple[List[FilePair], int]:
+    """
+    Paruje (fragment) mapy plików z użyciem bazy z _load_incremental_base.
+
+    Returns:
+        Pary w kolejności mapy plików i liczba sparowanych od nowa kluczy
+    """
+    if incremental_base is None:
+        file_pairs, _ = create_file_pairs(
+            file_map,
+            base_directory=base_directory,
+            pair_strategy=pair_strategy,
+            file_records=file_records,
+        )
+        return file_pairs, len(file_map)
+
+    previous_file_map, previous_pairs_by_key = incremental_base
+    file_pairs: List[FilePair] = []
+    changed_keys = 0
+    for map_key, files_list in file_map.items():
+        if previous_file_map.get(map_key) == files_list:
+            reused_pairs = previous_pairs_by_key.get(map_key, ())
+            apply_file_records(reused_pairs, file_records)
+            file_pairs.extend(reused_pairs)
+        else:
+            changed_keys += 1
+            new_pairs, _ = create_file_pairs(
+                {map_key: files_list},
+                base_directory=base_directory,
+                pair_strategy=pair_strategy,
+                file_records=file_records,
+            )
+            file_pairs.extend(new_pairs)
+    return file_pairs, changed_keys
+
+
+def _create_file_pairs_incremental(
+    file_map: Dict[str, List[str]],
+    base_directory: str,
+    pair_strategy: str,
+    max_depth: int,
+    file_records: Optional[Dict[str, FileRecord]] = None,
+) -> List[FilePair]:
+    """
+    Tworzy pary plików, łatając poprzedni wynik skanowania jeśli jest dostępny.
+
+    Parowanie odbywa się w obrębie klucza mapy plików (katalog + nazwa bazowa),
+    więc pary dla kluczy z niezmienioną listą plików są przenoszone bez zmian
+    (zachowując obiekty FilePair), a parowane są tylko nowe/zmienione klucze.
+    Przeniesione pary dostają aktualne rozmiary z rekordów plików.
+    """
+    incremental_base = _load_incremental_base(base_directory, pair_strategy, max_depth)
+    # Zachowujemy kolejność mapy plików (jak przy pełnym parowaniu)
+    file_pairs, changed_keys = _pair_file_map(
+        file_map, incremental_base, base_directory, pair_strategy, file_records
+    )
+    if incremental_base is not None:
+        logger.debug(
+            f"Inkrementalne parowanie: {changed_keys} zmienionych z "
+            f"{len(file_map)} kluczy"
+        )
+    return file_pairs
+
+
+def _collect_cross_folder_previews(
+    directory: str,
+    max_depth: int,
+    preview_folders: List[str],
+    file_records: Dict[str, FileRecord],
+) -> List[str]:
+    """
+    Zbiera podglądy z folderów podglądów leżących poza zakresem skanowania.
+
+    Są to foldery równoległe do skanowanego katalogu (../previews) oraz,
+    przy skanowaniu bez podfolderów (max_depth == 0), jego podfoldery
+    (./previews). Rekordy plików trafiają do `file_records`.
+    """
+    folder_names = {name.lower() for name in preview_folders}
+    listing_roots = []
+    parent_dir = os.path.dirname(directory)
+    if parent_dir and parent_dir != directory:
+        listing_roots.append(parent_dir)
+    if max_depth == 0:
+        listing_roots.append(directory)
+
+    preview_dirs = []
+    for root in listing_roots:
+        try:
+            with os.scandir(root) as iterator:
+                for entry in iterator:
+                    if entry.name.lower() in folder_names and entry.is_dir():
+                        entry_path = normalize_path(entry.path)
+                        if entry_path != directory:
+                            preview_dirs.append(entry_path)
+        except OSError as e:
+            logger.debug(f"Nie można wylistować {root}: {e}")
+
+    previews = []
+    for preview_dir in preview_dirs:
+        try:
+            with os.scandir(preview_dir) as iterator:
+                for entry in iterator:
+                    ext_lower = os.path.splitext(entry.name)[1].lower()
+                    if ext_lower not in PREVIEW_EXTENSIONS or not entry.is_file():
+                        continue
+                    preview_path = normalize_path(entry.path)
+                    previews.append(preview_path)
+                    try:
+                        file_records[preview_path] = create_file_record(
+                            preview_path, entry.stat()
+                        )
+                    except OSError:
+                        pass
+        except OSError as e:
+            logger.debug(f"Nie można wylistować {preview_dir}: {e}")
+    return previews
+
+
+def _pair_unpaired_across_folders(
+    directory: str,
+    max_depth: int,
+    file_pairs: List[FilePair],
+    unpaired_archives: List[str],
+    unpaired_previews: List[str],
+    file_records: Dict[str, FileRecord],
+) -> Tuple[List[str], List[str]]:
+    """
+    Dopina do `file_pairs` pary archiwów z podglądami w folderach podglądów.
+
+    Returns:
+        Zaktualizowane listy niesparowanych archiwów i podglądów
+    """
+    preview_folders = AppConfig.get_instance().get("cross_folder_pairing_folders", [])
+    if not preview_folders or not unpaired_archives:
+        return unpaired_archives, unpaired_previews
+
+    external_previews = _collect_cross_folder_previews(
+        directory, max_depth, preview_folders, file_records
+    )
+    cross_pairs, paired_files = pair_across_folders(
+        unpaired_archives,
+        [*unpaired_previews, *external_previews],
+        directory,
+        preview_folders,
+        file_records,
+    )
+    if not cross_pairs:
+        return unpaired_archives, unpaired_previews
+
+    logger.debug(f"Parowanie między folderami: {len(cross_pairs)} par")
+    file_pairs.extend(cross_pairs)
+    return (
+        [a for a in unpaired_archives if a not in paired_files],
+        [p for p in unpaired_previews if p not in paired_files],
+    )
+
+
 def scan_folder_for_pairs(
     directory: str,
     max_depth: int = -1,
@@ -271,9 +685,16 @@ def scan_folder_for_pairs(
     interrupt_check: Optional[Callable[[], bool]] = None,
     force_refresh_cache: bool = False,
     progress_callback: Optional[Callable[[int, str], None]] = None,
+    pairs_callback: Optional[Callable[[List[FilePair]], None]] = None,
 ) -> Tuple[List[FilePair], List[str], List[str], List[SpecialFolder]]:
     """
     Skanuje folder, tworzy pary i identyfikuje nieparowane pliki.
+
+    Z `pairs_callback` skanowanie działa strumieniowo: pary każdego katalogu
+    są tworzone i przekazywane zaraz po jego odczycie, jeszcze w trakcie
+    przechodzenia drzewa (parowanie odbywa się w obrębie katalogu). Ostatnią
+    partią są pary między folderami. Kolejne partie składają się na listę
+    par wyniku; niesparowane pliki i foldery specjalne są tylko w wyniku.
     """
     normalized_dir = normalize_path(directory)
 
@@ -286,6 +707,8 @@ def scan_folder_for_pairs(
             )
             if progress_callback:
                 progress_callback(100, f"Używam cache dla {normalized_dir}")
+            if pairs_callback and cached_result[0]:
+                pairs_callback(list(cached_result[0]))
             return cached_result
 
     # Jeśli katalog nie istnieje, zwróć puste listy
@@ -302,19 +725,49 @@ def scan_folder_for_pairs(
             scaled_percent = int(percent * 0.5)
             progress_callback(scaled_percent, message)
 
-    # 2. Zbierz wszystkie pliki (z użyciem cache dla mapy plików)
+    # 2. Zbierz wszystkie pliki (z użyciem cache dla mapy plików) razem
+    #    z rekordami stat - parowanie i rozmiary par nie wywołują już stat
+    #    (w trybie strumieniowym pary tworzone są po odczycie każdego katalogu)
+    file_records: Dict[str, FileRecord] = {}
+    streamed_pairs: Optional[List[FilePair]] = None
+    directory_callback = None
+    if pairs_callback:
+        streamed_pairs = []
+        incremental_base = _load_incremental_base(
+            normalized_dir, pair_strategy, max_depth
+        )
+
+        def directory_callback(directory_file_map, records):
+            directory_pairs, _ = _pair_file_map(
+                directory_file_map,
+                incremental_base,
+                normalized_dir,
+                pair_strategy,
+                records,
+            )
+            if directory_pairs:
+                streamed_pairs.extend(directory_pairs)
+                pairs_callback(directory_pairs)
+
     file_map = collect_files_streaming(
-        normalized_dir, max_depth, interrupt_check, force_refresh_cache, scaled_progress
+        normalized_dir,
+        max_depth,
+        interrupt_check,
+        force_refresh_cache,
+        scaled_progress,
+        file_records=file_records,
+        directory_callback=directory_callback,
     )
 
     # 3. Utwórz pary plików
     if progress_callback:
         progress_callback(55, "Tworzenie par plików...")
-    file_pairs, processed_files = create_file_pairs(
-        file_map,
-        base_directory=normalized_dir,
-        pair_strategy=pair_strategy,
-    )
+    if streamed_pairs is not None:
+        file_pairs = streamed_pairs
+    else:
+        file_pairs = _create_file_pairs_incremental(
+            file_map, normalized_dir, pair_strategy, max_depth, file_records
+        )
 
     # 4. Identyfikuj nieparowane pliki
     if progress_callback:
@@ -330,6 +783,17 @@ def scan_folder_for_pairs(
     unpaired_archives, unpaired_previews = identify_unpaired_files(
         file_map, processed_files
     )
+    folder_pairs_count = len(file_pairs)
+    unpaired_archives, unpaired_previews = _pair_unpaired_across_folders(
+        normalized_dir,
+        max_depth,
+        file_pairs,
+        unpaired_archives,
+        unpaired_previews,
+        file_records,
+    )
+    if pairs_callback and len(file_pairs) > folder_pairs_count:
+        pairs_callback(file_pairs[folder_pairs_count:])
 
     # 5. Znajdź specjalne foldery (tex, textures) na dysku
     if progress_callback:
@@ -379,12 +843,12 @@ def scan_folder_for_pairs(
             logger.info(f"Utworzono wirtualny folder: {virtual_folder_path}")
 
     # 7. Zapisz wynik w cache
+    scan_result = (file_pairs, unpaired_archives, unpaired_previews, special_folders)
     if use_cache:
-        cache.set_scan_result(
-            normalized_dir,
-            pair_strategy,
-            (file_pairs, unpaired_archives, unpaired_previews, special_folders),
-        )
+        cache.set_scan_result(normalized_dir, pair_strategy, scan_result)
+    cache.set_incremental_base(
+        normalized_dir, pair_strategy, max_depth, file_map, scan_result
+    )
 
     logger.info(
         f"Skanowanie zakończone dla {normalized_dir}. Znaleziono {len(file_pairs)} par."
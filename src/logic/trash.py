@@ -0,0 +1,351 @@
+"""
+Kosz systemowy zgodny ze specyfikacją Freedesktop (Trash specification 1.0).
+
+Plik trafia do kosza na tym samym systemie plików: do kosza domowego
+($XDG_DATA_HOME/Trash) albo do kosza w katalogu głównym punktu montowania
+($topdir/.Trash/$uid lub $topdir/.Trash-$uid). Przeniesienie jest wtedy
+zwykłym os.rename - bez kopiowania danych.
+
+Pliki są przetwarzane partiami: najpierw dla całej partii powstają pliki
+.trashinfo (O_EXCL rezerwuje nazwę w koszu), potem następują przeniesienia,
+a katalogi kosza są utrwalane jednym fsync na partię. Unikalna nazwa to
+nazwa oryginalna, a przy kolizji nazwa z losowym sufiksem - bez
+przeszukiwania kolejnych numerów.
+
+Na Windows kosz obsługuje send2trash (opcjonalna zależność).
+"""
+
+import errno
+import logging
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+TRASH_BATCH_SIZE = 256
+TRASHINFO_SUFFIX = ".trashinfo"
+
+
+@dataclass
+class TrashResult:
+    """Wynik przeniesienia plików do kosza (w kolejności wejściowej)."""
+
+    # (ścieżka oryginalna, ścieżka w koszu)
+    trashed: List[Tuple[str, str]] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    errors: List[Dict[str, str]] = field(default_factory=list)
+    interrupted: bool = False
+
+
+@dataclass
+class _TrashDirectory:
+    """Katalog kosza: files/ i info/ oraz katalog bazowy ścieżek w .trashinfo."""
+
+    path: str
+    # None = w .trashinfo ścieżka absolutna (kosz domowy)
+    topdir: Optional[str] = None
+
+    @property
+    def files_dir(self) -> str:
+        return os.path.join(self.path, "files")
+
+    @property
+    def info_dir(self) -> str:
+        return os.path.join(self.path, "info")
+
+
+class FreedesktopTrash:
+    """Kosz Freedesktop z koszami per punkt montowania."""
+
+    def __init__(self, home_trash_dir: Optional[str] = None):
+        """
+        Args:
+            home_trash_dir: Kosz domowy (domyślnie $XDG_DATA_HOME/Trash)
+        """
+        if home_trash_dir is None:
+            data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(
+                os.path.expanduser("~"), ".local", "share"
+            )
+            home_trash_dir = os.path.join(data_home, "Trash")
+        self.home_trash = _TrashDirectory(home_trash_dir)
+        self._uid = os.getuid()
+        self._home_device: Optional[int] = None
+        self._trash_by_device: Dict[int, _TrashDirectory] = {}
+        self._lock = threading.Lock()
+
+    def trash(
+        self,
+        paths: Iterable[str],
+        interrupt_check: Optional[Callable[[], bool]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> TrashResult:
+        """
+        Przenosi pliki do kosza.
+
+        Args:
+            paths: Ścieżki plików
+            interrupt_check: Funkcja sprawdzająca czy przerwać (między partiami)
+            progress_callback: Funkcja (przetworzone, wszystkie) wywoływana
+                po każdej partii
+        """
+        result = TrashResult()
+        paths = list(paths)
+        for start in range(0, len(paths), TRASH_BATCH_SIZE):
+            if interrupt_check and interrupt_check():
+                result.interrupted = True
+                break
+            batch = paths[start : start + TRASH_BATCH_SIZE]
+            self._trash_batch(batch, result)
+            if progress_callback:
+                progress_callback(start + len(batch), len(paths))
+        logger.info(
+            "Kosz: %d przeniesiono, %d brak plików, %d błędów%s",
+            len(result.trashed),
+            len(result.missing),
+            len(result.errors),
+            " (przerwano)" if result.interrupted else "",
+        )
+        return result
+
+    # --- Partia ---
+
+    def _trash_batch(self, paths: List[str], result: TrashResult):
+        deletion_date = time.strftime("%Y-%m-%dT%H:%M:%S")
+        reserved: List[Tuple[str, _TrashDirectory, str]] = []
+
+        # Faza 1: pliki .trashinfo rezerwujące nazwy w koszu
+        for path in paths:
+            path = os.path.abspath(path)
+            try:
+                trash_dir = self._trash_dir_for(os.lstat(path).st_dev, path)
+                name = self._reserve_name(trash_dir, path, deletion_date)
+            except FileNotFoundError:
+                logger.warning("Plik nie istnieje: %s", path)
+                result.missing.append(path)
+                continue
+            except OSError as e:
+                _add_error(result, path, e)
+                continue
+            reserved.append((path, trash_dir, name))
+
+        # Faza 2: przeniesienia
+        touched: Set[str] = set()
+        for path, trash_dir, name in reserved:
+            target = os.path.join(trash_dir.files_dir, name)
+            try:
+                try:
+                    os.rename(path, target)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # Kosz domowy jako zapasowy dla obcego systemu plików
+                    shutil.move(path, target)
+            except OSError as e:
+                self._remove_info(trash_dir, name)
+                if isinstance(e, FileNotFoundError) and not os.path.lexists(path):
+                    logger.warning("Plik nie istnieje: %s", path)
+                    result.missing.append(path)
+                else:
+                    _add_error(result, path, e)
+                continue
+            result.trashed.append((path, target))
+            touched.add(trash_dir.info_dir)
+            touched.add(trash_dir.files_dir)
+
+        # Faza 3: utrwalenie katalogów kosza raz na partię
+        for directory in touched:
+            _fsync_directory(directory)
+
+    # --- Nazwy w koszu ---
+
+    def _reserve_name(
+        self, trash_dir: _TrashDirectory, path: str, deletion_date: str
+    ) -> str:
+        """Tworzy .trashinfo (O_EXCL) i zwraca zarezerwowaną nazwę pliku."""
+        if trash_dir.topdir is None:
+            info_path = path
+        else:
+            info_path = os.path.relpath(path, trash_dir.topdir)
+        content = (
+            "[Trash Info]\n"
+            f"Path={quote(os.fsencode(info_path), safe='/')}\n"
+            f"DeletionDate={deletion_date}\n"
+        ).encode("ascii")
+
+        name = os.path.basename(path)
+        stem, ext = os.path.splitext(name)
+        while True:
+            info_file = os.path.join(trash_dir.info_dir, name + TRASHINFO_SUFFIX)
+            try:
+                fd = os.open(info_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                fd = None
+            if fd is not None:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                # Plik bez .trashinfo (np. po awarii) też blokuje nazwę
+                if not os.path.lexists(os.path.join(trash_dir.files_dir, name)):
+                    return name
+                os.remove(info_file)
+            name = f"{stem}.{uuid.uuid4().hex[:8]}{ext}"
+
+    @staticmethod
+    def _remove_info(trash_dir: _TrashDirectory, name: str):
+        try:
+            os.remove(os.path.join(trash_dir.info_dir, name + TRASHINFO_SUFFIX))
+        except OSError:
+            pass
+
+    # --- Katalogi kosza ---
+
+    def _trash_dir_for(self, device: int, path: str) -> _TrashDirectory:
+        with self._lock:
+            if self._home_device is None:
+                _ensure_trash_dirs(self.home_trash)
+                self._home_device = os.stat(self.home_trash.path).st_dev
+            if device == self._home_device:
+                return self.home_trash
+            if device not in self._trash_by_device:
+                self._trash_by_device[device] = self._find_topdir_trash(path)
+            return self._trash_by_device[device]
+
+    def _find_topdir_trash(self, path: str) -> _TrashDirectory:
+        """Kosz w katalogu głównym punktu montowania pliku (lub kosz domowy)."""
+        topdir = os.path.dirname(path)
+        while not os.path.ismount(topdir):
+            topdir = os.path.dirname(topdir)
+
+        # $topdir/.Trash/$uid - tylko gdy .Trash ma bit sticky i nie jest linkiem
+        shared = os.path.join(topdir, ".Trash")
+        try:
+            shared_stat = os.lstat(shared)
+            if (
+                stat.S_ISDIR(shared_stat.st_mode)
+                and shared_stat.st_mode & stat.S_ISVTX
+            ):
+                trash_dir = _TrashDirectory(
+                    os.path.join(shared, str(self._uid)), topdir
+                )
+                _ensure_trash_dirs(trash_dir)
+                return trash_dir
+        except OSError:
+            pass
+
+        trash_dir = _TrashDirectory(
+            os.path.join(topdir, f".Trash-{self._uid}"), topdir
+        )
+        try:
+            _ensure_trash_dirs(trash_dir)
+            if os.path.islink(trash_dir.path):
+                raise OSError(f"Katalog kosza jest linkiem: {trash_dir.path}")
+            return trash_dir
+        except OSError as e:
+            logger.warning(
+                "Brak kosza w %s (%s) - używam kosza domowego (kopiowanie)", topdir, e
+            )
+            return self.home_trash
+
+
+def _add_error(result: TrashResult, path: str, error: OSError):
+    if isinstance(error, PermissionError):
+        logger.error("Brak uprawnień do %s: %s", path, error)
+        result.errors.append(
+            {
+                "file_path": path,
+                "error": f"Brak uprawnień: {error}",
+                "error_type": "PERMISSION_ERROR",
+            }
+        )
+    else:
+        logger.error("Błąd przenoszenia do kosza %s: %s", path, error)
+        result.errors.append(
+            {"file_path": path, "error": str(error), "error_type": "UNKNOWN_ERROR"}
+        )
+
+
+def _ensure_trash_dirs(trash_dir: _TrashDirectory):
+    # mode dotyczy tylko ostatniego katalogu - sam kosz tworzony osobno
+    os.makedirs(trash_dir.path, mode=0o700, exist_ok=True)
+    os.makedirs(trash_dir.files_dir, mode=0o700, exist_ok=True)
+    os.makedirs(trash_dir.info_dir, mode=0o700, exist_ok=True)
+
+
+def _fsync_directory(directory: str):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Nie każdy system plików to obsługuje
+    finally:
+        os.close(fd)
+
+
+class _Send2TrashBackend:
+    """Kosz Windows przez send2trash."""
+
+    def trash(
+        self,
+        paths: Iterable[str],
+        interrupt_check: Optional[Callable[[], bool]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> TrashResult:
+        import send2trash
+
+        result = TrashResult()
+        paths = list(paths)
+        for processed, path in enumerate(paths, 1):
+            if interrupt_check and interrupt_check():
+                result.interrupted = True
+                break
+            if not os.path.lexists(path):
+                logger.warning("Plik nie istnieje: %s", path)
+                result.missing.append(path)
+            else:
+                try:
+                    send2trash.send2trash(path)
+                    result.trashed.append((path, ""))
+                except OSError as e:
+                    _add_error(result, path, e)
+            if progress_callback and (
+                processed % TRASH_BATCH_SIZE == 0 or processed == len(paths)
+            ):
+                progress_callback(processed, len(paths))
+        return result
+
+
+_trash_instance = None
+_trash_instance_lock = threading.Lock()
+
+
+def get_trash():
+    """
+    Zwraca kosz dla bieżącej platformy.
+
+    Returns:
+        Obiekt z metodą trash(paths, interrupt_check, progress_callback)
+        albo None, gdy kosz
+        jest niedostępny (Windows bez send2trash)
+    """
+    global _trash_instance
+    with _trash_instance_lock:
+        if _trash_instance is None:
+            if sys.platform.startswith("win"):
+                try:
+                    import send2trash  # noqa: F401
+                except ImportError:
+                    return None
+                _trash_instance = _Send2TrashBackend()
+            else:
+                _trash_instance = FreedesktopTrash()
+        return _trash_instance
@@ -14,7 +14,7 @@ from src.factories.worker_factory import UIWorkerFactory
 # Konfiguracja centralnej worker factory
 from src.logic.file_ops_components import configure_worker_factory
 from src.ui.main_window.main_window import MainWindow
-from src.utils.logging_config import setup_logging
+from src.utils.logging_config import is_logging_configured, setup_logging
 
 # Stałe kodów wyjścia
 EXIT_SUCCESS = 0
@@ -116,9 +116,10 @@ def main(style_sheet=""):
     Returns:
         int: Kod wyjścia aplikacji
     """
-    # Konfiguracja logowania
+    # Konfiguracja logowania (o ile nie skonfigurowano jej z argumentów)
     try:
-        setup_logging()
+        if not is_logging_configured():
+            setup_logging()
     except Exception as e:
         print(f"KRYTYCZNY BŁĄD: Inicjalizacja logów: {e}")
         return EXIT_LOGGING_ERROR
@@ -4,7 +4,9 @@ Moduł zawierający klasy modeli danych dla par plików.
 
 import logging
 import os
-from typing import Optional, Tuple, Union
+import sys
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
@@ -20,13 +22,83 @@ TRANSFORMATION_FAST = Qt.TransformationMode.FastTransformation
 # Specjalne wartości dla rozmiaru pliku
 FILE_SIZE_ERROR = -1  # Wskazuje błąd przy pobieraniu rozmiaru pliku
 
+# Limit dziennika zmienionych par (FilePair.get_changed_pairs) - po jego
+# przekroczeniu dziennik jest zaczynany od nowa, a indeksy z wcześniejszą
+# rewizją przeliczają wszystkie pary
+MAX_TRACKED_METADATA_CHANGES = 10000
+
+
+def _normalize_pair_path(path: str) -> str:
+    """
+    Normalizuje ścieżkę pliku pary z szybką ścieżką dla już znormalizowanych.
+
+    Skaner przekazuje ścieżki po normalize_path, więc w typowym przypadku
+    pełna normalizacja (normpath + czyszczenie separatorów) jest pomijana.
+    """
+    if (
+        "\\" not in path
+        and "//" not in path
+        and "/." not in path
+        and not path.endswith("/")
+    ):
+        return path
+    return normalize_path(path)
+
+
+@lru_cache(maxsize=64)
+def _normalize_working_directory(working_directory: str) -> str:
+    """Normalizuje i interuje katalog roboczy (wspólny dla wszystkich par)."""
+    return sys.intern(normalize_path(working_directory))
+
+
+def _read_file_size(path: str) -> int:
+    """Odczytuje rozmiar pliku jednym wywołaniem stat (FILE_SIZE_ERROR przy błędzie)."""
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        logger.warning(f"Plik nie istnieje, nie można pobrać rozmiaru: {path}")
+    except OSError as e:
+        logger.error(f"Błąd odczytu rozmiaru pliku {path}: {e}")
+    return FILE_SIZE_ERROR
+
+
+def _intern_color_tag(color: Optional[str]) -> Optional[str]:
+    """Interuje tag koloru - tysiące par dzieli kilka obiektów str."""
+    return sys.intern(color) if isinstance(color, str) else color
+
 
 class FilePair:
     """
     Reprezentuje parę plików: archiwum i jego podgląd.
     Przechowuje także metadane związane z tą parą.
+
+    Klasa używa __slots__ (brak __dict__ na instancję), współdzieli katalog
+    roboczy i tagi kolorów między parami oraz buforuje ścieżki względne -
+    ma to znaczenie przy bibliotekach liczących 100k+ par.
     """
 
+    __slots__ = (
+        "_working_directory",
+        "_archive_path",
+        "_preview_path",
+        "_relative_archive_path",
+        "_relative_preview_path",
+        "base_name",
+        "preview_thumbnail",
+        "archive_size_bytes",
+        "preview_size_bytes",
+        "_stars",
+        "_color_tag",
+    )
+
+    # Licznik zmian gwiazdek, kolorów i ścieżek archiwów we wszystkich parach -
+    # pozwala indeksom (np. FilePairFilterIndex) tanio wykryć, że dane się zmieniły
+    metadata_revision = 0
+    # Dziennik par zmienionych od rewizji _changed_pairs_base (po jednym wpisie
+    # na zmianę) - indeksy aktualizują tylko pary zmienione od swojej rewizji
+    _changed_pairs: List["FilePair"] = []
+    _changed_pairs_base = 0
+
     def __init__(
         self, archive_path: str, preview_path: Optional[str], working_directory: str
     ):
@@ -41,9 +113,9 @@ class FilePair:
         Raises:
             ValueError: Gdy którakolwiek ze ścieżek nie jest absolutna.
         """
-        norm_wd = normalize_path(working_directory)
-        norm_archive = normalize_path(archive_path)
-        norm_preview = normalize_path(preview_path) if preview_path else None
+        norm_wd = _normalize_working_directory(working_directory)
+        norm_archive = _normalize_pair_path(archive_path)
+        norm_preview = _normalize_pair_path(preview_path) if preview_path else None
 
         if not os.path.isabs(norm_archive):
             raise ValueError("Ścieżka do archiwum musi być absolutna.")
@@ -52,18 +124,95 @@ class FilePair:
         if not os.path.isabs(norm_wd):
             raise ValueError("Ścieżka do katalogu roboczego musi być absolutna.")
 
-        self.working_directory = norm_wd
-        self.archive_path: str = norm_archive
-        self.preview_path: Optional[str] = norm_preview
+        self._working_directory = norm_wd
+        self._archive_path: str = norm_archive
+        self._preview_path: Optional[str] = norm_preview
+        self._relative_archive_path: Optional[str] = None
+        self._relative_preview_path: Optional[str] = None
 
         # Nazwa bazowa jest pobierana z pliku archiwum
-        self.base_name: str = os.path.splitext(os.path.basename(self.archive_path))[0]
+        self.base_name: str = os.path.splitext(os.path.basename(norm_archive))[0]
 
         # Inicjalizacja metadanych z domyślnymi wartościami
         self.preview_thumbnail: Optional[QPixmap] = None
+        # Rozmiary plików - wypełniane z rekordów skanera lub leniwie przez stat
         self.archive_size_bytes: Optional[int] = None
-        self.stars: int = 0
-        self.color_tag: Optional[str] = None
+        self.preview_size_bytes: Optional[int] = None
+        self._stars: int = 0
+        self._color_tag: Optional[str] = None
+
+    # --- Ścieżki (zmiana unieważnia buforowane ścieżki względne) ---
+
+    @property
+    def working_directory(self) -> str:
+        return self._working_directory
+
+    @working_directory.setter
+    def working_directory(self, value: str):
+        self._working_directory = value
+        self._relative_archive_path = None
+        self._relative_preview_path = None
+
+    @property
+    def archive_path(self) -> str:
+        return self._archive_path
+
+    @archive_path.setter
+    def archive_path(self, value: str):
+        self._archive_path = value
+        self._relative_archive_path = None
+        FilePair._record_metadata_change(self)
+
+    @property
+    def preview_path(self) -> Optional[str]:
+        return self._preview_path
+
+    @preview_path.setter
+    def preview_path(self, value: Optional[str]):
+        self._preview_path = value
+        self._relative_preview_path = None
+        self.preview_size_bytes = None
+
+    # --- Metadane (zmiana podbija metadata_revision) ---
+
+    @property
+    def stars(self) -> int:
+        return self._stars
+
+    @stars.setter
+    def stars(self, value: int):
+        self._stars = value
+        FilePair._record_metadata_change(self)
+
+    @property
+    def color_tag(self) -> Optional[str]:
+        return self._color_tag
+
+    @color_tag.setter
+    def color_tag(self, value: Optional[str]):
+        self._color_tag = _intern_color_tag(value)
+        FilePair._record_metadata_change(self)
+
+    @classmethod
+    def _record_metadata_change(cls, pair: "FilePair"):
+        """Podbija metadata_revision i dopisuje parę do dziennika zmian."""
+        if len(cls._changed_pairs) >= MAX_TRACKED_METADATA_CHANGES:
+            cls._changed_pairs_base = cls.metadata_revision
+            cls._changed_pairs = []
+        cls._changed_pairs.append(pair)
+        cls.metadata_revision += 1
+
+    @classmethod
+    def get_changed_pairs(cls, revision: int) -> Optional[List["FilePair"]]:
+        """
+        Zwraca pary zmienione od rewizji `revision` (mogą się powtarzać).
+
+        Returns:
+            Lista par lub None, jeśli dziennik nie sięga już tej rewizji.
+        """
+        if revision < cls._changed_pairs_base:
+            return None
+        return cls._changed_pairs[revision - cls._changed_pairs_base :]
 
     def __repr__(self) -> str:
         """
@@ -103,9 +252,11 @@ class FilePair:
         Returns:
             Względna ścieżka do archiwum.
         """
-        return os.path.relpath(self.archive_path, self.working_directory).replace(
-            "\\", "/"
-        )
+        if self._relative_archive_path is None:
+            self._relative_archive_path = os.path.relpath(
+                self._archive_path, self._working_directory
+            ).replace("\\", "/")
+        return self._relative_archive_path
 
     def get_relative_preview_path(self) -> Optional[str]:
         """
@@ -114,11 +265,13 @@ class FilePair:
         Returns:
             Względna ścieżka do podglądu lub None.
         """
-        if not self.preview_path:
+        if not self._preview_path:
             return None
-        return os.path.relpath(self.preview_path, self.working_directory).replace(
-            "\\", "/"
-        )
+        if self._relative_preview_path is None:
+            self._relative_preview_path = os.path.relpath(
+                self._preview_path, self._working_directory
+            ).replace("\\", "/")
+        return self._relative_preview_path
 
     def get_base_name(self) -> str:
         """
@@ -181,29 +334,32 @@ class FilePair:
 
     def get_archive_size(self) -> Optional[int]:
         """
-        Pobiera i zwraca rozmiar pliku archiwum w bajtach.
+        Zwraca rozmiar pliku archiwum w bajtach.
+
+        Rozmiar zwykle pochodzi z rekordu skanera (bez dodatkowego stat);
+        w przeciwnym razie jest odczytywany raz i buforowany.
 
         Returns:
-            Rozmiar pliku w bajtach, FILE_SIZE_ERROR w przypadku błędu,
-            lub None, jeśli rozmiar nie został jeszcze pobrany.
+            Rozmiar pliku w bajtach lub FILE_SIZE_ERROR w przypadku błędu.
         """
         if self.archive_size_bytes is None:
-            try:
-                if os.path.exists(self.archive_path):
-                    self.archive_size_bytes = os.path.getsize(self.archive_path)
-                else:
-                    logger.warning(
-                        f"Plik archiwum nie istnieje, nie można pobrać rozmiaru: "
-                        f"{self.archive_path}"
-                    )
-                    self.archive_size_bytes = (
-                        FILE_SIZE_ERROR  # Wyraźne oznaczenie błędu
-                    )
-            except OSError as e:
-                logger.error(f"Błąd odczytu rozmiaru pliku {self.archive_path}: {e}")
-                self.archive_size_bytes = FILE_SIZE_ERROR
+            self.archive_size_bytes = _read_file_size(self.archive_path)
         return self.archive_size_bytes
 
+    def get_preview_size(self) -> Optional[int]:
+        """
+        Zwraca rozmiar pliku podglądu w bajtach (None gdy para nie ma podglądu).
+
+        Returns:
+            Rozmiar pliku w bajtach, FILE_SIZE_ERROR w przypadku błędu
+            lub None dla pary bez podglądu.
+        """
+        if not self._preview_path:
+            return None
+        if self.preview_size_bytes is None:
+            self.preview_size_bytes = _read_file_size(self._preview_path)
+        return self.preview_size_bytes
+
     def get_formatted_archive_size(self) -> str:
         """
         Zwraca sformatowany rozmiar pliku archiwum (np. KB, MB).
@@ -252,7 +408,7 @@ class FilePair:
         Returns:
             Liczba gwiazdek (0-5).
         """
-        return self.stars
+        return self._stars
 
     def set_color_tag(self, color: Optional[str]) -> Optional[str]:
         """
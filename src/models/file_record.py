@@ -0,0 +1,55 @@
+"""
+Kompaktowy rekord pliku zebrany podczas skanowania.
+
+Skaner ma dane stat z os.DirEntry w chwili listowania katalogu - rekord
+przenosi je dalej (parowanie, FilePair, statystyki), dzięki czemu te etapy
+nie wykonują ponownych wywołań stat (każde to round trip na udziale
+sieciowym).
+"""
+
+import os
+from typing import Dict, NamedTuple, Optional
+
+from src import app_config
+
+# Identyfikatory rozszerzeń obsługiwanych plików (indeks w krotce)
+FILE_EXTENSIONS = tuple(
+    dict.fromkeys(
+        ext.lower()
+        for ext in (
+            *app_config.SUPPORTED_ARCHIVE_EXTENSIONS,
+            *app_config.SUPPORTED_PREVIEW_EXTENSIONS,
+        )
+    )
+)
+_EXTENSION_IDS: Dict[str, int] = {ext: i for i, ext in enumerate(FILE_EXTENSIONS)}
+UNKNOWN_EXTENSION_ID = -1
+
+
+def get_extension_id(path: str) -> int:
+    """Zwraca identyfikator rozszerzenia pliku (UNKNOWN_EXTENSION_ID gdy nieznane)."""
+    return _EXTENSION_IDS.get(
+        os.path.splitext(path)[1].lower(), UNKNOWN_EXTENSION_ID
+    )
+
+
+class FileRecord(NamedTuple):
+    """Ścieżka, rozmiar (B), czas modyfikacji (s) i identyfikator rozszerzenia."""
+
+    path: str
+    size: int
+    mtime: float
+    ext_id: int
+
+    @property
+    def extension(self) -> Optional[str]:
+        if self.ext_id == UNKNOWN_EXTENSION_ID:
+            return None
+        return FILE_EXTENSIONS[self.ext_id]
+
+
+def create_file_record(path: str, stat_result: os.stat_result) -> FileRecord:
+    """Tworzy rekord pliku z wyniku stat (np. os.DirEntry.stat())."""
+    return FileRecord(
+        path, stat_result.st_size, stat_result.st_mtime, get_extension_id(path)
+    )
@@ -177,17 +177,14 @@ class SpecialFolder:
             Rozmiar folderu w bajtach
         """
         if self.folder_size_bytes is None:
+            # Import lokalny: pakiet src.logic importuje scanner_cache, który
+            # importuje ten moduł
+            from src.logic.folder_stats_engine import FolderStatsEngine
+
             try:
-                total_size = 0
-                if os.path.exists(self.folder_path):
-                    for root, dirs, files in os.walk(self.folder_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            try:
-                                total_size += os.path.getsize(file_path)
-                            except (PermissionError, OSError):
-                                continue
-                self.folder_size_bytes = total_size
+                self.folder_size_bytes = FolderStatsEngine.get_instance().get_total_size(
+                    self.folder_path
+                )
             except (PermissionError, OSError):
                 self.folder_size_bytes = 0
 
@@ -0,0 +1,188 @@
+"""
+Obserwator folderu roboczego - odświeżanie galerii na żywo.
+
+QFileSystemWatcher zgłasza zmiany zawartości katalogów (nowy render, plik
+przeniesiony w eksploratorze). Obserwowane są wszystkie katalogi odwiedzane
+przez skanowanie folderu (wg snapshotu katalogów skanera) oraz foldery
+podglądów. Zgłoszenia z krótkiego okna czasu są łączone (debouncing), po czym
+folder jest ponownie skanowany w tle z tą samą głębokością i strategią
+parowania co skanowanie wyświetlanych danych - inkrementalnie, z użyciem
+snapshotu i poprzednich par. Wynik trafia do kontrolera, który wylicza deltę
+i przekazuje do UI tylko zmiany.
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QThreadPool, QTimer, pyqtSignal
+
+from src.config import AppConfig
+from src.logic.scanner_cache import cache
+from src.utils.path_utils import normalize_path
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryWatchService(QObject):
+    """
+    Obserwuje folder roboczy (jego podfoldery i foldery podglądów) i po
+    zmianach zleca ponowne skanowanie w tle.
+    """
+
+    # ścieżka folderu, wynik scan_folder_for_pairs
+    directory_rescanned = pyqtSignal(str, object)
+
+    def __init__(self, debounce_ms: Optional[int] = None):
+        super().__init__()
+        config = AppConfig.get_instance()
+        if debounce_ms is None:
+            debounce_ms = config.get("directory_watcher_debounce_ms", 500)
+        self._enabled = config.get("directory_watcher_enabled", True)
+
+        self._directory: Optional[str] = None
+        self._max_depth = -1
+        self._pair_strategy = "first_match"
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        # Seria zdarzeń (np. kopiowanie wielu plików) = jedno skanowanie
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._start_rescan)
+
+        self._rescan_worker = None
+        self._rescan_pending = False
+
+    # --- API ---
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    def watch(
+        self, directory: str, max_depth: int = -1, pair_strategy: str = "first_match"
+    ):
+        """
+        Rozpoczyna obserwację folderu (zastępuje poprzednio obserwowany).
+
+        Args:
+            directory: Folder roboczy
+            max_depth: Głębokość skanowania, które dało wyświetlane dane
+            pair_strategy: Strategia parowania tego skanowania
+        """
+        self.stop()
+        if not self._enabled or not directory or not os.path.isdir(directory):
+            return
+
+        self._directory = normalize_path(directory)
+        self._max_depth = max_depth
+        self._pair_strategy = pair_strategy
+        self._update_watched_paths()
+        logger.debug(
+            f"Obserwacja folderu: {self._directory} "
+            f"({len(self._watcher.directories())} katalogów)"
+        )
+
+    def stop(self):
+        """Kończy obserwację; wynik trwającego skanowania zostanie pominięty."""
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._debounce_timer.stop()
+        self._rescan_pending = False
+        self._directory = None
+
+    def is_watching(self) -> bool:
+        return self._directory is not None
+
+    # --- Wewnętrzne ---
+
+    def _get_scanned_directories(self) -> List[str]:
+        """Zwraca katalogi odwiedzane przez skanowanie obserwowanego folderu."""
+        if self._max_depth == 0:
+            return [self._directory]
+        if not AppConfig.get_instance().get("scanner_use_directory_snapshot", True):
+            return [self._directory]
+        directories = cache.get_directory_snapshot(self._directory).get_directories(
+            self._max_depth
+        )
+        return directories or [self._directory]
+
+    def _update_watched_paths(self):
+        """Dopasowuje listę obserwowanych katalogów do aktualnego drzewa."""
+        # Foldery podglądów wewnątrz drzewa są już w snapshocie; tu dochodzą
+        # m.in. równoległe foldery podglądów folderu roboczego
+        wanted = set(self._get_scanned_directories())
+        wanted.update(self._get_preview_folders(self._directory))
+
+        watched = set(self._watcher.directories())
+        removed = watched - wanted
+        if removed:
+            self._watcher.removePaths(list(removed))
+        added = wanted - watched
+        if added:
+            failed = self._watcher.addPaths(sorted(added))
+            if failed:
+                logger.debug(f"Nie można obserwować: {failed}")
+
+    @staticmethod
+    def _get_preview_folders(directory: str) -> List[str]:
+        """Zwraca istniejące foldery podglądów parowane z folderem (podfoldery i równoległe)."""
+        folder_names = AppConfig.get_instance().get("cross_folder_pairing_folders", [])
+        parent_dir = os.path.dirname(directory)
+        folders = []
+        for name in folder_names:
+            for root in (directory, parent_dir):
+                path = os.path.join(root, name)
+                if os.path.isdir(path):
+                    folders.append(normalize_path(path))
+        return folders
+
+    def _on_directory_changed(self, path: str):
+        if self._directory is None:
+            return
+        # Usunięty/przemianowany katalog znika z obserwowanych
+        if path == self._directory and not os.path.isdir(path):
+            logger.info(f"Obserwowany folder zniknął: {path}")
+            self.stop()
+            return
+        self._debounce_timer.start()
+
+    def _start_rescan(self):
+        if self._directory is None:
+            return
+        if self._rescan_worker is not None:
+            # Kolejne zmiany w trakcie skanowania - jedno skanowanie po nim
+            self._rescan_pending = True
+            return
+
+        from src.ui.delegates.workers.scan_workers import DirectoryRescanWorker
+
+        worker = DirectoryRescanWorker(
+            self._directory, self._max_depth, self._pair_strategy
+        )
+        worker.signals.finished.connect(self._on_rescan_finished)
+        worker.signals.error.connect(self._on_rescan_error)
+        self._rescan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_rescan_finished(self, result):
+        self._rescan_worker = None
+        directory, scan_result = result
+        if directory == self._directory:
+            # Nowe/usunięte podfoldery zmieniają listę obserwowanych katalogów
+            self._update_watched_paths()
+            self.directory_rescanned.emit(directory, scan_result)
+        self._start_pending_rescan()
+
+    def _on_rescan_error(self, message: str):
+        self._rescan_worker = None
+        logger.warning(f"Błąd odświeżania obserwowanego folderu: {message}")
+        self._start_pending_rescan()
+
+    def _start_pending_rescan(self):
+        if self._rescan_pending and self._directory is not None:
+            self._rescan_pending = False
+            self._debounce_timer.start()
@@ -9,7 +9,9 @@ import shutil
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from src.config import AppConfig
 # from src.logic.file_pairing import update_pairs_after_move, remove_deleted_from_pairs  # TODO: Implementować te funkcje
+from src.logic.trash import get_trash
 from src.models.file_pair import FilePair
 from src.utils.path_validator import PathValidator
 
@@ -63,23 +65,8 @@ class FileOperationsService:
                     Path(file_path).unlink()
                     return True
             else:
-                # Linux/macOS - przenieś do ~/.local/share/Trash
-                trash_dir = Path.home() / ".local" / "share" / "Trash" / "files"
-                trash_dir.mkdir(parents=True, exist_ok=True)
-
-                file_name = Path(file_path).name
-                trash_path = trash_dir / file_name
-
-                # Jeśli plik już istnieje w koszu, dodaj suffix
-                counter = 1
-                while trash_path.exists():
-                    name_part = Path(file_path).stem
-                    ext_part = Path(file_path).suffix
-                    trash_path = trash_dir / f"{name_part}_{counter}{ext_part}"
-                    counter += 1
-
-                shutil.move(file_path, trash_path)
-                return True
+                # Linux/macOS - kosz Freedesktop na tym samym systemie plików
+                return bool(get_trash().trash([file_path]).trashed)
 
         except Exception as e:
             self.logger.error(f"Błąd podczas przenoszenia do kosza {file_path}: {e}")
@@ -89,7 +76,7 @@ class FileOperationsService:
         self, file_pairs: List[FilePair]
     ) -> Tuple[List[FilePair], List[str]]:
         """
-        Usuwa masowo pary plików.
+        Usuwa masowo pary plików (do kosza systemowego przy delete_to_trash).
 
         Args:
             file_pairs: Lista par plików do usunięcia
@@ -97,6 +84,12 @@ class FileOperationsService:
         Returns:
             Tuple[List[FilePair], List[str]]: (pomyślnie usunięte, błędy)
         """
+        trash = None
+        if AppConfig.get_instance().get("delete_to_trash", True):
+            trash = get_trash()
+        if trash is not None:
+            return self._bulk_delete_to_trash(trash, file_pairs)
+
         successfully_deleted = []
         errors = []
 
@@ -121,6 +114,41 @@ class FileOperationsService:
 
         return successfully_deleted, errors
 
+    def _bulk_delete_to_trash(
+        self, trash, file_pairs: List[FilePair]
+    ) -> Tuple[List[FilePair], List[str]]:
+        """Przenosi pary plików do kosza jedną operacją masową."""
+        paths = [
+            path
+            for file_pair in file_pairs
+            for path in (file_pair.archive_path, file_pair.preview_path)
+            if path
+        ]
+        result = trash.trash(paths)
+        failed = {
+            os.path.abspath(error["file_path"]): error for error in result.errors
+        }
+
+        successfully_deleted = []
+        errors = []
+        for file_pair in file_pairs:
+            pair_errors = [
+                failed[os.path.abspath(path)]["error"]
+                for path in (file_pair.archive_path, file_pair.preview_path)
+                if path and os.path.abspath(path) in failed
+            ]
+            if pair_errors:
+                error_msg = (
+                    f"Błąd usuwania {file_pair.name}: {'; '.join(pair_errors)}"
+                )
+                self.logger.error(error_msg)
+                errors.append(error_msg)
+            else:
+                successfully_deleted.append(file_pair)
+
+        self.logger.info(f"Przeniesiono do kosza {len(result.trashed)} plików")
+        return successfully_deleted, errors
+
     def bulk_move(
         self, file_pairs: List[FilePair], destination: str
     ) -> Tuple[List[FilePair], List[str]]:
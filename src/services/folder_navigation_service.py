@@ -0,0 +1,118 @@
+"""
+Nawigacja po folderach - skanowanie w tle z anulowaniem i wynikiem z cache.
+
+Kliknięcie folderu w drzewie nie skanuje już w wątku GUI. Ostatni wynik
+skanowania folderu (baza inkrementalna skanera, bez limitu wieku) jest
+zwracany natychmiast (stale-while-revalidate), a w tle startuje ponowne
+skanowanie - inkrementalne, z użyciem snapshotu katalogów. Folder bez
+wyniku w cache jest skanowany strumieniowo (pairs_batch_ready). Nowa nawigacja
+przerywa trwające skanowanie; wyniki przerwanych skanowań są pomijane.
+"""
+
+import logging
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from src.logic.scanner_cache import cache
+from src.utils.path_utils import normalize_path
+
+logger = logging.getLogger(__name__)
+
+
+class FolderNavigationService(QObject):
+    """Skanuje wybrany folder w tle; nowa nawigacja anuluje poprzednią."""
+
+    # ścieżka folderu, wynik scan_folder_for_pairs z cache (może być nieaktualny)
+    cached_result_ready = pyqtSignal(str, object)
+    # ścieżka folderu, partia par znalezionych w trakcie skanowania (bez cache)
+    pairs_batch_ready = pyqtSignal(str, list)
+    # ścieżka folderu, aktualny wynik scan_folder_for_pairs
+    scan_finished = pyqtSignal(str, object)
+    # ścieżka folderu, komunikat błędu
+    scan_failed = pyqtSignal(str, str)
+
+    def __init__(self, thread_pool: Optional[QThreadPool] = None):
+        super().__init__()
+        self._thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._worker = None
+        self._directory: Optional[str] = None
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    def is_scanning(self) -> bool:
+        return self._worker is not None
+
+    def navigate(
+        self, directory: str, max_depth: int = 0, pair_strategy: str = "first_match"
+    ) -> bool:
+        """
+        Rozpoczyna skanowanie folderu, przerywając poprzednie.
+
+        Jeśli folder był już skanowany, cached_result_ready jest emitowany
+        synchronicznie przed startem skanowania w tle. W przeciwnym razie
+        pary są emitowane partiami (pairs_batch_ready) przed scan_finished.
+
+        Returns:
+            True jeśli wyemitowano wynik z cache
+        """
+        self.cancel()
+        self._directory = normalize_path(directory)
+
+        has_cached_result = False
+        base = cache.get_incremental_base(self._directory, pair_strategy, max_depth)
+        if base is not None:
+            _, cached_result = base
+            self.cached_result_ready.emit(self._directory, cached_result)
+            has_cached_result = True
+
+        from src.ui.delegates.workers.scan_workers import DirectoryRescanWorker
+
+        worker = DirectoryRescanWorker(
+            self._directory,
+            max_depth,
+            pair_strategy,
+            stream_pairs=not has_cached_result,
+        )
+        worker.signals.pairs_batch_ready.connect(self._on_worker_pairs_batch)
+        worker.signals.finished.connect(self._on_worker_finished)
+        worker.signals.error.connect(self._on_worker_error)
+        self._worker = worker
+        self._thread_pool.start(worker)
+        logger.debug(
+            f"Nawigacja do {self._directory} "
+            f"({'z cache' if has_cached_result else 'bez cache'})"
+        )
+        return has_cached_result
+
+    def cancel(self):
+        """Przerywa trwające skanowanie; jego wynik zostanie pominięty."""
+        if self._worker is not None:
+            self._worker.interrupt()
+            self._worker = None
+
+    # --- Wewnętrzne ---
+
+    def _is_current_worker(self) -> bool:
+        """Czy sygnał pochodzi od bieżącego (nieanulowanego) workera."""
+        return self._worker is not None and self.sender() is self._worker.signals
+
+    def _on_worker_pairs_batch(self, pairs_batch: list):
+        if not self._is_current_worker():
+            return
+        self.pairs_batch_ready.emit(self._directory, pairs_batch)
+
+    def _on_worker_finished(self, result):
+        if not self._is_current_worker():
+            return
+        self._worker = None
+        directory, scan_result = result
+        self.scan_finished.emit(directory, scan_result)
+
+    def _on_worker_error(self, message: str):
+        if not self._is_current_worker():
+            return
+        self._worker = None
+        self.scan_failed.emit(self._directory, message)
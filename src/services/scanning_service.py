@@ -6,11 +6,12 @@ Separacja logiki biznesowej od UI zgodnie z Etapem 2 corrections.md
 import logging
 import os
 import time
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from src.logic import scanner
 from src.models.file_pair import FilePair
+from src.models.file_record import FileRecord
 from src.models.special_folder import SpecialFolder
 from src.utils.path_validator import PathValidator
 
@@ -26,6 +27,12 @@ class ScanResult:
     scan_time: float
     total_files: int
     error_message: Optional[str] = None
+    # Skanowany katalog (wynik ScanDirectoryWorker)
+    directory_path: str = ""
+    # Rekordy stat ze skanera (ścieżka -> FileRecord), o ile są dostępne
+    file_records: Dict[str, FileRecord] = field(default_factory=dict)
+    # Katalogi, których rekordy pochodzą ze snapshotu (mtime może być nieaktualny)
+    snapshot_record_directories: FrozenSet[str] = frozenset()
 
 
 class ScanningService:
@@ -79,6 +86,10 @@ class ScanningService:
                 special_folders=result[3],
                 scan_time=scan_time,
                 total_files=len(result[0]) * 2 + len(result[1]) + len(result[2]),
+                file_records=scanner.get_file_records(path),
+                snapshot_record_directories=scanner.get_snapshot_record_directories(
+                    path
+                ),
             )
 
             self.logger.info(
@@ -104,6 +115,19 @@ class ScanningService:
                 error_message=error_msg,
             )
 
+    def get_file_records(
+        self, path: str
+    ) -> Tuple[Dict[str, FileRecord], FrozenSet[str]]:
+        """
+        Zwraca rekordy plików z ostatniego skanowania katalogu (także
+        ponownego, np. przez obserwatora) oraz katalogi, których rekordy
+        pochodzą ze snapshotu.
+        """
+        return (
+            scanner.get_file_records(path),
+            scanner.get_snapshot_record_directories(path),
+        )
+
     def refresh_directory(self, path: str) -> ScanResult:
         """
         Odświeża katalog bez pełnego ponownego skanowania (jeśli możliwe).
@@ -33,6 +33,7 @@ from .bulk_workers import (
     BulkDeleteWorker,
     BulkMoveWorker,
     BulkMoveFilesWorker,
+    BulkJournalWorker,
 )
 
 # Processing workery
@@ -45,6 +46,7 @@ from .processing_workers import (
 
 # Scan workery
 from .scan_workers import (
+    DirectoryRescanWorker,
     ScanFolderWorker,
 )
 
@@ -63,13 +65,13 @@ __all__ = [
     'ManuallyPairFilesWorker', 'RenameFilePairWorker', 'DeleteFilePairWorker', 'MoveFilePairWorker',
     
     # Bulk workery
-    'BulkDeleteWorker', 'BulkMoveWorker', 'BulkMoveFilesWorker',
+    'BulkDeleteWorker', 'BulkMoveWorker', 'BulkMoveFilesWorker', 'BulkJournalWorker',
     
     # Processing workery
     'ThumbnailGenerationWorker', 'BatchThumbnailWorker', 'DataProcessingWorker', 'SaveMetadataWorker',
     
     # Scan workery
-    'ScanFolderWorker',
+    'ScanFolderWorker', 'DirectoryRescanWorker',
     
     # Factory
     'WorkerFactory',
@@ -52,6 +52,7 @@ class UnifiedWorkerSignals(QObject):
     scan_finished = pyqtSignal(
         list, list, list
     )  # found_pairs, unpaired_archives, unpaired_previews
+    pairs_batch_ready = pyqtSignal(list)  # pary znalezione w trakcie skanowania
 
 
 class UnifiedBaseWorker(QRunnable):
@@ -1,32 +1,45 @@
 """
 Workery do operacji masowych (bulk) na wielu plikach jednocześnie.
+
+Operacje na plikach wykonuje BulkFileEngine (pula wątków, dziennik operacji),
+a usuwanie do kosza - kosz systemowy (src.logic.trash); workery budują plan
+operacji i przekładają wynik na format oczekiwany przez UI.
 """
 
 import logging
 import os
-import shutil
-from collections import defaultdict
-from typing import List, Tuple
-
+from typing import List
+
+from src.config import AppConfig
+from src.logic.bulk_file_engine import (
+    BulkFileEngine,
+    BulkOperationResult,
+    FileOperation,
+    get_journal_dir,
+)
+from src.logic.trash import get_trash
 from src.models.file_pair import FilePair
 from src.utils.path_utils import normalize_path
 
-from .base_workers import BatchOperationMixin, UnifiedBaseWorker, WorkerPriority
+from .base_workers import UnifiedBaseWorker, WorkerPriority
 
 logger = logging.getLogger(__name__)
 
 
-class BulkWorkerBase(UnifiedBaseWorker, BatchOperationMixin):
+class BulkWorkerBase(UnifiedBaseWorker):
     """Klasa bazowa dla wszystkich bulk workerów z wspólną funkcjonalnością."""
 
     def __init__(self, timeout_seconds: int = 300, batch_size: int = 20):
         UnifiedBaseWorker.__init__(
             self, timeout_seconds=timeout_seconds, priority=WorkerPriority.NORMAL
         )
-        BatchOperationMixin.__init__(self, batch_size)
+        # Zachowane dla zgodności API (WorkerFactory); równoległością
+        # i zapisem dziennika steruje BulkFileEngine
+        self.batch_size = batch_size
         self.error_count = 0
         self.success_count = 0
         self.detailed_errors = []
+        self.journal_path = None
 
     def _validate_file_list(self, files: list, error_msg: str):
         """Wspólna walidacja listy plików."""
@@ -40,39 +53,24 @@ class BulkWorkerBase(UnifiedBaseWorker, BatchOperationMixin):
         if not os.path.isdir(directory):
             raise ValueError(f"{error_msg} - katalog nie istnieje: {directory}")
 
-    def _safe_file_operation(self, operation_func, file_path: str, *args, **kwargs):
-        """Bezpieczne wykonanie operacji na pliku z obsługą błędów."""
-        try:
-            return operation_func(file_path, *args, **kwargs)
-        except FileNotFoundError:
-            logger.warning(f"Plik nie istnieje: {file_path}")
-            return False
-        except PermissionError as e:
-            self.error_count += 1
-            self.detailed_errors.append(
-                {
-                    "file_path": file_path,
-                    "error": f"Brak uprawnień: {str(e)}",
-                    "error_type": "PERMISSION_ERROR",
-                }
-            )
-            logger.error(f"Brak uprawnień do {file_path}: {str(e)}")
-            return False
-        except Exception as e:
-            self.error_count += 1
-            self.detailed_errors.append(
-                {"file_path": file_path, "error": str(e), "error_type": "UNKNOWN_ERROR"}
-            )
-            logger.error(f"Błąd operacji na {file_path}: {str(e)}", exc_info=True)
-            return False
+    def _create_engine(self, progress_message: str) -> BulkFileEngine:
+        """Tworzy silnik operacji z przerwaniem i postępem tego workera."""
+        return BulkFileEngine(
+            journal_dir=get_journal_dir(),
+            interrupt_check=lambda: self._interrupted,
+            progress_callback=lambda processed, total: self.emit_progress_batched(
+                processed, total, progress_message
+            ),
+        )
 
-    def _emit_progress_with_throttle(
-        self, processed: int, total: int, message: str, throttle: int = 25
-    ):
-        """Emituj progress z throttling."""
-        if processed % throttle == 0 or processed % max(1, total // 20) == 0:
-            percent = int((processed / total) * 100)
-            self.emit_progress(percent, message)
+    def _collect_engine_result(self, result: BulkOperationResult):
+        """Przenosi błędy i stan przerwania z wyniku silnika do workera."""
+        self.success_count += len(result.completed)
+        self.error_count += len(result.errors)
+        self.detailed_errors.extend(result.errors)
+        self.journal_path = result.journal_path
+        if result.interrupted:
+            self.emit_interrupted()
 
 
 class BulkDeleteWorker(BulkWorkerBase):
@@ -88,26 +86,40 @@ class BulkDeleteWorker(BulkWorkerBase):
             self.files_to_delete, "Lista plików do usunięcia jest pusta"
         )
 
-    def _group_files_by_directory(self) -> dict:
-        """Grupuje pliki według katalogów."""
-        grouped = defaultdict(list)
+    def _plan_operations(self) -> List[FileOperation]:
+        operations = []
         for file_pair in self.files_to_delete:
             if file_pair.archive_path:
-                archive_dir = os.path.dirname(file_pair.archive_path)
-                grouped[archive_dir].append(("archive", file_pair.archive_path))
+                operations.append(
+                    FileOperation(file_pair.archive_path, tag="archive")
+                )
             if file_pair.preview_path:
-                preview_dir = os.path.dirname(file_pair.preview_path)
-                grouped[preview_dir].append(("preview", file_pair.preview_path))
-        return grouped
-
-    def _process_batch_implementation(self, batch_data: List[Tuple[str, str]]):
-        for file_type, file_path in batch_data:
-            if self.check_interruption():
-                return
-
-            if self._safe_file_operation(os.remove, file_path):
-                self.deleted_files.append((file_type, file_path))
-                self.success_count += 1
+                operations.append(
+                    FileOperation(file_pair.preview_path, tag="preview")
+                )
+        return operations
+
+    def _delete_to_trash(self, trash):
+        """Przenosi pliki do kosza (zmiana nazw w obrębie systemu plików)."""
+        operations = self._plan_operations()
+        trash_result = trash.trash(
+            [op.source for op in operations],
+            interrupt_check=lambda: self._interrupted,
+            progress_callback=lambda processed, total: self.emit_progress_batched(
+                processed, total, "Przenoszenie plików do kosza..."
+            ),
+        )
+        trashed = {os.path.abspath(source) for source, _ in trash_result.trashed}
+        self.deleted_files = [
+            (op.tag, op.source)
+            for op in operations
+            if os.path.abspath(op.source) in trashed
+        ]
+        self.success_count += len(self.deleted_files)
+        self.error_count += len(trash_result.errors)
+        self.detailed_errors.extend(trash_result.errors)
+        if trash_result.interrupted:
+            self.emit_interrupted()
 
     def _run_implementation(self):
         try:
@@ -115,24 +127,18 @@ class BulkDeleteWorker(BulkWorkerBase):
             total_pairs = len(self.files_to_delete)
             self.emit_progress(0, f"Rozpoczęto usuwanie {total_pairs} par plików...")
 
-            grouped_files = self._group_files_by_directory()
-            processed_pairs = 0
-
-            for directory, files_in_dir in grouped_files.items():
-                if self.check_interruption():
-                    break
-
-                for file_info in files_in_dir:
-                    self.add_to_batch(file_info)
-                    processed_pairs += 1
-
-                    self._emit_progress_with_throttle(
-                        processed_pairs,
-                        total_pairs * 2,
-                        f"Usuwanie: {len(self.deleted_files)} plików usuniętych...",
-                    )
-
-            self.finalize_batches()
+            trash = None
+            if AppConfig.get_instance().get("delete_to_trash", True):
+                trash = get_trash()
+            if trash is not None:
+                self._delete_to_trash(trash)
+            else:
+                engine = self._create_engine("Usuwanie plików...")
+                engine_result = engine.delete(self._plan_operations())
+                self._collect_engine_result(engine_result)
+                self.deleted_files = [
+                    (op.tag, op.source) for op in engine_result.completed
+                ]
 
             message = f"Usunięto {len(self.deleted_files)} plików."
             if self.error_count > 0:
@@ -167,93 +173,55 @@ class BulkMoveWorker(BulkWorkerBase):
         )
         self._validate_directory(self.destination_dir, "Katalog docelowy")
 
-    def _group_files_by_source_directory(self) -> dict:
-        """Grupuje pliki według katalogów źródłowych."""
-        grouped = defaultdict(list)
-        for file_pair in self.files_to_move:
-            if file_pair.archive_path:
-                source_dir = os.path.dirname(file_pair.archive_path)
-                grouped[source_dir].append(
-                    ("archive", file_pair.archive_path, file_pair)
-                )
-            if file_pair.preview_path:
-                source_dir = os.path.dirname(file_pair.preview_path)
-                grouped[source_dir].append(
-                    ("preview", file_pair.preview_path, file_pair)
-                )
-        return grouped
-
-    def _move_file_safe(self, source_path: str, target_path: str) -> bool:
-        """Bezpieczne przeniesienie pliku."""
-        if os.path.exists(target_path):
-            self.skipped_count += 1
-            self.skipped_files.append(
-                {
-                    "file_path": source_path,
-                    "target_path": target_path,
-                    "reason": "Plik już istnieje",
-                }
-            )
-            return False
-
-        return self._safe_file_operation(shutil.move, source_path, target_path)
-
-    def _process_batch_implementation(
-        self, batch_data: List[Tuple[str, str, FilePair]]
-    ):
+    def _plan_operations(self) -> List[FileOperation]:
         dest_dir = normalize_path(self.destination_dir)
-
-        for file_type, file_path, file_pair in batch_data:
-            if self.check_interruption():
-                return
-
-            filename = os.path.basename(file_path)
-            target_path = os.path.join(dest_dir, filename)
-
-            if self._move_file_safe(file_path, target_path):
-                self.moved_files.append((file_path, target_path))
-                self.success_count += 1
-
-                # Aktualizuj ścieżkę w file_pair
-                if file_type == "archive":
-                    file_pair.archive_path = target_path
-                else:
-                    file_pair.preview_path = target_path
-
-                if file_pair not in self.updated_file_pairs:
-                    self.updated_file_pairs.append(file_pair)
+        operations = []
+        for file_pair in self.files_to_move:
+            for file_type, file_path in (
+                ("archive", file_pair.archive_path),
+                ("preview", file_pair.preview_path),
+            ):
+                if file_path:
+                    target_path = os.path.join(dest_dir, os.path.basename(file_path))
+                    operations.append(
+                        FileOperation(file_path, target_path, (file_type, file_pair))
+                    )
+        return operations
+
+    def _apply_moves(self, completed: List[FileOperation]):
+        """Aktualizuje ścieżki w parach plików po przeniesieniu."""
+        updated_ids = set()
+        for op in completed:
+            file_type, file_pair = op.tag
+            self.moved_files.append((op.source, op.target))
+            if file_type == "archive":
+                file_pair.archive_path = op.target
+            else:
+                file_pair.preview_path = op.target
+
+            if id(file_pair) not in updated_ids:
+                updated_ids.add(id(file_pair))
+                self.updated_file_pairs.append(file_pair)
 
     def _run_implementation(self):
         try:
             self._validate_inputs()
-            total_files = len(self.files_to_move) * 2  # archive + preview
             self.emit_progress(
                 0, f"Rozpoczęto przenoszenie {len(self.files_to_move)} par plików..."
             )
 
-            grouped_files = self._group_files_by_source_directory()
-            processed_files = 0
-
-            for source_directory, files_in_dir in grouped_files.items():
-                if self.check_interruption():
-                    break
-
-                for file_info in files_in_dir:
-                    self.add_to_batch(file_info)
-                    processed_files += 1
-
-                    self._emit_progress_with_throttle(
-                        processed_files,
-                        total_files,
-                        f"Przenoszenie: {len(self.moved_files)} plików przeniesiono...",
-                    )
-
-            self.finalize_batches()
+            engine = self._create_engine("Przenoszenie plików...")
+            engine_result = engine.move(self._plan_operations())
+            self._collect_engine_result(engine_result)
+            self._apply_moves(engine_result.completed)
+            self.skipped_files = engine_result.skipped
+            self.skipped_count = len(engine_result.skipped)
 
             result = {
                 "moved_pairs": self.updated_file_pairs,
                 "detailed_errors": self.detailed_errors,
                 "skipped_files": self.skipped_files,
+                "journal_path": self.journal_path,
                 "summary": {
                     "total_requested": len(self.files_to_move),
                     "successfully_moved": len(self.updated_file_pairs),
@@ -292,57 +260,33 @@ class BulkMoveFilesWorker(BulkWorkerBase):
         )
         self._validate_directory(self.destination_dir, "Katalog docelowy")
 
-    def _process_batch_implementation(self, batch_data: List[str]):
-        dest_dir = normalize_path(self.destination_dir)
-
-        for file_path in batch_data:
-            if self.check_interruption():
-                return
-
-            filename = os.path.basename(file_path)
-            target_path = os.path.join(dest_dir, filename)
-
-            if os.path.exists(target_path):
-                self.skipped_count += 1
-                self.skipped_files.append(
-                    {
-                        "file_path": file_path,
-                        "target_path": target_path,
-                        "reason": "Plik już istnieje",
-                    }
-                )
-                continue
-
-            if self._safe_file_operation(shutil.move, file_path, target_path):
-                self.moved_files.append((file_path, target_path))
-                self.success_count += 1
-
     def _run_implementation(self):
         try:
             self._validate_inputs()
             total_files = len(self.file_paths)
             self.emit_progress(0, f"Rozpoczęto przenoszenie {total_files} plików...")
 
-            processed_files = 0
-            for file_path in self.file_paths:
-                if self.check_interruption():
-                    break
-
-                self.add_to_batch(file_path)
-                processed_files += 1
-
-                self._emit_progress_with_throttle(
-                    processed_files,
-                    total_files,
-                    f"Przenoszenie: {len(self.moved_files)} plików przeniesiono...",
+            dest_dir = normalize_path(self.destination_dir)
+            operations = [
+                FileOperation(
+                    file_path, os.path.join(dest_dir, os.path.basename(file_path))
                 )
-
-            self.finalize_batches()
+                for file_path in self.file_paths
+            ]
+            engine = self._create_engine("Przenoszenie plików...")
+            engine_result = engine.move(operations)
+            self._collect_engine_result(engine_result)
+            self.moved_files = [
+                (op.source, op.target) for op in engine_result.completed
+            ]
+            self.skipped_files = engine_result.skipped
+            self.skipped_count = len(engine_result.skipped)
 
             result = {
                 "moved_files": self.moved_files,
                 "detailed_errors": self.detailed_errors,
                 "skipped_files": self.skipped_files,
+                "journal_path": self.journal_path,
                 "summary": {
                     "total_requested": total_files,
                     "successfully_moved": self.success_count,
@@ -377,31 +321,23 @@ class MoveUnpairedArchivesWorker(BulkWorkerBase):
         )
         self._validate_directory(self.target_folder, "Folder docelowy")
 
-    def _get_unique_filename(self, target_path: str) -> str:
-        """Generuje unikalną nazwę pliku jeśli już istnieje."""
-        if not os.path.exists(target_path):
-            return target_path
-
-        base, ext = os.path.splitext(target_path)
-        counter = 1
-        while os.path.exists(f"{base}_{counter}{ext}"):
-            counter += 1
-        return f"{base}_{counter}{ext}"
-
-    def _process_batch_implementation(self, batch_data: List[str]):
-        for archive_path in batch_data:
-            if self.check_interruption():
-                return
+    def _get_unique_filename(self, target_path: str, reserved: set) -> str:
+        """
+        Generuje unikalną nazwę pliku jeśli już istnieje lub została
+        przydzielona innemu archiwum z tej samej operacji.
+        """
 
-            filename = os.path.basename(archive_path)
-            target_path = os.path.join(self.target_folder, filename)
+        def is_taken(path: str) -> bool:
+            return os.path.normcase(path) in reserved or os.path.exists(path)
 
-            # Wygeneruj unikalną nazwę jeśli plik już istnieje
-            target_path = self._get_unique_filename(target_path)
-
-            if self._safe_file_operation(shutil.move, archive_path, target_path):
-                self.moved_files.append((archive_path, target_path))
-                self.success_count += 1
+        if is_taken(target_path):
+            base, ext = os.path.splitext(target_path)
+            counter = 1
+            while is_taken(f"{base}_{counter}{ext}"):
+                counter += 1
+            target_path = f"{base}_{counter}{ext}"
+        reserved.add(os.path.normcase(target_path))
+        return target_path
 
     def _run_implementation(self):
         try:
@@ -411,26 +347,31 @@ class MoveUnpairedArchivesWorker(BulkWorkerBase):
                 0, f"Rozpoczęto przenoszenie {total_files} plików archiwum..."
             )
 
-            processed_files = 0
-            for archive_path in self.unpaired_archives:
-                if self.check_interruption():
-                    break
-
-                self.add_to_batch(archive_path)
-                processed_files += 1
-
-                self._emit_progress_with_throttle(
-                    processed_files,
-                    total_files,
-                    f"Przenoszenie: {len(self.moved_files)} archiwów przeniesiono...",
-                    throttle=10,
+            reserved = set()
+            operations = [
+                FileOperation(
+                    archive_path,
+                    self._get_unique_filename(
+                        os.path.join(
+                            self.target_folder, os.path.basename(archive_path)
+                        ),
+                        reserved,
+                    ),
                 )
-
-            self.finalize_batches()
+                for archive_path in self.unpaired_archives
+            ]
+            engine = self._create_engine("Przenoszenie archiwów...")
+            engine_result = engine.move(operations)
+            self._collect_engine_result(engine_result)
+            self.moved_files = [
+                (op.source, op.target) for op in engine_result.completed
+            ]
 
             result = {
                 "moved_files": self.moved_files,
                 "detailed_errors": self.detailed_errors,
+                "skipped_files": engine_result.skipped,
+                "journal_path": self.journal_path,
                 "summary": {
                     "total_requested": total_files,
                     "successfully_moved": self.success_count,
@@ -445,3 +386,50 @@ class MoveUnpairedArchivesWorker(BulkWorkerBase):
             self.emit_error(f"Błąd walidacji: {str(ve)}")
         except Exception as e:
             self.emit_error(f"Nieoczekiwany błąd: {str(e)}", e)
+
+
+class BulkJournalWorker(BulkWorkerBase):
+    """
+    Worker dokańczający (resume) lub cofający (rollback) operację masową
+    przerwaną w poprzedniej sesji, na podstawie jej dziennika.
+    """
+
+    def __init__(self, journal_path: str, rollback: bool = False):
+        super().__init__(timeout_seconds=600)
+        self.source_journal_path = journal_path
+        self.rollback = rollback
+
+    def _run_implementation(self):
+        try:
+            if self.rollback:
+                self.emit_progress(0, "Cofanie przerwanej operacji...")
+                engine = self._create_engine("Cofanie przeniesień...")
+                engine_result = engine.rollback(self.source_journal_path)
+            else:
+                self.emit_progress(0, "Dokańczanie przerwanej operacji...")
+                engine = self._create_engine("Dokańczanie operacji...")
+                engine_result = engine.resume(self.source_journal_path)
+            self._collect_engine_result(engine_result)
+
+            result = {
+                "completed_files": [
+                    (op.source, op.target) for op in engine_result.completed
+                ],
+                "detailed_errors": self.detailed_errors,
+                "skipped_files": engine_result.skipped,
+                "journal_path": self.journal_path,
+                "rollback": self.rollback,
+                "summary": {
+                    "completed": self.success_count,
+                    "errors": self.error_count,
+                    "skipped": len(engine_result.skipped),
+                },
+            }
+
+            self.emit_progress(100, f"Przetworzono {self.success_count} plików")
+            self.emit_finished(result)
+
+        except ValueError as ve:
+            self.emit_error(f"Błąd walidacji: {str(ve)}")
+        except Exception as e:
+            self.emit_error(f"Nieoczekiwany błąd: {str(e)}", e)
@@ -5,14 +5,19 @@ Workery do przetwarzania i generowania danych (miniaturek, metadanych).
 import logging
 import os
 import time
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Tuple
 
-from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QSize, Qt, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QPixmap
 
 from src.logic.metadata.metadata_core import MetadataManager
 from src.models.file_pair import FilePair
-from src.utils.image_utils import create_thumbnail_from_file
+from src.utils.image_utils import (
+    create_thumbnail_from_file,
+    should_preserve_thumbnail_transparency,
+)
+from src.utils.thumbnail_process_pool import ThumbnailProcessPool
 
 from .base_workers import AsyncUnifiedBaseWorker, UnifiedBaseWorker, WorkerPriority
 
@@ -71,6 +76,26 @@ class ThumbnailGenerationWorker(UnifiedBaseWorker):
         logger.error(f"Błąd generowania miniatury: {message}")
         self.signals.thumbnail_error.emit(message, self.path, self.width, self.height)
 
+    def _create_pixmap(self, width: int, height: int) -> QPixmap:
+        """Tworzy miniaturkę - w puli procesów, jeśli jest włączona."""
+        if ThumbnailProcessPool.is_enabled():
+            try:
+                pool = ThumbnailProcessPool.get_instance()
+                for _, _, _, image, error in pool.generate(
+                    [(self.path, width, height)],
+                    should_preserve_thumbnail_transparency(),
+                ):
+                    if image is not None:
+                        return QPixmap.fromImage(image)
+                    logger.debug(f"Pula procesów: {error} - generuję w wątku")
+            except BrokenProcessPool as e:
+                logger.warning(f"Awaria puli procesów miniaturek: {e}")
+                ThumbnailProcessPool.get_instance().reset()
+
+        return create_thumbnail_from_file(
+            self.path, width, height, placeholder_on_error=False
+        )
+
     def _run_implementation(self):
         """Generuje miniaturkę dla określonego pliku."""
         try:
@@ -104,16 +129,37 @@ class ThumbnailGenerationWorker(UnifiedBaseWorker):
 
             # Generowanie miniaturki z proper context management
             try:
-                pixmap = create_thumbnail_from_file(self.path, self.width, self.height)
+                # Kwadratowe miniatury generowane są raz na poziomie mip, z którego
+                # powstaje dokładny rozmiar i niższe poziomy (zmiana rozmiaru
+                # suwakiem nie wymaga ponownego dekodowania)
+                mip_level = ThumbnailCache.mip_level_for(self.width, self.height)
+                if mip_level is None:
+                    pixmap = self._create_pixmap(self.width, self.height)
+                else:
+                    mip_pixmap = self._create_pixmap(mip_level, mip_level)
+                    pixmap = mip_pixmap
+                    if mip_level != self.width and not mip_pixmap.isNull():
+                        pixmap = mip_pixmap.scaled(
+                            QSize(self.width, self.height),
+                            Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation,
+                        )
 
                 if pixmap.isNull():
                     self.emit_error(f"Nie udało się utworzyć miniatury dla {self.path}")
                     return
 
+                # Kodowanie dla dyskowego cache poza blokadą cache
+                encoded_data = ThumbnailCache.get_instance().encode_thumbnail(pixmap)
+
                 # Zapisz do cache z resource protection
                 def save_to_cache():
                     cache = ThumbnailCache.get_instance()
-                    cache.add_thumbnail(self.path, self.width, self.height, pixmap)
+                    cache.add_thumbnail(
+                        self.path, self.width, self.height, pixmap, encoded_data
+                    )
+                    if mip_level is not None:
+                        cache.add_mip_chain(self.path, mip_level, mip_pixmap)
 
                 self.with_thumbnail_cache_lock(save_to_cache)
 
@@ -182,8 +228,16 @@ class BatchThumbnailWorker(UnifiedBaseWorker):
             )
 
             processed_count = 0
+            requests = self.thumbnail_requests
 
-            for idx, (path, width, height) in enumerate(self.thumbnail_requests):
+            if ThumbnailProcessPool.is_enabled() and total_requests > 1:
+                processed_count, requests = self._run_with_process_pool(
+                    ThumbnailCache
+                )
+                if processed_count is None:
+                    return
+
+            for idx, (path, width, height) in enumerate(requests):
                 if self.check_interruption():
                     return
 
@@ -212,7 +266,9 @@ class BatchThumbnailWorker(UnifiedBaseWorker):
                         self.emit_error(f"Plik nie istnieje", path, width, height)
                         continue
 
-                    pixmap = create_thumbnail_from_file(path, width, height)
+                    pixmap = create_thumbnail_from_file(
+                        path, width, height, placeholder_on_error=False
+                    )
 
                     if pixmap.isNull():
                         self.emit_error(
@@ -220,10 +276,15 @@ class BatchThumbnailWorker(UnifiedBaseWorker):
                         )
                         continue
 
+                    # Kodowanie dla dyskowego cache poza blokadą cache
+                    encoded_data = ThumbnailCache.get_instance().encode_thumbnail(
+                        pixmap
+                    )
+
                     # Zapisz do cache z resource protection
                     def save_to_cache():
                         cache = ThumbnailCache.get_instance()
-                        cache.add_thumbnail(path, width, height, pixmap)
+                        cache.add_thumbnail(path, width, height, pixmap, encoded_data)
 
                     self.with_thumbnail_cache_lock(save_to_cache)
 
@@ -240,13 +301,95 @@ class BatchThumbnailWorker(UnifiedBaseWorker):
                 f"Zakończono generowanie miniatur. "
                 f"Sukces: {processed_count}/{total_requests}",
             )
-            self.emit_finished(processed_count)
+            super().emit_finished(processed_count)
 
         except ValueError as ve:
             self.emit_error(f"Błąd walidacji: {str(ve)}", "", 0, 0)
         except Exception as e:
             self.emit_error(f"Nieoczekiwany błąd: {str(e)}", "", 0, 0)
 
+    def _run_with_process_pool(self, thumbnail_cache_class):
+        """
+        Generuje brakujące miniatury w puli procesów (poza GIL).
+
+        Trafienia w cache są obsługiwane w wątku workera, reszta trafia
+        paczkami do procesów roboczych. Wyniki (surowe piksele) zasilają
+        ThumbnailCache i sygnały thumbnail_finished jak w trybie wątkowym.
+
+        Returns:
+            Krotka (liczba sukcesów lub None przy przerwaniu, żądania do
+            wygenerowania w wątku - niepusta tylko po awarii puli)
+        """
+        total_requests = len(self.thumbnail_requests)
+        processed_count = 0
+        missing = []
+
+        for path, width, height in self.thumbnail_requests:
+            if self.check_interruption():
+                return None, []
+
+            def get_from_cache():
+                cache = thumbnail_cache_class.get_instance()
+                return cache.get_thumbnail(path, width, height)
+
+            cached_pixmap = self.with_thumbnail_cache_lock(get_from_cache)
+            if cached_pixmap is not None:
+                self.emit_finished(cached_pixmap, path, width, height)
+                processed_count += 1
+            elif not os.path.exists(path):
+                self.emit_error("Plik nie istnieje", path, width, height)
+            else:
+                missing.append((path, width, height))
+
+        completed = set()
+        completed_count = 0
+        pool = ThumbnailProcessPool.get_instance()
+        try:
+            for path, width, height, image, error in pool.generate(
+                missing,
+                should_preserve_thumbnail_transparency(),
+                interrupt_check=self.check_interruption,
+            ):
+                completed.add((path, width, height))
+                completed_count += 1
+                if image is None or image.isNull():
+                    self.emit_error(
+                        f"Nie udało się utworzyć miniatury: {error}",
+                        path,
+                        width,
+                        height,
+                    )
+                    continue
+
+                pixmap = QPixmap.fromImage(image)
+                encoded_data = thumbnail_cache_class.get_instance().encode_thumbnail(
+                    image
+                )
+
+                def save_to_cache():
+                    cache = thumbnail_cache_class.get_instance()
+                    cache.add_thumbnail(path, width, height, pixmap, encoded_data)
+
+                self.with_thumbnail_cache_lock(save_to_cache)
+                self.emit_finished(pixmap, path, width, height)
+                processed_count += 1
+
+                done_count = total_requests - len(missing) + completed_count
+                if done_count % 5 == 0:
+                    self.emit_progress(
+                        int(done_count / total_requests * 100),
+                        f"Generowanie miniatur: {done_count}/{total_requests}...",
+                    )
+        except BrokenProcessPool as e:
+            logger.warning(f"Awaria puli procesów miniaturek, generuję w wątku: {e}")
+            pool.reset()
+            remaining = [r for r in missing if r not in completed]
+            return processed_count, remaining
+
+        if completed_count < len(missing):
+            return None, []  # Przerwano
+        return processed_count, []
+
 
 class DataProcessingWorker(QObject):
     """
@@ -4,11 +4,13 @@ Workery do skanowania folderów i zarządzania plikami.
 
 import logging
 import os
+import time
 from PyQt6.QtCore import QThreadPool
 
 from .base_workers import UnifiedBaseWorker
 from src.ui.delegates.scanner_worker import ScanFolderWorkerQRunnable
-from src.logic.scanner_core import scan_folder_for_pairs
+from src.logic.scanner import get_file_records, get_snapshot_record_directories
+from src.logic.scanner_core import ScanningInterrupted, scan_folder_for_pairs
 from src.models.file_pair import FilePair
 from src.services.scanning_service import ScanResult
 from src.ui.directory_tree.data_classes import FolderStatistics
@@ -96,8 +98,48 @@ class ScanFolderWorker(UnifiedBaseWorker):
             self.emit_error(f"Błąd podczas uruchamiania skanowania: {str(e)}", e)
 
 
-class ScanDirectoryWorker(UnifiedBaseWorker):
-    """Worker do asynchronicznego skanowania katalogu."""
+class PairsBatchMixin:
+    """
+    Mixin dla workerów skanowania emitujących pary w trakcie skanowania.
+
+    Pary przekazane przez pairs_callback skanera są zbierane i emitowane
+    sygnałem pairs_batch_ready - pierwsza partia od razu, kolejne nie
+    częściej niż co PAIRS_BATCH_INTERVAL_S.
+    """
+
+    PAIRS_BATCH_INTERVAL_S = 0.25
+
+    def _init_pairs_batch(self):
+        self._pending_pairs = []
+        self._last_batch_time = None
+
+    def _on_pairs_found(self, pairs):
+        """Zbiera pary z katalogu i emituje partię, gdy minął interwał."""
+        self._pending_pairs.extend(pairs)
+        now = time.time()
+        if (
+            self._last_batch_time is None
+            or now - self._last_batch_time >= self.PAIRS_BATCH_INTERVAL_S
+        ):
+            self._emit_pairs_batch(now)
+
+    def _emit_pairs_batch(self, now: float):
+        if self._pending_pairs:
+            self.signals.pairs_batch_ready.emit(self._pending_pairs)
+            self._pending_pairs = []
+        self._last_batch_time = now
+
+
+class ScanDirectoryWorker(PairsBatchMixin, UnifiedBaseWorker):
+    """
+    Worker do asynchronicznego skanowania katalogu.
+
+    Skanuje strumieniowo: pary z już odczytanych katalogów są emitowane
+    sygnałem pairs_batch_ready w trakcie skanowania (pierwsza partia od razu,
+    kolejne nie częściej niż co PAIRS_BATCH_INTERVAL_S). Pełny wynik
+    (ScanResult z niesparowanymi plikami i folderami specjalnymi) przychodzi
+    sygnałem finished, po ostatniej partii.
+    """
 
     def __init__(self, directory_path: str, max_depth: int = -1):
         """
@@ -108,21 +150,31 @@ class ScanDirectoryWorker(UnifiedBaseWorker):
             max_depth: Maksymalna głębokość skanowania.
         """
         super().__init__()
+        self._init_pairs_batch()
         self.directory_path = directory_path
         self.max_depth = max_depth
-        self.signals.moveToMainThread()
 
     def _run_implementation(self) -> ScanResult:
         """
         Wykonuje skanowanie w osobnym wątku.
         """
         self.emit_progress(0, f"Skanowanie: {os.path.basename(self.directory_path)}...")
-        
-        file_pairs, unpaired_archives, unpaired_previews, special_folders = scan_folder_for_pairs(
-            directory=self.directory_path,
-            max_depth=self.max_depth,
-            progress_callback=self.emit_progress,
-        )
+
+        start_time = time.time()
+        try:
+            file_pairs, unpaired_archives, unpaired_previews, special_folders = (
+                scan_folder_for_pairs(
+                    directory=self.directory_path,
+                    max_depth=self.max_depth,
+                    interrupt_check=lambda: self._interrupted,
+                    progress_callback=self.emit_progress,
+                    pairs_callback=self._on_pairs_found,
+                )
+            )
+        except ScanningInterrupted:
+            self.emit_interrupted()
+            return None
+        self._emit_pairs_batch(time.time())
 
         scan_result = ScanResult(
             directory_path=self.directory_path,
@@ -130,7 +182,61 @@ class ScanDirectoryWorker(UnifiedBaseWorker):
             unpaired_archives=unpaired_archives,
             unpaired_previews=unpaired_previews,
             special_folders=special_folders,
+            scan_time=time.time() - start_time,
+            total_files=(
+                len(file_pairs) * 2 + len(unpaired_archives) + len(unpaired_previews)
+            ),
+            file_records=get_file_records(self.directory_path),
+            snapshot_record_directories=get_snapshot_record_directories(
+                self.directory_path
+            ),
         )
 
         self.emit_progress(100, f"Znaleziono {len(scan_result.file_pairs)} par")
-        return scan_result 
\ No newline at end of file
+        self.emit_finished(scan_result)
+        return scan_result
+
+
+class DirectoryRescanWorker(PairsBatchMixin, UnifiedBaseWorker):
+    """
+    Worker ponownego skanowania folderu po zmianach wykrytych przez obserwatora
+    oraz przy nawigacji po folderach (FolderNavigationService).
+
+    Skanuje z tą samą głębokością i strategią co skanowanie wyświetlanych
+    danych, z pominięciem cache wyniku - inkrementalne parowanie zachowuje
+    obiekty FilePair dla niezmienionych plików. Wynik: (ścieżka folderu,
+    wynik scan_folder_for_pairs). Przerwanie (interrupt) kończy skanowanie
+    sygnałem interrupted. Z stream_pairs=True pary są dodatkowo emitowane
+    partiami (pairs_batch_ready) w trakcie skanowania, przed finished.
+    """
+
+    def __init__(
+        self,
+        directory_path: str,
+        max_depth: int = -1,
+        pair_strategy: str = "first_match",
+        stream_pairs: bool = False,
+    ):
+        super().__init__()
+        self._init_pairs_batch()
+        self.directory_path = directory_path
+        self.max_depth = max_depth
+        self.pair_strategy = pair_strategy
+        self.stream_pairs = stream_pairs
+
+    def _run_implementation(self):
+        try:
+            scan_result = scan_folder_for_pairs(
+                directory=self.directory_path,
+                max_depth=self.max_depth,
+                pair_strategy=self.pair_strategy,
+                force_refresh_cache=True,
+                interrupt_check=lambda: self._interrupted,
+                pairs_callback=self._on_pairs_found if self.stream_pairs else None,
+            )
+        except ScanningInterrupted:
+            self.emit_interrupted()
+            return
+        if self.stream_pairs:
+            self._emit_pairs_batch(time.time())
+        self.emit_finished((self.directory_path, scan_result))
@@ -1,5 +1,10 @@
 from dataclasses import dataclass
 
+from src.logic.folder_stats_engine import DirectoryStats
+
+_BYTES_PER_GB = 1024**3
+
+
 @dataclass
 class FolderStatistics:
     """Statystyki folderu - rozmiar i liczba par plików."""
@@ -17,6 +22,17 @@ class FolderStatistics:
     def total_pairs(self) -> int:
         return self.pairs_count + self.subfolders_pairs
 
+    @classmethod
+    def from_directory_stats(cls, stats: DirectoryStats) -> "FolderStatistics":
+        """Tworzy statystyki folderu z wyniku FolderStatsEngine."""
+        return cls(
+            size_gb=stats.size / _BYTES_PER_GB,
+            pairs_count=stats.pairs,
+            subfolders_size_gb=(stats.total_size - stats.size) / _BYTES_PER_GB,
+            subfolders_pairs=stats.total_pairs - stats.pairs,
+            total_files=stats.total_files,
+        )
+
 # ... istniejący kod ...
 # Tu zostanie przeniesiona klasa FolderStatistics oraz sygnały z pliku directory_tree_manager.py
 # ... istniejący kod ... 
\ No newline at end of file
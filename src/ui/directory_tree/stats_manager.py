@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, List, Optional, Callable
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QMessageBox, QProgressDialog
 
+from src.logic.folder_stats_engine import FolderStatsEngine
+
 from .data_classes import FolderStatistics
 from .workers import FolderStatisticsWorker
 
@@ -43,9 +45,11 @@ class DirectoryTreeStatsManager:
             logger.debug("Brak widocznych folderów do obliczenia statystyk")
             return
 
-        # Deleguj do worker_coordinator
+        # Deleguj do worker_coordinator - jedno przejście po całym drzewie
         self.worker_coordinator.start_background_stats_calculation(
-            visible_folders=visible_folders, data_manager=self.data_manager
+            visible_folders=visible_folders,
+            data_manager=self.data_manager,
+            callback=self._refresh_folders_display,
         )
 
     def _get_visible_folders(self) -> List[str]:
@@ -98,6 +102,11 @@ class DirectoryTreeStatsManager:
             callback=lambda stats: self._refresh_folder_display(folder_path),
         )
 
+    def _refresh_folders_display(self, folder_paths: List[str]):
+        """Odświeża wyświetlanie folderów, dla których przeliczono statystyki."""
+        for folder_path in folder_paths:
+            self._refresh_folder_display(folder_path)
+
     def _refresh_folder_display(self, folder_path: str):
         """Odświeża wyświetlanie konkretnego folderu w drzewie."""
         try:
@@ -199,11 +208,11 @@ Dane z cache: {'Tak' if self.manager.get_cached_folder_statistics(folder_path) e
 
         visible_folders = self._get_visible_folders()
 
+        # Silnik zapomina całe drzewo, a przeliczenie to jedno przejście
+        FolderStatsEngine.get_instance().invalidate(self.manager._main_working_directory)
         for folder_path in visible_folders:
-            # Usuń z cache aby wymusić przeliczenie
             self.manager.invalidate_folder_cache(folder_path)
-            # Rozpocznij przeliczanie
-            self._calculate_stats_async_silent(folder_path)
+        self.start_background_stats_calculation()
 
         logger.info(
             f"Rozpoczęto przeliczanie statystyk dla {len(visible_folders)} folderów"
@@ -211,8 +220,9 @@ Dane z cache: {'Tak' if self.manager.get_cached_folder_statistics(folder_path) e
 
     def _force_recalculate_folder_stats(self, folder_path: str):
         """Wymuś przeliczenie statystyk dla konkretnego folderu."""
-        # Usuń z cache
+        # Usuń z cache (również rekordy silnika - nadpisane pliki nie zmieniają mtime)
         self.manager.invalidate_folder_cache(folder_path)
+        FolderStatsEngine.get_instance().invalidate(folder_path)
         # Rozpocznij przeliczanie
         self._calculate_stats_async_silent(folder_path)
         logger.info(f"Rozpoczęto przeliczanie statystyk dla folderu: {folder_path}")
\ No newline at end of file
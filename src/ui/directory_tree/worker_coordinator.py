@@ -5,6 +5,8 @@ Zarządza wątkami skanowania i aktualizacji.
 
 import logging
 from PyQt6.QtCore import QThreadPool
+from src.utils.path_utils import normalize_path
+
 from .throttled_scheduler import ThrottledWorkerScheduler
 from .workers import FolderStatisticsWorker, FolderScanWorker
 
@@ -92,55 +94,67 @@ class DirectoryTreeWorkerCoordinator:
             logger.error(f"Błąd uruchamiania statystyk {folder_path}: {e}")
             return False
 
-    def start_background_stats_calculation(self, visible_folders: list, data_manager):
-        """Rozpoczyna obliczanie statystyk w tle dla widocznych folderów."""
-        stats_calculated = 0
-        
-        for folder_path in visible_folders:
-            # Sprawdź czy statystyki są już w cache
-            cached_stats = data_manager.load_directory_data(folder_path)
-            if cached_stats:
-                continue  # Pomiń - są już w cache
-            
-            # Użyj scheduler do throttling
-            def create_stats_worker(path=folder_path):
-                def worker_factory():
-                    return self._create_stats_worker_with_manager(path, data_manager)
-                return worker_factory
-
-            task_scheduled = self.scheduler.schedule_task(
-                f"stats_{folder_path}", 
-                create_stats_worker(folder_path)
+    def start_background_stats_calculation(
+        self, visible_folders: list, data_manager, callback=None
+    ):
+        """
+        Rozpoczyna obliczanie statystyk w tle dla widocznych folderów.
+
+        Zamiast workera na każdy folder (każdy z własnym przejściem po
+        poddrzewie) planowany jest jeden worker dla folderu roboczego -
+        FolderStatsEngine liczy całe drzewo w jednym przejściu, a wyniki
+        widocznych folderów trafiają do cache.
+
+        Args:
+            callback: Wywoływany z listą folderów, których statystyki zapisano
+        """
+        missing = [
+            folder_path
+            for folder_path in visible_folders
+            if not data_manager.load_directory_data(folder_path)
+        ]
+        if not missing:
+            return
+
+        root_folder = data_manager.working_directory or visible_folders[0]
+
+        def worker_factory():
+            return self._create_tree_stats_worker(
+                root_folder, visible_folders, data_manager, callback
             )
-            
-            if task_scheduled:
-                stats_calculated += 1
-            
-            # Ogranicz liczbę równoczesnych obliczeń
-            if stats_calculated >= 10:
-                break
 
-        if stats_calculated > 0:
-            logger.info(f"📊 Zaplanowano obliczanie statystyk dla {stats_calculated} folderów")
-
-    def _create_stats_worker_with_manager(self, folder_path: str, data_manager):
-        """Tworzy worker statystyk z integracją z data_manager."""
-        worker = FolderStatisticsWorker(folder_path)
-        
-        def on_finished(stats):
-            # Zapisz do cache i odśwież widok
-            data_manager.update_directory_stats(folder_path, stats)
-            logger.debug(f"📊 Statystyki obliczone dla: {folder_path}")
+        self.scheduler.schedule_task(f"stats_tree_{root_folder}", worker_factory)
+        logger.info(
+            f"📊 Zaplanowano statystyki drzewa {root_folder} "
+            f"({len(missing)} folderów bez statystyk)"
+        )
+
+    def _create_tree_stats_worker(
+        self, root_folder: str, visible_folders: list, data_manager, callback=None
+    ):
+        """Tworzy worker statystyk drzewa zapisujący wyniki widocznych folderów."""
+        worker = FolderStatisticsWorker(root_folder)
+
+        def on_tree_finished(tree_stats):
+            updated = []
+            for folder_path in visible_folders:
+                stats = tree_stats.get(normalize_path(folder_path))
+                if stats is not None:
+                    data_manager.update_directory_stats(folder_path, stats)
+                    updated.append(folder_path)
+            logger.debug(f"📊 Statystyki obliczone dla {len(updated)} folderów")
+            if callback:
+                callback(updated)
 
         def on_error(error_msg):
             # Logi błędów dla diagnostyki
-            logger.debug(f"❌ Błąd statystyk {folder_path}: {error_msg}")
+            logger.debug(f"❌ Błąd statystyk drzewa {root_folder}: {error_msg}")
+
+        worker.custom_signals.tree_finished.connect(on_tree_finished)
+        worker.custom_signals.error.connect(on_error)
+        worker.custom_signals.finished.connect(lambda: self._remove_worker(worker))
+        worker.custom_signals.error.connect(lambda: self._remove_worker(worker))
 
-        worker.signals.finished.connect(on_finished)
-        worker.signals.error.connect(on_error)
-        worker.signals.finished.connect(lambda: self._remove_worker(worker))
-        worker.signals.error.connect(lambda: self._remove_worker(worker))
-        
         self.active_workers.add(worker)
         return worker
 
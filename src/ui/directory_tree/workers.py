@@ -7,8 +7,7 @@ import os
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from src import app_config
-from src.logic.scanner import scan_folder_for_pairs
+from src.logic.folder_stats_engine import FolderStatsEngine
 from src.logic.scanner_core import should_ignore_folder
 from src.ui.delegates.workers import UnifiedBaseWorker
 from src.utils.path_utils import normalize_path
@@ -22,6 +21,7 @@ class FolderStatisticsSignals(QObject):
     """Sygnały dla workera statystyk folderów."""
 
     finished = pyqtSignal(object)  # FolderStatistics
+    tree_finished = pyqtSignal(object)  # Dict[ścieżka, FolderStatistics] poddrzewa
     error = pyqtSignal(str)
     progress = pyqtSignal(int, str)
     interrupted = pyqtSignal()
@@ -42,127 +42,37 @@ class FolderStatisticsWorker(UnifiedBaseWorker):
 
     def _run_implementation(self):
         """
-        🚀 OPTYMALIZACJA: Oblicza statystyki folderu w JEDNYM przejściu os.walk
-        zamiast dwóch oddzielnych - ~50% szybciej!
+        Oblicza statystyki folderu wspólnym silnikiem FolderStatsEngine.
+
+        Silnik odczytuje całe poddrzewo raz (równolegle) i agreguje wyniki od
+        liści w górę, więc jedno przeliczenie daje statystyki wszystkich
+        podfolderów - trafiają one do sygnału tree_finished. Katalogi bez
+        zmian (ten sam mtime) nie są ponownie listowane.
         """
         try:
-            stats = FolderStatistics()
-            self.emit_progress(
-                0, "Rozpoczynanie zoptymalizowanego obliczania statystyk..."
-            )
+            self.emit_progress(0, "Obliczanie statystyk folderu...")
 
-            if self.check_interruption():
+            engine = FolderStatsEngine.get_instance()
+            tree_stats = engine.scan(
+                self.folder_path, interrupt_check=self.check_interruption
+            )
+            if tree_stats is None or self.check_interruption():
                 return
 
-            # 🔥 OPTYMALIZACJA: Jednorazowe skanowanie plików z klasyfikacją typów
-            self.emit_progress(20, "Skanowanie plików (optymalizowane)...")
-
-            # Zbierz statystyki podstawowe w jednym przejściu
-            main_folder_size = 0
-            subfolders_size = 0
-            total_files = 0
-            main_folder_files = 0
-
-            # Kontenery na pliki według typów (dla szybkiego obliczania par)
-            archive_files = []
-            preview_files = []
-
-            # Rozszerzenia archiwów i podglądów (zgodne z logiką aplikacji)
-            archive_extensions = set(app_config.SUPPORTED_ARCHIVE_EXTENSIONS)
-            preview_extensions = set(app_config.SUPPORTED_PREVIEW_EXTENSIONS)
-
-            for root, dirs, files in os.walk(self.folder_path):
-                if self.check_interruption():
-                    return
-
-                # Filtruj ignorowane foldery z listy dirs (modyfikacja in-place)
-                dirs[:] = [d for d in dirs if not should_ignore_folder(d)]
+            folder_stats = {
+                path: FolderStatistics.from_directory_stats(directory_stats)
+                for path, directory_stats in tree_stats.items()
+            }
+            stats = folder_stats.get(self.folder_path, FolderStatistics())
 
-                is_main_folder = root == self.folder_path
-                folder_size = 0
-
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_name = file.lower()
-
-                    try:
-                        # Oblicz rozmiar
-                        file_size = os.path.getsize(file_path)
-                        folder_size += file_size
-                        total_files += 1
-
-                        if is_main_folder:
-                            main_folder_files += 1
-
-                        # Klasyfikuj typ pliku dla obliczania par
-                        file_ext = os.path.splitext(file_name)[1].lower()
-                        if file_ext in archive_extensions:
-                            archive_files.append(file_path)
-                        elif file_ext in preview_extensions:
-                            preview_files.append(file_path)
-
-                    except (OSError, FileNotFoundError):
-                        continue
-
-                if is_main_folder:
-                    main_folder_size += folder_size
-                else:
-                    subfolders_size += folder_size
-
-            # Ustaw podstawowe statystyki
-            stats.size_gb = main_folder_size / (1024**3)
-            stats.subfolders_size_gb = subfolders_size / (1024**3)
-
-            # stats.total_size_gb = (main_folder_size + subfolders_size) / (1024**3)  # BŁĄD - to property!
-            stats.total_files = total_files
-
-            self.emit_progress(70, "Obliczanie par plików (szybka metoda)...")
-
-            # 🔥 OPTYMALIZACJA: Szybkie obliczanie par bez pełnego skanowania
-            if self.check_interruption():
-                return
+            logger.debug(
+                f"📊 Statystyki {os.path.basename(self.folder_path)}: "
+                f"{stats.total_pairs} par, {stats.total_files} plików, "
+                f"{stats.total_size_gb:.2f}GB ({len(folder_stats)} folderów)"
+            )
 
-            try:
-                # 🔥 NAPRAWKA: Prawidłowy algorytm liczenia par
-                # Zamiast liczyć wszystkie podglądy, liczymy rzeczywiste pary
-                pairs_count = 0
-
-                # Utwórz mapę nazw bazowych podglądów (dla szybkiego wyszukiwania)
-                preview_basenames = set()
-                for preview_path in preview_files:
-                    basename = os.path.splitext(os.path.basename(preview_path))[
-                        0
-                    ].lower()
-                    preview_basenames.add(basename)
-
-                # Dla każdego archiwum sprawdź czy ma pasujący podgląd
-                # JEDEN archiwum = JEDNA para (nie wszystkie podglądy!)
-                for archive_path in archive_files:
-                    basename = os.path.splitext(os.path.basename(archive_path))[
-                        0
-                    ].lower()
-                    if basename in preview_basenames:
-                        pairs_count += 1  # ✅ POPRAWNE - liczymy pary, nie podglądy
-
-                stats.pairs_count = pairs_count
-                # NAPRAWKA: total_pairs to readonly property - usuń przypisanie
-                # stats.total_pairs = pairs_count  # BŁĄD - to property!
-                stats.subfolders_pairs = 0  # Można rozszerzyć w przyszłości
-
-                logger.debug(
-                    f"📊 NAPRAWIONE statystyki {os.path.basename(self.folder_path)}: "
-                    f"{pairs_count} par (z {len(archive_files)} archiwów i {len(preview_files)} podglądów), "
-                    f"{total_files} plików, {stats.total_size_gb:.2f}GB"
-                )
-
-            except Exception as e:
-                logger.warning(f"Błąd szybkiego obliczania par: {e}")
-                stats.pairs_count = 0
-                # NAPRAWKA: total_pairs to readonly property - usuń przypisanie
-                # stats.total_pairs = 0  # BŁĄD - to property!
-                stats.subfolders_pairs = 0
-
-            self.emit_progress(100, "Zakończono zoptymalizowane obliczanie statystyk")
+            self.emit_progress(100, "Zakończono obliczanie statystyk")
+            self.custom_signals.tree_finished.emit(folder_stats)
             self.custom_signals.finished.emit(stats)
             self.emit_finished(stats)
 
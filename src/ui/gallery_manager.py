@@ -12,18 +12,30 @@ from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import QApplication, QGridLayout, QWidget
 
 from src import app_config
+from src.config.config_core import AppConfig
 from src.controllers.gallery_controller import GalleryController
 from src.models.file_pair import FilePair
 from src.models.special_folder import SpecialFolder
 from src.ui.widgets.file_tile_widget import FileTileWidget
+from src.ui.widgets.gallery_item_view import GalleryItemView
 from src.ui.widgets.special_folder_tile_widget import SpecialFolderTileWidget
+from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+from src.ui.widgets.tile_resource_manager import get_resource_manager
 
 logger = logging.getLogger(__name__)
 
+# Tryby galerii (klucz konfiguracji gallery_view_mode)
+GALLERY_VIEW_MODE_WIDGETS = "widgets"
+GALLERY_VIEW_MODE_ITEM_VIEW = "item_view"
+
 
 class GalleryManager:
     """
     Klasa zarządzająca galerią kafelków.
+
+    W trybie "item_view" (gallery_view_mode) zamiast kafelków FileTileWidget
+    galerię wyświetla GalleryItemView - QListView z delegatem, który rysuje
+    tylko widoczne elementy. Publiczny interfejs managera pozostaje ten sam.
     """
 
     VIRTUALIZATION_UPDATE_DELAY = 50  # ms, opóźnienie dla aktualizacji wirtualizacji
@@ -44,6 +56,13 @@ class GalleryManager:
         self.special_folder_widgets: Dict[str, SpecialFolderTileWidget] = {}
         self.file_pairs_list: List[FilePair] = []
         self.special_folders_list: List[SpecialFolder] = []
+        # Pula wolnych kafelków zdjętych z ekranu - ponownie wiązanych z
+        # nowymi parami przez update_data (rozmiar pilnuje TileResourceManager)
+        self._tile_pool: List[FileTileWidget] = []
+        self._tiles_per_screen = 1
+        # Kierunek ostatniego przewinięcia (1 = w dół, -1 = w górę) dla prefetchu
+        self._last_scroll_value = 0
+        self._scroll_direction = 1
         # Inicjalizuj current_thumbnail_size jako int, zgodnie z app_config
         self.current_thumbnail_size = app_config.DEFAULT_THUMBNAIL_SIZE
         # Zapisz krotkę rozmiaru dla spójności interfejsu
@@ -60,14 +79,72 @@ class GalleryManager:
         # Podłącz sygnał zmiany scrollbara
         self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
+        # Widok model/delegat (tylko w trybie item_view)
+        self.item_view = None
+        self._tiles_scroll_content = None
+        view_mode = AppConfig.get_instance().get(
+            "gallery_view_mode", GALLERY_VIEW_MODE_WIDGETS
+        )
+        if view_mode == GALLERY_VIEW_MODE_ITEM_VIEW:
+            self._install_item_view()
+
+    def _install_item_view(self):
+        """
+        Podmienia zawartość scroll area na GalleryItemView.
+
+        Kontener kafelków pozostaje w pamięci (ukryty), bo odwołują się do
+        niego inne managery. Sygnały widoku trafiają do tych samych handlerów
+        głównego okna, do których TileManager podłącza kafelki.
+        """
+        view = self.scroll_area.widget()
+        if not isinstance(view, GalleryItemView):
+            self._tiles_scroll_content = self.scroll_area.takeWidget()
+            view = GalleryItemView()
+            self.scroll_area.setWidget(view)
+
+            view.archive_open_requested.connect(self.main_window.open_archive)
+            view.preview_image_requested.connect(self.main_window._show_preview_dialog)
+            view.tile_selected.connect(self.main_window._handle_tile_selection_changed)
+            view.stars_changed.connect(self.main_window._handle_stars_changed)
+            view.color_tag_changed.connect(self.main_window._handle_color_tag_changed)
+            view.tile_context_menu_requested.connect(
+                self.main_window._show_file_context_menu
+            )
+            view.folder_clicked.connect(self._on_folder_clicked)
+        view.set_tile_size(self._current_size_tuple)
+
+        self.item_view = view
+        logging.info("Galeria w trybie item_view (QListView + delegat)")
+
+    def _get_selected_pairs(self):
+        """Zwraca zbiór zaznaczonych par z kontrolera (None gdy niedostępny)."""
+        controller = getattr(self.main_window, "controller", None)
+        selection_manager = getattr(controller, "selection_manager", None)
+        selected_tiles = getattr(selection_manager, "selected_tiles", None)
+        return selected_tiles if isinstance(selected_tiles, set) else None
+
+    def refresh_tiles_display(self):
+        """Przerysowuje widoczne elementy po zmianie metadanych lub selekcji."""
+        if self.item_view is not None:
+            self.item_view.gallery_model.notify_items_changed()
+        else:
+            self.tiles_container.update()
+
     def _on_scroll(self, value):
         """Wywołuje opóźnioną aktualizację widocznych kafelków."""
+        if value != self._last_scroll_value:
+            self._scroll_direction = 1 if value > self._last_scroll_value else -1
+            self._last_scroll_value = value
         self._virtualization_timer.start(self.VIRTUALIZATION_UPDATE_DELAY)
 
     def clear_gallery(self):
         """
         Czyści galerię kafelków - usuwa wszystkie widgety z pamięci.
         """
+        if self.item_view is not None:
+            self.item_view.gallery_model.set_items([], [])
+            return
+
         self.tiles_container.setUpdatesEnabled(False)
         try:
             # Usuń wszystkie widgety z layoutu
@@ -81,14 +158,14 @@ class GalleryManager:
                     widget.setVisible(False)
                     self.tiles_layout.removeWidget(widget)  # Jawne usunięcie
 
-            # Usuń widgety par plików ze słownika i pamięci
+            # Zwolnij kafelki par plików (do puli lub z pamięci)
             for archive_path in list(
                 self.gallery_tile_widgets.keys()
             ):  # Iteruj po kopii kluczy
-                tile = self.gallery_tile_widgets.pop(archive_path)
-                tile.setParent(None)
-                tile.deleteLater()
+                self._release_tile(archive_path)
             self.gallery_tile_widgets.clear()
+            # Miniatury poprzedniej zawartości galerii nie są już potrzebne
+            ThumbnailScheduler.get_instance().clear()
 
             # Usuń widgety folderów ze słownika i pamięci
             for folder_path in list(
@@ -104,14 +181,33 @@ class GalleryManager:
 
     def create_tile_widget_for_pair(self, file_pair: FilePair, parent_widget):
         """
-        Tworzy pojedynczy kafelek dla pary plików.
+        Zwraca kafelek dla pary plików - istniejący, z puli lub nowy.
+        W trybie item_view kafelki nie są tworzone (zwraca None).
         """
+        if self.item_view is not None:
+            return None
+
+        archive_path = file_pair.get_archive_path()
+        tile = self.gallery_tile_widgets.get(archive_path)
+        if tile is not None:
+            return tile
+
         try:
-            # Przekaż _current_size_tuple jako krotkę (width, height)
-            tile = FileTileWidget(file_pair, self._current_size_tuple, parent_widget)
+            if self._tile_pool:
+                tile = self._tile_pool.pop()
+                if tile.thumbnail_size != self._current_size_tuple:
+                    tile.set_thumbnail_size(self._current_size_tuple)
+                self._bind_tile(tile, file_pair, rebind=True)
+            else:
+                # Przekaż _current_size_tuple jako krotkę (width, height)
+                tile = FileTileWidget(file_pair, self._current_size_tuple, parent_widget)
+                tile_manager = getattr(self.main_window, "tile_manager", None)
+                if tile_manager is not None:
+                    tile_manager.connect_tile_signals(tile)
+                self._bind_tile(tile, file_pair, rebind=False)
             # Ukryj na starcie, update_gallery_view zdecyduje o widoczności
             tile.setVisible(False)
-            self.gallery_tile_widgets[file_pair.get_archive_path()] = tile
+            self.gallery_tile_widgets[archive_path] = tile
             return tile
         except Exception as e:
             logging.error(
@@ -119,11 +215,97 @@ class GalleryManager:
             )
             return None
 
+    def _bind_tile(self, tile: FileTileWidget, file_pair: FilePair, rebind: bool):
+        """
+        Wiąże kafelek z parą plików (rebind=True dla kafelka z puli)
+        i ustawia stan zaznaczenia pary.
+
+        Sygnały checkboxa są blokowane, aby przestawienie go przy zmianie
+        pary nie zmieniało zbioru zaznaczonych par. Kafelek z puli dostaje
+        pusty podgląd, zanim załaduje się miniatura nowej pary (para bez
+        podglądu nie pokazuje miniatury poprzedniej).
+        """
+        controls = getattr(tile, "metadata_controls", None)
+        checkbox = getattr(controls, "selection_checkbox", None)
+        if checkbox is not None:
+            checkbox.blockSignals(True)
+        try:
+            if rebind:
+                tile.reset_thumbnail()
+                tile.update_data(file_pair)
+            if controls is not None:
+                selected_pairs = self._get_selected_pairs()
+                controls.update_selection_display(
+                    bool(selected_pairs) and file_pair in selected_pairs
+                )
+        finally:
+            if checkbox is not None:
+                checkbox.blockSignals(False)
+
+    def _release_tile(self, archive_path: str):
+        """
+        Zdejmuje kafelek z galerii: wraca do puli, jeśli TileResourceManager
+        na to pozwala, a w przeciwnym razie jest niszczony.
+        """
+        tile = self.gallery_tile_widgets.pop(archive_path, None)
+        if tile is None:
+            return
+
+        tile.setVisible(False)
+        self.tiles_layout.removeWidget(tile)
+        tile.setParent(None)
+
+        resource_manager = get_resource_manager()
+        if resource_manager.can_pool_tile(len(self._tile_pool), self._tiles_per_screen):
+            self._tile_pool.append(tile)
+        else:
+            self._destroy_tile(tile)
+
+    def _destroy_tile(self, tile: FileTileWidget):
+        """Zwalnia zasoby kafelka i usuwa go z pamięci."""
+        try:
+            tile.cleanup()
+        except Exception as e:
+            logging.debug(f"Błąd czyszczenia kafelka: {e}")
+        tile.deleteLater()
+
+    def _trim_tile_pool(self):
+        """Przycina pulę do limitu (np. po powiększeniu kafelków)."""
+        limit = get_resource_manager().get_tile_pool_limit(self._tiles_per_screen)
+        while len(self._tile_pool) > limit:
+            self._destroy_tile(self._tile_pool.pop())
+
+    def remove_pairs(self, file_pairs: List[FilePair]):
+        """
+        Usuwa pary z galerii (np. pliki usunięte poza aplikacją) bez
+        przebudowy pozostałych kafelków.
+        """
+        removed_ids = {id(pair) for pair in file_pairs}
+        self.file_pairs_list = [
+            pair for pair in self.file_pairs_list if id(pair) not in removed_ids
+        ]
+        if self.item_view is not None:
+            return
+
+        scheduler = ThumbnailScheduler.get_instance()
+        size = self._current_size_tuple
+        for pair in file_pairs:
+            self._release_tile(pair.get_archive_path())
+            preview_path = pair.get_preview_path()
+            if preview_path:
+                scheduler.cancel(preview_path, *size)
+
     def update_gallery_view(self):
         """
         Aktualizuje widok galerii z WIRTUALIZACJĄ.
         Nie tworzy wszystkich widgetów, tylko oblicza layout i pokazuje pierwszy widok.
         """
+        if self.item_view is not None:
+            model = self.item_view.gallery_model
+            model.set_selection(self._get_selected_pairs())
+            model.set_items(self.special_folders_list, self.file_pairs_list)
+            return
+
         self.tiles_container.setUpdatesEnabled(False)
         try:
             # 1. Wyczyść stare widgety z layoutu, ale ZACHOWAJ je w pamięci
@@ -132,37 +314,68 @@ class GalleryManager:
                 if item.widget():
                     item.widget().setParent(None)
 
-            # 2. Oblicz wymiary wirtualnego layoutu
-            container_width = (
-                self.scroll_area.width() - self.scroll_area.verticalScrollBar().width()
-            )
-            tile_width_with_spacing = (
-                self.current_thumbnail_size + self.tiles_layout.spacing() + 10
-            )
-            cols = max(1, math.floor(container_width / tile_width_with_spacing))
-
-            total_items = len(self.special_folders_list) + len(self.file_pairs_list)
-            if total_items == 0:
-                self.tiles_container.setMinimumHeight(0)
+            # 2-3. Oblicz wymiary wirtualnego layoutu i ustaw rozmiar kontenera
+            if not self._resize_tiles_container():
                 return
 
-            total_rows = math.ceil(total_items / cols)
-            tile_height_with_spacing = (
-                self.current_thumbnail_size + self.tiles_layout.spacing() + 40
-            )
-            total_height = total_rows * tile_height_with_spacing
-
-            # 3. Ustaw rozmiar kontenera, aby scrollbary działały poprawnie
-            self.tiles_container.setMinimumHeight(total_height)
-
             # 4. Wywołaj pierwszą aktualizację widocznych kafelków
             self._update_visible_tiles()
 
         finally:
             self.tiles_container.setUpdatesEnabled(True)
 
+    def _resize_tiles_container(self) -> bool:
+        """
+        Ustawia wysokość kontenera dla wirtualnego layoutu, aby scrollbary
+        działały poprawnie. Zwraca False, gdy galeria jest pusta.
+        """
+        container_width = (
+            self.scroll_area.width() - self.scroll_area.verticalScrollBar().width()
+        )
+        tile_width_with_spacing = (
+            self.current_thumbnail_size + self.tiles_layout.spacing() + 10
+        )
+        cols = max(1, math.floor(container_width / tile_width_with_spacing))
+
+        total_items = len(self.special_folders_list) + len(self.file_pairs_list)
+        if total_items == 0:
+            self.tiles_container.setMinimumHeight(0)
+            return False
+
+        total_rows = math.ceil(total_items / cols)
+        tile_height_with_spacing = (
+            self.current_thumbnail_size + self.tiles_layout.spacing() + 40
+        )
+        self.tiles_container.setMinimumHeight(total_rows * tile_height_with_spacing)
+        return True
+
+    def append_pairs(self, file_pairs: List[FilePair]):
+        """
+        Dopisuje pary na końcu galerii (partie strumieniowego skanowania).
+
+        Istniejące kafelki i wiersze modelu zostają - rośnie tylko wysokość
+        kontenera, a widoczne kafelki są uzupełniane opóźnioną wirtualizacją.
+        """
+        if not file_pairs:
+            return
+
+        if self.item_view is not None:
+            model = self.item_view.gallery_model
+            if model.shows_pairs(self.file_pairs_list):
+                model.append_pairs(file_pairs)
+            else:
+                self.file_pairs_list.extend(file_pairs)
+                self.update_gallery_view()
+            return
+
+        self.file_pairs_list.extend(file_pairs)
+        self._resize_tiles_container()
+        self._virtualization_timer.start(self.VIRTUALIZATION_UPDATE_DELAY)
+
     def _update_visible_tiles(self):
         """Tworzy/usuwa kafelki w zależności od tego, czy są widoczne."""
+        if self.item_view is not None:
+            return  # QListView sam rysuje tylko widoczne elementy
 
         container_width = (
             self.scroll_area.width() - self.scroll_area.verticalScrollBar().width()
@@ -188,19 +401,43 @@ class GalleryManager:
             0, math.floor(visible_start_y / tile_height_with_spacing)
         )
         last_visible_row = math.ceil(visible_end_y / tile_height_with_spacing)
+        # "Ekran" dla puli to całe renderowane okno (widok + bufory), aby
+        # skok paskiem przewijania obsłużyć w całości kafelkami z puli
+        self._tiles_per_screen = cols * (
+            math.ceil((viewport_height + 2 * buffer) / tile_height_with_spacing) + 1
+        )
 
         # Określ indeksy widocznych itemów
         first_visible_item_idx = first_visible_row * cols
         last_visible_item_idx = (last_visible_row + 1) * cols
 
-        all_items = self.special_folders_list + self.file_pairs_list
+        folder_count = len(self.special_folders_list)
+        total_items = folder_count + len(self.file_pairs_list)
+        visible_range = range(
+            first_visible_item_idx, min(last_visible_item_idx, total_items)
+        )
+
+        def item_at(index):
+            if index < folder_count:
+                return self.special_folders_list[index]
+            return self.file_pairs_list[index - folder_count]
+
+        # Najpierw zwolnij kafelki, które wyszły poza widoczny obszar -
+        # wracają do puli i od razu obsłużą nowo widoczne pary
+        visible_pair_paths = {
+            item.get_archive_path()
+            for item in map(item_at, visible_range)
+            if not isinstance(item, SpecialFolder)
+        }
+        for path in list(self.gallery_tile_widgets.keys()):
+            if path not in visible_pair_paths:
+                self._release_tile(path)
+
         visible_items_set = set()
 
         # Dodaj widoczne kafelki
-        for i in range(
-            first_visible_item_idx, min(last_visible_item_idx, len(all_items))
-        ):
-            item = all_items[i]
+        for i in visible_range:
+            item = item_at(i)
 
             if isinstance(item, SpecialFolder):
                 path = item.get_folder_path()
@@ -230,13 +467,15 @@ class GalleryManager:
             if not widget.isVisible():
                 widget.setVisible(True)
 
-        # Usuń niewidoczne kafelki
-        for path, widget in list(self.gallery_tile_widgets.items()):
-            if path not in visible_items_set:
-                widget.setVisible(False)
-                self.tiles_layout.removeWidget(widget)
-                widget.setParent(None)
-                # Nie niszczymy widgetu, zostaje w cache (self.gallery_tile_widgets)
+        self._trim_tile_pool()
+        self._schedule_thumbnails(
+            item_at,
+            visible_range,
+            total_items,
+            cols,
+            math.floor(scroll_y / tile_height_with_spacing),
+            math.ceil((scroll_y + viewport_height) / tile_height_with_spacing) - 1,
+        )
 
         for path, widget in list(self.special_folder_widgets.items()):
             if path not in visible_items_set:
@@ -244,6 +483,55 @@ class GalleryManager:
                 self.tiles_layout.removeWidget(widget)
                 widget.setParent(None)
 
+    def _schedule_thumbnails(
+        self, item_at, visible_range, total_items, cols, first_row, last_row
+    ):
+        """
+        Porządkuje kolejkę ThumbnailScheduler według odległości od widoku.
+
+        Priorytet to odległość wiersza od widocznych wierszy (first_row..
+        last_row), z pierwszeństwem wierszy w kierunku przewijania. Żądania
+        kafelków spoza renderowanego okna są anulowane, a za oknem zlecany
+        jest prefetch thumbnail_prefetch_rows wierszy.
+        """
+        width, height = self._current_size_tuple
+        direction = self._scroll_direction
+
+        def priority_for(index):
+            row = index // cols
+            if row < first_row:
+                return (first_row - row) * 2 + (1 if direction > 0 else 0)
+            if row > last_row:
+                return (row - last_row) * 2 + (1 if direction < 0 else 0)
+            return 0
+
+        priorities = {}
+        for i in visible_range:
+            item = item_at(i)
+            if isinstance(item, FilePair) and item.preview_path:
+                priorities[item.preview_path] = priority_for(i)
+
+        prefetch_rows = AppConfig.get_instance().get("thumbnail_prefetch_rows", 2)
+        prefetch_count = prefetch_rows * cols
+        if direction > 0:
+            end = min(visible_range.stop + prefetch_count, total_items)
+            prefetch_range = range(visible_range.stop, end)
+        else:
+            start = max(0, visible_range.start - prefetch_count)
+            prefetch_range = range(start, visible_range.start)
+        prefetch_requests = []
+        for i in prefetch_range:
+            item = item_at(i)
+            if isinstance(item, FilePair) and item.preview_path:
+                priority = priority_for(i)
+                priorities[item.preview_path] = priority
+                prefetch_requests.append((item.preview_path, width, height, priority))
+
+        scheduler = ThumbnailScheduler.get_instance()
+        scheduler.reprioritize(priorities)
+        if prefetch_requests:
+            scheduler.prefetch(prefetch_requests)
+
     def apply_filters_and_update_view(
         self, all_file_pairs: List[FilePair], filter_criteria: dict
     ):
@@ -260,6 +548,26 @@ class GalleryManager:
         )
         self.update_gallery_view()
 
+    def append_filtered_pairs(
+        self,
+        all_file_pairs: List[FilePair],
+        appended_count: int,
+        filter_criteria: dict,
+    ):
+        """
+        Filtruje tylko `appended_count` par dopisanych na końcu all_file_pairs
+        i dokłada pasujące do galerii.
+        """
+        if self.file_pairs_list is all_file_pairs:
+            # Bez filtrów galeria dostaje listę kontrolera - dopisane pary
+            # są już na niej, więc galeria przechodzi na własną kopię
+            self.file_pairs_list = all_file_pairs[: len(all_file_pairs) - appended_count]
+        self.append_pairs(
+            self.controller.apply_filters_to_appended(
+                all_file_pairs, appended_count, filter_criteria
+            )
+        )
+
     def update_thumbnail_size(self, new_size):
         """
         Aktualizuje rozmiar miniatur i przerenderowuje galerię.
@@ -281,6 +589,10 @@ class GalleryManager:
             f"GalleryManager: Ustawianie nowego rozmiaru: {self._current_size_tuple}"
         )
 
+        if self.item_view is not None:
+            self.item_view.set_tile_size(self._current_size_tuple)
+            return
+
         # Zaktualizuj rozmiar w kafelkach - dla WSZYSTKICH kafelków
         for tile in self.gallery_tile_widgets.values():
             # FileTileWidget.set_thumbnail_size oczekuje krotki (width, height)
@@ -299,8 +611,9 @@ class GalleryManager:
 
     def get_all_tile_widgets(self) -> List[FileTileWidget]:
         """
-        Zwraca listę wszystkich widgetów kafelków w galerii.
-        Używane do operacji zbiorczych (zaznaczanie wszystkich, operacje na zaznaczonych).
+        Zwraca listę widgetów kafelków związanych obecnie z parami plików.
+        Kafelki istnieją tylko dla widocznego obszaru galerii (kafelki
+        z puli nie są zwracane).
 
         Returns:
             List[FileTileWidget]: Lista wszystkich widgetów kafelków
@@ -396,6 +709,8 @@ class GalleryManager:
         )
 
         self.special_folders_list = special_folders
+        if self.item_view is not None:
+            return  # Foldery są rysowane przez delegata widoku
 
         # Wyczyść poprzednie widgety folderów
         for folder_path in list(self.special_folder_widgets.keys()):
@@ -4,9 +4,26 @@ Przeniesione z main_window.py w ramach refaktoryzacji.
 """
 
 import logging
+import os
 
 from PyQt6.QtWidgets import QMessageBox
 
+from src.config import AppConfig
+from src.logic.bulk_file_engine import (
+    OPERATION_MOVE,
+    discard_journal,
+    find_pending_journals,
+    read_journal_kind,
+)
+from src.logic.trash import get_trash
+from src.ui.delegates.workers import BulkJournalWorker
+
+# Decyzje użytkownika dla dziennika przerwanej operacji
+JOURNAL_ACTION_RESUME = "resume"
+JOURNAL_ACTION_ROLLBACK = "rollback"
+JOURNAL_ACTION_DISCARD = "discard"
+JOURNAL_ACTION_LATER = "later"
+
 
 class BulkOperationsManager:
     """Zarządzanie operacjami masowymi na plikach."""
@@ -20,6 +37,7 @@ class BulkOperationsManager:
         """
         self.main_window = main_window
         self.logger = logging.getLogger(__name__)
+        self._pending_journals = []
 
     def perform_bulk_delete(self):
         """
@@ -248,11 +266,15 @@ class BulkOperationsManager:
         Returns:
             True jeśli użytkownik potwierdził, False w przeciwnym razie
         """
+        if AppConfig.get_instance().get("delete_to_trash", True) and get_trash():
+            warning = "Pliki zostaną przeniesione do kosza systemowego."
+        else:
+            warning = "Ta operacja jest nieodwracalna!"
         reply = QMessageBox.question(
             self.main_window,
             "Potwierdzenie usuwania",
             f"Czy na pewno chcesz usunąć {count} zaznaczonych par plików?\n\n"
-            "Ta operacja jest nieodwracalna!",
+            + warning,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -279,3 +301,111 @@ class BulkOperationsManager:
         self.main_window.selection_manager.update_bulk_operations_visibility()
 
         logging.info(f"Bulk {operation_name} completed: {len(processed_pairs)} pairs")
+
+    # --- Przerwane operacje (dzienniki BulkFileEngine) ---
+
+    def check_pending_bulk_operations(self):
+        """
+        Proponuje dokończenie, cofnięcie lub odrzucenie operacji masowych
+        przerwanych w poprzedniej sesji (dzienniki w katalogu bulk_journal).
+        """
+        self._pending_journals = find_pending_journals()
+        if self._pending_journals:
+            self.logger.info(
+                f"Znaleziono {len(self._pending_journals)} przerwanych operacji masowych"
+            )
+        self._handle_next_pending_journal()
+
+    def _handle_next_pending_journal(self):
+        """Pyta o kolejny dziennik; dziennik w toku obsługuje jeden worker naraz."""
+        while self._pending_journals:
+            journal_path = self._pending_journals.pop(0)
+            kind = read_journal_kind(journal_path)
+            action = self._ask_journal_action(journal_path, kind)
+            if action == JOURNAL_ACTION_DISCARD:
+                discard_journal(journal_path)
+                self.logger.info(f"Odrzucono dziennik operacji: {journal_path}")
+            elif action in (JOURNAL_ACTION_RESUME, JOURNAL_ACTION_ROLLBACK):
+                self._start_journal_worker(
+                    journal_path, rollback=action == JOURNAL_ACTION_ROLLBACK
+                )
+                return
+
+    def _ask_journal_action(self, journal_path: str, kind) -> str:
+        """
+        Pyta użytkownika, co zrobić z przerwaną operacją.
+
+        Returns:
+            Jedna ze stałych JOURNAL_ACTION_*
+        """
+        msg_box = QMessageBox(self.main_window)
+        msg_box.setWindowTitle("Przerwana operacja")
+        msg_box.setIcon(QMessageBox.Icon.Question)
+        msg_box.setDetailedText(journal_path)
+
+        buttons = {}
+        if kind is None:
+            msg_box.setText(
+                "Znaleziono uszkodzony dziennik przerwanej operacji na plikach."
+            )
+        else:
+            operation_name = "przenoszenia" if kind == OPERATION_MOVE else "usuwania"
+            msg_box.setText(
+                f"Poprzednia operacja {operation_name} plików została przerwana.\n\n"
+                "Czy chcesz ją dokończyć?"
+            )
+            buttons[
+                msg_box.addButton("Dokończ", QMessageBox.ButtonRole.AcceptRole)
+            ] = JOURNAL_ACTION_RESUME
+            if kind == OPERATION_MOVE:
+                buttons[
+                    msg_box.addButton("Cofnij", QMessageBox.ButtonRole.ActionRole)
+                ] = JOURNAL_ACTION_ROLLBACK
+        buttons[
+            msg_box.addButton("Odrzuć", QMessageBox.ButtonRole.DestructiveRole)
+        ] = JOURNAL_ACTION_DISCARD
+        later_button = msg_box.addButton("Później", QMessageBox.ButtonRole.RejectRole)
+        msg_box.setEscapeButton(later_button)
+        msg_box.exec()
+
+        return buttons.get(msg_box.clickedButton(), JOURNAL_ACTION_LATER)
+
+    def _start_journal_worker(self, journal_path: str, rollback: bool):
+        """Uruchamia dokończenie lub cofnięcie operacji w tle."""
+        worker = BulkJournalWorker(journal_path, rollback=rollback)
+        self.main_window.worker_manager.setup_worker_connections(
+            worker,
+            on_finished=self.on_bulk_journal_finished,
+            on_error=self._on_bulk_journal_error,
+            show_progress=True,
+        )
+        self.main_window.thread_pool.start(worker)
+
+    def on_bulk_journal_finished(self, result):
+        """
+        Slot wywoływany po dokończeniu lub cofnięciu przerwanej operacji.
+
+        Args:
+            result: Słownik z wynikami BulkJournalWorker
+        """
+        summary = result.get("summary", {})
+        action_name = "Cofnięto" if result.get("rollback") else "Dokończono"
+        message = f"{action_name} przerwaną operację: {summary.get('completed', 0)} plików"
+        if summary.get("errors"):
+            message += f", błędy: {summary['errors']}"
+        if result.get("journal_path"):
+            message += " (ponownie przerwana)"
+        self.main_window._show_progress(100, message)
+        logging.info(message)
+
+        # Pliki zmieniły położenie - odśwież bieżący folder
+        current_directory = self.main_window.controller.current_directory
+        if current_directory and os.path.isdir(current_directory):
+            self.main_window._force_refresh()
+
+        self._handle_next_pending_journal()
+
+    def _on_bulk_journal_error(self, error_message: str):
+        """Zgłasza błąd dokończenia operacji i przechodzi do kolejnego dziennika."""
+        self.main_window._handle_worker_error(error_message)
+        self._handle_next_pending_journal()
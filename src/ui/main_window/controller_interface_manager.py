@@ -7,6 +7,7 @@ import logging
 from typing import List
 
 from src.models.file_pair import FilePair
+from src.ui.widgets.thumbnail_cache import ThumbnailCache
 
 
 class ControllerInterfaceManager:
@@ -35,6 +36,10 @@ class ControllerInterfaceManager:
         # UWAGA: Controller już zaktualizował swój stan w handle_folder_selection()
         # NIE wywołujemy controller.handle_scan_finished() aby nie nadpisać danych!
 
+        self.update_file_records(
+            scan_result.file_records, scan_result.snapshot_record_directories
+        )
+
         # Wyczyść poprzednie widgety
         self.main_window.gallery_manager.clear_gallery()
 
@@ -48,6 +53,19 @@ class ControllerInterfaceManager:
         # UWAGA: update_unpaired_files_lists() jest już wywoływana w _on_tile_loading_finished()
         # Nie wywołujemy tutaj aby uniknąć błędów z niezainicjalizowanymi widgetami
 
+    def update_file_records(self, file_records, snapshot_directories=frozenset()):
+        """
+        Przekazuje rekordy plików ze skanera do cache miniatur - klucze
+        dyskowego cache powstają z nich bez wywołań os.stat.
+
+        Args:
+            file_records: Rekordy plików (ścieżka -> FileRecord)
+            snapshot_directories: Katalogi z rekordami ze snapshotu
+        """
+        ThumbnailCache.get_instance().set_file_records(
+            file_records, snapshot_directories
+        )
+
     def confirm_bulk_delete(self, count: int) -> bool:
         """
         Potwierdza operację masowego usuwania - delegacja do BulkOperationsManager.
@@ -10,6 +10,7 @@ from typing import List
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QListWidgetItem
 
+from src.logic.scan_delta import ScanDelta
 from src.models.file_pair import FilePair
 
 
@@ -38,23 +39,10 @@ class DataManager:
         self.main_window.unpaired_archives_list_widget.clear()
         self.main_window.unpaired_previews_list_widget.clear()
 
-        # Wyczyść kontener miniaturek
-        while self.main_window.unpaired_previews_layout.count():
-            widget_to_remove = self.main_window.unpaired_previews_layout.itemAt(
-                0
-            ).widget()
-            if widget_to_remove:
-                widget_to_remove.setParent(None)
-                self.main_window.unpaired_previews_layout.removeWidget(widget_to_remove)
-
         sorted_archives = sorted(
             self.main_window.controller.unpaired_archives,
             key=lambda x: os.path.basename(x).lower(),
         )
-        sorted_previews = sorted(
-            self.main_window.controller.unpaired_previews,
-            key=lambda x: os.path.basename(x).lower(),
-        )
 
         # Aktualizuj listę archiwów (posortowane)
         for archive_path in sorted_archives:
@@ -62,17 +50,8 @@ class DataManager:
             item.setData(Qt.ItemDataRole.UserRole, archive_path)
             self.main_window.unpaired_archives_list_widget.addItem(item)
 
-        # Aktualizuj miniaturki podglądów (posortowane)
-        for preview_path in sorted_previews:
-            # Dodaj do ukrytego QListWidget dla kompatybilności
-            item = QListWidgetItem(os.path.basename(preview_path))
-            item.setData(Qt.ItemDataRole.UserRole, preview_path)
-            self.main_window.unpaired_previews_list_widget.addItem(item)
-
-            # Dodaj miniaturkę przez manager unpaired files
-            if hasattr(self.main_window, "unpaired_files_tab_manager"):
-                manager = self.main_window.unpaired_files_tab_manager
-                manager._add_preview_thumbnail(preview_path)
+        # Miniaturki podglądów odświeża wirtualizowana siatka
+        # (update_unpaired_files_direct -> update_unpaired_files_lists)
 
         logging.debug(
             f"Zaktualizowano listy niesparowanych: "
@@ -230,6 +209,23 @@ class DataManager:
         if hasattr(self.main_window, "unpaired_files_tab_manager"):
             self.main_window.unpaired_files_tab_manager.update_unpaired_files_lists()
 
+    def apply_scan_delta(self, delta: ScanDelta):
+        """
+        Nakłada deltę skanowania na galerię i zakładkę niesparowanych plików.
+
+        Stan kontrolera jest już zaktualizowany - galeria zwalnia tylko kafelki
+        usuniętych par i ponownie filtruje listę (wirtualizacja dotworzy
+        kafelki nowych par), a listy niesparowanych plików są łatane w miejscu.
+        """
+        if delta.removed_pairs and hasattr(self.main_window, "gallery_manager"):
+            self.main_window.gallery_manager.remove_pairs(delta.removed_pairs)
+        if delta.added_pairs or delta.removed_pairs:
+            self.apply_filters_and_update_view()
+
+        unpaired_tab = getattr(self.main_window, "unpaired_files_tab_manager", None)
+        if unpaired_tab is not None:
+            unpaired_tab.apply_unpaired_delta(delta)
+
     def add_new_pair(self, new_pair: FilePair):
         """Dodaje nową parę do UI."""
         self.main_window.controller.current_file_pairs.append(new_pair)
@@ -253,6 +249,20 @@ class DataManager:
                 all_file_pairs, filter_criteria
             )
 
+    def append_pairs_to_view(self, appended_count: int):
+        """Dokłada do galerii pasujące pary spośród ostatnio dopisanych."""
+        if hasattr(self.main_window, "gallery_tab_manager"):
+            self.main_window.gallery_tab_manager.append_pairs_to_view(appended_count)
+        elif hasattr(self.main_window, "gallery_manager") and hasattr(
+            self.main_window, "controller"
+        ):
+            all_file_pairs = getattr(
+                self.main_window.controller, "current_file_pairs", []
+            )
+            self.main_window.gallery_manager.append_filtered_pairs(
+                all_file_pairs, appended_count, {}
+            )
+
     def update_gallery_view(self):
         """Aktualizuje widok galerii."""
         self.main_window.gallery_tab_manager.update_gallery_view()
@@ -152,7 +152,7 @@ class EventHandler:
         )
 
         # Aktualizuj metadane
-        file_pair.star_rating = new_star_count
+        file_pair.set_stars(new_star_count)
 
         # Zaplanuj zapisanie metadanych
         self.main_window._schedule_metadata_save()
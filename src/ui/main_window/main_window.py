@@ -533,6 +533,12 @@ class MainWindow(QMainWindow):
         """Delegacja do Interface."""
         return self.interface.update_scan_results(scan_result)
 
+    def update_file_records(self, file_records, snapshot_directories=frozenset()):
+        """Delegacja do ControllerInterfaceManager."""
+        self.controller_interface_manager.update_file_records(
+            file_records, snapshot_directories
+        )
+
     def confirm_bulk_delete(self, count: int) -> bool:
         """Potwierdza masowe usuwanie - direct implementation."""
         from PyQt6.QtWidgets import QMessageBox
@@ -560,6 +566,10 @@ class MainWindow(QMainWindow):
             100, lambda: self.show_info_message("Operacja zakończona", message)
         )
 
+    def apply_scan_delta(self, delta):
+        """Nakłada zmiany wykryte w folderze roboczym na widoki - direct implementation."""
+        self.data_manager.apply_scan_delta(delta)
+
     def update_bulk_operations_visibility(self, selected_count: int):
         """Aktualizuje widoczność przycisków masowych - direct implementation."""
         if hasattr(self, "controller"):
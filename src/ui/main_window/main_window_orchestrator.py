@@ -11,6 +11,8 @@ Odpowiedzialności:
 
 from typing import Any, Dict
 
+from PyQt6.QtCore import QTimer
+
 from src import app_config
 from src.controllers.main_window_controller import MainWindowController
 from src.services.thread_coordinator import ThreadCoordinator
@@ -190,6 +192,11 @@ class MainWindowOrchestrator:
         self.main_window.window_initialization_manager.show_preferences_loaded_confirmation()
         self.main_window.window_initialization_manager.initialize_default_folder()
 
+        # Operacje masowe przerwane w poprzedniej sesji - pytanie po pokazaniu okna
+        QTimer.singleShot(
+            0, self.main_window.bulk_operations_manager.check_pending_bulk_operations
+        )
+
         self.logger.debug("✅ Finalizacja zakończona")
 
     def coordinate_managers(self) -> Dict[str, Any]:
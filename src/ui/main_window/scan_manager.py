@@ -7,6 +7,8 @@ import os
 
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
+from src.logic.filter_logic import clear_filter_index
+from src.services.folder_navigation_service import FolderNavigationService
 from src.utils.path_validator import PathValidator
 
 
@@ -17,6 +19,18 @@ class ScanManager:
         self.main_window = main_window
         self.logger = logging.getLogger(__name__)
 
+        # Zmiana folderu z drzewa skanuje w tle (z anulowaniem poprzedniej)
+        self.folder_navigation = FolderNavigationService()
+        self.folder_navigation.cached_result_ready.connect(
+            self._on_navigation_cached_result
+        )
+        self.folder_navigation.pairs_batch_ready.connect(
+            self._on_navigation_pairs_batch
+        )
+        self.folder_navigation.scan_finished.connect(self._on_navigation_scan_finished)
+        self.folder_navigation.scan_failed.connect(self._on_navigation_scan_failed)
+        self._showing_cached_result = False
+
     def select_working_directory(self, directory_path=None):
         """Otwiera dialog wyboru folderu lub używa podanej ścieżki."""
         if directory_path:
@@ -94,38 +108,21 @@ class ScanManager:
             else:
                 self.main_window.gallery_manager.clear_gallery()
                 self.main_window.data_manager.clear_unpaired_files_lists()
+                clear_filter_index()
 
             # Wykonaj skanowanie
             if is_initial_scan:
                 self.start_folder_scanning(normalized_path)
             else:
-                # Logika z change_directory
-                scan_result = self.main_window.controller.scan_service.scan_directory(
-                    normalized_path, max_depth=0
+                # Skanowanie w tle - wynik z cache (jeśli jest) pokazywany od
+                # razu, aktualny wynik nakładany po zakończeniu skanowania
+                self.main_window.controller.directory_watcher.stop()
+                self.main_window.controller.finish_streamed_pairs()
+                self._showing_cached_result = False
+                self.main_window._show_progress(
+                    0, f"Skanowanie: {os.path.basename(normalized_path)}"
                 )
-
-                if scan_result.error_message:
-                    self.main_window.show_error_message(
-                        "Błąd skanowania", scan_result.error_message
-                    )
-                    return False
-
-                # Aktualizuj kontroler
-                self.main_window.controller.current_directory = normalized_path
-                self.main_window.controller.current_file_pairs = scan_result.file_pairs
-                self.main_window.controller.unpaired_archives = (
-                    scan_result.unpaired_archives
-                )
-                self.main_window.controller.unpaired_previews = (
-                    scan_result.unpaired_previews
-                )
-
-                # 🔧 NAPRAWKA: Aktualizuj FileExplorerTab z nowym folderem
-                if hasattr(self.main_window, "file_explorer_tab"):
-                    self.main_window.file_explorer_tab.set_root_path(normalized_path)
-
-                # Aktualizuj widoki
-                self.main_window.data_manager.update_views_after_scan(scan_result)
+                self.folder_navigation.navigate(normalized_path, max_depth=0)
 
             return True
 
@@ -137,8 +134,64 @@ class ScanManager:
                 )
             return False
 
+    def _on_navigation_cached_result(self, directory: str, result):
+        """Pokazuje ostatni znany wynik folderu przed zakończeniem skanowania."""
+        self._showing_cached_result = True
+        self._show_folder_result(directory, result)
+
+    def _on_navigation_pairs_batch(self, directory: str, pairs_batch: list):
+        """Pokazuje pary folderu bez wyniku w cache w trakcie skanowania."""
+        self.main_window.controller.add_streamed_pairs(directory, pairs_batch)
+
+    def _on_navigation_scan_finished(self, directory: str, result):
+        """Nakłada aktualny wynik skanowania folderu wybranego w drzewie."""
+        self.main_window.controller.finish_streamed_pairs()
+        if self._showing_cached_result:
+            # Galeria pokazuje już wynik z cache - tylko zmiany (delta)
+            self._showing_cached_result = False
+            self.main_window.controller.apply_rescan_result(directory, result)
+            self.main_window._hide_progress()
+        else:
+            self._show_folder_result(directory, result)
+        self.main_window.controller.watch_directory(directory, max_depth=0)
+
+    def _on_navigation_scan_failed(self, directory: str, message: str):
+        self._showing_cached_result = False
+        self.main_window.controller.finish_streamed_pairs()
+        self.main_window._hide_progress()
+        self.main_window.show_error_message("Błąd skanowania", message)
+
+    def _show_folder_result(self, directory: str, result):
+        """Ustawia wynik skanowania folderu jako dane aplikacji i tworzy kafelki."""
+        file_pairs, unpaired_archives, unpaired_previews, special_folders = result
+
+        # Kopie list - kontroler modyfikuje je w miejscu, a wynik z cache jest
+        # bazą inkrementalnego skanowania
+        controller = self.main_window.controller
+        controller.current_directory = directory
+        controller.current_file_pairs = list(file_pairs)
+        controller.unpaired_archives = list(unpaired_archives)
+        controller.unpaired_previews = list(unpaired_previews)
+        controller.special_folders = list(special_folders)
+        controller.refresh_file_records(directory)
+
+        # 🔧 NAPRAWKA: Aktualizuj FileExplorerTab z nowym folderem
+        if hasattr(self.main_window, "file_explorer_tab"):
+            self.main_window.file_explorer_tab.set_root_path(directory)
+
+        self.main_window.gallery_manager.clear_gallery()
+        if controller.current_file_pairs:
+            self.main_window.worker_manager.start_data_processing_worker_without_tree_reset(
+                controller.current_file_pairs
+            )
+        else:
+            self.finish_folder_change_without_tree_reset()
+
     def stop_current_scanning(self):
         """Przerywa aktualnie działające skanowanie."""
+        self.folder_navigation.cancel()
+        self._showing_cached_result = False
+        self.main_window.worker_manager.stop_directory_scan_worker()
         if (
             hasattr(self.main_window, "scan_thread")
             and self.main_window.scan_thread
@@ -4,7 +4,6 @@ ScanResultsHandler - obsługa wyników skanowania folderów.
 """
 
 import logging
-import os
 
 from PyQt6.QtCore import QTimer
 
@@ -137,66 +136,14 @@ class ScanResultsHandler:
         Zmienia bieżący katalog roboczy i rozpoczyna skanowanie.
         Ta metoda jest wywoływana z DirectoryTreeManagera.
 
+        Skanowanie odbywa się w tle (ScanManager/FolderNavigationService),
+        bez blokowania wątku GUI.
+
         Args:
             folder_path: Ścieżka do nowego katalogu roboczego
         """
         self.logger.info(f"Zmiana katalogu na: {folder_path} (bez resetu drzewa)")
-        normalized_path = normalize_path(folder_path)
-
-        if not self.main_window._validate_directory_path(normalized_path):
-            return
-
-        try:
-            self.logger.debug("Rozpoczynam zmianę katalogu bez resetu drzewa...")
-            self.main_window._show_progress(
-                0, f"Skanowanie: {os.path.basename(normalized_path)}"
-            )
-            self.main_window.is_scanning = True
-
-            # Uruchom skanowanie w tle
-            scan_result = self.main_window.controller.scan_service.scan_directory(
-                normalized_path, max_depth=0
-            )
-            # DIAGNOSTYKA
-            self.logger.critical(
-                f"DIAGNOSTYKA CHANGE_DIRECTORY: Otrzymano "
-                f"{len(scan_result.special_folders)} folderów specjalnych "
-                f"ze skanera: {scan_result.special_folders}"
-            )
-
-            # Zatrzymaj spinner/progress bar
-            self.main_window.is_scanning = False
-            self.main_window._hide_progress()
-
-            # Zaktualizuj stan kontrolera ręcznie
-            self.main_window.controller.current_directory = normalized_path
-            self.main_window.controller.current_file_pairs = scan_result.file_pairs
-            self.main_window.controller.unpaired_archives = (
-                scan_result.unpaired_archives
-            )
-            self.main_window.controller.unpaired_previews = (
-                scan_result.unpaired_previews
-            )
-            self.main_window.controller.special_folders = scan_result.special_folders
-
-            # 🔧 NAPRAWKA: Aktualizuj FileExplorerTab z nowym folderem
-            if hasattr(self.main_window, "file_explorer_tab"):
-                self.main_window.file_explorer_tab.set_root_path(normalized_path)
-                self.logger.debug(
-                    f"FileExplorerTab zaktualizowany folderem: {normalized_path}"
-                )
-
-            if scan_result.file_pairs:
-                self.main_window.worker_manager.start_data_processing_worker_without_tree_reset(
-                    scan_result.file_pairs
-                )
-            else:
-                self.finish_folder_change_without_tree_reset()
-
-        except Exception as scan_error:
-            error_msg = f"Błąd skanowania folderu: {scan_error}"
-            self.logger.error(error_msg)
-            self.main_window.show_error_message("Błąd", error_msg)
+        self.main_window.scan_manager.change_directory(normalize_path(folder_path))
 
     def finish_folder_change_without_tree_reset(self):
         """
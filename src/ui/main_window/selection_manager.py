@@ -48,6 +48,7 @@ class SelectionManager:
             hasattr(self.main_window, "gallery_manager")
             and self.main_window.gallery_manager
         ):
+            self.main_window.gallery_manager.refresh_tiles_display()
             for tile_widget in self.main_window.gallery_manager.get_all_tile_widgets():
                 if hasattr(tile_widget, "metadata_controls"):
                     tile_widget.metadata_controls.update_selection_display(False)
@@ -56,12 +57,20 @@ class SelectionManager:
         logging.debug("Cleared all tile selections")
 
     def select_all_tiles(self):
-        """Selects all currently visible tiles."""
+        """Selects all file pairs currently shown in the gallery."""
         if (
             hasattr(self.main_window, "gallery_manager")
             and self.main_window.gallery_manager
         ):
-            for tile_widget in self.main_window.gallery_manager.get_all_tile_widgets():
+            gallery_manager = self.main_window.gallery_manager
+            # Tiles exist only for the visible area (pooled), so select the
+            # displayed pairs directly and refresh whatever is on screen
+            self.main_window.controller.selection_manager.selected_tiles.update(
+                gallery_manager.file_pairs_list
+            )
+            gallery_manager.refresh_tiles_display()
+
+            for tile_widget in gallery_manager.get_all_tile_widgets():
                 if hasattr(tile_widget, "file_pair") and tile_widget.file_pair:
                     self.main_window.controller.selection_manager.selected_tiles.add(
                         tile_widget.file_pair
@@ -4,10 +4,16 @@ Przeniesione z MainWindow w ramach refaktoryzacji.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
+
+from PyQt6.QtCore import QTimer
 
 from src.models.file_pair import FilePair
 
+# Liczba par sprawdzanych w jednym kroku odświeżania kafelków - między
+# krokami pętla zdarzeń Qt obsługuje UI
+TILE_REFRESH_CHUNK_SIZE = 250
+
 
 class TileManager:
     """
@@ -28,9 +34,12 @@ class TileManager:
         # Wskaźnik, czy trwa proces tworzenia kafelków
         self._is_creating_tiles = False
 
+        # Numer bieżącego odświeżania kafelków (nowsze przerywa starsze)
+        self._refresh_generation = 0
+
     def create_tile_widget_for_pair(self, file_pair: FilePair) -> Optional[object]:
         """
-        Tworzy pojedynczy kafelek dla pary plików.
+        Pobiera kafelek dla pary plików z GalleryManager (z puli lub nowy).
         """
         # Walidacja danych wejściowych - Problem #4
         if not file_pair:
@@ -41,49 +50,55 @@ class TileManager:
             logging.error(f"Nieprawidłowy FilePair - brak archive_path: {file_pair}")
             return None
 
-        tile = self.main_window.gallery_manager.create_tile_widget_for_pair(
+        return self.main_window.gallery_manager.create_tile_widget_for_pair(
             file_pair, self.main_window
         )
-        if tile:
-            # Podłącz sygnały kafelka
-            tile.archive_open_requested.connect(self.main_window.open_archive)
-            tile.preview_image_requested.connect(self.main_window._show_preview_dialog)
-            tile.tile_selected.connect(self.main_window._handle_tile_selection_changed)
-            tile.stars_changed.connect(self.main_window._handle_stars_changed)
-            tile.color_tag_changed.connect(self.main_window._handle_color_tag_changed)
-            tile.tile_context_menu_requested.connect(
-                self.main_window._show_file_context_menu
-            )
 
-            # Podłącz callback do śledzenia ładowania miniaturek
-            original_on_thumbnail_loaded = tile._on_thumbnail_loaded
-
-            def thumbnail_loaded_callback(*args, **kwargs):
-                try:
-                    if (
-                        hasattr(tile, "thumbnail_label")
-                        and tile.thumbnail_label is not None
-                    ):
-                        try:
-                            tile.thumbnail_label.isVisible()
-                            result = original_on_thumbnail_loaded(*args, **kwargs)
-                            self.main_window.progress_manager.on_thumbnail_progress()
-                            return result
-                        except RuntimeError:
-                            logging.debug("Thumbnail callback: Widget usunięty")
-                            return None
-                    else:
-                        logging.debug(
-                            "Thumbnail callback: thumbnail_label nie istnieje"
-                        )
+    def connect_tile_signals(self, tile):
+        """
+        Podłącza sygnały nowego kafelka do handlerów głównego okna.
+
+        Wywoływane przez GalleryManager tylko dla nowo utworzonych kafelków -
+        kafelki z puli zachowują połączenia, a ich sygnały niosą aktualny
+        file_pair.
+        """
+        # Podłącz sygnały kafelka
+        tile.archive_open_requested.connect(self.main_window.open_archive)
+        tile.preview_image_requested.connect(self.main_window._show_preview_dialog)
+        tile.tile_selected.connect(self.main_window._handle_tile_selection_changed)
+        tile.stars_changed.connect(self.main_window._handle_stars_changed)
+        tile.color_tag_changed.connect(self.main_window._handle_color_tag_changed)
+        tile.tile_context_menu_requested.connect(
+            self.main_window._show_file_context_menu
+        )
+
+        # Podłącz callback do śledzenia ładowania miniaturek
+        original_on_thumbnail_loaded = tile._on_thumbnail_loaded
+
+        def thumbnail_loaded_callback(*args, **kwargs):
+            try:
+                if (
+                    hasattr(tile, "thumbnail_label")
+                    and tile.thumbnail_label is not None
+                ):
+                    try:
+                        tile.thumbnail_label.isVisible()
+                        result = original_on_thumbnail_loaded(*args, **kwargs)
+                        self.main_window.progress_manager.on_thumbnail_progress()
+                        return result
+                    except RuntimeError:
+                        logging.debug("Thumbnail callback: Widget usunięty")
                         return None
-                except Exception as e:
-                    logging.warning(f"Błąd w thumbnail callback: {e}")
+                else:
+                    logging.debug(
+                        "Thumbnail callback: thumbnail_label nie istnieje"
+                    )
                     return None
+            except Exception as e:
+                logging.warning(f"Błąd w thumbnail callback: {e}")
+                return None
 
-            tile._on_thumbnail_loaded = thumbnail_loaded_callback
-
-        return tile
+        tile._on_thumbnail_loaded = thumbnail_loaded_callback
 
     def start_tile_creation(self, file_pairs: list):
         """
@@ -102,8 +117,11 @@ class TileManager:
 
     def create_tile_widgets_batch(self, file_pairs_batch: list):
         """
-        Tworzy kafelki dla batch'a par plików - OPTYMALIZACJA dla wydajności.
-        Zamiast tworzyć po jednym kafelku, tworzy je grupami aby zmniejszyć obciążenie UI.
+        Obsługuje batch par plików przygotowanych przez DataProcessingWorker.
+
+        Kafelki nie są tworzone z góry dla wszystkich par - GalleryManager
+        tworzy je (lub pobiera z puli) tylko dla widocznego obszaru galerii.
+        Tutaj aktualizowany jest jedynie postęp ładowania.
 
         Args:
             file_pairs_batch: Lista obiektów FilePair do przetworzenia w tym batch'u
@@ -114,12 +132,6 @@ class TileManager:
             self.main_window.progress_manager.init_batch_processing(total_tiles)
 
         try:
-            created_count = 0
-            for file_pair in file_pairs_batch:
-                tile = self.create_tile_widget_for_pair(file_pair)
-                if tile:
-                    created_count += 1
-
             # NAPRAWKA PROGRESS BAR: Użyj rzeczywistego licznika kafelków z galerii
             actual_tiles_count = len(self.main_window.gallery_manager.file_pairs_list)
 
@@ -146,29 +158,55 @@ class TileManager:
             f"Odświeżanie {len(file_pairs_list)} istniejących kafelków po wczytaniu metadanych"
         )
 
-        # Pobierz wszystkie istniejące kafelki z galerii
-        existing_tiles = self.main_window.gallery_manager.get_all_tile_widgets()
-
-        refreshed_count = 0
-        for tile in existing_tiles:
-            if hasattr(tile, "file_pair") and tile.file_pair:
-                # Znajdź odpowiadającą parę plików w zaktualizowanej liście
-                for updated_file_pair in file_pairs_list:
-                    if (
-                        hasattr(updated_file_pair, "archive_path")
-                        and tile.file_pair.archive_path
-                        == updated_file_pair.archive_path
-                    ):
-                        # Aktualizuj dane kafelka
-                        tile.update_data(updated_file_pair)
-                        refreshed_count += 1
-                        break
+        # Nowe odświeżanie unieważnia kroki poprzedniego, jeszcze trwającego
+        self._refresh_generation += 1
+        self._refresh_tiles_chunk(list(file_pairs_list), 0, self._refresh_generation, 0)
+
+    def _refresh_tiles_chunk(
+        self,
+        file_pairs_list: List[FilePair],
+        start: int,
+        generation: int,
+        refreshed_count: int,
+    ):
+        """
+        Odświeża jeden krok kafelków i planuje kolejny przez pętlę zdarzeń.
+
+        Kafelki są wyszukiwane w indeksie ścieżek archiwów GalleryManager
+        (O(1) na parę), a update_data wywoływane jest tylko dla kafelków,
+        których gwiazdki lub kolor faktycznie się zmieniły.
+        """
+        if generation != self._refresh_generation:
+            return
+
+        gallery_manager = self.main_window.gallery_manager
+        end = min(start + TILE_REFRESH_CHUNK_SIZE, len(file_pairs_list))
+        for updated_file_pair in file_pairs_list[start:end]:
+            if not getattr(updated_file_pair, "archive_path", None):
+                continue
+            tile = gallery_manager.get_tile_for_path(
+                updated_file_pair.get_archive_path()
+            )
+            if tile is None or not tile.needs_metadata_refresh(updated_file_pair):
+                continue
+
+            # Aktualizuj dane kafelka
+            tile.update_data(updated_file_pair)
+            refreshed_count += 1
+
+        if end < len(file_pairs_list):
+            QTimer.singleShot(
+                0,
+                lambda: self._refresh_tiles_chunk(
+                    file_pairs_list, end, generation, refreshed_count
+                ),
+            )
+            return
 
         self.logger.debug(f"Odświeżono {refreshed_count} kafelków z metadanymi")
 
         # Wymuś odświeżenie UI
-        if hasattr(self.main_window.gallery_manager, "tiles_container"):
-            self.main_window.gallery_manager.tiles_container.update()
+        gallery_manager.refresh_tiles_display()
 
     def on_tile_loading_finished(self):
         """
@@ -111,8 +111,8 @@ class UIInitializer:
                 self.main_window.unpaired_files_tab_manager.get_widgets_for_main_window()
             )
 
-            self.main_window.unpaired_previews_layout = unpaired_widgets[
-                "unpaired_previews_layout"
+            self.main_window.unpaired_previews_grid = unpaired_widgets[
+                "unpaired_previews_grid"
             ]
             self.main_window.pair_manually_button = unpaired_widgets[
                 "pair_manually_button"
@@ -180,9 +180,10 @@ class UIInitializer:
             "thread_pool_configured": hasattr(self.main_window, "thread_pool"),
             "main_layout_created": hasattr(self.main_window, "main_layout"),
             "tabs_initialized": hasattr(self.main_window, "tab_widget"),
-            "unpaired_widgets_configured": hasattr(
-                self.main_window, "unpaired_previews_layout"
-            ),
+            "unpaired_widgets_configured": getattr(
+                self.main_window, "unpaired_previews_grid", None
+            )
+            is not None,
             "expand_collapse_buttons": hasattr(
                 self.main_window, "folder_tree_container"
             ),
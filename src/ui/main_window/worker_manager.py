@@ -349,30 +349,40 @@ class WorkerManager:
     def start_directory_scan_worker(self, directory_path: str):
         """
         Uruchamia workera do asynchronicznego skanowania katalogu.
-        """
-        if self.scan_worker and self.scan_worker.isRunning():
-            self.logger.warning("Skanowanie katalogu jest już w toku.")
-            return
 
+        Pary są przekazywane do kontrolera partiami w trakcie skanowania;
+        nowe skanowanie przerywa poprzednie, a jego sygnały są pomijane.
+        """
         from src.ui.delegates.workers.scan_workers import ScanDirectoryWorker
 
-        # Przerwij stary worker jeśli istnieje
-        if self.scan_thread and self.scan_thread.isRunning():
-            self.scan_thread.quit()
-            self.scan_thread.wait()
+        self.stop_directory_scan_worker()
 
-        self.scan_thread = QThread()
-        self.scan_worker = ScanDirectoryWorker(directory_path)
-        self.scan_worker.moveToThread(self.scan_thread)
-
-        # Podłącz sygnały
-        self.scan_worker.signals.finished.connect(
-            self.main_window.controller._on_scan_worker_finished
+        worker = ScanDirectoryWorker(directory_path)
+        worker.signals.pairs_batch_ready.connect(
+            partial(self._on_scan_pairs_batch, worker)
         )
-        self.scan_worker.signals.progress.connect(self.main_window._show_progress)
-        self.scan_worker.signals.error.connect(self.main_window._handle_worker_error)
-        self.scan_thread.started.connect(self.scan_worker.run)
-        self.scan_thread.finished.connect(self.scan_thread.deleteLater)
+        worker.signals.finished.connect(partial(self._on_scan_worker_finished, worker))
+        worker.signals.progress.connect(self.main_window._show_progress)
+        worker.signals.error.connect(self.main_window._handle_worker_error)
+        self.scan_worker = worker
 
-        self.scan_thread.start()
+        self.thread_pool.start(worker)
         self.logger.info(f"Uruchomiono asynchroniczne skanowanie dla: {directory_path}")
+
+    def stop_directory_scan_worker(self):
+        """Przerywa trwające skanowanie katalogu."""
+        if self.scan_worker is not None:
+            self.scan_worker.interrupt()
+            self.scan_worker = None
+
+    def _on_scan_pairs_batch(self, worker, pairs_batch: list):
+        if worker is self.scan_worker:
+            self.main_window.controller.add_streamed_pairs(
+                worker.directory_path, pairs_batch
+            )
+
+    def _on_scan_worker_finished(self, worker, scan_result):
+        if worker is not self.scan_worker:
+            return
+        self.scan_worker = None
+        self.main_window.controller._on_scan_worker_finished(scan_result)
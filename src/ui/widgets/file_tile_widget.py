@@ -357,6 +357,13 @@ class FileTileWidget(QWidget):
             # Reset dla None file_pair
             self._reset_ui_state()
 
+    def reset_thumbnail(self):
+        """Przywraca pusty podgląd nowego kafelka (przed związaniem z inną parą)."""
+        if hasattr(self, "_thumbnail_component"):
+            self._thumbnail_component.reset()
+        if hasattr(self, "thumbnail_label"):
+            self.thumbnail_label.clear()
+
     def set_file_pair(self, file_pair: Optional[FilePair]):
         """KOMPATYBILNOŚĆ: Alias dla update_data()."""
         self.update_data(file_pair)
@@ -609,6 +616,24 @@ class FileTileWidget(QWidget):
         """Sprawdza czy kafelek jest zaznaczony."""
         return self.is_selected
 
+    def needs_metadata_refresh(self, file_pair: FilePair) -> bool:
+        """
+        Sprawdza, czy wyświetlane gwiazdki/kolor różnią się od danych file_pair.
+
+        FilePair jest zwykle aktualizowany w miejscu (ten sam obiekt), dlatego
+        porównanie odbywa się ze stanem komponentu metadanych kafelka.
+        """
+        if self.file_pair is not file_pair:
+            return True
+
+        metadata_component = getattr(self, "_metadata_component", None)
+        if metadata_component is None:
+            return True
+
+        return metadata_component.get_stars() != file_pair.get_stars() or (
+            metadata_component.get_color_tag() != (file_pair.get_color_tag() or "")
+        )
+
     def reload_thumbnail(self):
         """NOWE API: Odświeża miniaturę."""
         if hasattr(self, "_thumbnail_component") and self.file_pair:
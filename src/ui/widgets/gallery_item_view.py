@@ -0,0 +1,561 @@
+"""
+Galeria w trybie model/widok - alternatywa dla kafelków FileTileWidget.
+
+Zamiast osobnego QWidget dla każdej pary plików, QListView w trybie ikon
+rysuje tylko widoczne elementy przez delegata (miniatura, obwódka tagu
+koloru, nazwa, gwiazdki, rozmiar, checkbox selekcji). Model jedynie
+odwołuje się do list folderów specjalnych i par plików GalleryManager -
+niczego nie kopiuje - więc pamięć zależy od liczby widocznych komórek,
+a nie od liczby par w folderze.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import (
+    QEvent,
+    QMimeData,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QDrag, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QListView,
+    QMenu,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from src.models.file_pair import FilePair
+from src.models.special_folder import SpecialFolder
+from src.ui.widgets.lazy_thumbnail_model import (
+    LazyThumbnailListModel,
+    ThumbnailFailedRole,
+    thumbnail_dimension_for_tile,
+    tile_size_tuple,
+)
+from src.ui.widgets.tile_styles import TileColorScheme, TileSizeConstants
+
+# Role danych modelu
+GalleryItemRole = Qt.ItemDataRole.UserRole
+GallerySelectedRole = Qt.ItemDataRole.UserRole + 1
+
+# Odstęp między kafelkami w siatce (jak spacing QGridLayout galerii)
+TILE_SPACING = 10
+STAR_COUNT = 5
+STAR_COLOR = "#FFD700"
+STAR_EMPTY_COLOR = "#888888"
+SELECTED_BORDER_COLOR = "#5A9FD4"
+
+
+class GalleryListModel(LazyThumbnailListModel):
+    """
+    Model galerii: najpierw foldery specjalne, potem pary plików.
+
+    Wiersze są wyliczane z indeksu w dwóch listach przekazanych przez
+    GalleryManager. Miniatury podglądów są ładowane leniwie przez
+    LazyThumbnailListModel, a stan zaznaczenia pochodzi ze zbioru
+    selected_tiles kontrolera (ten sam obiekt, bez kopiowania).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._folders: List[SpecialFolder] = []
+        self._pairs: List[FilePair] = []
+        self._selection: Set[FilePair] = set()
+        # Indeksy ścieżek budowane leniwie - dopiero gdy są potrzebne
+        self._preview_rows: Optional[Dict[str, int]] = None
+        self._archive_rows: Optional[Dict[str, int]] = None
+
+    # --- Dane ---
+
+    def set_items(self, special_folders: List[SpecialFolder], file_pairs: List[FilePair]):
+        """Zastępuje zawartość modelu (listy są używane bez kopiowania)."""
+        self.beginResetModel()
+        self._folders = special_folders
+        self._pairs = file_pairs
+        self._preview_rows = None
+        self._archive_rows = None
+        self._reset_thumbnail_requests()
+        self.endResetModel()
+
+    def shows_pairs(self, file_pairs: List[FilePair]) -> bool:
+        """Sprawdza, czy model wyświetla właśnie tę listę par."""
+        return self._pairs is file_pairs
+
+    def append_pairs(self, file_pairs: List[FilePair]):
+        """Dopisuje pary na końcu listy modelu bez resetu widoku."""
+        if not file_pairs:
+            return
+        first = len(self._folders) + len(self._pairs)
+        self.beginInsertRows(QModelIndex(), first, first + len(file_pairs) - 1)
+        self._pairs.extend(file_pairs)
+        for row, pair in enumerate(file_pairs, first):
+            if self._preview_rows is not None and pair.preview_path:
+                self._preview_rows[pair.preview_path] = row
+            if self._archive_rows is not None:
+                self._archive_rows[pair.archive_path] = row
+        self.endInsertRows()
+
+    def set_selection(self, selection: Optional[Set[FilePair]]):
+        """Ustawia zbiór zaznaczonych par, z którego korzysta GallerySelectedRole."""
+        self._selection = selection if selection is not None else set()
+
+    def is_selected(self, file_pair: FilePair) -> bool:
+        return file_pair in self._selection
+
+    def item(self, row: int):
+        """Zwraca SpecialFolder lub FilePair dla wiersza (None poza zakresem)."""
+        folder_count = len(self._folders)
+        if 0 <= row < folder_count:
+            return self._folders[row]
+        if folder_count <= row < folder_count + len(self._pairs):
+            return self._pairs[row - folder_count]
+        return None
+
+    def file_pair(self, index: QModelIndex) -> Optional[FilePair]:
+        """Zwraca parę plików dla indeksu lub None (folder, indeks nieprawidłowy)."""
+        item = self.item(index.row()) if index.isValid() else None
+        return item if isinstance(item, FilePair) else None
+
+    def row_for_path(self, path: str) -> int:
+        """Zwraca wiersz pary, której podgląd to path (-1 gdy brak)."""
+        if self._preview_rows is None:
+            offset = len(self._folders)
+            self._preview_rows = {
+                pair.preview_path: offset + row
+                for row, pair in enumerate(self._pairs)
+                if pair.preview_path
+            }
+        return self._preview_rows.get(path, -1)
+
+    def row_for_archive_path(self, archive_path: str) -> int:
+        """Zwraca wiersz pary o danej ścieżce archiwum (-1 gdy brak)."""
+        if self._archive_rows is None:
+            offset = len(self._folders)
+            self._archive_rows = {
+                pair.archive_path: offset + row for row, pair in enumerate(self._pairs)
+            }
+        return self._archive_rows.get(archive_path, -1)
+
+    def notify_items_changed(self):
+        """Informuje widok o zmianie metadanych lub zaznaczenia elementów."""
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(self.index(0), self.index(rows - 1), [GallerySelectedRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._folders) + len(self._pairs)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        item = self.item(index.row()) if index.isValid() else None
+        if item is None:
+            return None
+
+        if isinstance(item, SpecialFolder):
+            if role == Qt.ItemDataRole.DisplayRole:
+                return item.get_folder_name()
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return item.get_folder_path()
+            if role == GalleryItemRole:
+                return item
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.get_base_name()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return item.archive_path
+        if role == GalleryItemRole:
+            return item
+        if role == GallerySelectedRole:
+            return self.is_selected(item)
+        if role == ThumbnailFailedRole:
+            return bool(item.preview_path) and self.is_thumbnail_failed(item.preview_path)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._get_thumbnail(item.preview_path) if item.preview_path else None
+        return None
+
+
+class GalleryTileDelegate(QStyledItemDelegate):
+    """
+    Rysuje kafelek galerii bezpośrednio na widoku i rozpoznaje kliknięcia
+    w jego obszary (miniatura, nazwa, checkbox, gwiazdki, tag koloru).
+    """
+
+    thumbnail_clicked = pyqtSignal(object)
+    filename_clicked = pyqtSignal(object)
+    selection_toggled = pyqtSignal(object)
+    star_clicked = pyqtSignal(object, int)
+    color_clicked = pyqtSignal(object, QPoint)
+    folder_clicked = pyqtSignal(str)
+
+    CONTROL_SIZE = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tile_size: Tuple[int, int] = tile_size_tuple(
+            TileSizeConstants.DEFAULT_THUMBNAIL_SIZE
+        )
+        self.folder_icon = None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(*self.tile_size)
+
+    def _layout(self, rect: QRect, thumbnail_dimension: int) -> Dict[str, QRect]:
+        """Wylicza obszary elementów kafelka."""
+        padding = TileSizeConstants.TILE_PADDING
+        control = self.CONTROL_SIZE
+        tile = rect.adjusted(TILE_SPACING // 2, TILE_SPACING // 2, -TILE_SPACING // 2, -TILE_SPACING // 2)
+        thumb_x = tile.x() + (tile.width() - thumbnail_dimension) // 2
+        thumbnail = QRect(thumb_x, tile.y() + padding, thumbnail_dimension, thumbnail_dimension)
+        controls_y = tile.bottom() - padding - control
+        filename = QRect(
+            tile.x() + padding,
+            thumbnail.bottom() + 2,
+            tile.width() - padding * 2,
+            max(0, controls_y - thumbnail.bottom() - 4),
+        )
+        checkbox = QRect(tile.x() + padding, controls_y, control, control)
+        stars = QRect(checkbox.right() + 4, controls_y, control * STAR_COUNT, control)
+        color = QRect(tile.right() - padding - control + 1, controls_y, control, control)
+        size = QRect(
+            stars.right() + 4,
+            controls_y,
+            max(0, color.left() - stars.right() - 8),
+            control,
+        )
+        return {
+            "tile": tile,
+            "thumbnail": thumbnail,
+            "filename": filename,
+            "checkbox": checkbox,
+            "stars": stars,
+            "size": size,
+            "color": color,
+        }
+
+    def _thumbnail_dimension(self, index: QModelIndex) -> int:
+        model = index.model()
+        if isinstance(model, LazyThumbnailListModel):
+            return model.thumbnail_dimension()
+        return thumbnail_dimension_for_tile(self.tile_size)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        item = index.data(GalleryItemRole)
+        areas = self._layout(option.rect, self._thumbnail_dimension(index))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        selected = isinstance(item, FilePair) and bool(index.data(GallerySelectedRole))
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Tło kafelka
+        background = TileColorScheme.BACKGROUND_HOVER if hovered else TileColorScheme.BACKGROUND
+        if selected:
+            border = SELECTED_BORDER_COLOR
+        else:
+            border = TileColorScheme.BORDER_HOVER if hovered else TileColorScheme.BORDER
+        painter.setPen(QPen(QColor(border), 2 if selected else 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(areas["tile"], 6, 6)
+
+        if isinstance(item, SpecialFolder):
+            self._paint_folder(painter, areas, index, hovered)
+            painter.restore()
+            return
+
+        self._paint_thumbnail(painter, areas["thumbnail"], item, index)
+
+        # Nazwa pliku
+        painter.setPen(QColor(TileColorScheme.TEXT_HOVER if hovered else TileColorScheme.TEXT))
+        name = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideMiddle,
+            areas["filename"].width(),
+        )
+        painter.drawText(areas["filename"], Qt.AlignmentFlag.AlignCenter, name)
+
+        # Gwiazdki
+        stars = item.get_stars()
+        star_rect = QRect(areas["stars"].topLeft(), QSize(self.CONTROL_SIZE, self.CONTROL_SIZE))
+        for star in range(STAR_COUNT):
+            painter.setPen(QColor(STAR_COLOR if star < stars else STAR_EMPTY_COLOR))
+            painter.drawText(
+                star_rect.translated(star * self.CONTROL_SIZE, 0),
+                Qt.AlignmentFlag.AlignCenter,
+                "★" if star < stars else "☆",
+            )
+
+        # Rozmiar archiwum
+        if areas["size"].width() > 0:
+            painter.setPen(QColor(TileColorScheme.TEXT))
+            size_text = painter.fontMetrics().elidedText(
+                item.get_formatted_archive_size(),
+                Qt.TextElideMode.ElideRight,
+                areas["size"].width(),
+            )
+            painter.drawText(
+                areas["size"],
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                size_text,
+            )
+
+        # Tag koloru
+        color_tag = (item.get_color_tag() or "").strip()
+        painter.setPen(QPen(QColor(TileColorScheme.BORDER_HOVER if hovered else TileColorScheme.BORDER), 1))
+        painter.setBrush(QColor(color_tag) if color_tag else Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(areas["color"].adjusted(2, 2, -2, -2))
+        painter.restore()
+
+        # Checkbox selekcji
+        style = option.widget.style() if option.widget else None
+        if style is not None:
+            checkbox_option = QStyleOptionButton()
+            checkbox_option.rect = areas["checkbox"]
+            checkbox_option.state = QStyle.StateFlag.State_Enabled | (
+                QStyle.StateFlag.State_On if selected else QStyle.StateFlag.State_Off
+            )
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_IndicatorCheckBox,
+                checkbox_option,
+                painter,
+                option.widget,
+            )
+
+    def _paint_thumbnail(self, painter: QPainter, rect: QRect, file_pair: FilePair, index: QModelIndex):
+        """Rysuje miniaturę (lub placeholder) z obwódką w kolorze tagu."""
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            painter.drawPixmap(rect, pixmap)
+        elif index.data(ThumbnailFailedRole) or not file_pair.preview_path:
+            painter.setPen(QColor(TileColorScheme.ERROR_COLOR))
+            painter.drawText(
+                rect,
+                Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+                "Brak podglądu",
+            )
+        else:
+            painter.fillRect(rect, QColor(TileColorScheme.LOADING_COLOR))
+
+        color_tag = (file_pair.get_color_tag() or "").strip()
+        if color_tag:
+            painter.setPen(QPen(QColor(color_tag), 3))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(rect.adjusted(1, 1, -2, -2))
+
+    def _paint_folder(self, painter: QPainter, areas: Dict[str, QRect], index: QModelIndex, hovered: bool):
+        """Rysuje kafelek folderu specjalnego (ikona i nazwa)."""
+        if self.folder_icon is not None:
+            self.folder_icon.paint(painter, areas["thumbnail"].adjusted(16, 16, -16, -16))
+        painter.setPen(QColor(TileColorScheme.TEXT_HOVER if hovered else TileColorScheme.TEXT))
+        name_rect = areas["filename"].united(areas["checkbox"]).united(areas["color"])
+        name = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideMiddle,
+            name_rect.width(),
+        )
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, name)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (
+            event.type() != QEvent.Type.MouseButtonRelease
+            or event.button() != Qt.MouseButton.LeftButton
+        ):
+            return False
+
+        item = index.data(GalleryItemRole)
+        areas = self._layout(option.rect, self._thumbnail_dimension(index))
+        position = event.position().toPoint()
+        if not areas["tile"].contains(position):
+            return False
+
+        if isinstance(item, SpecialFolder):
+            self.folder_clicked.emit(item.get_folder_path())
+            return True
+        if not isinstance(item, FilePair):
+            return False
+
+        if areas["checkbox"].contains(position):
+            self.selection_toggled.emit(item)
+            return True
+        if areas["stars"].contains(position):
+            star = (position.x() - areas["stars"].x()) // self.CONTROL_SIZE
+            self.star_clicked.emit(item, min(star, STAR_COUNT - 1))
+            return True
+        if areas["color"].contains(position):
+            self.color_clicked.emit(item, areas["color"].bottomLeft())
+            return True
+        if areas["thumbnail"].contains(position):
+            self.thumbnail_clicked.emit(item)
+            return True
+        if areas["filename"].contains(position):
+            self.filename_clicked.emit(item)
+            return True
+        return False
+
+
+class GalleryItemView(QListView):
+    """
+    Wirtualizowany widok galerii.
+
+    Udostępnia te same sygnały co FileTileWidget, dzięki czemu menu
+    kontekstowe, podgląd, otwieranie archiwów, gwiazdki, tagi koloru
+    i selekcja trafiają do tych samych handlerów głównego okna.
+    """
+
+    archive_open_requested = pyqtSignal(FilePair)
+    preview_image_requested = pyqtSignal(FilePair)
+    tile_selected = pyqtSignal(FilePair, bool)
+    stars_changed = pyqtSignal(FilePair, int)
+    color_tag_changed = pyqtSignal(FilePair, str)
+    tile_context_menu_requested = pyqtSignal(FilePair, QWidget, object)
+    folder_clicked = pyqtSignal(str)
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+        self._press_position: Optional[QPoint] = None
+        self._press_index = QModelIndex()
+
+        self.gallery_model = GalleryListModel(self)
+        self.delegate = GalleryTileDelegate(self)
+        self.delegate.folder_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        self.delegate.thumbnail_clicked.connect(self.preview_image_requested)
+        self.delegate.filename_clicked.connect(self.archive_open_requested)
+        self.delegate.selection_toggled.connect(self._on_selection_toggled)
+        self.delegate.star_clicked.connect(self._on_star_clicked)
+        self.delegate.color_clicked.connect(self._on_color_clicked)
+        self.delegate.folder_clicked.connect(self.folder_clicked)
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(500)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setMouseTracking(True)
+        self.setModel(self.gallery_model)
+        self.setItemDelegate(self.delegate)
+        self.set_tile_size(TileSizeConstants.DEFAULT_THUMBNAIL_SIZE)
+
+    def set_tile_size(self, size):
+        """Ustawia rozmiar kafelka (int lub krotka (szerokość, wysokość))."""
+        tile_size = tile_size_tuple(size)
+        self.delegate.tile_size = tile_size
+        self.setGridSize(QSize(*tile_size))
+        self.gallery_model.set_thumbnail_dimension(thumbnail_dimension_for_tile(tile_size))
+
+    def refresh_file_pair(self, file_pair: FilePair):
+        """Przerysowuje kafelek jednej pary (np. po zmianie metadanych)."""
+        row = self.gallery_model.row_for_archive_path(file_pair.archive_path)
+        if row >= 0:
+            self.update(self.gallery_model.index(row))
+
+    # --- Interakcje z kafelkami ---
+
+    def _on_selection_toggled(self, file_pair: FilePair):
+        self.tile_selected.emit(file_pair, not self.gallery_model.is_selected(file_pair))
+        self.refresh_file_pair(file_pair)
+
+    def _on_star_clicked(self, file_pair: FilePair, star_index: int):
+        new_star_count = star_index + 1
+        if new_star_count == file_pair.get_stars():
+            new_star_count = 0  # Odznacz wszystko
+        self.stars_changed.emit(file_pair, new_star_count)
+        self.refresh_file_pair(file_pair)
+
+    def _on_color_clicked(self, file_pair: FilePair, position: QPoint):
+        """Pokazuje menu predefiniowanych tagów koloru pod kontrolką."""
+        menu = QMenu(self)
+        current = (file_pair.get_color_tag() or "").strip().lower()
+        for name, color_hex in TileColorScheme.PREDEFINED_COLOR_TAGS.items():
+            action = menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(color_hex.lower() == current)
+            action.setData(color_hex)
+
+        chosen = menu.exec(self.viewport().mapToGlobal(position))
+        if chosen is not None:
+            self.color_tag_changed.emit(file_pair, chosen.data())
+            self.refresh_file_pair(file_pair)
+
+    def contextMenuEvent(self, event):
+        """Przekazuje żądanie menu kontekstowego pary pod kursorem."""
+        file_pair = self.gallery_model.file_pair(self.indexAt(event.pos()))
+        if file_pair is None:
+            super().contextMenuEvent(event)
+            return
+        self.tile_context_menu_requested.emit(file_pair, self.viewport(), event.pos())
+
+    # --- Drag & drop (jak TileInteractionComponent) ---
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._press_position = event.position().toPoint()
+            self._press_index = self.indexAt(self._press_position)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if (
+            self._press_position is not None
+            and event.buttons() & Qt.MouseButton.LeftButton
+            and (event.position().toPoint() - self._press_position).manhattanLength()
+            >= QApplication.startDragDistance()
+        ):
+            file_pair = self.gallery_model.file_pair(self._press_index)
+            self._press_position = None
+            if file_pair is not None:
+                self._start_drag(file_pair)
+                return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._press_position = None
+        super().mouseReleaseEvent(event)
+
+    def _start_drag(self, file_pair: FilePair):
+        """Rozpoczyna przeciąganie archiwum i podglądu pary."""
+        if not file_pair.archive_path or not file_pair.preview_path:
+            logging.warning("Cannot start drag - incomplete file pair")
+            return
+
+        mime_data = QMimeData()
+        mime_data.setUrls(
+            [
+                QUrl.fromLocalFile(file_pair.archive_path),
+                QUrl.fromLocalFile(file_pair.preview_path),
+            ]
+        )
+        drag = QDrag(self)
+        drag.setMimeData(mime_data)
+
+        pixmap = self.gallery_model.data(self._press_index, Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            pixmap = pixmap.scaled(
+                QSize(100, 100),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            drag.setPixmap(pixmap)
+            drag.setHotSpot(pixmap.rect().center())
+
+        logging.debug(f"Starting drag operation for: {os.path.basename(file_pair.archive_path)}")
+        drag.exec(Qt.DropAction.MoveAction)
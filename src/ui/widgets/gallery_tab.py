@@ -525,6 +525,30 @@ class GalleryTab:
         if hasattr(self, "filter_panel"):
             self.filter_panel.setEnabled(is_gallery_populated)
 
+    def append_pairs_to_view(self, appended_count: int):
+        """
+        Dokłada do galerii pasujące pary spośród `appended_count` ostatnich
+        par kontrolera, bez ponownego filtrowania całej listy.
+        """
+        if not hasattr(self.main_window, "gallery_manager"):
+            return
+
+        filter_criteria = {}
+        if hasattr(self, "filter_panel"):
+            filter_criteria = self.filter_panel.get_filter_criteria()
+
+        self.main_window.gallery_manager.append_filtered_pairs(
+            self.main_window.controller.current_file_pairs,
+            appended_count,
+            filter_criteria,
+        )
+
+        if self.main_window.gallery_manager.file_pairs_list:
+            if hasattr(self.main_window, "size_control_panel"):
+                self.main_window.size_control_panel.setVisible(True)
+            if hasattr(self, "filter_panel"):
+                self.filter_panel.setEnabled(True)
+
     def get_widgets_for_main_window(self):
         """
         Zwraca referencje do widgetów potrzebnych w głównym oknie.
@@ -0,0 +1,162 @@
+"""
+Bazowy model listy z leniwie ładowanymi miniaturami.
+
+Wspólna logika wirtualizowanych widoków (siatka niesparowanych podglądów,
+galeria w trybie QListView): miniatura jest pobierana z pamięci ThumbnailCache
+dopiero gdy widok poprosi o DecorationRole widocznego elementu, a brakujące
+miniatury są zbierane przez krótki czas i ładowane (cache dyskowy) lub
+generowane w tle paczkami (BatchThumbnailWorker).
+"""
+
+import logging
+from typing import List, Optional, Set
+
+from PyQt6.QtCore import QAbstractListModel, Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QPixmap
+
+from src.ui.widgets.tile_styles import TileSizeConstants
+
+logger = logging.getLogger(__name__)
+
+# Maksymalna liczba miniatur w jednym zadaniu BatchThumbnailWorker
+THUMBNAIL_BATCH_SIZE = 32
+# Opóźnienie zbierania żądań miniatur z jednego przebiegu rysowania (ms)
+THUMBNAIL_REQUEST_DELAY_MS = 30
+
+# Rola informująca, że miniatury elementu nie udało się wygenerować
+ThumbnailFailedRole = Qt.ItemDataRole.UserRole + 2
+
+
+def tile_size_tuple(size) -> tuple:
+    """Zwraca rozmiar kafelka jako krotkę (szerokość, wysokość)."""
+    return (size, size) if isinstance(size, int) else (size[0], size[1])
+
+
+def thumbnail_dimension_for_tile(tile_size) -> int:
+    """Oblicza bok kwadratowej miniatury dla rozmiaru kafelka (jak FileTileWidget)."""
+    width, height = tile_size_tuple(tile_size)
+    dimension = min(
+        width - TileSizeConstants.TILE_PADDING * 2,
+        height
+        - TileSizeConstants.FILENAME_MAX_HEIGHT
+        - TileSizeConstants.METADATA_MAX_HEIGHT
+        - TileSizeConstants.TILE_PADDING * 2,
+    )
+    return max(dimension, TileSizeConstants.MIN_THUMBNAIL_WIDTH)
+
+
+class LazyThumbnailListModel(QAbstractListModel):
+    """
+    Model listy, który dostarcza miniatury na żądanie widoku.
+
+    Klasy pochodne implementują row_for_path() i wywołują
+    _get_thumbnail(path) w data() dla DecorationRole.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thumbnail_dimension = thumbnail_dimension_for_tile(
+            TileSizeConstants.DEFAULT_THUMBNAIL_SIZE
+        )
+        self._requested: Set[str] = set()
+        self._pending: List[str] = []
+        self._failed: Set[str] = set()
+
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(THUMBNAIL_REQUEST_DELAY_MS)
+        self._request_timer.timeout.connect(self._start_pending_requests)
+
+    def row_for_path(self, path: str) -> int:
+        """Zwraca wiersz elementu, którego miniatura pochodzi z path (-1 gdy brak)."""
+        raise NotImplementedError
+
+    # --- Miniatury ---
+
+    def thumbnail_dimension(self) -> int:
+        return self._thumbnail_dimension
+
+    def set_thumbnail_dimension(self, dimension: int):
+        """Zmienia rozmiar miniatur - widoczne elementy zostaną pobrane ponownie."""
+        if dimension == self._thumbnail_dimension:
+            return
+        self._thumbnail_dimension = dimension
+        self._reset_thumbnail_requests()
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(
+                self.index(0),
+                self.index(rows - 1),
+                [Qt.ItemDataRole.DecorationRole],
+            )
+
+    def is_thumbnail_failed(self, path: str) -> bool:
+        return path in self._failed
+
+    def _reset_thumbnail_requests(self):
+        self._requested.clear()
+        self._pending.clear()
+        self._failed.clear()
+        self._request_timer.stop()
+
+    def _get_thumbnail(self, path: str) -> Optional[QPixmap]:
+        """
+        Zwraca miniaturę z pamięci cache. Wywoływane w wątku GUI przy
+        rysowaniu, więc bez odczytu z dysku - dyskowy cache sprawdza
+        BatchThumbnailWorker, a do tego czasu widok dostaje przeskalowany
+        sąsiedni poziom mip (o ile jest w pamięci).
+        """
+        from src.ui.widgets.thumbnail_cache import ThumbnailCache
+
+        dimension = self._thumbnail_dimension
+        cache = ThumbnailCache.get_instance()
+        pixmap = cache.get_memory_thumbnail(path, dimension, dimension)
+        if pixmap is not None:
+            return pixmap
+
+        if path not in self._requested and path not in self._failed:
+            self._requested.add(path)
+            self._pending.append(path)
+            if not self._request_timer.isActive():
+                self._request_timer.start()
+        return cache.get_nearest_thumbnail(path, dimension, dimension)
+
+    def _start_pending_requests(self):
+        """Uruchamia generowanie zebranych miniatur paczkami w tle."""
+        from src.ui.delegates.workers.processing_workers import BatchThumbnailWorker
+
+        pending, self._pending = self._pending, []
+        dimension = self._thumbnail_dimension
+        for start in range(0, len(pending), THUMBNAIL_BATCH_SIZE):
+            requests = [
+                (path, dimension, dimension)
+                for path in pending[start : start + THUMBNAIL_BATCH_SIZE]
+            ]
+            worker = BatchThumbnailWorker(requests)
+            worker.signals.thumbnail_finished.connect(self._on_thumbnail_finished)
+            worker.signals.thumbnail_error.connect(self._on_thumbnail_error)
+            QThreadPool.globalInstance().start(worker)
+        if pending:
+            logger.debug("Zlecono generowanie %d miniatur", len(pending))
+
+    def _on_thumbnail_finished(self, pixmap: QPixmap, path: str, width: int, height: int):
+        if width != self._thumbnail_dimension:
+            return  # Wynik dla poprzedniego rozmiaru
+        # Po usunięciu miniatury z pamięci (LRU) kolejny odczyt zleci ją ponownie
+        self._requested.discard(path)
+        self._notify_thumbnail_changed(path)
+
+    def _on_thumbnail_error(self, message: str, path: str, width: int, height: int):
+        if width != self._thumbnail_dimension:
+            return
+        self._requested.discard(path)
+        self._failed.add(path)
+        self._notify_thumbnail_changed(path)
+
+    def _notify_thumbnail_changed(self, path: str):
+        row = self.row_for_path(path)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(
+                index, index, [Qt.ItemDataRole.DecorationRole, ThumbnailFailedRole]
+            )
@@ -1,14 +1,32 @@
 import logging
 import os
+import threading
 import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from PIL import Image
-from PyQt6.QtCore import Q_ARG, QDir, QMetaObject, QObject, QSize, Qt, QTimer, pyqtSlot
+from PyQt6.QtCore import (
+    Q_ARG,
+    QBuffer,
+    QByteArray,
+    QDir,
+    QIODevice,
+    QMetaObject,
+    QObject,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtSlot,
+)
 from PyQt6.QtGui import QIcon, QImage, QPixmap
 
 from src.app_config import config
+from src.models.file_record import FileRecord
+from src.ui.widgets.thumbnail_disk_cache import (
+    THUMBNAIL_CACHE_DIR_NAME,
+    ThumbnailDiskCache,
+)
 from src.utils.image_utils import (
     create_placeholder_pixmap,
     crop_to_square,
@@ -18,6 +36,11 @@ from src.utils.path_utils import normalize_path
 
 logger = logging.getLogger(__name__)
 
+# Poziomy łańcucha mip miniatur (kwadratowe, w px). Miniatura generowana jest
+# raz na najbliższym większym poziomie, a niższe poziomy powstają przez
+# skalowanie w pamięci - zmiana rozmiaru suwakiem korzysta z nich bez I/O.
+MIP_LEVELS = (128, 256, 512, 1024)
+
 
 class ThumbnailCache(QObject):
     _instance = None
@@ -43,10 +66,34 @@ class ThumbnailCache(QObject):
         self._cleanup_timer.timeout.connect(self._perform_cleanup)
         self._cleanup_interval_ms = 5000  # 5 sekund między cleanupami
 
+        # Drugi poziom cache - trwały cache na dysku (opcjonalny)
+        self._disk_cache = self._create_disk_cache()
+        # Rekordy skanera (rozmiar, mtime) zastępujące os.stat przy budowie
+        # kluczy dyskowego cache oraz katalogi z rekordami ze snapshotu -
+        # podmieniane razem (krotka), bo czytają je wątki workerów
+        self._file_records: Tuple[Dict[str, FileRecord], FrozenSet[str]] = (
+            {},
+            frozenset(),
+        )
+
         logger.debug(
             f"ThumbnailCache zainicjalizowany: max_entries={self._max_entries}, max_memory={self._max_memory_mb}MB"
         )
 
+    def _create_disk_cache(self) -> Optional[ThumbnailDiskCache]:
+        """Tworzy dyskowy cache miniatur jeśli włączono go w konfiguracji."""
+        if not config.thumbnail_cache_enable_disk:
+            return None
+
+        cache_dir = config.thumbnail_cache_disk_dir or os.path.join(
+            config.get_app_data_dir(), THUMBNAIL_CACHE_DIR_NAME
+        )
+        try:
+            return ThumbnailDiskCache(cache_dir, config.thumbnail_cache_disk_max_mb)
+        except Exception as e:
+            logger.error(f"Nie można zainicjalizować dyskowego cache miniatur: {e}")
+            return None
+
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
@@ -138,6 +185,10 @@ class ThumbnailCache(QObject):
         """
         Pobiera miniaturę z cache. Zwraca None jeśli nie ma w cache.
         Aktualizuje pozycję w LRU cache przy dostępie.
+
+        Dyskowy cache jest odczytywany tylko w wątkach roboczych - w wątku
+        GUI brak miniatury w pamięci oznacza None (odczyt i dekodowanie
+        z dysku wykona worker generujący miniaturę).
         """
         cache_key = self._normalize_cache_key(path, width, height)
 
@@ -145,21 +196,162 @@ class ThumbnailCache(QObject):
             # Aktualizuj pozycję w LRU
             self._update_cache_access(cache_key)
             pixmap, timestamp, size_bytes = self._cache[cache_key]
-            logger.debug(f"Cache HIT: {path} ({width}x{height})")
+            logger.debug("Cache HIT: %s (%dx%d)", path, width, height)
             return pixmap
 
-        logger.debug(f"Cache MISS: {path} ({width}x{height})")
+        if (
+            self._disk_cache is not None
+            and threading.current_thread() is not threading.main_thread()
+        ):
+            pixmap = self._get_from_disk(cache_key)
+            if pixmap is not None:
+                logger.debug("Disk cache HIT: %s (%dx%d)", path, width, height)
+                self._add_to_memory(cache_key, pixmap)
+                return pixmap
+
+        logger.debug("Cache MISS: %s (%dx%d)", path, width, height)
         return None
 
-    def add_thumbnail(self, path: str, width: int, height: int, pixmap: QPixmap):
-        """Dodaje załadowaną miniaturę do cache z obsługą LRU."""
+    def get_memory_thumbnail(
+        self, path: str, width: int, height: int
+    ) -> Optional[QPixmap]:
+        """Pobiera miniaturę tylko z cache pamięciowego (bez odczytu z dysku)."""
+        cache_key = self._normalize_cache_key(path, width, height)
+        if cache_key not in self._cache:
+            return None
+        self._update_cache_access(cache_key)
+        return self._cache[cache_key][0]
+
+    def get_nearest_thumbnail(
+        self, path: str, width: int, height: int
+    ) -> Optional[QPixmap]:
+        """
+        Zwraca miniaturę przeskalowaną z najbliższego poziomu mip w pamięci.
+
+        Preferowany jest najmniejszy poziom nie mniejszy od żądanego rozmiaru;
+        gdy go brak - największy dostępny (obraz tymczasowy do czasu
+        wygenerowania miniatury w dokładnym rozmiarze). Bez odczytu z dysku.
+        """
+        target = max(width, height)
+        larger = [level for level in MIP_LEVELS if level >= target]
+        smaller = [level for level in MIP_LEVELS if level < target]
+        for level in larger + smaller[::-1]:
+            pixmap = self.get_memory_thumbnail(path, level, level)
+            if pixmap is not None:
+                return pixmap.scaled(
+                    QSize(width, height),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+        return None
+
+    @staticmethod
+    def mip_level_for(width: int, height: int) -> Optional[int]:
+        """
+        Zwraca poziom mip, na którym należy wygenerować miniaturę (width, height),
+        lub None dla miniatur niekwadratowych i większych niż najwyższy poziom.
+        """
+        if width != height:
+            return None
+        for level in MIP_LEVELS:
+            if level >= width:
+                return level
+        return None
+
+    def add_mip_chain(self, path: str, level: int, pixmap: QPixmap):
+        """
+        Zapisuje w pamięci miniaturę poziomu mip `level` oraz wszystkie niższe
+        poziomy - każdy skalowany z poprzedniego, bez ponownego dekodowania.
+        """
+        if not path or not pixmap or pixmap.isNull():
+            return
+
+        level_pixmap = pixmap
+        for mip_level in reversed(MIP_LEVELS):
+            if mip_level > level:
+                continue
+            if mip_level < level:
+                level_pixmap = level_pixmap.scaled(
+                    QSize(mip_level, mip_level),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            cache_key = self._normalize_cache_key(path, mip_level, mip_level)
+            if cache_key not in self._cache:
+                self._add_to_memory(cache_key, level_pixmap)
+
+    def contains(self, path: str, width: int, height: int) -> bool:
+        """
+        Sprawdza obecność miniatury w cache pamięciowym - bez odczytu z dysku
+        i bez zmiany kolejności LRU (używane przy planowaniu prefetchu).
+        """
+        return self._normalize_cache_key(path, width, height) in self._cache
+
+    def add_thumbnail(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        pixmap: QPixmap,
+        encoded_data: Optional[bytes] = None,
+    ):
+        """
+        Dodaje załadowaną miniaturę do cache z obsługą LRU.
+
+        Args:
+            encoded_data: Miniatura zakodowana przez encode_thumbnail() -
+                zapisywana w dyskowym cache. Bez niej miniatura trafia
+                tylko do pamięci (kodowanie nie odbywa się w tym wątku).
+        """
         if not path or not pixmap or pixmap.isNull():
             logger.warning(
-                f"Próba dodania nieprawidłowej miniatury do cache dla: {path}"
+                "Próba dodania nieprawidłowej miniatury do cache dla: %s", path
             )
             return
 
         cache_key = self._normalize_cache_key(path, width, height)
+        self._add_to_memory(cache_key, pixmap)
+
+        logger.debug("Dodano do cache: %s (%dx%d)", path, width, height)
+
+        if self._disk_cache is not None and encoded_data:
+            self._put_to_disk(cache_key, encoded_data)
+
+    def encode_thumbnail(self, image) -> Optional[bytes]:
+        """
+        Koduje miniaturę (QImage lub QPixmap) do formatu dyskowego cache.
+
+        Wywoływane przez workery generujące miniatury poza blokadą cache;
+        wynik przekazywany jest do add_thumbnail(encoded_data=...).
+
+        Returns:
+            Zakodowane bajty lub None gdy dyskowy cache jest wyłączony.
+        """
+        if self._disk_cache is None or image is None or image.isNull():
+            return None
+        if isinstance(image, QPixmap):
+            image = image.toImage()
+        thumbnail_format, quality = self._get_format_settings()
+        return self._encode_image(image, thumbnail_format, quality) or None
+
+    def set_file_records(
+        self,
+        file_records: Optional[Dict[str, FileRecord]],
+        snapshot_directories: FrozenSet[str] = frozenset(),
+    ):
+        """
+        Ustawia rekordy plików ze skanera (rozmiar, mtime) używane przy
+        budowie kluczy dyskowego cache zamiast os.stat.
+
+        Rekordy przekazuje kontroler po skanowaniu folderu (także po
+        odświeżeniu przez obserwatora); pliki bez rekordu lub z katalogów
+        `snapshot_directories` (rekordy ze snapshotu) są sprawdzane przez
+        os.stat.
+        """
+        self._file_records = (file_records or {}, frozenset(snapshot_directories))
+
+    def _add_to_memory(self, cache_key: tuple, pixmap: QPixmap):
+        """Dodaje miniaturę do cache w pamięci i planuje cleanup."""
         size_bytes = self._estimate_pixmap_size(pixmap)
         timestamp = time.time()
 
@@ -172,13 +364,64 @@ class ThumbnailCache(QObject):
         self._cache[cache_key] = (pixmap, timestamp, size_bytes)
         self._total_memory_bytes += size_bytes
 
-        logger.debug(
-            f"Dodano do cache: {path} ({width}x{height}), rozmiar: {size_bytes//1024}KB"
-        )
-
         # Zaplanuj czyszczenie cache tylko jeśli jest potrzebne i nie jest już zaplanowane
         self._schedule_cleanup()
 
+    def _disk_key(self, cache_key: tuple) -> Optional[str]:
+        """Buduje klucz dyskowego cache (uwzględnia mtime i rozmiar pliku)."""
+        normalized_path, width, height, thumbnail_format, quality = cache_key
+        return ThumbnailDiskCache.build_key(
+            normalized_path,
+            width,
+            height,
+            thumbnail_format,
+            quality,
+            self._get_known_file_stat(normalized_path),
+        )
+
+    def _get_known_file_stat(self, normalized_path: str) -> Optional[tuple]:
+        """Zwraca (rozmiar, mtime) z rekordu skanera lub None."""
+        file_records, snapshot_directories = self._file_records
+        record = file_records.get(normalized_path)
+        if record is None:
+            return None
+        # mtime ze snapshotu może być nieaktualny - wtedy rozstrzyga os.stat
+        if os.path.dirname(normalized_path) in snapshot_directories:
+            return None
+        return record.size, record.mtime
+
+    def _get_from_disk(self, cache_key: tuple) -> Optional[QPixmap]:
+        """Odczytuje i dekoduje miniaturę z dyskowego cache."""
+        disk_key = self._disk_key(cache_key)
+        data = self._disk_cache.get(disk_key) if disk_key else None
+        if not data:
+            return None
+
+        image = QImage.fromData(data)
+        if image.isNull():
+            self._disk_cache.remove(disk_key)
+            return None
+        return QPixmap.fromImage(image)
+
+    def _put_to_disk(self, cache_key: tuple, encoded_data: bytes):
+        """Zapisuje zakodowaną miniaturę do dyskowego cache."""
+        disk_key = self._disk_key(cache_key)
+        if disk_key:
+            self._disk_cache.put(disk_key, encoded_data)
+
+    @staticmethod
+    def _encode_image(image: QImage, thumbnail_format: str, quality: int) -> bytes:
+        """Koduje obraz do formatu miniaturek (fallback na PNG)."""
+        byte_array = QByteArray()
+        buffer = QBuffer(byte_array)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        if not image.save(buffer, thumbnail_format, quality):
+            buffer.seek(0)
+            if not image.save(buffer, "PNG"):
+                return b""
+        buffer.close()
+        return bytes(byte_array)
+
     def clear_cache(self):
         """Czyści całą pamięć podręczną miniatur."""
         self._cache.clear()
@@ -190,6 +433,16 @@ class ThumbnailCache(QObject):
         )
         logger.info("Pamięć podręczna miniatur została wyczyszczona.")
 
+    def clear_disk_cache(self):
+        """Czyści dyskowy cache miniatur (jeśli jest włączony)."""
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def flush_disk_cache(self):
+        """Zapisuje indeksy dyskowego cache miniatur."""
+        if self._disk_cache is not None:
+            self._disk_cache.flush()
+
     def remove_thumbnail(self, path: str, width: int, height: int):
         """Usuwa konkretną miniaturę z cache."""
         cache_key = self._normalize_cache_key(path, width, height)
@@ -211,6 +464,11 @@ class ThumbnailCache(QObject):
             "memory_mb": self._total_memory_bytes / (1024 * 1024),
             "max_entries": self._max_entries,
             "max_memory_mb": self._max_memory_mb,
+            "disk": (
+                self._disk_cache.get_statistics()
+                if self._disk_cache is not None
+                else None
+            ),
         }
 
     def update_limits(self, max_entries: int, max_memory_mb: int):
@@ -235,20 +493,22 @@ class ThumbnailCache(QObject):
         Tworzy znormalizowany klucz cache.
         NAPRAWKA: Uwzględnia format miniaturek w kluczu cache.
         """
+        thumbnail_format, thumbnail_quality = self._get_format_settings()
+        normalized_path = normalize_path(path) if path else ""
+        # Klucz cache uwzględnia format i jakość aby różne ustawienia nie kolidowały
+        return (normalized_path, width, height, thumbnail_format, thumbnail_quality)
+
+    @staticmethod
+    def _get_format_settings() -> tuple:
+        """Zwraca (format, jakość) miniaturek z konfiguracji."""
         try:
             from src.app_config import AppConfig
 
             config = AppConfig.get_instance()
-            thumbnail_format = config.get_thumbnail_format()
-            thumbnail_quality = config.get_thumbnail_quality()
+            return config.get_thumbnail_format(), config.get_thumbnail_quality()
         except Exception:
             # Fallback jeśli nie można pobrać konfiguracji
-            thumbnail_format = "WEBP"
-            thumbnail_quality = 80
-
-        normalized_path = normalize_path(path) if path else ""
-        # Klucz cache uwzględnia format i jakość aby różne ustawienia nie kolidowały
-        return (normalized_path, width, height, thumbnail_format, thumbnail_quality)
+            return "WEBP", 80
 
     def _estimate_pixmap_size(self, pixmap: QPixmap) -> int:
         """
@@ -350,9 +610,11 @@ class ThumbnailCache(QObject):
 
         if should_log:
             logger.debug(
-                f"Thumbnail cache memory: {memory_usage_mb:.1f}MB "
-                f"({memory_usage_percent:.1f}%), "
-                f"entries: {len(self._cache)}/{self._max_entries}"
+                "Thumbnail cache memory: %.1fMB (%.1f%%), entries: %d/%d",
+                memory_usage_mb,
+                memory_usage_percent,
+                len(self._cache),
+                self._max_entries,
             )
 
             # Alert przy krytycznym zużyciu
@@ -122,7 +122,7 @@ class ThumbnailComponent(QObject):
             from src.ui.widgets.thumbnail_cache import ThumbnailCache
 
             cache = ThumbnailCache.get_instance()
-            cached_pixmap = cache.get_thumbnail(file_path, size[0], size[1])
+            cached_pixmap = cache.get_memory_thumbnail(file_path, size[0], size[1])
 
             if cached_pixmap:
                 self._on_thumbnail_ready(file_path, cached_pixmap)
@@ -0,0 +1,393 @@
+"""
+Trwały (dyskowy) cache miniaturek - drugi poziom za ThumbnailCache.
+
+Miniatury są przechowywane już zakodowane (WEBP/JPEG/PNG) w plikach paczek
+(pack files) podzielonych na shardy. Każdy shard ma własny indeks JSON
+z pozycją wpisu w paczce i czasem ostatniego dostępu, co pozwala na
+eviction LRU ograniczony całkowitym rozmiarem cache.
+
+Klucz wpisu: (znormalizowana ścieżka, mtime, rozmiar pliku, wymiary
+miniatury, format, jakość) - zmiana pliku źródłowego automatycznie
+unieważnia wpis.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.path_utils import normalize_path
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CACHE_DIR_NAME = "thumbnail_cache"
+PACK_FILE_SUFFIX = ".pack"
+INDEX_FILE_SUFFIX = ".idx"
+INDEX_FORMAT_VERSION = 1
+
+# Liczba zapisów po której indeks brudnego sharda jest zrzucany na dysk
+INDEX_FLUSH_EVERY = 64
+# Eviction zostawia cache na tym poziomie limitu (histereza)
+EVICTION_TARGET_RATIO = 0.9
+# Kompaktowanie paczki gdy martwe dane przekraczają ten udział i minimalny rozmiar
+COMPACTION_DEAD_RATIO = 0.5
+COMPACTION_MIN_DEAD_BYTES = 1024 * 1024
+
+
+class _Shard:
+    """Pojedynczy shard: plik paczki + indeks w pamięci."""
+
+    def __init__(self, shard_id: int, cache_dir: str):
+        self.shard_id = shard_id
+        self.pack_path = os.path.join(cache_dir, f"{shard_id:02x}{PACK_FILE_SUFFIX}")
+        self.index_path = os.path.join(cache_dir, f"{shard_id:02x}{INDEX_FILE_SUFFIX}")
+        # key -> [offset, length, last_access]
+        self.entries: Dict[str, List] = {}
+        self.live_bytes = 0
+        self.pack_size = 0
+        self.dirty = False
+
+    def load(self):
+        """Wczytuje indeks sharda i odrzuca wpisy wykraczające poza paczkę."""
+        try:
+            self.pack_size = os.path.getsize(self.pack_path)
+        except OSError:
+            self.pack_size = 0
+
+        if not os.path.exists(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Uszkodzony indeks cache miniatur {self.index_path}: {e}")
+            self.dirty = True
+            return
+
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            self.dirty = True
+            return
+
+        for key, (offset, length, last_access) in data.get("entries", {}).items():
+            # Paczka mogła zostać obcięta (np. crash w trakcie zapisu)
+            if offset + length > self.pack_size:
+                self.dirty = True
+                continue
+            self.entries[key] = [offset, length, last_access]
+            self.live_bytes += length
+
+    def save_index(self):
+        """Atomowo zapisuje indeks sharda."""
+        if not self.dirty:
+            return
+        directory = os.path.dirname(self.index_path)
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                delete=False,
+                encoding="utf-8",
+                dir=directory,
+                suffix=".tmp",
+                prefix="idx_",
+            ) as temp_file:
+                json.dump(
+                    {"version": INDEX_FORMAT_VERSION, "entries": self.entries},
+                    temp_file,
+                    separators=(",", ":"),
+                )
+                temp_path = temp_file.name
+            os.replace(temp_path, self.index_path)
+            temp_path = None
+            self.dirty = False
+        except OSError as e:
+            logger.error(f"Błąd zapisu indeksu cache miniatur {self.index_path}: {e}")
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+
+class ThumbnailDiskCache:
+    """
+    Dyskowy cache zakodowanych miniaturek z podziałem na shardy i eviction LRU.
+
+    Thread-safe - wywoływany zarówno z głównego wątku, jak i z workerów
+    generujących miniatury.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 1024, shard_count: int = 16):
+        """
+        Inicjalizuje dyskowy cache miniaturek.
+
+        Args:
+            cache_dir: Katalog przechowywania paczek i indeksów
+            max_size_mb: Maksymalny rozmiar danych w cache (MB)
+            shard_count: Liczba shardów (1-256)
+        """
+        if not 1 <= shard_count <= 256:
+            raise ValueError(f"Nieprawidłowa liczba shardów: {shard_count}")
+
+        self.cache_dir = normalize_path(cache_dir)
+        self._max_bytes = max(1, int(max_size_mb)) * 1024 * 1024
+        self._lock = threading.RLock()
+        self._writes_since_flush = 0
+        self._hits = 0
+        self._misses = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._shards = [_Shard(i, self.cache_dir) for i in range(shard_count)]
+        for shard in self._shards:
+            shard.load()
+
+        atexit.register(self.flush)
+
+        logger.debug(
+            f"ThumbnailDiskCache: {self.cache_dir}, wpisy={self.get_entry_count()}, "
+            f"rozmiar={self.get_total_bytes() // 1024}KB, limit={max_size_mb}MB"
+        )
+
+    @staticmethod
+    def build_key(
+        path: str,
+        width: int,
+        height: int,
+        thumbnail_format: str,
+        quality: int,
+        file_stat: Optional[Tuple[int, float]] = None,
+    ) -> Optional[str]:
+        """
+        Buduje klucz wpisu dla pliku źródłowego.
+
+        Args:
+            file_stat: Znany (rozmiar, mtime) pliku, np. z rekordu skanera -
+                pozwala pominąć wywołanie os.stat.
+
+        Returns:
+            Klucz (hex sha1) lub None jeśli pliku nie można odczytać.
+        """
+        if file_stat is None:
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                return None
+            file_stat = (stat_result.st_size, stat_result.st_mtime)
+
+        size, mtime = file_stat
+        raw_key = "|".join(
+            (
+                normalize_path(path),
+                repr(float(mtime)),
+                str(size),
+                f"{width}x{height}",
+                str(thumbnail_format),
+                str(quality),
+            )
+        )
+        return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+    def _shard_for(self, key: str) -> _Shard:
+        return self._shards[int(key[:2], 16) % len(self._shards)]
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Zwraca zakodowaną miniaturę lub None jeśli nie ma jej w cache."""
+        if not key:
+            return None
+
+        with self._lock:
+            shard = self._shard_for(key)
+            entry = shard.entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            offset, length, _ = entry
+            try:
+                with open(shard.pack_path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(length)
+            except OSError as e:
+                logger.warning(f"Błąd odczytu paczki {shard.pack_path}: {e}")
+                data = b""
+
+            if len(data) != length:
+                self._drop_entry(shard, key)
+                self._misses += 1
+                return None
+
+            entry[2] = time.time()
+            shard.dirty = True
+            self._hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> bool:
+        """
+        Zapisuje zakodowaną miniaturę do cache.
+
+        Returns:
+            True jeśli zapis się powiódł.
+        """
+        if not key or not data:
+            return False
+
+        with self._lock:
+            shard = self._shard_for(key)
+            if key in shard.entries:
+                self._drop_entry(shard, key)
+
+            try:
+                with open(shard.pack_path, "ab") as f:
+                    offset = f.tell()
+                    f.write(data)
+            except OSError as e:
+                logger.error(f"Błąd zapisu do paczki {shard.pack_path}: {e}")
+                return False
+
+            shard.entries[key] = [offset, len(data), time.time()]
+            shard.live_bytes += len(data)
+            shard.pack_size = offset + len(data)
+            shard.dirty = True
+
+            if self.get_total_bytes() > self._max_bytes:
+                self._evict(int(self._max_bytes * EVICTION_TARGET_RATIO))
+
+            self._writes_since_flush += 1
+            if self._writes_since_flush >= INDEX_FLUSH_EVERY:
+                self.flush()
+
+            return True
+
+    def remove(self, key: str):
+        """Usuwa wpis z cache (dane zostaną odzyskane przy kompaktowaniu)."""
+        with self._lock:
+            shard = self._shard_for(key)
+            if key in shard.entries:
+                self._drop_entry(shard, key)
+
+    def _drop_entry(self, shard: _Shard, key: str):
+        offset, length, _ = shard.entries.pop(key)
+        shard.live_bytes -= length
+        shard.dirty = True
+
+    def _evict(self, target_bytes: int):
+        """Usuwa najdawniej używane wpisy aż rozmiar spadnie do target_bytes."""
+        candidates = []
+        for shard in self._shards:
+            for key, (_, length, last_access) in shard.entries.items():
+                candidates.append((last_access, key, shard))
+        candidates.sort(key=lambda item: item[0])
+
+        total = self.get_total_bytes()
+        removed = 0
+        for _, key, shard in candidates:
+            if total <= target_bytes:
+                break
+            total -= shard.entries[key][1]
+            self._drop_entry(shard, key)
+            removed += 1
+
+        logger.debug(f"ThumbnailDiskCache eviction: usunięto {removed} wpisów")
+
+        for shard in self._shards:
+            self._maybe_compact(shard)
+
+    def _maybe_compact(self, shard: _Shard):
+        """Przepisuje paczkę sharda jeśli zawiera zbyt dużo martwych danych."""
+        dead_bytes = shard.pack_size - shard.live_bytes
+        if dead_bytes < COMPACTION_MIN_DEAD_BYTES:
+            return
+        if shard.pack_size and dead_bytes / shard.pack_size < COMPACTION_DEAD_RATIO:
+            return
+
+        temp_path = shard.pack_path + ".tmp"
+        new_entries = {}
+        try:
+            with open(shard.pack_path, "rb") as src, open(temp_path, "wb") as dst:
+                for key, (offset, length, last_access) in shard.entries.items():
+                    src.seek(offset)
+                    data = src.read(length)
+                    if len(data) != length:
+                        continue
+                    new_entries[key] = [dst.tell(), length, last_access]
+                    dst.write(data)
+                new_size = dst.tell()
+            os.replace(temp_path, shard.pack_path)
+        except OSError as e:
+            logger.error(f"Błąd kompaktowania paczki {shard.pack_path}: {e}")
+            if os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return
+
+        shard.entries = new_entries
+        shard.live_bytes = sum(length for _, length, _ in new_entries.values())
+        shard.pack_size = new_size
+        shard.dirty = True
+        shard.save_index()
+
+    def flush(self):
+        """Zapisuje indeksy wszystkich zmienionych shardów."""
+        with self._lock:
+            self._writes_since_flush = 0
+            # Katalog mógł zostać usunięty z zewnątrz (np. ręczne czyszczenie)
+            if not os.path.isdir(self.cache_dir):
+                return
+            for shard in self._shards:
+                shard.save_index()
+
+    def clear(self):
+        """Usuwa wszystkie wpisy i pliki paczek."""
+        with self._lock:
+            for shard in self._shards:
+                for file_path in (shard.pack_path, shard.index_path):
+                    try:
+                        if os.path.exists(file_path):
+                            os.remove(file_path)
+                    except OSError as e:
+                        logger.warning(f"Nie można usunąć {file_path}: {e}")
+                shard.entries.clear()
+                shard.live_bytes = 0
+                shard.pack_size = 0
+                shard.dirty = False
+            self._writes_since_flush = 0
+        logger.info("Dyskowy cache miniatur został wyczyszczony.")
+
+    def update_limit(self, max_size_mb: int):
+        """Aktualizuje limit rozmiaru i wymusza eviction jeśli potrzeba."""
+        with self._lock:
+            self._max_bytes = max(1, int(max_size_mb)) * 1024 * 1024
+            if self.get_total_bytes() > self._max_bytes:
+                self._evict(int(self._max_bytes * EVICTION_TARGET_RATIO))
+                self.flush()
+
+    def get_entry_count(self) -> int:
+        """Zwraca liczbę wpisów w cache."""
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def get_total_bytes(self) -> int:
+        """Zwraca rozmiar żywych danych w cache (bajty)."""
+        return sum(shard.live_bytes for shard in self._shards)
+
+    def get_statistics(self) -> dict:
+        """Zwraca statystyki dyskowego cache."""
+        with self._lock:
+            total_lookups = self._hits + self._misses
+            return {
+                "entries": self.get_entry_count(),
+                "size_mb": self.get_total_bytes() / (1024 * 1024),
+                "pack_size_mb": sum(s.pack_size for s in self._shards) / (1024 * 1024),
+                "max_size_mb": self._max_bytes / (1024 * 1024),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / total_lookups if total_lookups else 0.0,
+            }
@@ -0,0 +1,232 @@
+"""
+Centralny harmonogram generowania miniatur kafelków galerii.
+
+Żądania miniatur trafiają do kolejki priorytetowej (mniejsza wartość =
+wcześniej), a do QThreadPool wysyłana jest tylko niewielka liczba zadań
+naraz. Dzięki temu GalleryManager może po każdym przewinięciu:
+- uporządkować kolejkę według odległości od widocznego obszaru,
+- anulować żądania kafelków, które zniknęły z ekranu,
+- dołożyć prefetch kolejnych wierszy w kierunku przewijania.
+
+Zadania już uruchomione nie są przerywane - ich wynik trafia do
+ThumbnailCache i przyda się przy powrocie do danego miejsca galerii.
+"""
+
+import heapq
+import itertools
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# Priorytet żądań, dla których nikt nie podał odległości od widoku
+DEFAULT_PRIORITY = 0
+
+ThumbnailKey = Tuple[str, int, int]
+
+
+class ThumbnailScheduler(QObject):
+    """
+    Kolejka priorytetowa żądań miniatur z anulowaniem i prefetchem.
+
+    Wyniki są rozgłaszane sygnałami thumbnail_ready / thumbnail_failed;
+    odbiorcy filtrują je po ścieżce i rozmiarze.
+    """
+
+    thumbnail_ready = pyqtSignal(object, str, int, int)  # pixmap, path, width, height
+    thumbnail_failed = pyqtSignal(str, str, int, int)  # message, path, width, height
+
+    _instance = None
+
+    def __init__(self, max_in_flight: Optional[int] = None):
+        super().__init__()
+        if max_in_flight is None:
+            max_in_flight = QThreadPool.globalInstance().maxThreadCount()
+        self._max_in_flight = max(1, max_in_flight)
+
+        # Kopiec wpisów [priorytet, numer, klucz]; anulowany wpis ma klucz None
+        self._heap: List[list] = []
+        self._queued: Dict[ThumbnailKey, list] = {}
+        self._in_flight: Dict[ThumbnailKey, object] = {}
+        self._counter = itertools.count()
+
+        # Żądania z jednego przebiegu układania kafelków wysyłane są razem,
+        # po ustawieniu priorytetów przez GalleryManager
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.setInterval(0)
+        self._dispatch_timer.timeout.connect(self._dispatch)
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # --- Żądania ---
+
+    def request(
+        self, path: str, width: int, height: int, priority: Optional[int] = None
+    ) -> bool:
+        """
+        Dodaje żądanie miniatury do kolejki.
+
+        Ponowne żądanie tej samej miniatury nie tworzy duplikatu - co
+        najwyżej podnosi jej priorytet.
+
+        Returns:
+            bool: True jeśli miniatura jest w kolejce lub w trakcie generowania
+        """
+        if not path:
+            return False
+
+        key = (path, width, height)
+        if key in self._in_flight:
+            return True
+
+        entry = self._queued.get(key)
+        if entry is not None:
+            if priority is not None and priority < entry[0]:
+                self._push(key, priority)
+            return True
+
+        self._push(key, DEFAULT_PRIORITY if priority is None else priority)
+        self._schedule_dispatch()
+        return True
+
+    def prefetch(self, requests: List[Tuple[str, int, int, int]]) -> int:
+        """
+        Zleca wstępne generowanie miniatur (path, width, height, priority),
+        pomijając te, które są już w pamięciowym ThumbnailCache.
+
+        Returns:
+            int: Liczba nowych żądań
+        """
+        from src.ui.widgets.thumbnail_cache import ThumbnailCache
+
+        cache = ThumbnailCache.get_instance()
+        added = 0
+        for path, width, height, priority in requests:
+            key = (path, width, height)
+            if key in self._queued or key in self._in_flight:
+                self.request(path, width, height, priority)
+                continue
+            if cache.contains(path, width, height):
+                continue
+            self.request(path, width, height, priority)
+            added += 1
+        return added
+
+    def cancel(self, path: str, width: int, height: int) -> bool:
+        """Usuwa żądanie z kolejki (uruchomionego zadania nie przerywa)."""
+        entry = self._queued.pop((path, width, height), None)
+        if entry is None:
+            return False
+        entry[2] = None
+        return True
+
+    def reprioritize(self, priorities: Dict[str, int], cancel_missing: bool = True):
+        """
+        Ustawia priorytety oczekujących żądań według ścieżek.
+
+        Args:
+            priorities: Ścieżka -> priorytet (np. odległość w wierszach od widoku)
+            cancel_missing: Anuluj żądania ścieżek spoza słownika (nieaktualne)
+        """
+        cancelled = 0
+        for key, entry in list(self._queued.items()):
+            priority = priorities.get(key[0])
+            if priority is None:
+                if cancel_missing:
+                    self.cancel(*key)
+                    cancelled += 1
+            elif priority != entry[0]:
+                self._push(key, priority)
+
+        # Po wielu anulowaniach kopiec puchnie od martwych wpisów
+        if len(self._heap) > 2 * len(self._queued) + 64:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+
+        if cancelled:
+            logger.debug(f"Anulowano {cancelled} nieaktualnych żądań miniatur")
+
+    def is_pending(self, path: str, width: int, height: int) -> bool:
+        """Sprawdza, czy miniatura czeka w kolejce lub jest generowana."""
+        key = (path, width, height)
+        return key in self._queued or key in self._in_flight
+
+    def clear(self):
+        """Anuluje wszystkie oczekujące żądania."""
+        for entry in self._queued.values():
+            entry[2] = None
+        self._queued.clear()
+        self._heap.clear()
+        self._dispatch_timer.stop()
+
+    def get_statistics(self) -> dict:
+        return {
+            "queued": len(self._queued),
+            "in_flight": len(self._in_flight),
+            "max_in_flight": self._max_in_flight,
+        }
+
+    # --- Wewnętrzne ---
+
+    def _push(self, key: ThumbnailKey, priority: int):
+        old_entry = self._queued.get(key)
+        if old_entry is not None:
+            old_entry[2] = None
+        entry = [priority, next(self._counter), key]
+        self._queued[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _schedule_dispatch(self):
+        if not self._dispatch_timer.isActive():
+            self._dispatch_timer.start()
+
+    def _pop_next(self) -> Optional[ThumbnailKey]:
+        while self._heap:
+            key = heapq.heappop(self._heap)[2]
+            if key is not None:
+                del self._queued[key]
+                return key
+        return None
+
+    def _dispatch(self):
+        """Uruchamia najpilniejsze żądania, aż do limitu zadań w toku."""
+        while len(self._in_flight) < self._max_in_flight:
+            key = self._pop_next()
+            if key is None:
+                return
+            self._start_worker(key)
+
+    def _start_worker(self, key: ThumbnailKey):
+        from src.ui.delegates.workers.processing_workers import (
+            ThumbnailGenerationWorker,
+        )
+
+        worker = ThumbnailGenerationWorker(*key)
+        worker.signals.thumbnail_finished.connect(self._on_worker_finished)
+        worker.signals.thumbnail_error.connect(self._on_worker_error)
+        # Timeout/przerwanie nie emitują thumbnail_error - zwolnij slot
+        worker.signals.timeout.connect(
+            lambda message, key=key: self._on_worker_error(message, *key)
+        )
+        worker.signals.interrupted.connect(
+            lambda key=key: self._on_worker_error("Przerwano", *key)
+        )
+        self._in_flight[key] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_worker_finished(self, pixmap, path: str, width: int, height: int):
+        self._in_flight.pop((path, width, height), None)
+        self.thumbnail_ready.emit(pixmap, path, width, height)
+        self._schedule_dispatch()
+
+    def _on_worker_error(self, message: str, path: str, width: int, height: int):
+        self._in_flight.pop((path, width, height), None)
+        self.thumbnail_failed.emit(message, path, width, height)
+        self._schedule_dispatch()
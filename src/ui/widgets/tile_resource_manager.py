@@ -46,6 +46,7 @@ class ResourceLimits:
     cleanup_interval_seconds: int = 300  # 5 minut
     memory_check_interval_seconds: int = 60  # 1 minuta
     cache_cleanup_threshold_ratio: float = 0.8  # Cleanup gdy cache 80% pełny
+    tile_pool_screens: int = 2  # Pula wolnych kafelków galerii: ile ekranów
 
 
 class MemoryMonitor(QObject):
@@ -337,6 +338,22 @@ class TileResourceManager(QObject):
         """Wyrejestrowuje tile (automatyczne przez weak reference)."""
         # WeakSet automatycznie usuwa gdy tile zostanie usunięty
         pass
+
+    # === TILE POOL ===
+
+    def get_tile_pool_limit(self, tiles_per_screen: int) -> int:
+        """
+        Zwraca maksymalny rozmiar puli wolnych kafelków galerii.
+
+        Pula mieści tile_pool_screens ekranów kafelków, ale nigdy więcej
+        niż pozwala max_tiles.
+        """
+        pool_limit = max(tiles_per_screen, 1) * self.limits.tile_pool_screens
+        return max(0, min(pool_limit, self.limits.max_tiles))
+
+    def can_pool_tile(self, pool_size: int, tiles_per_screen: int) -> bool:
+        """Sprawdza, czy kafelek zdjęty z ekranu może trafić do puli (zamiast zniszczenia)."""
+        return pool_size < self.get_tile_pool_limit(tiles_per_screen)
     
     # === WORKER MANAGEMENT ===
     
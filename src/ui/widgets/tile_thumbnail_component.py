@@ -61,7 +61,8 @@ class ThumbnailComponent(QObject):
 
         # Worker management
         self._current_worker_id: int = 0
-        self._load_worker: Optional[object] = None
+        self._load_worker: Optional[object] = None  # (path, width, height) w schedulerze
+        self._scheduler_connected: bool = False
         self._resource_manager_worker_id: Optional[int] = None  # Resource management
 
         # Timers for debouncing
@@ -116,6 +117,7 @@ class ThumbnailComponent(QObject):
             self._current_path == file_path
             and self._current_size == target_size
             and self._is_loading
+            and self._is_request_pending()
         ):
             if self.config.enable_debug_logging:
                 logger.debug(f"Already loading {file_path} at {target_size}")
@@ -236,16 +238,24 @@ class ThumbnailComponent(QObject):
             # Import thumbnail worker
             from src.ui.widgets.thumbnail_cache import ThumbnailCache
 
-            # Get from cache first
+            # Tylko cache w pamięci - odczyt z dysku odbywa się w workerze
             cache = ThumbnailCache.get_instance()
-            cached_pixmap = cache.get_thumbnail(file_path, size[0], size[1])
+            cached_pixmap = cache.get_memory_thumbnail(file_path, size[0], size[1])
 
             if cached_pixmap:
                 self._on_thumbnail_ready(file_path, cached_pixmap, from_cache=True)
                 return True
 
             # Start worker for loading
-            return self._start_worker_loading(file_path, size)
+            started = self._start_worker_loading(file_path, size)
+
+            # Do czasu wygenerowania dokładnego rozmiaru pokaż miniaturę
+            # przeskalowaną z najbliższego poziomu mip (np. przy zmianie suwaka)
+            nearest_pixmap = cache.get_nearest_thumbnail(file_path, size[0], size[1])
+            if started and nearest_pixmap is not None:
+                self._on_thumbnail_ready(file_path, nearest_pixmap, from_cache=True)
+
+            return started
 
         except Exception as e:
             self._emit_error(f"Failed to start async loading: {e}")
@@ -275,41 +285,29 @@ class ThumbnailComponent(QObject):
             return False
 
     def _start_worker_loading(self, file_path: str, size: Tuple[int, int]) -> bool:
-        """Start worker-based thumbnail loading."""
-        try:
-            # Import worker classes
-            from src.ui.delegates.workers.processing_workers import (
-                ThumbnailGenerationWorker,
-            )
-
-            # Create worker
-            self._current_worker_id += 1
-            worker_id = self._current_worker_id
-
-            worker = ThumbnailGenerationWorker(file_path, size[0], size[1])
-
-            # Connect worker signals
-            worker.signals.thumbnail_finished.connect(
-                lambda pixmap, path, w, h: self._on_worker_thumbnail_ready(
-                    worker_id, path, pixmap
-                )
-            )
-            worker.signals.thumbnail_error.connect(
-                lambda msg, path, w, h: self._on_worker_thumbnail_error(
-                    worker_id, msg, path
-                )
-            )
+        """
+        Zleca wygenerowanie miniatury centralnemu ThumbnailScheduler.
 
-            # Store worker reference
-            self._load_worker = worker
+        Kolejnością i anulowaniem żądań zarządza GalleryManager (odległość
+        kafelka od widocznego obszaru), więc komponent tylko czeka na wynik.
+        """
+        try:
+            from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
 
-            # Start worker in thread pool
-            from PyQt6.QtCore import QThreadPool
+            scheduler = ThumbnailScheduler.get_instance()
+            if not self._scheduler_connected:
+                scheduler.thumbnail_ready.connect(self._on_scheduler_thumbnail_ready)
+                scheduler.thumbnail_failed.connect(self._on_scheduler_thumbnail_error)
+                self._scheduler_connected = True
 
-            QThreadPool.globalInstance().start(worker)
+            self._current_worker_id += 1
+            self._load_worker = (file_path, size[0], size[1])
+            scheduler.request(file_path, size[0], size[1])
 
             if self.config.enable_debug_logging:
-                logger.debug(f"Started worker {worker_id} for {file_path}")
+                logger.debug(
+                    f"Queued thumbnail request {self._current_worker_id} for {file_path}"
+                )
 
             return True
 
@@ -317,22 +315,34 @@ class ThumbnailComponent(QObject):
             self._emit_error(f"Failed to start worker: {e}")
             return False
 
-    def _on_worker_thumbnail_ready(self, worker_id: int, path: str, pixmap: QPixmap):
-        """Callback gdy worker završí loading."""
-        # Check if this is current worker
-        if worker_id != self._current_worker_id:
-            if self.config.enable_debug_logging:
-                logger.debug(f"Ignoring outdated worker {worker_id} result")
+    def _is_request_pending(self) -> bool:
+        """Sprawdza, czy żądanie komponentu nie zostało anulowane w schedulerze."""
+        if not isinstance(self._load_worker, tuple):
+            return self._is_loading
+        from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+
+        return ThumbnailScheduler.get_instance().is_pending(*self._load_worker)
+
+    def _on_scheduler_thumbnail_ready(
+        self, pixmap: QPixmap, path: str, width: int, height: int
+    ):
+        """Callback gdy scheduler wygeneruje miniaturę (dowolnego kafelka)."""
+        if not self._is_loading or self._load_worker != (path, width, height):
             return
 
+        self._is_loading = False
+        self._load_worker = None
         self._on_thumbnail_ready(path, pixmap, from_cache=False)
 
-    def _on_worker_thumbnail_error(self, worker_id: int, error_msg: str, path: str):
-        """Callback gdy worker ma błąd."""
-        # Check if this is current worker
-        if worker_id != self._current_worker_id:
+    def _on_scheduler_thumbnail_error(
+        self, error_msg: str, path: str, width: int, height: int
+    ):
+        """Callback gdy generowanie miniatury w schedulerze się nie powiodło."""
+        if not self._is_loading or self._load_worker != (path, width, height):
             return
 
+        self._is_loading = False
+        self._load_worker = None
         self._emit_error(f"Worker error: {error_msg}")
 
     def _on_thumbnail_ready(self, path: str, pixmap: QPixmap, from_cache: bool = False):
@@ -368,7 +378,11 @@ class ThumbnailComponent(QObject):
     def _cancel_current_loading(self):
         """Anuluje obecne ładowanie."""
         if self._is_loading and self._load_worker:
-            # Cancel worker
+            # Usuń żądanie z kolejki schedulera (zadania w toku dokończą się do cache)
+            if isinstance(self._load_worker, tuple):
+                from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+
+                ThumbnailScheduler.get_instance().cancel(*self._load_worker)
             self._current_worker_id += 1  # Invalidate current worker
             self._load_worker = None
 
@@ -457,6 +471,14 @@ class ThumbnailComponent(QObject):
         """Sprawdza czy memory usage jest w akceptowalnych granicach."""
         return self.config.is_memory_usage_acceptable(self._memory_usage_bytes)
 
+    def reset(self):
+        """Anuluje ładowanie i zapomina miniaturę (kafelek wiązany z inną parą)."""
+        self._cancel_current_loading()
+        self._pixmap = None
+        self._memory_usage_bytes = 0
+        self._current_path = None
+        self._set_state(TileState.EMPTY)
+
     def cleanup(self):
         """Cleanup komponentu - usuwa wszystkie zasoby."""
         self._cancel_current_loading()
@@ -469,6 +491,19 @@ class ThumbnailComponent(QObject):
         if self._resize_timer.isActive():
             self._resize_timer.stop()
 
+        if self._scheduler_connected:
+            from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+
+            scheduler = ThumbnailScheduler.get_instance()
+            try:
+                scheduler.thumbnail_ready.disconnect(self._on_scheduler_thumbnail_ready)
+                scheduler.thumbnail_failed.disconnect(
+                    self._on_scheduler_thumbnail_error
+                )
+            except (TypeError, RuntimeError):
+                pass
+            self._scheduler_connected = False
+
         # Cleanup resource manager worker
         if self._resource_manager_worker_id is not None:
             try:
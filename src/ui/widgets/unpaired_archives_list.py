@@ -3,6 +3,7 @@ Widget do zarządzania listą niesparowanych archiwów.
 Wydzielone z unpaired_files_tab.py w ramach refaktoryzacji.
 """
 
+import bisect
 import logging
 import os
 from typing import TYPE_CHECKING
@@ -149,6 +150,34 @@ class UnpairedArchivesList(QWidget):
         for archive_path in sorted_archives:
             self.add_archive(archive_path)
             
+    def apply_delta(self, added: list[str], removed: list[str]):
+        """
+        Dodaje i usuwa archiwa w miejscu, zachowując sortowanie i zaznaczenie.
+        
+        Args:
+            added: Ścieżki nowych archiwów
+            removed: Ścieżki archiwów do usunięcia
+        """
+        if self.list_widget is None:
+            return
+        removed_paths = set(removed)
+        for row in range(self.list_widget.count() - 1, -1, -1):
+            item = self.list_widget.item(row)
+            if item.data(Qt.ItemDataRole.UserRole) in removed_paths:
+                self.list_widget.takeItem(row)
+
+        names = [
+            self.list_widget.item(row).text().lower()
+            for row in range(self.list_widget.count())
+        ]
+        for archive_path in added:
+            name = os.path.basename(archive_path)
+            row = bisect.bisect_right(names, name.lower())
+            item = QListWidgetItem(name)
+            item.setData(Qt.ItemDataRole.UserRole, archive_path)
+            self.list_widget.insertItem(row, item)
+            names.insert(row, name.lower())
+            
     def get_selected_items(self) -> list[QListWidgetItem]:
         """
         Zwraca listę zaznaczonych elementów.
@@ -21,7 +21,6 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSplitter,
-    QStyle,
     QVBoxLayout,
     QWidget,
 )
@@ -302,14 +301,8 @@ class UnpairedFilesTab:
         # Nowy widget do zarządzania podglądami
         self.unpaired_previews_grid = None
         self.unpaired_previews_panel = None
-        self.unpaired_previews_scroll_area = None
-        self.unpaired_previews_container = None
-        self.unpaired_previews_layout = None
         self.unpaired_previews_list_widget = None
         self.pair_manually_button = None
-        self.preview_checkboxes = []
-        # Przechowywanie referencji do kafelków dla skalowania
-        self.preview_tile_widgets = []
         # Aktualny rozmiar miniaturek
         self.current_thumbnail_size = TileSizeConstants.DEFAULT_THUMBNAIL_SIZE
 
@@ -416,55 +409,10 @@ class UnpairedFilesTab:
         
         # Zachowaj kompatybilność z istniejącym kodem
         self.unpaired_previews_list_widget = self.unpaired_previews_grid.hidden_list_widget
-        self.unpaired_previews_layout = self.unpaired_previews_grid.grid_layout
-        self.unpaired_previews_container = self.unpaired_previews_grid.container
         
         # Dodaj do splitter'a
         self.unpaired_splitter.addWidget(self.unpaired_previews_grid)
 
-    def _add_preview_thumbnail(self, preview_path):
-        """
-        Dodaje miniaturkę podglądu do kontenera podglądów.
-        Używa uproszczonej wersji FileTileWidget bez gwiazdek i tagów kolorów.
-
-        Args:
-            preview_path: Ścieżka do pliku podglądu
-        """
-        # Upewnij się, że plik istnieje
-        if not os.path.exists(preview_path):
-            return
-
-        # Utwórz kafelek podglądu
-        preview_tile = UnpairedPreviewTile(
-            preview_path, self.unpaired_previews_container
-        )
-        preview_tile.set_thumbnail_size(self.current_thumbnail_size)
-
-        # Podłącz sygnał preview_image_requested do metody wyświetlającej PreviewDialog
-        preview_tile.preview_image_requested.connect(self._show_preview_dialog)
-        preview_tile.checkbox.stateChanged.connect(
-            lambda state, cb=preview_tile.checkbox, path=preview_path: self._on_preview_checkbox_changed(
-                cb, path, state
-            )
-        )
-        preview_tile.delete_button.clicked.connect(
-            lambda: self._delete_preview_file(preview_path)
-        )
-
-        # Ustaw ikonę dla przycisku usuń
-        trash_icon = self.main_window.style().standardIcon(
-            QStyle.StandardPixmap.SP_TrashIcon
-        )
-        preview_tile.delete_button.setIcon(trash_icon)
-
-        # Dodaj do listy checkboxów i kafelków
-        self.preview_checkboxes.append(preview_tile.checkbox)
-        self.preview_tile_widgets.append(preview_tile)
-
-        # Dodaj do siatki - maksymalnie 3 miniaturki w rzędzie
-        row, col = divmod(self.unpaired_previews_layout.count(), 3)
-        self.unpaired_previews_layout.addWidget(preview_tile, row, col)
-
     def _show_preview_dialog(self, preview_path: str):
         """
         Wyświetla okno dialogowe z podglądem obrazu.
@@ -495,42 +443,6 @@ class UnpairedFilesTab:
             QMessageBox.critical(self.main_window, "Błąd Podglądu", error_message)
 
 
-    def _on_preview_checkbox_changed(self, checkbox, preview_path, state):
-        """
-        Obsługuje zmianę stanu checkboxa, zapewniając wybór tylko jednego elementu.
-        """
-        # Zablokuj sygnały, aby uniknąć rekurencji
-        checkbox.blockSignals(True)
-
-        if state == Qt.CheckState.Checked.value:
-            # Odznacz wszystkie inne checkboxy
-            for cb in self.preview_checkboxes:
-                if cb is not checkbox and cb.isChecked():
-                    cb.blockSignals(True)
-                    cb.setChecked(False)
-                    cb.blockSignals(False)
-
-            # Zaznacz odpowiedni element na ukrytej liście
-            for i in range(self.unpaired_previews_list_widget.count()):
-                item = self.unpaired_previews_list_widget.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == preview_path:
-                    self.unpaired_previews_list_widget.setCurrentItem(item)
-                    break
-        else:
-            # Odznacz element na liście, jeśli to on był zaznaczony
-            current_item = self.unpaired_previews_list_widget.currentItem()
-            if (
-                current_item
-                and current_item.data(Qt.ItemDataRole.UserRole) == preview_path
-            ):
-                self.unpaired_previews_list_widget.setCurrentItem(None)
-
-        # Odblokuj sygnały
-        checkbox.blockSignals(False)
-
-        # Aktualizacja stanu przycisku jest wywoływana przez sygnał
-        # itemSelectionChanged z unpaired_previews_list_widget
-
     def _select_preview_for_pairing(self, preview_path):
         """
         Zaznacza podgląd do parowania.
@@ -538,12 +450,8 @@ class UnpairedFilesTab:
         Args:
             preview_path: Ścieżka do pliku podglądu
         """
-        # Znajdź i zaznacz odpowiedni element w ukrytym QListWidget
-        for i in range(self.unpaired_previews_list_widget.count()):
-            item = self.unpaired_previews_list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == preview_path:
-                self.unpaired_previews_list_widget.setCurrentItem(item)
-                break
+        if self.unpaired_previews_grid:
+            self.unpaired_previews_grid.set_checked_preview(preview_path)
 
     def _delete_preview_file(self, preview_path):
         """
@@ -603,8 +511,6 @@ class UnpairedFilesTab:
         # Zachowaj kompatybilność z starym kodem
         elif self.unpaired_previews_list_widget:
             self.unpaired_previews_list_widget.clear()
-        # Wyczyść również listę kafelków
-        self.preview_tile_widgets.clear()
         logging.debug("Wyczyszczono listy niesparowanych plików w UI.")
 
     def update_unpaired_files_lists(self):
@@ -626,12 +532,6 @@ class UnpairedFilesTab:
             )
             return
 
-        if not hasattr(self, "unpaired_previews_layout") and not hasattr(self, "unpaired_previews_grid"):
-            logging.error(
-                "CRITICAL ERROR: Brak widget'a/layoutu do zarządzania podglądami!"
-            )
-            return
-
         # Sprawdzamy czy widget jest None a nie czy jest "falsy"
         if (self.unpaired_archives_list_widget is None and 
             self.unpaired_archives_list is None):
@@ -673,10 +573,6 @@ class UnpairedFilesTab:
         # Fallback dla starego kodu
         elif self.unpaired_previews_list_widget:
             self.unpaired_previews_list_widget.clear()
-            
-        # Wyczyść stare listy pomocnicze
-        self.preview_checkboxes.clear()
-        self.preview_tile_widgets.clear()
 
         # Sortuj alfabetycznie przed wyświetleniem (dodatkowe zabezpieczenie)
         sorted_archives = sorted(
@@ -701,6 +597,25 @@ class UnpairedFilesTab:
         )
         self._update_pair_button_state()
 
+    def apply_unpaired_delta(self, delta):
+        """
+        Łata listy niesparowanych plików o zmiany wykryte w folderze
+        (ScanDelta), bez przebudowy całych list.
+        """
+        if self.unpaired_archives_list:
+            self.unpaired_archives_list.apply_delta(
+                delta.added_unpaired_archives, delta.removed_unpaired_archives
+            )
+        if self.unpaired_previews_grid:
+            self.unpaired_previews_grid.apply_delta(
+                delta.added_unpaired_previews, delta.removed_unpaired_previews
+            )
+        if (self.unpaired_archives_list is None
+                or self.unpaired_previews_grid is None):
+            self.update_unpaired_files_lists()
+            return
+        self._update_pair_button_state()
+
     def _update_pair_button_state(self):
         """
         Aktualizuje stan przycisku do ręcznego parowania.
@@ -913,7 +828,7 @@ class UnpairedFilesTab:
             "unpaired_files_tab": self.unpaired_files_tab,
             "unpaired_archives_list_widget": self.unpaired_archives_list_widget,
             "unpaired_previews_list_widget": self.unpaired_previews_list_widget,
-            "unpaired_previews_layout": self.unpaired_previews_layout,
+            "unpaired_previews_grid": self.unpaired_previews_grid,
             "pair_manually_button": self.pair_manually_button,
         }
 
@@ -929,11 +844,6 @@ class UnpairedFilesTab:
         # Aktualizuj rozmiar w nowym widget'u podglądów
         if self.unpaired_previews_grid:
             self.unpaired_previews_grid.update_thumbnail_size(new_size)
-        else:
-            # Fallback dla starych kafelków
-            for preview_tile in self.preview_tile_widgets:
-                if isinstance(preview_tile, UnpairedPreviewTile):
-                    preview_tile.set_thumbnail_size(new_size)
 
     def _handle_delete_unpaired_previews(self):
         """
@@ -943,12 +853,7 @@ class UnpairedFilesTab:
         if self.unpaired_previews_grid:
             unpaired_previews = self.unpaired_previews_grid.get_all_preview_paths()
         else:
-            # Fallback dla starego kodu
-            unpaired_previews = [
-                self.unpaired_previews_layout.itemAt(i).widget().preview_path
-                for i in range(self.unpaired_previews_layout.count())
-                if self.unpaired_previews_layout.itemAt(i).widget()
-            ]
+            unpaired_previews = list(self.main_window.controller.unpaired_previews)
 
         if not unpaired_previews:
             QMessageBox.information(
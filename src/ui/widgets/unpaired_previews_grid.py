@@ -1,165 +1,409 @@
 """
 Widget do zarządzania siatką podglądów niesparowanych plików.
 Wydzielone z unpaired_files_tab.py w ramach refaktoryzacji.
+
+Siatka jest wirtualizowana (model/widok): QListView w trybie ikon rysuje
+tylko widoczne elementy przez delegata, a miniatury są pobierane
+z ThumbnailCache lub generowane w tle (BatchThumbnailWorker) dopiero gdy
+element pojawi się na ekranie. Otwarcie zakładki nie zależy więc od
+liczby niesparowanych podglądów.
 """
 
+import bisect
 import logging
 import os
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import (
-    QGridLayout,
+    QAbstractItemView,
     QLabel,
+    QListView,
     QListWidget,
     QListWidgetItem,
-    QScrollArea,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
 
-from src.ui.widgets.tile_styles import TileSizeConstants
+from src.ui.widgets.lazy_thumbnail_model import (
+    LazyThumbnailListModel,
+    ThumbnailFailedRole,
+    tile_size_tuple,
+    thumbnail_dimension_for_tile,
+)
+from src.ui.widgets.tile_styles import TileColorScheme, TileSizeConstants
 
 if TYPE_CHECKING:
     from src.ui.main_window import MainWindow
-    from src.ui.widgets.unpaired_files_tab import UnpairedPreviewTile
+
+# Role danych modelu
+PreviewPathRole = Qt.ItemDataRole.UserRole
+PreviewCheckedRole = Qt.ItemDataRole.UserRole + 1
+PreviewFailedRole = ThumbnailFailedRole
+
+
+def _preview_sort_key(path: str) -> str:
+    return os.path.basename(path).lower()
+
+
+class UnpairedPreviewsModel(LazyThumbnailListModel):
+    """
+    Model listy niesparowanych podglądów.
+
+    Przechowuje tylko ścieżki - miniatury są pobierane leniwie z ThumbnailCache
+    w data() (wywoływanym przez widok wyłącznie dla widocznych elementów),
+    a brakujące są zlecane do generowania w tle paczkami.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._checked_path: Optional[str] = None
+
+    # --- Dane ---
+
+    def set_paths(self, paths: List[str]):
+        """Zastępuje zawartość modelu listą ścieżek."""
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._rows = {path: row for row, path in enumerate(self._paths)}
+        if self._checked_path not in self._rows:
+            self._checked_path = None
+        self._reset_thumbnail_requests()
+        self.endResetModel()
+
+    def apply_delta(self, added: List[str], removed: List[str]):
+        """
+        Usuwa i wstawia ścieżki (z zachowaniem sortowania po nazwie pliku),
+        zgłaszając widokowi tylko zmienione wiersze - bez resetu modelu.
+        """
+        removed_rows = sorted(
+            (self._rows[path] for path in set(removed) if path in self._rows),
+            reverse=True,
+        )
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._paths[row]
+            self.endRemoveRows()
+
+        present = set(self._paths)
+        for path in added:
+            if path in present:
+                continue
+            row = bisect.bisect_right(
+                self._paths, _preview_sort_key(path), key=_preview_sort_key
+            )
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._paths.insert(row, path)
+            self.endInsertRows()
+            present.add(path)
+
+        self._rows = {path: row for row, path in enumerate(self._paths)}
+        if self._checked_path not in self._rows:
+            self._checked_path = None
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def row_for_path(self, path: str) -> int:
+        return self._rows.get(path, -1)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._paths):
+            return None
+        path = self._paths[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(path)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return os.path.basename(path)
+        if role == PreviewPathRole:
+            return path
+        if role == PreviewCheckedRole:
+            return path == self._checked_path
+        if role == PreviewFailedRole:
+            return path in self._failed
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._get_thumbnail(path)
+        return None
+
+    # --- Zaznaczenie (pojedyncze, jak checkboxy kafelków) ---
+
+    def checked_path(self) -> Optional[str]:
+        return self._checked_path
+
+    def set_checked_path(self, path: Optional[str]):
+        """Zaznacza podgląd (None odznacza), odświeżając tylko zmienione wiersze."""
+        if path == self._checked_path:
+            return
+        previous, self._checked_path = self._checked_path, path
+        for changed in (previous, path):
+            row = self.row_for_path(changed) if changed else -1
+            if row >= 0:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [PreviewCheckedRole])
+
+
+class UnpairedPreviewDelegate(QStyledItemDelegate):
+    """
+    Rysuje kafelek podglądu (miniatura, nazwa, checkbox, przycisk usuń)
+    i obsługuje kliknięcia w jego obszary.
+    """
+
+    checkbox_toggled = pyqtSignal(str)
+    delete_requested = pyqtSignal(str)
+    preview_requested = pyqtSignal(str)
+
+    CONTROL_SIZE = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tile_size: Tuple[int, int] = tile_size_tuple(
+            TileSizeConstants.DEFAULT_THUMBNAIL_SIZE
+        )
+        self.trash_icon = None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(*self.tile_size)
+
+    def _layout(self, rect: QRect, thumbnail_dimension: int) -> Dict[str, QRect]:
+        """Wylicza obszary elementów kafelka."""
+        padding = TileSizeConstants.TILE_PADDING
+        tile = rect.adjusted(4, 4, -4, -4)
+        thumb_x = tile.x() + (tile.width() - thumbnail_dimension) // 2
+        thumbnail = QRect(thumb_x, tile.y() + padding, thumbnail_dimension, thumbnail_dimension)
+        controls_y = tile.bottom() - padding - self.CONTROL_SIZE
+        filename = QRect(
+            tile.x() + padding,
+            thumbnail.bottom() + 2,
+            tile.width() - padding * 2,
+            max(0, controls_y - thumbnail.bottom() - 4),
+        )
+        checkbox = QRect(tile.x() + padding, controls_y, self.CONTROL_SIZE, self.CONTROL_SIZE)
+        delete = QRect(
+            tile.right() - padding - self.CONTROL_SIZE,
+            controls_y,
+            self.CONTROL_SIZE,
+            self.CONTROL_SIZE,
+        )
+        return {
+            "tile": tile,
+            "thumbnail": thumbnail,
+            "filename": filename,
+            "checkbox": checkbox,
+            "delete": delete,
+        }
+
+    def _thumbnail_dimension(self, index: QModelIndex) -> int:
+        model = index.model()
+        if isinstance(model, UnpairedPreviewsModel):
+            return model.thumbnail_dimension()
+        return thumbnail_dimension_for_tile(self.tile_size)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        areas = self._layout(option.rect, self._thumbnail_dimension(index))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Tło kafelka
+        background = TileColorScheme.BACKGROUND_HOVER if hovered else TileColorScheme.BACKGROUND
+        border = TileColorScheme.BORDER_HOVER if hovered else TileColorScheme.BORDER
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(areas["tile"], 6, 6)
+
+        # Miniatura, placeholder lub informacja o błędzie
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            painter.drawPixmap(areas["thumbnail"], pixmap)
+        elif index.data(PreviewFailedRole):
+            painter.setPen(QColor(TileColorScheme.ERROR_COLOR))
+            painter.drawText(
+                areas["thumbnail"],
+                Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+                "Nie można załadować podglądu",
+            )
+        else:
+            painter.fillRect(areas["thumbnail"], QColor(TileColorScheme.LOADING_COLOR))
+
+        # Nazwa pliku
+        painter.setPen(QColor(TileColorScheme.TEXT_HOVER if hovered else TileColorScheme.TEXT))
+        name = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideMiddle,
+            areas["filename"].width(),
+        )
+        painter.drawText(areas["filename"], Qt.AlignmentFlag.AlignCenter, name)
+        painter.restore()
+
+        # Checkbox i przycisk usuń
+        style = option.widget.style() if option.widget else None
+        if style is not None:
+            checkbox_option = QStyleOptionButton()
+            checkbox_option.rect = areas["checkbox"]
+            checkbox_option.state = QStyle.StateFlag.State_Enabled | (
+                QStyle.StateFlag.State_On
+                if index.data(PreviewCheckedRole)
+                else QStyle.StateFlag.State_Off
+            )
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_IndicatorCheckBox,
+                checkbox_option,
+                painter,
+                option.widget,
+            )
+        if self.trash_icon is not None:
+            self.trash_icon.paint(painter, areas["delete"])
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (
+            event.type() != QEvent.Type.MouseButtonRelease
+            or event.button() != Qt.MouseButton.LeftButton
+        ):
+            return False
+
+        path = index.data(PreviewPathRole)
+        areas = self._layout(option.rect, self._thumbnail_dimension(index))
+        position = event.position().toPoint()
+        if areas["checkbox"].contains(position):
+            self.checkbox_toggled.emit(path)
+            return True
+        if areas["delete"].contains(position):
+            self.delete_requested.emit(path)
+            return True
+        if areas["thumbnail"].contains(position):
+            logging.debug(f"Kliknięcie w miniaturkę: {os.path.basename(path)}")
+            self.preview_requested.emit(path)
+            return True
+        return False
 
 
 class UnpairedPreviewsGrid(QWidget):
     """
     Widget odpowiedzialny za wyświetlanie i zarządzanie siatką podglądów niesparowanych plików.
-    
+
     Funkcjonalności:
-    - Wyświetlanie miniaturek w siatce
-    - Zarządzanie checkboxami dla selekcji
+    - Wyświetlanie miniaturek w wirtualizowanej siatce (QListView + delegat)
+    - Zaznaczanie pojedynczego podglądu checkboxem
     - Skalowanie miniaturek
     - Sygnały o zmianie selekcji
     """
-    
+
     # Sygnały
     selection_changed = pyqtSignal()  # Emitowany gdy zmieni się selekcja
     preview_deleted = pyqtSignal(str)  # Emitowany gdy podgląd zostanie usunięty
-    
+
     def __init__(self, main_window: "MainWindow", parent: QWidget = None):
         """
         Inicjalizuje widget siatki podglądów.
-        
+
         Args:
             main_window: Referencja do głównego okna aplikacji
             parent: Widget nadrzędny
         """
         super().__init__(parent)
         self.main_window = main_window
-        
+
         # Komponenty UI
-        self.scroll_area = None
-        self.container = None
-        self.grid_layout = None
-        self.hidden_list_widget = None  # Dla kompatybilności z istniejącym kodem
-        
+        self.list_view = None
+        self.model = None
+        self.delegate = None
+        # Dla kompatybilności z istniejącym kodem - zawiera tylko zaznaczony podgląd
+        self.hidden_list_widget = None
+
         # Stan
-        self.preview_tile_widgets: List["UnpairedPreviewTile"] = []
-        self.preview_checkboxes = []
         self.current_thumbnail_size = TileSizeConstants.DEFAULT_THUMBNAIL_SIZE
-        
+
         self._init_ui()
-        
+
     def _init_ui(self):
         """Inicjalizuje interfejs użytkownika."""
         layout = QVBoxLayout(self)
-        
+
         # Etykieta
         label = QLabel("Niesparowane Podglądy:")
         layout.addWidget(label)
-        
-        # Panel przewijania dla miniaturek
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        # Kontener na miniaturki
-        self.container = QWidget()
-        self.grid_layout = QGridLayout(self.container)
-        self.grid_layout.setContentsMargins(5, 5, 5, 5)
-        self.grid_layout.setSpacing(10)
-        
-        self.scroll_area.setWidget(self.container)
-        layout.addWidget(self.scroll_area)
-        
+
+        # Wirtualizowana siatka miniaturek
+        self.model = UnpairedPreviewsModel(self)
+        self.delegate = UnpairedPreviewDelegate(self)
+        self.delegate.trash_icon = self.style().standardIcon(
+            QStyle.StandardPixmap.SP_TrashIcon
+        )
+        self.delegate.checkbox_toggled.connect(self._on_preview_checkbox_toggled)
+        self.delegate.delete_requested.connect(self._on_delete_preview_requested)
+        self.delegate.preview_requested.connect(self._on_preview_image_requested)
+
+        self.list_view = QListView()
+        self.list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.list_view.setMovement(QListView.Movement.Static)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self._apply_tile_size()
+        layout.addWidget(self.list_view)
+
         # Ukryty QListWidget dla kompatybilności z istniejącym kodem
         self.hidden_list_widget = QListWidget()
         self.hidden_list_widget.setVisible(False)
         self.hidden_list_widget.itemSelectionChanged.connect(self._on_hidden_list_selection_changed)
         layout.addWidget(self.hidden_list_widget)
-        
+
+    def _apply_tile_size(self):
+        tile_size = tile_size_tuple(self.current_thumbnail_size)
+        self.delegate.tile_size = tile_size
+        self.list_view.setGridSize(QSize(*tile_size))
+        self.model.set_thumbnail_dimension(
+            thumbnail_dimension_for_tile(self.current_thumbnail_size)
+        )
+
     def _on_hidden_list_selection_changed(self):
         """Obsługuje zmianę selekcji w ukrytej liście."""
         self.selection_changed.emit()
-        
-    def add_preview_tile(self, preview_path: str) -> "UnpairedPreviewTile":
+
+    def add_preview_tile(self, preview_path: str):
         """
-        Dodaje kafelek podglądu do siatki.
-        
+        Dodaje podgląd na koniec siatki.
+
         Args:
             preview_path: Ścieżka do pliku podglądu
-            
-        Returns:
-            Utworzony kafelek podglądu
         """
-        # Import w metodzie, aby uniknąć cyklicznych importów
-        from src.ui.widgets.unpaired_files_tab import UnpairedPreviewTile
-        
-        if not os.path.exists(preview_path):
-            logging.warning(f"Plik podglądu nie istnieje: {preview_path}")
-            return None
-            
-        # Utwórz kafelek podglądu
-        preview_tile = UnpairedPreviewTile(preview_path, self.container)
-        preview_tile.set_thumbnail_size(self.current_thumbnail_size)
-        
-        # Podłącz sygnały
-        preview_tile.preview_image_requested.connect(self._on_preview_image_requested)
-        preview_tile.checkbox.stateChanged.connect(
-            lambda state, cb=preview_tile.checkbox, path=preview_path: 
-            self._on_preview_checkbox_changed(cb, path, state)
-        )
-        preview_tile.delete_button.clicked.connect(
-            lambda: self._on_delete_preview_requested(preview_path)
-        )
-        
-        # Ustaw ikonę dla przycisku usuń
-        from PyQt6.QtWidgets import QStyle
-        trash_icon = self.main_window.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon)
-        preview_tile.delete_button.setIcon(trash_icon)
-        
-        # Dodaj do list zarządzających
-        self.preview_checkboxes.append(preview_tile.checkbox)
-        self.preview_tile_widgets.append(preview_tile)
-        
-        # Dodaj do siatki - maksymalnie 3 miniaturki w rzędzie
-        row, col = divmod(self.grid_layout.count(), 3)
-        self.grid_layout.addWidget(preview_tile, row, col)
-        
-        # Dodaj do ukrytego QListWidget dla kompatybilności
-        item = QListWidgetItem(os.path.basename(preview_path))
-        item.setData(Qt.ItemDataRole.UserRole, preview_path)
-        self.hidden_list_widget.addItem(item)
-        
-        return preview_tile
-        
+        self.model.set_paths(self.model.paths() + [preview_path])
+
     def _on_preview_image_requested(self, preview_path: str):
         """
         Obsługuje żądanie wyświetlenia podglądu obrazu.
-        
+
         Args:
             preview_path: Ścieżka do pliku podglądu
         """
         # Pokaż podgląd obrazu
-        from PyQt6.QtGui import QPixmap
         from PyQt6.QtWidgets import QMessageBox
         from src.ui.widgets.preview_dialog import PreviewDialog
-        
+
         if not preview_path or not os.path.exists(preview_path):
             QMessageBox.warning(
                 self.main_window,
@@ -167,157 +411,130 @@ class UnpairedPreviewsGrid(QWidget):
                 "Plik podglądu nie istnieje.",
             )
             return
-            
+
         try:
             pixmap = QPixmap(preview_path)
             if pixmap.isNull():
                 raise ValueError("Nie udało się załadować obrazu do QPixmap.")
-                
+
             # Używaj PreviewDialog jak w galerii
             dialog = PreviewDialog(pixmap, self.main_window)
             dialog.exec()
-            
+
         except Exception as e:
             error_message = f"Wystąpił błąd podczas ładowania podglądu: {e}"
             logging.error(error_message)
             QMessageBox.critical(self.main_window, "Błąd Podglądu", error_message)
-            
-    def _on_preview_checkbox_changed(self, checkbox, preview_path: str, state: int):
+
+    def _on_preview_checkbox_toggled(self, preview_path: str):
         """
-        Obsługuje zmianę stanu checkboxa, zapewniając wybór tylko jednego elementu.
-        
+        Obsługuje kliknięcie checkboxa, zapewniając wybór tylko jednego elementu.
+
         Args:
-            checkbox: Checkbox, który się zmienił
             preview_path: Ścieżka do pliku podglądu
-            state: Nowy stan checkboxa
         """
-        # Zablokuj sygnały, aby uniknąć rekurencji
-        checkbox.blockSignals(True)
-        
-        if state == Qt.CheckState.Checked.value:
-            # Odznacz wszystkie inne checkboxy
-            for cb in self.preview_checkboxes:
-                if cb is not checkbox and cb.isChecked():
-                    cb.blockSignals(True)
-                    cb.setChecked(False)
-                    cb.blockSignals(False)
-                    
-            # Zaznacz odpowiedni element na ukrytej liście
-            for i in range(self.hidden_list_widget.count()):
-                item = self.hidden_list_widget.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == preview_path:
-                    self.hidden_list_widget.setCurrentItem(item)
-                    break
+        if self.model.checked_path() == preview_path:
+            self.set_checked_preview(None)
         else:
-            # Odznacz element na liście, jeśli to on był zaznaczony
-            current_item = self.hidden_list_widget.currentItem()
-            if (current_item and 
-                current_item.data(Qt.ItemDataRole.UserRole) == preview_path):
-                self.hidden_list_widget.setCurrentItem(None)
-                
-        # Odblokuj sygnały
-        checkbox.blockSignals(False)
-        
+            self.set_checked_preview(preview_path)
+
+    def set_checked_preview(self, preview_path: Optional[str]):
+        """
+        Zaznacza podgląd do parowania (None czyści zaznaczenie).
+
+        Args:
+            preview_path: Ścieżka do pliku podglądu lub None
+        """
+        self.model.set_checked_path(preview_path)
+
+        self.hidden_list_widget.blockSignals(True)
+        self.hidden_list_widget.clear()
+        if preview_path:
+            item = QListWidgetItem(os.path.basename(preview_path))
+            item.setData(Qt.ItemDataRole.UserRole, preview_path)
+            self.hidden_list_widget.addItem(item)
+            self.hidden_list_widget.setCurrentItem(item)
+        self.hidden_list_widget.blockSignals(False)
+        self.selection_changed.emit()
+
     def _on_delete_preview_requested(self, preview_path: str):
         """
         Obsługuje żądanie usunięcia podglądu.
-        
+
         Args:
             preview_path: Ścieżka do pliku podglądu
         """
         self.preview_deleted.emit(preview_path)
-        
+
     def clear(self):
         """Czyści wszystkie podglądy z siatki."""
-        # Wyczyść listę checkboxów i kafelków
-        self.preview_checkboxes.clear()
-        self.preview_tile_widgets.clear()
-        
-        # Wyczyść ukrytą listę
+        self.model.set_paths([])
         if self.hidden_list_widget:
             self.hidden_list_widget.clear()
-            
-        # Wyczyść kontener siatki
-        while self.grid_layout.count():
-            item_to_remove = self.grid_layout.takeAt(0)
-            if item_to_remove:
-                widget_to_remove = item_to_remove.widget()
-                if widget_to_remove:
-                    widget_to_remove.setParent(None)
-                    widget_to_remove.deleteLater()
-                else:
-                    # Jeśli to layout, wyczyść go rekurencyjnie
-                    layout_to_remove = item_to_remove.layout()
-                    if layout_to_remove:
-                        while layout_to_remove.count():
-                            child = layout_to_remove.takeAt(0)
-                            if child.widget():
-                                child.widget().setParent(None)
-                                child.widget().deleteLater()
-                                
+
     def update_previews(self, preview_paths: List[str]):
         """
         Aktualizuje całą siatkę podglądów.
-        
+
         Args:
             preview_paths: Lista ścieżek do plików podglądów
         """
-        self.clear()
-        
         # Sortuj alfabetycznie
         sorted_previews = sorted(preview_paths, key=lambda x: os.path.basename(x).lower())
-        
-        for preview_path in sorted_previews:
-            self.add_preview_tile(preview_path)
-            
+
+        checked_path = self.model.checked_path()
+        self.model.set_paths(sorted_previews)
+        if checked_path and self.model.checked_path() is None:
+            self.set_checked_preview(None)
+
+    def apply_delta(self, added: List[str], removed: List[str]):
+        """
+        Dodaje i usuwa podglądy bez przebudowy siatki.
+
+        Args:
+            added: Ścieżki nowych podglądów
+            removed: Ścieżki podglądów do usunięcia
+        """
+        checked_path = self.model.checked_path()
+        self.model.apply_delta(added, removed)
+        if checked_path and self.model.checked_path() is None:
+            self.set_checked_preview(None)
+
     def update_thumbnail_size(self, new_size):
         """
         Aktualizuje rozmiar miniaturek w siatce.
-        
+
         Args:
             new_size: Nowy rozmiar kafelka (int lub tuple (width, height))
         """
         self.current_thumbnail_size = new_size
-        
-        # Aktualizuj wszystkie istniejące kafelki
-        for preview_tile in self.preview_tile_widgets:
-            preview_tile.set_thumbnail_size(new_size)
-            
+        self._apply_tile_size()
+
     def get_selected_items(self) -> List[QListWidgetItem]:
         """
         Zwraca listę zaznaczonych elementów z ukrytej listy.
-        
+
         Returns:
             Lista zaznaczonych elementów
         """
         if not self.hidden_list_widget:
             return []
         return self.hidden_list_widget.selectedItems()
-        
+
     def get_selected_preview_path(self) -> str | None:
         """
         Zwraca ścieżkę do zaznaczonego podglądu.
-        
+
         Returns:
             Ścieżka do podglądu lub None jeśli nic nie zaznaczono
         """
-        selected_items = self.get_selected_items()
-        if not selected_items:
-            return None
-        return selected_items[0].data(Qt.ItemDataRole.UserRole)
-        
+        return self.model.checked_path()
+
     def get_all_preview_paths(self) -> List[str]:
         """
         Zwraca wszystkie ścieżki podglądów w siatce.
-        
+
         Returns:
             Lista ścieżek do wszystkich podglądów
         """
-        paths = []
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'preview_path'):
-                    paths.append(widget.preview_path)
-        return paths
\ No newline at end of file
+        return self.model.paths()
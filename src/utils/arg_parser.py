@@ -43,6 +43,12 @@ def parse_args():
         "--log-dir", type=str, default="logs", help="Katalog na pliki logów"
     )
 
+    parser.add_argument(
+        "--sync-log",
+        action="store_true",
+        help="Zapisuj logi synchronicznie w wątku logującym (bez wątku logowania)",
+    )
+
     # Opcje stylu
     parser.add_argument(
         "--style", type=str, help="Ścieżka do niestandardowego pliku QSS ze stylami"
@@ -77,7 +83,10 @@ def setup_logging_from_args(args):
 
     # Konfiguracja systemu logowania
     setup_logging(
-        log_level=log_level, log_to_file=not args.no_file_log, log_dir=args.log_dir
+        log_level=log_level,
+        log_to_file=not args.no_file_log,
+        log_dir=args.log_dir,
+        use_queue=not args.sync_log,
     )
 
     # Dodatkowa konfiguracja dla trybu debug
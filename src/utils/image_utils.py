@@ -4,11 +4,15 @@ Funkcje pomocnicze do operacji na obrazach.
 
 import logging
 import os
-from io import BytesIO
 
 from PIL import Image, ImageDraw, ImageFont
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+# Zapas rozdzielczości przy dekodowaniu w zmniejszonym rozmiarze - obraz jest
+# redukowany (DCT/reduce) najwyżej do rozmiar_docelowy * gap, a resztę
+# skalowania wykonuje LANCZOS, więc jakość miniatur się nie zmienia
+THUMBNAIL_REDUCING_GAP = 2.0
 
 
 def create_placeholder_pixmap(width, height, color="#E0E0E0", text="Brak podglądu"):
@@ -45,13 +49,7 @@ def create_placeholder_pixmap(width, height, color="#E0E0E0", text="Brak podglą
             logging.warning(f"Nie udało się narysować tekstu na placeholderze: {e}")
 
         # Konwersja obrazu PIL do QPixmap
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        q_image = QImage()
-        q_image.loadFromData(buffer.getvalue())
-        return QPixmap.fromImage(q_image)
+        return QPixmap.fromImage(pillow_image_to_qimage(img))
 
     except Exception as e:
         logging.error(f"Błąd tworzenia placeholdera: {e}")
@@ -59,108 +57,185 @@ def create_placeholder_pixmap(width, height, color="#E0E0E0", text="Brak podglą
         return QPixmap(width, height)
 
 
-def pillow_image_to_qpixmap(pil_image):
+def prepare_pillow_image_for_qt(pil_image, preserve_transparency):
     """
-    Konwertuje obiekt obrazu Pillow (PIL.Image) na QPixmap (PyQt6).
+    Sprowadza obraz PIL do trybu RGB lub RGBA (8 bitów na kanał).
+
+    Args:
+        pil_image (PIL.Image): Obraz źródłowy
+        preserve_transparency (bool): Czy zachować kanał alfa
+
+    Returns:
+        PIL.Image: Obraz w trybie "RGB" lub "RGBA"
+    """
+    has_alpha = pil_image.mode in ("RGBA", "LA", "PA") or (
+        pil_image.mode == "P" and "transparency" in pil_image.info
+    )
+
+    if has_alpha and preserve_transparency:
+        return pil_image if pil_image.mode == "RGBA" else pil_image.convert("RGBA")
+
+    if has_alpha:
+        # Brak przezroczystości - kompozycja na białym tle
+        rgba_image = pil_image.convert("RGBA")
+        return Image.alpha_composite(
+            Image.new("RGBA", rgba_image.size, (255, 255, 255, 255)), rgba_image
+        ).convert("RGB")
+
+    return pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
 
-    NAPRAWKA: Używa konfigurowalnego formatu miniaturek z AppConfig.
-    Domyślnie WebP dla lepszej kompresji i jakości (25-34% mniejsze pliki).
+
+def pillow_image_to_qimage(pil_image, preserve_transparency=True):
+    """
+    Konwertuje obraz Pillow bezpośrednio na QImage (bez kodowania do pliku).
+
+    QImage jest budowany nad surowym buforem pikseli (RGB888/RGBA8888
+    z jawnym bytesPerLine), po czym wykonywana jest jedna kopia, by QImage
+    był właścicielem danych i przeżył bufor Pythona.
 
     Args:
         pil_image (PIL.Image): Obiekt obrazu z biblioteki Pillow
+        preserve_transparency (bool): Czy zachować kanał alfa
 
     Returns:
-        QPixmap: Obiekt QPixmap utworzony z obrazu Pillow
+        QImage: Obraz Qt (pusty QImage w przypadku błędu)
+    """
+    try:
+        pil_image = prepare_pillow_image_for_qt(pil_image, preserve_transparency)
+        width, height = pil_image.size
+        if pil_image.mode == "RGBA":
+            image_format = QImage.Format.Format_RGBA8888
+            bytes_per_line = width * 4
+        else:
+            image_format = QImage.Format.Format_RGB888
+            bytes_per_line = width * 3
+
+        data = pil_image.tobytes("raw", pil_image.mode)
+        return QImage(data, width, height, bytes_per_line, image_format).copy()
+
+    except Exception as e:
+        logging.error(f"Błąd konwersji obrazu Pillow do QImage: {e}")
+        return QImage()
+
+
+def should_preserve_thumbnail_transparency():
+    """
+    Sprawdza, czy miniatury mają zachować kanał alfa.
+
+    Returns:
+        bool: True dla formatów WEBP/PNG z włączoną przezroczystością
     """
     try:
         from src.app_config import AppConfig
 
         config = AppConfig.get_instance()
+        return (
+            config.get_thumbnail_format() in ("WEBP", "PNG")
+            and config.get_thumbnail_preserve_transparency()
+        )
+    except Exception as e:
+        logging.debug(f"Brak ustawień formatu miniaturek, używam domyślnych: {e}")
+        return True
 
-        # Pobierz ustawienia formatu z konfiguracji
-        thumbnail_format = config.get_thumbnail_format()
-        thumbnail_quality = config.get_thumbnail_quality()
-        webp_method = config.get_thumbnail_webp_method()
-        preserve_transparency = config.get_thumbnail_preserve_transparency()
-
-        # Przygotuj obraz w zależności od formatu i ustawień przezroczystości
-        if thumbnail_format == "WEBP" and preserve_transparency:
-            # WebP obsługuje przezroczystość - zachowaj RGBA
-            if pil_image.mode not in ("RGB", "RGBA"):
-                if pil_image.mode in ("LA", "PA"):
-                    pil_image = pil_image.convert("RGBA")
-                else:
-                    pil_image = pil_image.convert("RGB")
-        elif thumbnail_format == "PNG" and preserve_transparency:
-            # PNG obsługuje przezroczystość - zachowaj RGBA
-            if pil_image.mode not in ("RGB", "RGBA"):
-                if pil_image.mode in ("LA", "PA"):
-                    pil_image = pil_image.convert("RGBA")
-                else:
-                    pil_image = pil_image.convert("RGB")
-        else:
-            # JPEG nie obsługuje przezroczystości - konwertuj na RGB
-            if pil_image.mode == "RGBA":
-                background = Image.new("RGB", pil_image.size, (255, 255, 255))
-                pil_image = Image.alpha_composite(
-                    Image.new("RGBA", pil_image.size, (255, 255, 255, 255)), pil_image
-                ).convert("RGB")
-            elif pil_image.mode != "RGB":
-                pil_image = pil_image.convert("RGB")
-
-        # Zapis do bufora w pamięci używając wybranego formatu
-        buffer = BytesIO()
-
-        if thumbnail_format == "WEBP":
-            # WebP z konfigurowalnymi ustawieniami
-            pil_image.save(
-                buffer, format="WEBP", quality=thumbnail_quality, method=webp_method
-            )
-        elif thumbnail_format == "PNG":
-            # PNG lossless - jakość nie ma znaczenia
-            pil_image.save(buffer, format="PNG", optimize=True)
-        else:  # JPEG
-            # JPEG z konfigurowalnymi ustawieniami
-            pil_image.save(
-                buffer, format="JPEG", quality=thumbnail_quality, optimize=True
-            )
 
-        buffer.seek(0)
+def pillow_image_to_qpixmap(pil_image):
+    """
+    Konwertuje obiekt obrazu Pillow (PIL.Image) na QPixmap (PyQt6).
+
+    Konwersja odbywa się bezpośrednio na buforze pikseli - bez kodowania
+    do WEBP/PNG/JPEG w pamięci. Format miniaturek z AppConfig jest używany
+    tylko przy zapisie do trwałego cache (ThumbnailCache), tutaj decyduje
+    jedynie o zachowaniu przezroczystości (JPEG jej nie obsługuje).
+
+    Args:
+        pil_image (PIL.Image): Obiekt obrazu z biblioteki Pillow
+
+    Returns:
+        QPixmap: Obiekt QPixmap utworzony z obrazu Pillow
+    """
+    q_image = pillow_image_to_qimage(
+        pil_image, should_preserve_thumbnail_transparency()
+    )
+    if q_image.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(q_image)
+
 
-        # Konwersja do QImage i dalej do QPixmap
-        q_image = QImage()
-        q_image.loadFromData(buffer.getvalue())
-        q_pixmap = QPixmap.fromImage(q_image)
+def _request_reduced_decode(pil_image, size):
+    """
+    Prosi dekoder JPEG o obraz zmniejszony skalowaniem DCT (1/2, 1/4, 1/8).
+
+    Krótszy bok zdekodowanego obrazu pozostaje nie mniejszy niż
+    size * THUMBNAIL_REDUCING_GAP, więc przycięcie do kwadratu działa
+    identycznie jak na pełnej rozdzielczości. Dla innych formatów oraz
+    obrazów już wczytanych funkcja nic nie robi.
+
+    Args:
+        pil_image (PIL.Image): Otwarty (jeszcze niewczytany) obraz
+        size (int): Docelowy rozmiar kwadratu
+    """
+    if pil_image.format != "JPEG" or not getattr(pil_image, "tile", None):
+        return
 
-        return q_pixmap
+    width, height = pil_image.size
+    scale = size * THUMBNAIL_REDUCING_GAP / min(width, height)
+    if scale >= 1.0:
+        return
 
+    try:
+        pil_image.draft(None, (int(width * scale) + 1, int(height * scale) + 1))
     except Exception as e:
-        logging.error(
-            f"Błąd konwersji obrazu Pillow do QPixmap ({thumbnail_format}): {e}"
-        )
-        # Fallback na JPEG jeśli wybrany format nie działa
-        try:
-            logging.warning("Próba fallback na JPEG...")
-            if pil_image.mode == "RGBA":
-                background = Image.new("RGB", pil_image.size, (255, 255, 255))
-                pil_image = Image.alpha_composite(
-                    Image.new("RGBA", pil_image.size, (255, 255, 255, 255)), pil_image
-                ).convert("RGB")
-            elif pil_image.mode != "RGB":
-                pil_image = pil_image.convert("RGB")
+        logging.debug(f"Dekodowanie w zmniejszonym rozmiarze niedostępne: {e}")
+
 
-            buffer = BytesIO()
-            pil_image.save(buffer, format="JPEG", quality=80, optimize=True)
-            buffer.seek(0)
+def _get_thumbnail_decode_backend():
+    """Zwraca backend dekodowania miniatur z konfiguracji ("pillow" lub "qt")."""
+    try:
+        from src.app_config import AppConfig
 
-            q_image = QImage()
-            q_image.loadFromData(buffer.getvalue())
-            q_pixmap = QPixmap.fromImage(q_image)
+        return AppConfig.get_instance().thumbnail_decode_backend
+    except Exception:
+        return "pillow"
 
-            return q_pixmap
-        except Exception as fallback_error:
-            logging.error(f"Błąd fallback JPEG: {fallback_error}")
-            return QPixmap()
+
+def _create_thumbnail_with_qt(file_path, width, height):
+    """
+    Tworzy miniaturkę przez QImageReader ze skalowaniem w dekoderze.
+
+    Semantyka jak w ścieżce Pillow: kwadrat przycinany od góry/lewej
+    krawędzi, w pozostałych przypadkach dopasowanie z zachowaniem proporcji
+    (bez powiększania).
+
+    Returns:
+        QPixmap lub None, jeśli Qt nie potrafi odczytać pliku
+    """
+    reader = QImageReader(file_path)
+    source_size = reader.size()
+    if not source_size.isValid() or source_size.isEmpty():
+        return None
+
+    source_width, source_height = source_size.width(), source_size.height()
+    if width == height:
+        scale = width / min(source_width, source_height)
+        reader.setScaledSize(
+            QSize(
+                max(width, round(source_width * scale)),
+                max(width, round(source_height * scale)),
+            )
+        )
+        reader.setScaledClipRect(QRect(0, 0, width, width))
+    elif source_width > width or source_height > height:
+        reader.setScaledSize(
+            source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+
+    image = reader.read()
+    if image.isNull():
+        logging.debug(
+            f"QImageReader nie odczytał {file_path}: {reader.errorString()}"
+        )
+        return None
+    return QPixmap.fromImage(image)
 
 
 def crop_to_square(pil_image, size):
@@ -180,7 +255,10 @@ def crop_to_square(pil_image, size):
         PIL.Image: Przycięty i przeskalowany obraz kwadratowy
     """
     try:
-        # Pobierz wymiary oryginalnego obrazu
+        # Dekodowanie JPEG od razu w zmniejszonej rozdzielczości (skalowanie DCT)
+        _request_reduced_decode(pil_image, size)
+
+        # Pobierz wymiary (po ewentualnej redukcji przy dekodowaniu)
         width, height = pil_image.size
 
         # Oblicz rozmiar kwadratu do wycięcia (minimum z szerokości i wysokości)
@@ -210,8 +288,10 @@ def crop_to_square(pil_image, size):
         # Wytnij kwadrat zgodnie z obliczonymi współrzędnymi
         cropped_image = pil_image.crop((left, top, right, bottom))
 
-        # Przeskaluj do docelowego rozmiaru
-        resized_image = cropped_image.resize((size, size), Image.LANCZOS)
+        # Przeskaluj do docelowego rozmiaru (reduce() dla dużych obrazów)
+        resized_image = cropped_image.resize(
+            (size, size), Image.LANCZOS, reducing_gap=THUMBNAIL_REDUCING_GAP
+        )
 
         return resized_image
 
@@ -221,7 +301,37 @@ def crop_to_square(pil_image, size):
         return pil_image.resize((size, size), Image.LANCZOS)
 
 
-def create_thumbnail_from_file(file_path, width, height):
+def create_thumbnail_image(file_path, width, height):
+    """
+    Dekoduje plik graficzny i tworzy miniaturkę jako obraz PIL.
+
+    Nie używa Qt, więc może działać także w osobnym procesie.
+
+    Args:
+        file_path: Ścieżka do pliku graficznego
+        width: Szerokość miniaturki w pikselach
+        height: Wysokość miniaturki w pikselach
+
+    Returns:
+        PIL.Image: Wczytana miniaturka (niezależna od pliku źródłowego)
+
+    Raises:
+        OSError: Jeśli pliku nie można odczytać lub zdekodować
+    """
+    # Utworzenie miniaturki z proper context management
+    with Image.open(file_path) as img:
+        # Jeśli miniaturka ma być kwadratowa, przytnij obraz
+        if width == height:
+            return crop_to_square(img, width)
+
+        # W przeciwnym razie zachowaj proporcje (thumbnail() sam prosi
+        # dekoder o zmniejszony rozmiar - bez kopii pełnego obrazu)
+        img.thumbnail((width, height), Image.LANCZOS, reducing_gap=THUMBNAIL_REDUCING_GAP)
+        img.load()
+        return img
+
+
+def create_thumbnail_from_file(file_path, width, height, placeholder_on_error=True):
     """
     Tworzy miniaturkę (QPixmap) na podstawie pliku graficznego.
 
@@ -232,36 +342,44 @@ def create_thumbnail_from_file(file_path, width, height):
         file_path: Ścieżka do pliku graficznego
         width: Szerokość miniaturki w pikselach
         height: Wysokość miniaturki w pikselach
+        placeholder_on_error: Czy w przypadku błędu zwrócić placeholder
+            z opisem błędu. Workery zapisujące miniatury w cache przekazują
+            False, aby placeholder nie trafił do cache jak miniatura.
 
     Returns:
-        QPixmap: Utworzona miniaturka lub pusty QPixmap w przypadku błędu
+        QPixmap: Utworzona miniaturka, a w przypadku błędu placeholder
+        lub pusty QPixmap (placeholder_on_error=False)
     """
+
+    def error_pixmap(text):
+        if placeholder_on_error:
+            return create_placeholder_pixmap(width, height, text=text)
+        return QPixmap()
+
     try:
         # Sprawdzenie czy plik istnieje
         if not os.path.exists(file_path):
             logging.warning(f"Plik nie istnieje: {file_path}")
-            return create_placeholder_pixmap(width, height, text="Brak pliku")
-
-        # Utworzenie miniaturki z proper context management
-        with Image.open(file_path) as img:
-            # Jeśli miniaturka ma być kwadratowa, przytnij obraz
-            if width == height:
-                img_resized = crop_to_square(img, width)
-            else:
-                # W przeciwnym razie zachowaj proporcje
-                img_resized = img.copy()
-                img_resized.thumbnail((width, height), Image.LANCZOS)
-
-            # Konwersja na QPixmap
-            pixmap = pillow_image_to_qpixmap(img_resized)
-
-            if pixmap and not pixmap.isNull():
+            return error_pixmap("Brak pliku")
+
+        # Alternatywny backend: QImageReader ze skalowaniem w dekoderze
+        if _get_thumbnail_decode_backend() == "qt":
+            pixmap = _create_thumbnail_with_qt(file_path, width, height)
+            if pixmap is not None and not pixmap.isNull():
                 return pixmap
-            else:
-                # W przypadku nieudanej konwersji
-                return create_placeholder_pixmap(width, height, text="Błąd konwersji")
+
+        # Konwersja na QPixmap
+        pixmap = pillow_image_to_qpixmap(
+            create_thumbnail_image(file_path, width, height)
+        )
+
+        if pixmap and not pixmap.isNull():
+            return pixmap
+        else:
+            # W przypadku nieudanej konwersji
+            return error_pixmap("Błąd konwersji")
 
     except Exception as e:
         logging.error(f"Błąd podczas tworzenia miniatury dla {file_path}: {e}")
         # Zwróć placeholder w przypadku błędu
-        return create_placeholder_pixmap(width, height, text="Błąd")
+        return error_pixmap("Błąd")
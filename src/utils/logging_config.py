@@ -2,22 +2,40 @@
 Konfiguracja systemu logowania dla aplikacji.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import re
 from typing import Optional
 
+# Wątek zapisujący logi z kolejki (tryb asynchroniczny)
+_queue_listener: Optional[QueueListener] = None
+_atexit_registered = False
+_configured = False
 
-def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir="logs"):
+
+def setup_logging(
+    log_level=logging.INFO, log_to_file=True, log_dir="logs", use_queue=True
+):
     """
     Konfiguruje system logowania aplikacji.
 
+    W trybie asynchronicznym (use_queue) główny logger ma tylko QueueHandler,
+    który wkłada rekordy do nieograniczonej kolejki - wątki workerów nie
+    czekają na zapis do konsoli i pliku. Zapisem zajmuje się QueueListener
+    we własnym wątku, zatrzymywany (z opróżnieniem kolejki) przez
+    stop_logging() lub przy zakończeniu procesu.
+
     Args:
         log_level (int): Poziom logowania, domyślnie INFO.
         log_to_file (bool): Czy zapisywać logi do pliku, domyślnie True.
         log_dir (str): Katalog na pliki logów, domyślnie 'logs'.
+        use_queue (bool): Czy zapisywać logi w osobnym wątku, domyślnie True.
     """
+    global _queue_listener, _atexit_registered, _configured
+
     # Tworzenie formatowania dla logów
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -27,16 +45,18 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir="logs"):
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
-    # Czyszczenie istniejących handlerów
+    # Czyszczenie istniejących handlerów (i wątku poprzedniej konfiguracji)
+    stop_logging()
     if logger.hasHandlers():
         logger.handlers.clear()
 
-    # Dodanie handlera konsoli
+    # Handler konsoli
+    handlers = []
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
-    # Dodanie handlera pliku, jeśli wymagane
+    # Handler pliku, jeśli wymagane
     if log_to_file:
         # Upewnij się, że katalog na logi istnieje
         if not os.path.exists(log_dir):
@@ -48,12 +68,47 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir="logs"):
             log_file_path, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
+        handlers.append(file_handler)
+
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(log_queue, *handlers)
+        _queue_listener.start()
+        if not _atexit_registered:
+            atexit.register(stop_logging)
+            _atexit_registered = True
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    _configured = True
     logging.debug("System logowania zainicjalizowany")
     return logger
 
 
+def is_logging_configured() -> bool:
+    """Czy setup_logging() było już wywołane (np. z argumentów linii poleceń)."""
+    return _configured
+
+
+def stop_logging():
+    """
+    Zatrzymuje wątek zapisu logów po zapisaniu rekordów z kolejki.
+
+    Bezpieczne do wielokrotnego wywołania; bez trybu asynchronicznego nic
+    nie robi.
+    """
+    global _queue_listener
+    listener = _queue_listener
+    if listener is None:
+        return
+    _queue_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
 class OptimizedLogger:
     """
     Zoptymalizowany logger bez emoji dla main_window.
@@ -0,0 +1,256 @@
+"""
+Wieloprocesowy silnik generowania miniaturek.
+
+Dekodowanie, przycinanie i skalowanie obrazów PIL częściowo trzyma GIL,
+więc dodatkowe wątki QThreadPool słabo skalują się z liczbą rdzeni. Ten moduł
+wykonuje te kroki w puli procesów (ProcessPoolExecutor). Piksele wracają do
+procesu GUI przez pamięć współdzieloną (jeden segment na paczkę żądań),
+a nie przez pickle.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from PyQt6.QtGui import QImage
+
+logger = logging.getLogger(__name__)
+
+# Liczba żądań w jednym zadaniu dla procesu roboczego
+DEFAULT_CHUNK_SIZE = 16
+
+ThumbnailRequest = Tuple[str, int, int]
+# (ścieżka, szerokość, wysokość, obraz lub None, komunikat błędu lub None)
+ThumbnailResult = Tuple[str, int, int, Optional[QImage], Optional[str]]
+
+
+def _slot_size(width: int, height: int) -> int:
+    """Rozmiar miejsca na piksele miniatury w segmencie (RGBA, 4 bajty/piksel)."""
+    return max(width, 1) * max(height, 1) * 4
+
+
+def _render_thumbnail_batch(
+    requests: Sequence[ThumbnailRequest],
+    preserve_transparency: bool,
+    segment_name: str,
+) -> List[tuple]:
+    """
+    Generuje paczkę miniaturek w procesie roboczym.
+
+    Piksele są zapisywane do segmentu pamięci współdzielonej utworzonego przez
+    proces GUI - każde żądanie ma w nim własne miejsce (_slot_size).
+
+    Returns:
+        Lista opisów: ("ok", offset, szerokość, wysokość, tryb)
+        lub ("error", komunikat).
+    """
+    from src.utils.image_utils import create_thumbnail_image, prepare_pillow_image_for_qt
+
+    segment = shared_memory.SharedMemory(name=segment_name)
+    descriptors = []
+    offset = 0
+    try:
+        for path, width, height in requests:
+            slot_size = _slot_size(width, height)
+            try:
+                image = prepare_pillow_image_for_qt(
+                    create_thumbnail_image(path, width, height), preserve_transparency
+                )
+                data = image.tobytes("raw", image.mode)
+                if len(data) > slot_size:
+                    raise ValueError(
+                        f"Miniatura {image.size} większa niż żądane {width}x{height}"
+                    )
+                segment.buf[offset : offset + len(data)] = data
+                descriptors.append(
+                    ("ok", offset, image.size[0], image.size[1], image.mode)
+                )
+            except Exception as e:
+                descriptors.append(("error", str(e)))
+            offset += slot_size
+    finally:
+        # Właścicielem segmentu jest proces GUI - tu tylko odłączenie
+        segment.close()
+    return descriptors
+
+
+def _create_batch_segment(
+    requests: Sequence[ThumbnailRequest],
+) -> shared_memory.SharedMemory:
+    """Tworzy segment pamięci współdzielonej na piksele paczki żądań."""
+    size = sum(_slot_size(width, height) for _, width, height in requests)
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def _release_segment(segment: shared_memory.SharedMemory):
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _collect_batch_results(
+    requests: Sequence[ThumbnailRequest],
+    segment: shared_memory.SharedMemory,
+    descriptors: List[tuple],
+) -> List[ThumbnailResult]:
+    """Kopiuje piksele z pamięci współdzielonej do QImage (jedna kopia)."""
+    results = []
+    for (path, width, height), descriptor in zip(requests, descriptors):
+        if descriptor[0] != "ok":
+            results.append((path, width, height, None, descriptor[1]))
+            continue
+
+        _, offset, image_width, image_height, mode = descriptor
+        if mode == "RGBA":
+            image_format = QImage.Format.Format_RGBA8888
+            bytes_per_line = image_width * 4
+        else:
+            image_format = QImage.Format.Format_RGB888
+            bytes_per_line = image_width * 3
+        view = segment.buf[offset : offset + bytes_per_line * image_height]
+        try:
+            # QImage nad widokiem segmentu, kopia czyni go właścicielem pikseli
+            image = QImage(
+                view, image_width, image_height, bytes_per_line, image_format
+            ).copy()
+        finally:
+            view.release()
+        results.append((path, width, height, image, None))
+    return results
+
+
+class ThumbnailProcessPool:
+    """
+    Pula procesów generujących miniaturki (singleton).
+
+    Procesy są uruchamiane leniwie przy pierwszym żądaniu metodą "spawn"
+    (fork procesu z wątkami Qt nie jest bezpieczny) i zamykane przy wyjściu
+    z aplikacji.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "ThumbnailProcessPool":
+        """Zwraca współdzieloną instancję puli (liczba procesów z AppConfig)."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from src.config import AppConfig
+
+                workers = AppConfig.get_instance().thumbnail_process_pool_workers
+                cls._instance = cls(max_workers=workers or None)
+                atexit.register(cls._instance.shutdown)
+            return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Sprawdza, czy generowanie miniatur w procesach jest włączone."""
+        from src.config import AppConfig
+
+        return bool(AppConfig.get_instance().thumbnail_process_pool_enabled)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.debug(
+                    f"Uruchomiono pulę {self.max_workers} procesów miniaturek"
+                )
+            return self._executor
+
+    def generate(
+        self,
+        requests: Sequence[ThumbnailRequest],
+        preserve_transparency: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        interrupt_check: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[ThumbnailResult]:
+        """
+        Generuje miniaturki, zwracając wyniki w miarę kończenia się paczek.
+
+        Args:
+            requests: Lista krotek (ścieżka, szerokość, wysokość)
+            preserve_transparency: Czy zachować kanał alfa
+            chunk_size: Liczba żądań w jednym zadaniu procesu roboczego
+            interrupt_check: Funkcja przerywająca (anuluje oczekujące paczki)
+
+        Yields:
+            Krotki (ścieżka, szerokość, wysokość, QImage lub None, błąd lub None)
+
+        Raises:
+            BrokenProcessPool: Jeśli proces roboczy zakończył się awaryjnie
+        """
+        executor = self._get_executor()
+        pending = {}
+        try:
+            for start in range(0, len(requests), max(1, chunk_size)):
+                chunk = list(requests[start : start + chunk_size])
+                # Segment tworzy (i zwalnia) proces GUI - procesy robocze tylko
+                # do niego piszą, więc nie ma ponownego dołączania do segmentu
+                segment = _create_batch_segment(chunk)
+                try:
+                    future = executor.submit(
+                        _render_thumbnail_batch,
+                        chunk,
+                        preserve_transparency,
+                        segment.name,
+                    )
+                except BaseException:
+                    _release_segment(segment)
+                    raise
+                pending[future] = (chunk, segment)
+
+            while pending:
+                done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                if interrupt_check and interrupt_check():
+                    return
+                for future in done:
+                    chunk, segment = pending.pop(future)
+                    try:
+                        descriptors = future.result()
+                        results = _collect_batch_results(chunk, segment, descriptors)
+                    finally:
+                        _release_segment(segment)
+                    yield from results
+        finally:
+            for future, (_, segment) in pending.items():
+                if future.cancel():
+                    _release_segment(segment)
+                else:
+                    # Proces roboczy może jeszcze pisać do segmentu
+                    future.add_done_callback(
+                        lambda _, segment=segment: _release_segment(segment)
+                    )
+            if pending:
+                logger.debug(f"Anulowano {len(pending)} paczek miniaturek")
+
+    def shutdown(self):
+        """Zamyka procesy robocze."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def reset(self):
+        """Zamyka pulę po awarii - kolejne żądanie uruchomi nowe procesy."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
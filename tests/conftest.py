@@ -0,0 +1,51 @@
+"""
+Wspólne narzędzia testów skanera: tworzenie plików i katalog tymczasowy
+z czystym stanem cache skanera.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logic.metadata.metadata_core import MetadataRegistry
+from src.logic.scanner_cache import ThreadSafeCache, cache
+
+
+def touch(path, content=b"data"):
+    """Tworzy plik (wraz z katalogami nadrzędnymi) o podanej zawartości."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _clear_scanner_state():
+    cache.clear()
+    ThreadSafeCache().snapshots.clear()
+
+
+@pytest.fixture
+def scan_temp_dir(request):
+    """
+    Katalog tymczasowy dla testów skanowania.
+
+    Przed testem i po nim czyści cache skanera i snapshoty katalogów, a po
+    teście także rejestr metadanych. W klasach unittest.TestCase ścieżka
+    jest dostępna jako self.temp_dir już w setUp (fixture działa przed setUp
+    i sprząta po tearDown).
+    """
+    temp_dir = tempfile.mkdtemp()
+    _clear_scanner_state()
+    if request.instance is not None:
+        request.instance.temp_dir = temp_dir
+    yield temp_dir
+    MetadataRegistry.cleanup_all()
+    _clear_scanner_state()
+    shutil.rmtree(temp_dir, ignore_errors=True)
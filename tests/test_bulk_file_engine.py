@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+TESTY: BulkFileEngine - równoległe przenoszenie/usuwanie z dziennikiem operacji
+"""
+
+import errno
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.logic import bulk_file_engine
+from src.logic.bulk_file_engine import (
+    BulkFileEngine,
+    BulkOperationJournal,
+    FileOperation,
+    find_pending_journals,
+    read_journal_kind,
+)
+from src.models.file_pair import FilePair
+from src.ui.delegates.workers import bulk_workers
+from src.ui.delegates.workers.bulk_workers import (
+    BulkJournalWorker,
+    BulkMoveWorker,
+    MoveUnpairedArchivesWorker,
+)
+from src.ui.main_window import bulk_operations_manager
+from src.ui.main_window.bulk_operations_manager import BulkOperationsManager
+
+
+def _write(path, content=b"data"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TestBulkFileEngine(unittest.TestCase):
+    """Testy silnika masowych operacji na plikach"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        self.target_dir = os.path.join(self.temp_dir, "target")
+        self.journal_dir = os.path.join(self.temp_dir, "journal")
+        os.makedirs(self.target_dir)
+        self.sources = []
+        for i in range(10):
+            path = os.path.join(self.source_dir, f"model{i}.zip")
+            _write(path, f"model{i}".encode())
+            self.sources.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _move_operations(self):
+        return [
+            FileOperation(path, os.path.join(self.target_dir, os.path.basename(path)))
+            for path in self.sources
+        ]
+
+    def _record_start(self, journal_path, op_id, source):
+        """Dopisuje wpis "start" jak przed zmianą nazwy lub kopiowaniem."""
+        journal = BulkOperationJournal.load(journal_path)[0]
+        journal.record_start(op_id, BulkFileEngine._identity(os.stat(source)))
+        journal.close()
+
+    def _interrupt_after(self, submissions):
+        calls = []
+
+        def interrupt_check():
+            calls.append(None)
+            return len(calls) > submissions
+
+        return interrupt_check
+
+    def test_move_same_device(self):
+        """Test przeniesienia przez os.rename z wynikiem w kolejności wejścia"""
+        operations = self._move_operations()
+        with patch.object(
+            bulk_file_engine.shutil, "copystat", side_effect=AssertionError
+        ):
+            result = BulkFileEngine(max_workers=4, journal_dir=self.journal_dir).move(
+                operations
+            )
+
+        self.assertEqual(result.completed, operations)
+        self.assertEqual(result.errors, [])
+        self.assertIsNone(result.journal_path)
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+        for op in operations:
+            self.assertFalse(os.path.exists(op.source))
+            self.assertEqual(
+                _read(op.target), os.path.basename(op.source)[:-4].encode()
+            )
+
+        print("✅ Same-device move OK")
+
+    def test_existing_and_duplicate_targets_skipped(self):
+        """Test pominięcia istniejącego celu i dwóch operacji na ten sam cel"""
+        operations = self._move_operations()
+        _write(operations[0].target, b"existing")
+        operations.append(FileOperation(self.sources[1], operations[1].target))
+
+        result = BulkFileEngine(max_workers=4).move(operations)
+
+        self.assertEqual(len(result.completed), 9)
+        self.assertEqual(
+            sorted(entry["file_path"] for entry in result.skipped),
+            [self.sources[0], self.sources[1]],
+        )
+        self.assertEqual(_read(operations[0].target), b"existing")
+        self.assertTrue(os.path.exists(self.sources[0]))
+
+        print("✅ Skip existing OK")
+
+    def test_delete_reports_missing_files(self):
+        """Test usuwania z brakującymi plikami raportowanymi osobno"""
+        os.remove(self.sources[3])
+        operations = [FileOperation(path, tag=i) for i, path in enumerate(self.sources)]
+
+        result = BulkFileEngine(max_workers=4).delete(operations)
+
+        self.assertEqual([op.tag for op in result.missing], [3])
+        self.assertEqual(len(result.completed), 9)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(os.listdir(self.source_dir), [])
+
+        print("✅ Delete OK")
+
+    def test_cross_device_move_copies_and_removes_source(self):
+        """Test kopiowania porcjami przy przenoszeniu między urządzeniami"""
+        engine = BulkFileEngine(max_workers=2)
+        devices = {self.source_dir: 1, self.target_dir: 2}
+        operations = self._move_operations()[:3]
+        with patch.object(bulk_file_engine, "COPY_CHUNK_SIZE", 2), patch.object(
+            engine, "_device_of", side_effect=devices.get
+        ), patch.object(bulk_file_engine.os, "rename", side_effect=AssertionError):
+            result = engine.move(operations)
+
+        self.assertEqual(result.completed, operations)
+        for op in operations:
+            self.assertFalse(os.path.exists(op.source))
+            self.assertFalse(os.path.exists(op.target + bulk_file_engine.PART_SUFFIX))
+            self.assertEqual(
+                _read(op.target), os.path.basename(op.source)[:-4].encode()
+            )
+
+        print("✅ Cross-device copy OK")
+
+    def test_exdev_rename_falls_back_to_copy(self):
+        """Test kopiowania gdy os.rename zgłasza EXDEV"""
+        operation = self._move_operations()[0]
+        with patch.object(
+            bulk_file_engine.os,
+            "rename",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            result = BulkFileEngine(max_workers=1).move([operation])
+
+        self.assertEqual(result.completed, [operation])
+        self.assertFalse(os.path.exists(operation.source))
+        self.assertEqual(_read(operation.target), b"model0")
+
+        print("✅ EXDEV fallback OK")
+
+    def test_journal_removed_after_per_file_errors(self):
+        """Test usunięcia dziennika, gdy operacja zakończyła się z błędami"""
+        operations = self._move_operations()
+        real_rename = os.rename
+
+        def rename(source, target):
+            if source == operations[4].source:
+                raise PermissionError(errno.EACCES, "Permission denied")
+            real_rename(source, target)
+
+        with patch.object(bulk_file_engine.os, "rename", side_effect=rename):
+            result = BulkFileEngine(max_workers=4, journal_dir=self.journal_dir).move(
+                operations
+            )
+
+        self.assertEqual(len(result.completed), 9)
+        self.assertEqual(
+            [entry["error_type"] for entry in result.errors], ["PERMISSION_ERROR"]
+        )
+        self.assertIsNone(result.journal_path)
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+
+        print("✅ Journal removed after errors OK")
+
+    def test_interrupted_move_resumed_from_journal(self):
+        """Test wznowienia przerwanego przenoszenia z dziennika"""
+        operations = self._move_operations()
+        result = BulkFileEngine(
+            max_workers=1,
+            journal_dir=self.journal_dir,
+            interrupt_check=self._interrupt_after(3),
+        ).move(operations)
+
+        self.assertTrue(result.interrupted)
+        self.assertEqual(result.completed, operations[:3])
+        self.assertEqual(find_pending_journals(self.journal_dir), [result.journal_path])
+
+        resumed = BulkFileEngine(max_workers=4).resume(result.journal_path)
+
+        self.assertFalse(resumed.interrupted)
+        self.assertEqual(len(resumed.completed), 7)
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+        self.assertEqual(os.listdir(self.source_dir), [])
+        self.assertEqual(len(os.listdir(self.target_dir)), 10)
+
+        print("✅ Resume OK")
+
+    def test_rollback_restores_moved_files(self):
+        """Test cofnięcia przeniesień, także niezapisanych przed awarią"""
+        operations = self._move_operations()
+        result = BulkFileEngine(
+            max_workers=1,
+            journal_dir=self.journal_dir,
+            interrupt_check=self._interrupt_after(2),
+        ).move(operations)
+        self.assertEqual(len(result.completed), 2)
+        # Przeniesienie wykonane tuż przed awarią, bez wpisu "done"
+        self._record_start(result.journal_path, 5, operations[5].source)
+        os.rename(operations[5].source, operations[5].target)
+        # Plik, którego operacja nie została rozpoczęta, zostaje w celu
+        _write(operations[6].target, b"foreign")
+        os.remove(operations[6].source)
+
+        rolled_back = BulkFileEngine(max_workers=4).rollback(result.journal_path)
+
+        self.assertEqual(len(rolled_back.completed), 3)
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+        self.assertEqual(os.listdir(self.target_dir), ["model6.zip"])
+        for path in self.sources[:6] + self.sources[7:]:
+            self.assertTrue(os.path.exists(path))
+
+        print("✅ Rollback OK")
+
+    def test_resume_recovers_move_copied_before_crash(self):
+        """Test wznowienia gdy kopia była gotowa, a źródło nieusunięte"""
+        operations = self._move_operations()[:2]
+        journal = BulkOperationJournal.create(
+            self.journal_dir, bulk_file_engine.OPERATION_MOVE, operations
+        )
+        journal.close()
+        self._record_start(journal.path, 0, operations[0].source)
+        shutil.copy2(operations[0].source, operations[0].target)
+
+        result = BulkFileEngine(max_workers=2).resume(journal.path)
+
+        self.assertEqual(len(result.completed), 2)
+        self.assertEqual(result.skipped, [])
+        for op in operations:
+            self.assertFalse(os.path.exists(op.source))
+            self.assertTrue(os.path.exists(op.target))
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+
+        print("✅ Crash recovery OK")
+
+    def test_resume_keeps_source_when_target_was_not_moved(self):
+        """Test wznowienia gdy cel niewykonanej operacji już istnieje"""
+        operations = self._move_operations()[:3]
+        result = BulkFileEngine(
+            max_workers=1,
+            journal_dir=self.journal_dir,
+            interrupt_check=self._interrupt_after(1),
+        ).move(operations)
+        self.assertEqual(result.completed, operations[:1])
+        # Inny plik o tym samym rozmiarze co źródło ("model1")
+        _write(operations[1].target, b"BBBBBB")
+
+        resumed = BulkFileEngine(max_workers=2).resume(result.journal_path)
+
+        self.assertEqual(resumed.completed, operations[2:])
+        self.assertEqual(
+            [entry["file_path"] for entry in resumed.skipped], [operations[1].source]
+        )
+        self.assertEqual(_read(operations[1].source), b"model1")
+        self.assertEqual(_read(operations[1].target), b"BBBBBB")
+
+        print("✅ Resume keeps unmoved source OK")
+
+    def test_resume_does_not_adopt_changed_target(self):
+        """Test rozpoczętego przeniesienia, którego cel nie pochodzi ze źródła"""
+        operations = self._move_operations()[:1]
+        journal = BulkOperationJournal.create(
+            self.journal_dir, bulk_file_engine.OPERATION_MOVE, operations
+        )
+        journal.close()
+        self._record_start(journal.path, 0, operations[0].source)
+        _write(operations[0].target, b"BBBBBB")
+        os.utime(operations[0].target, (0, 0))
+
+        result = BulkFileEngine(max_workers=1).resume(journal.path)
+
+        self.assertEqual(result.completed, [])
+        self.assertEqual(len(result.skipped), 1)
+        self.assertEqual(_read(operations[0].source), b"model0")
+
+        print("✅ Changed target rejected OK")
+
+    def test_delete_cannot_be_rolled_back(self):
+        """Test odrzucenia cofnięcia usuwania"""
+        operations = [FileOperation(path) for path in self.sources]
+        result = BulkFileEngine(
+            max_workers=1,
+            journal_dir=self.journal_dir,
+            interrupt_check=self._interrupt_after(1),
+        ).delete(operations)
+
+        with self.assertRaises(ValueError):
+            BulkFileEngine().rollback(result.journal_path)
+
+        print("✅ Delete rollback rejected OK")
+
+    def test_move_worker_result_format(self):
+        """Test wyniku BulkMoveWorker z aktualizacją ścieżek par"""
+        previews = []
+        for path in self.sources[:3]:
+            preview = path[:-4] + ".jpg"
+            _write(preview)
+            previews.append(preview)
+        pairs = [
+            FilePair(archive, preview, self.source_dir)
+            for archive, preview in zip(self.sources[:3], previews)
+        ]
+        _write(os.path.join(self.target_dir, "model2.jpg"), b"existing")
+
+        results = []
+        worker = BulkMoveWorker(pairs, self.target_dir)
+        worker.signals.finished.connect(results.append)
+        with patch.object(
+            bulk_workers, "get_journal_dir", return_value=self.journal_dir
+        ):
+            worker.run()
+
+        result = results[0]
+        self.assertEqual(result["moved_pairs"], pairs)
+        self.assertEqual(len(result["skipped_files"]), 1)
+        self.assertEqual(result["summary"]["successfully_moved"], 3)
+        self.assertEqual(result["summary"]["skipped"], 1)
+        self.assertIsNone(result["journal_path"])
+        self.assertEqual(
+            pairs[0].archive_path, os.path.join(self.target_dir, "model0.zip")
+        )
+        self.assertEqual(pairs[2].preview_path, previews[2])
+
+        print("✅ Move worker OK")
+
+    def test_unpaired_archives_get_unique_names(self):
+        """Test unikalnych nazw dla archiwów o tej samej nazwie"""
+        duplicate = os.path.join(self.source_dir, "other", "model0.zip")
+        _write(duplicate, b"other")
+        _write(os.path.join(self.target_dir, "model0.zip"), b"existing")
+
+        results = []
+        worker = MoveUnpairedArchivesWorker(
+            [self.sources[0], duplicate], self.target_dir
+        )
+        worker.signals.finished.connect(results.append)
+        with patch.object(
+            bulk_workers, "get_journal_dir", return_value=self.journal_dir
+        ):
+            worker.run()
+
+        self.assertEqual(
+            [os.path.basename(target) for _, target in results[0]["moved_files"]],
+            ["model0_1.zip", "model0_2.zip"],
+        )
+        self.assertEqual(_read(os.path.join(self.target_dir, "model0_2.zip")), b"other")
+
+        print("✅ Unique names OK")
+
+    def test_journal_worker_resumes_and_rolls_back(self):
+        """Test dokończenia i cofnięcia przerwanych operacji przez worker"""
+        operations = self._move_operations()
+        journal_paths = []
+        for chunk, interrupt_after in ((operations[:5], 2), (operations[5:], 1)):
+            result = BulkFileEngine(
+                max_workers=1,
+                journal_dir=self.journal_dir,
+                interrupt_check=self._interrupt_after(interrupt_after),
+            ).move(chunk)
+            journal_paths.append(result.journal_path)
+        self.assertEqual(read_journal_kind(journal_paths[0]), "move")
+
+        results = []
+        for journal_path, rollback in zip(journal_paths, (False, True)):
+            worker = BulkJournalWorker(journal_path, rollback=rollback)
+            worker.signals.finished.connect(results.append)
+            worker.run()
+
+        self.assertEqual(results[0]["summary"]["completed"], 3)
+        self.assertEqual(results[1]["summary"]["completed"], 1)
+        self.assertIsNone(results[0]["journal_path"])
+        self.assertEqual(find_pending_journals(self.journal_dir), [])
+        self.assertEqual(
+            sorted(os.listdir(self.target_dir)),
+            [f"model{i}.zip" for i in range(5)],
+        )
+        for path in self.sources[5:]:
+            self.assertTrue(os.path.exists(path))
+
+        print("✅ Journal worker OK")
+
+    def test_pending_journals_offered_at_startup(self):
+        """Test obsługi dzienników przerwanych operacji przez BulkOperationsManager"""
+        journal_paths = []
+        for chunk in (self._move_operations()[:5], self._move_operations()[5:]):
+            result = BulkFileEngine(
+                max_workers=1,
+                journal_dir=self.journal_dir,
+                interrupt_check=self._interrupt_after(1),
+            ).move(chunk)
+            journal_paths.append(result.journal_path)
+        corrupt_journal = os.path.join(self.journal_dir, "zz-corrupt.journal")
+        _write(corrupt_journal, b"{broken")
+
+        main_window = MagicMock()
+        main_window.controller.current_directory = None
+        main_window.thread_pool.start.side_effect = lambda worker: worker.run()
+        main_window.worker_manager.setup_worker_connections.side_effect = (
+            lambda worker, on_finished, on_error, show_progress: (
+                worker.signals.finished.connect(on_finished)
+            )
+        )
+        manager = BulkOperationsManager(main_window)
+        asked = []
+
+        def ask(journal_path, kind):
+            asked.append(kind)
+            return ["rollback", "later", "discard"][len(asked) - 1]
+
+        with patch.object(
+            bulk_operations_manager,
+            "find_pending_journals",
+            return_value=journal_paths + [corrupt_journal],
+        ), patch.object(manager, "_ask_journal_action", side_effect=ask):
+            manager.check_pending_bulk_operations()
+
+        self.assertEqual(asked, ["move", "move", None])
+        self.assertEqual(find_pending_journals(self.journal_dir), [journal_paths[1]])
+        self.assertEqual(os.listdir(self.target_dir), ["model5.zip"])
+        main_window._show_progress.assert_called_once()
+
+        print("✅ Pending journals at startup OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
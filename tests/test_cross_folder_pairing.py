@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+TESTY: Parowanie archiwów z podglądami z folderów previews/renders
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import touch
+from src.logic import scanner_core
+from src.logic.file_pairing import pair_across_folders
+from src.utils.path_utils import normalize_path
+
+PREVIEW_FOLDERS = ["previews", "renders"]
+
+
+class TestPairAcrossFolders(unittest.TestCase):
+    """Testy indeksu parowania między folderami"""
+
+    def test_child_and_sibling_layouts(self):
+        """Test parowania z podfolderem i folderem równoległym"""
+        archives = ["/e/models/chair.zip", "/e/models/lamp.zip", "/e/models/sofa.zip"]
+        previews = [
+            "/e/models/previews/chair.png",
+            "/e/models/previews/chair.jpg",
+            "/e/renders/lamp.jpg",
+            "/e/other/sofa.jpg",
+        ]
+
+        pairs, paired = pair_across_folders(
+            archives, previews, "/e/models", PREVIEW_FOLDERS
+        )
+
+        self.assertEqual(
+            [(p.archive_path, p.preview_path) for p in pairs],
+            [
+                ("/e/models/chair.zip", "/e/models/previews/chair.jpg"),
+                ("/e/models/lamp.zip", "/e/renders/lamp.jpg"),
+            ],
+        )
+        self.assertNotIn("/e/models/sofa.zip", paired)
+        self.assertEqual(pair_across_folders(archives, previews, "/e", []), ([], set()))
+
+        print("✅ Cross-folder layouts OK")
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestCrossFolderScan(unittest.TestCase):
+    """Testy parowania między folderami podczas skanowania"""
+
+    def setUp(self):
+        self.models_dir = normalize_path(os.path.join(self.temp_dir, "models"))
+        touch(os.path.join(self.models_dir, "chair.zip"))
+        touch(os.path.join(self.models_dir, "table.zip"))
+        touch(os.path.join(self.models_dir, "table.jpg"))
+        touch(os.path.join(self.temp_dir, "previews", "chair.jpg"))
+
+    def _scan(self):
+        return scanner_core.scan_folder_for_pairs(
+            self.models_dir, max_depth=0, force_refresh_cache=True
+        )
+
+    def test_sibling_previews_paired_in_flat_scan(self):
+        """Test parowania z ../previews przy skanowaniu bez podfolderów"""
+        pairs, unpaired_archives, unpaired_previews, _ = self._scan()
+
+        previews = {p.get_base_name(): p.get_preview_path() for p in pairs}
+        self.assertEqual(
+            previews["chair"],
+            normalize_path(os.path.join(self.temp_dir, "previews", "chair.jpg")),
+        )
+        self.assertEqual(unpaired_archives, [])
+        self.assertEqual(unpaired_previews, [])
+
+        # Usunięty podgląd nie może przetrwać w inkrementalnym łataniu par
+        os.remove(os.path.join(self.temp_dir, "previews", "chair.jpg"))
+        pairs, unpaired_archives, _, _ = self._scan()
+        self.assertEqual([p.get_base_name() for p in pairs], ["table"])
+        self.assertEqual(len(unpaired_archives), 1)
+
+        print("✅ Cross-folder scan OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+TESTY: Obserwator folderu roboczego i delty skanowania
+"""
+
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from conftest import touch
+from src.logic import scanner_core
+from src.logic.scan_delta import compute_scan_delta
+from src.models.file_pair import FilePair
+from src.services.directory_watch_service import DirectoryWatchService
+from src.ui.widgets.unpaired_previews_grid import UnpairedPreviewsModel
+from src.utils.path_utils import normalize_path
+
+
+class TestScanDelta(unittest.TestCase):
+    """Testy wyliczania delty skanowania"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_delta_keeps_unchanged_pairs(self):
+        """Test delty: niezmienione pary pozostają starymi obiektami"""
+        chair = FilePair("/w/chair.zip", "/w/chair.jpg", "/w")
+        lamp = FilePair("/w/lamp.zip", "/w/lamp.jpg", "/w")
+        new_chair = FilePair("/w/chair.zip", "/w/chair.jpg", "/w")
+        sofa = FilePair("/w/sofa.zip", "/w/sofa.png", "/w")
+
+        delta = compute_scan_delta(
+            [chair, lamp], ["/w/a.rar"], ["/w/sofa.png"],
+            [new_chair, sofa], ["/w/a.rar", "/w/lamp.zip"], [],
+        )
+
+        self.assertEqual(delta.added_pairs, [sofa])
+        self.assertEqual(delta.removed_pairs, [lamp])
+        self.assertEqual(delta.added_unpaired_archives, ["/w/lamp.zip"])
+        self.assertEqual(delta.removed_unpaired_previews, ["/w/sofa.png"])
+        self.assertTrue(compute_scan_delta([chair], [], [], [new_chair], [], []).is_empty())
+
+        print("✅ Scan delta OK")
+
+    def test_previews_model_patched_in_place(self):
+        """Test łatania modelu podglądów bez resetu"""
+        model = UnpairedPreviewsModel()
+        model.set_paths(["/w/a.jpg", "/w/c.jpg"])
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+
+        model.apply_delta(["/w/B.jpg", "/w/d.jpg"], ["/w/c.jpg"])
+
+        self.assertEqual(model.paths(), ["/w/a.jpg", "/w/B.jpg", "/w/d.jpg"])
+        self.assertEqual(model.row_for_path("/w/d.jpg"), 2)
+        self.assertEqual(resets, [])
+
+        print("✅ Previews model delta OK")
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestDirectoryWatchService(unittest.TestCase):
+    """Testy obserwatora folderu"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.root = normalize_path(self.temp_dir)
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_burst_of_changes_coalesced_into_one_rescan(self):
+        """Test połączenia serii zmian w jedno skanowanie"""
+        service = DirectoryWatchService(debounce_ms=200)
+        self.addCleanup(service.stop)
+        results = []
+        service.directory_rescanned.connect(
+            lambda directory, result: results.append((directory, result))
+        )
+        # Pierwsze skanowanie (wynik bazowy) przed startem obserwacji
+        scanner_core.scan_folder_for_pairs(self.root, max_depth=0)
+        service.watch(self.root)
+
+        touch(os.path.join(self.temp_dir, "chair.zip"))
+        touch(os.path.join(self.temp_dir, "chair.jpg"))
+        touch(os.path.join(self.temp_dir, "lamp.rar"))
+
+        self.assertTrue(self._wait_for(lambda: results))
+        self._wait_for(lambda: len(results) > 1, timeout=0.5)
+        self.assertEqual(len(results), 1)
+
+        directory, (pairs, unpaired_archives, _, _) = results[0]
+        self.assertEqual(directory, self.root)
+        self.assertEqual([p.get_base_name() for p in pairs], ["chair"])
+        self.assertEqual([os.path.basename(a) for a in unpaired_archives], ["lamp.rar"])
+
+        print("✅ Coalesced rescan OK")
+
+    def test_root_change_keeps_subfolder_pairs(self):
+        """Test ponownego skanowania z głębokością skanowania galerii"""
+        sub_dir = os.path.join(self.temp_dir, "sub")
+        os.makedirs(sub_dir)
+        touch(os.path.join(self.temp_dir, "chair.zip"))
+        touch(os.path.join(self.temp_dir, "chair.jpg"))
+        touch(os.path.join(sub_dir, "lamp.zip"))
+        touch(os.path.join(sub_dir, "lamp.jpg"))
+        old_pairs, old_archives, old_previews, _ = scanner_core.scan_folder_for_pairs(
+            self.root, max_depth=-1
+        )
+        self.assertEqual(len(old_pairs), 2)
+
+        service = DirectoryWatchService(debounce_ms=100)
+        self.addCleanup(service.stop)
+        results = []
+        service.directory_rescanned.connect(
+            lambda directory, result: results.append(result)
+        )
+        service.watch(self.root, max_depth=-1)
+        self.assertIn(normalize_path(sub_dir), service._watcher.directories())
+
+        touch(os.path.join(self.temp_dir, "sofa.rar"))
+        self.assertTrue(self._wait_for(lambda: results))
+
+        new_pairs, new_archives, new_previews, _ = results[0]
+        delta = compute_scan_delta(
+            old_pairs, old_archives, old_previews,
+            new_pairs, new_archives, new_previews,
+        )
+        self.assertEqual(delta.removed_pairs, [])
+        self.assertEqual(delta.added_pairs, [])
+        self.assertEqual(
+            [os.path.basename(a) for a in delta.added_unpaired_archives], ["sofa.rar"]
+        )
+
+        # Zmiana w podfolderze również jest wykrywana
+        results.clear()
+        touch(os.path.join(sub_dir, "desk.zip"))
+        self.assertTrue(self._wait_for(lambda: results))
+        self.assertIn("desk.zip", [os.path.basename(a) for a in results[0][1]])
+
+        print("✅ Recursive rescan OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
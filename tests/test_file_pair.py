@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+TESTY: FilePair - kompaktowy model pary plików
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.file_pair import FilePair
+
+
+class TestFilePair(unittest.TestCase):
+    """Testy dla FilePair"""
+
+    def test_no_instance_dict(self):
+        """Test braku __dict__ (slots) i blokady literówek w atrybutach"""
+        pair = FilePair("/work/a/model.zip", "/work/a/model.jpg", "/work")
+
+        self.assertFalse(hasattr(pair, "__dict__"))
+        with self.assertRaises(AttributeError):
+            pair.star_rating = 3
+
+        print("✅ Slots OK")
+
+    def test_paths_are_normalized(self):
+        """Test normalizacji ścieżek niebędących w postaci kanonicznej"""
+        pair = FilePair("/work//a/./sub/../model.zip", "/work/a/model.jpg", "/work/")
+
+        self.assertEqual(pair.get_archive_path(), "/work/a/model.zip")
+        self.assertEqual(pair.working_directory, "/work")
+        self.assertEqual(pair.get_base_name(), "model")
+        with self.assertRaises(ValueError):
+            FilePair("relative/model.zip", None, "/work")
+
+        print("✅ Path normalization OK")
+
+    def test_relative_paths_follow_path_changes(self):
+        """Test unieważnienia buforowanych ścieżek względnych"""
+        pair = FilePair("/work/a/model.zip", "/work/a/model.jpg", "/work")
+        self.assertEqual(pair.get_relative_archive_path(), "a/model.zip")
+        self.assertEqual(pair.get_relative_preview_path(), "a/model.jpg")
+
+        pair.archive_path = "/work/b/model.zip"
+        pair.preview_path = None
+
+        self.assertEqual(pair.get_relative_archive_path(), "b/model.zip")
+        self.assertIsNone(pair.get_relative_preview_path())
+
+        pair.working_directory = "/work/b"
+        self.assertEqual(pair.get_relative_archive_path(), "model.zip")
+
+        print("✅ Relative path cache OK")
+
+    def test_color_tags_are_shared(self):
+        """Test współdzielenia obiektów tagów kolorów"""
+        first = FilePair("/work/one.zip", None, "/work")
+        second = FilePair("/work/two.zip", None, "/work")
+        first.set_color_tag("".join(["#FF", "0000"]))
+        second.color_tag = "".join(["#FF00", "00"])
+
+        self.assertIs(first.get_color_tag(), second.get_color_tag())
+        self.assertIs(first.working_directory, second.working_directory)
+
+        print("✅ Shared strings OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
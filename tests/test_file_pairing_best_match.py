@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+TESTY: Strategia best_match - indeks prefiksów nazw podglądów
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import touch
+from src.logic import scanner_core
+from src.logic.file_pairing import _PreviewNameIndex, create_file_pairs
+from src.models.file_record import FileRecord, get_extension_id
+from src.utils.path_utils import normalize_path
+
+
+def _records(paths, mtime=1.0):
+    return {path: FileRecord(path, 1, mtime, get_extension_id(path)) for path in paths}
+
+
+class TestBestMatchPairing(unittest.TestCase):
+    """Testy parowania best_match"""
+
+    def test_partial_matches_in_both_directions(self):
+        """Test dopasowań prefiksowych w obu kierunkach, od najdłuższych"""
+        index = _PreviewNameIndex(
+            ["/d/chair.jpg", "/d/chair_oak.png", "/d/chair_oak_big.jpg", "/d/table.jpg"]
+        )
+
+        self.assertEqual(
+            index.partial_matches("chair_oak_big_x", 20),
+            ["chair_oak_big", "chair_oak", "chair"],
+        )
+        self.assertEqual(
+            index.partial_matches("chair_o", 20), ["chair_oak_big", "chair_oak", "chair"]
+        )
+        self.assertEqual(index.partial_matches("chair_o", 1), ["chair_oak_big"])
+        self.assertEqual(index.partial_matches("lamp", 20), [])
+
+        print("✅ Partial prefix matches OK")
+
+    def test_best_match_pairs(self):
+        """Test wyboru podglądu: dokładna nazwa, potem prefiks i rozszerzenie"""
+        files = [
+            "/d/chair.zip",
+            "/d/chair.png",
+            "/d/chair.jpg",
+            "/d/sofa_v2.rar",
+            "/d/sofa.png",
+            "/d/lamp.7z",
+        ]
+        pairs, processed = create_file_pairs(
+            {"/d": files}, "/d", "best_match", file_records=_records(files)
+        )
+
+        self.assertEqual(
+            [(p.archive_path, p.preview_path) for p in pairs],
+            [("/d/chair.zip", "/d/chair.jpg"), ("/d/sofa_v2.rar", "/d/sofa.png")],
+        )
+        self.assertNotIn("/d/lamp.7z", processed)
+
+        print("✅ best_match pairs OK")
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestBestMatchScan(unittest.TestCase):
+    """Testy best_match przez scan_folder_for_pairs"""
+
+    def setUp(self):
+        self.root = normalize_path(self.temp_dir)
+        for name in (
+            "chair.zip",
+            "chair_v2.zip",
+            "chair_old.zip",
+            "c.zip",
+            "chair.jpg",
+            "lamp.7z",
+        ):
+            touch(os.path.join(self.root, name))
+
+    def _scan(self):
+        return scanner_core.scan_folder_for_pairs(
+            self.root, pair_strategy="best_match", force_refresh_cache=True
+        )
+
+    def _pair_names(self, pairs):
+        return sorted(
+            (os.path.basename(p.archive_path), os.path.basename(p.preview_path))
+            for p in pairs
+        )
+
+    def test_pairs_within_map_key(self):
+        """Test parowania w obrębie klucza mapy - podgląd sparowany raz"""
+        pairs, unpaired_archives, unpaired_previews, _ = self._scan()
+
+        self.assertEqual(self._pair_names(pairs), [("chair.zip", "chair.jpg")])
+        previews = [p.preview_path for p in pairs]
+        self.assertEqual(len(previews), len(set(previews)))
+        self.assertEqual(
+            sorted(os.path.basename(p) for p in unpaired_archives),
+            ["c.zip", "chair_old.zip", "chair_v2.zip", "lamp.7z"],
+        )
+        self.assertEqual(unpaired_previews, [])
+
+        print("✅ best_match scan OK")
+
+    def test_rescan_pairs_new_preview(self):
+        """Test sparowania archiwum po dodaniu podglądu o tej samej nazwie"""
+        first_pairs = self._scan()[0]
+        touch(os.path.join(self.root, "chair_v2.jpg"))
+
+        pairs = self._scan()[0]
+
+        self.assertEqual(
+            self._pair_names(pairs),
+            [("chair.zip", "chair.jpg"), ("chair_v2.zip", "chair_v2.jpg")],
+        )
+        self.assertEqual(len(first_pairs), 1)
+
+        print("✅ best_match rescan OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
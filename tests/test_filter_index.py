@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+TESTY: FilePairFilterIndex - indeksowane filtrowanie par plików
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logic.filter_logic import (
+    COLOR_FILTER_ALL,
+    COLOR_FILTER_NONE,
+    clear_filter_index,
+    filter_appended_file_pairs,
+    filter_file_pairs,
+    get_filter_index,
+)
+from src.models import file_pair as file_pair_module
+from src.models.file_pair import FilePair
+from src.utils.path_utils import normalize_path
+
+
+def _color_matches(pair_color, color):
+    """Dopasowanie koloru para po parze (niewrażliwe na wielkość liter)."""
+    if color == COLOR_FILTER_ALL:
+        return True
+    if color == COLOR_FILTER_NONE:
+        return not pair_color
+    return pair_color is not None and pair_color.strip().lower() == color.lower()
+
+
+def _reference_filter(pairs, min_stars, color, prefix):
+    """Filtrowanie para po parze - semantyka sprzed wprowadzenia indeksu."""
+    prefix = normalize_path(prefix) if prefix else None
+    return [
+        pair
+        for pair in pairs
+        if (not prefix or pair.get_archive_path().startswith(prefix))
+        and not (min_stars > 0 and pair.get_stars() < min_stars)
+        and _color_matches(pair.get_color_tag(), color)
+    ]
+
+
+class TestFilePairFilterIndex(unittest.TestCase):
+    """Testy dla FilePairFilterIndex"""
+
+    def setUp(self):
+        colors = [None, "", "#FF0000", "#ff0000 ", "#00FF00"]
+        self.pairs = []
+        for i in range(200):
+            folder = ["a", "a/sub", "ab", "b"][i % 4]
+            pair = FilePair(f"/work/{folder}/model_{i}.zip", None, "/work")
+            pair.set_stars(i % 6)
+            pair.set_color_tag(colors[i % len(colors)])
+            self.pairs.append(pair)
+
+    def test_parity_with_reference(self):
+        """Test zgodności wyników z filtrowaniem para po parze"""
+        for min_stars in (0, 1, 3, 5):
+            for color in ("ALL", COLOR_FILTER_NONE, "#FF0000", "#00ff00", "#0000FF"):
+                for prefix in (None, "/work/a", "/work/a/", "/work/b", "/other"):
+                    criteria = {
+                        "min_stars": min_stars,
+                        "required_color_tag": color,
+                        "path_prefix": prefix,
+                    }
+                    self.assertEqual(
+                        filter_file_pairs(self.pairs, criteria),
+                        _reference_filter(self.pairs, min_stars, color, prefix),
+                        criteria,
+                    )
+
+        print("✅ Reference parity OK")
+
+    def test_metadata_changes_are_picked_up(self):
+        """Test przyrostowej aktualizacji indeksu po zmianie metadanych"""
+        index = get_filter_index(self.pairs)
+        criteria = {"min_stars": 5, "required_color_tag": "#ABCDEF"}
+        self.assertEqual(filter_file_pairs(self.pairs, criteria), [])
+
+        self.pairs[7].set_stars(5)
+        self.pairs[7].set_color_tag("#abcdef")
+        self.pairs[8].archive_path = "/elsewhere/model_8.zip"
+
+        self.assertEqual(filter_file_pairs(self.pairs, criteria), [self.pairs[7]])
+        self.assertEqual(
+            filter_file_pairs(self.pairs, {"path_prefix": "/elsewhere"}),
+            [self.pairs[8]],
+        )
+        self.assertIs(get_filter_index(self.pairs), index)
+
+        print("✅ Incremental update OK")
+
+    def test_sync_visits_only_changed_pairs(self):
+        """Test aktualizacji indeksu tylko dla par z dziennika zmian"""
+        criteria = {"min_stars": 5}
+        filter_file_pairs(self.pairs, criteria)
+        self.pairs[3].set_stars(5)
+        FilePair("/work/a/other.zip", None, "/work").set_stars(5)
+
+        visited = []
+        original_get_stars = FilePair.get_stars
+
+        def counting_get_stars(pair):
+            visited.append(pair)
+            return original_get_stars(pair)
+
+        with patch.object(FilePair, "get_stars", counting_get_stars):
+            result = filter_file_pairs(self.pairs, criteria)
+
+        self.assertEqual(visited, [self.pairs[3]])
+        self.assertEqual(result, _reference_filter(self.pairs, 5, "ALL", None))
+
+        print("✅ Dirty pairs sync OK")
+
+    def test_sync_after_change_log_overflow(self):
+        """Test pełnej aktualizacji, gdy dziennik zmian nie sięga rewizji"""
+        criteria = {"min_stars": 5, "required_color_tag": "#ABCDEF"}
+        filter_file_pairs(self.pairs, criteria)
+
+        with patch.object(file_pair_module, "MAX_TRACKED_METADATA_CHANGES", 1):
+            self.pairs[7].set_stars(5)
+            self.pairs[7].set_color_tag("#abcdef")
+            self.pairs[9].set_stars(5)
+
+        self.assertEqual(filter_file_pairs(self.pairs, criteria), [self.pairs[7]])
+        self.assertEqual(
+            filter_file_pairs(self.pairs, {"min_stars": 5}),
+            _reference_filter(self.pairs, 5, "ALL", None),
+        )
+
+        print("✅ Change log overflow OK")
+
+    def test_index_matches_list_identity(self):
+        """Test dopasowania indeksu po tożsamości listy, długości i ostatniej parze"""
+        index = get_filter_index(self.pairs)
+
+        self.assertIsNot(get_filter_index(list(self.pairs)), index)
+        index = get_filter_index(self.pairs)
+        self.pairs[-1] = FilePair("/work/b/replaced.zip", None, "/work")
+        self.assertIsNot(get_filter_index(self.pairs), index)
+
+        print("✅ Index identity match OK")
+
+    def test_list_changes_rebuild_index(self):
+        """Test przebudowy indeksu po zmianie składu listy"""
+        index = get_filter_index(self.pairs)
+        extra = FilePair("/work/a/extra.zip", None, "/work")
+        extra.set_stars(5)
+        self.pairs.insert(0, extra)
+
+        result = filter_file_pairs(self.pairs, {"min_stars": 5})
+
+        self.assertIsNot(get_filter_index(self.pairs), index)
+        self.assertIs(result[0], extra)
+        self.assertEqual(result, _reference_filter(self.pairs, 5, "ALL", None))
+
+        print("✅ Index rebuild OK")
+
+    def test_appended_pairs_extend_index(self):
+        """Test filtrowania partii dopisanych par bez przebudowy indeksu"""
+        pairs = self.pairs[:120]
+        criteria = {"min_stars": 3, "path_prefix": "/work/a"}
+        filter_file_pairs(pairs, criteria)
+        index = get_filter_index(pairs)
+
+        for end in (150, 200):
+            start = len(pairs)
+            pairs.extend(self.pairs[start:end])
+            for batch_criteria in (criteria, {"required_color_tag": "#FF0000"}):
+                self.assertEqual(
+                    filter_appended_file_pairs(pairs, end - start, batch_criteria),
+                    _reference_filter(
+                        self.pairs[start:end],
+                        batch_criteria.get("min_stars", 0),
+                        batch_criteria.get("required_color_tag", "ALL"),
+                        batch_criteria.get("path_prefix"),
+                    ),
+                )
+
+        self.assertIs(get_filter_index(pairs), index)
+        self.assertEqual(
+            filter_file_pairs(pairs, criteria),
+            _reference_filter(pairs, 3, "ALL", "/work/a"),
+        )
+
+        print("✅ Appended pairs OK")
+
+    def test_clear_releases_index(self):
+        """Test zwolnienia indeksu (i par poprzedniego skanowania)"""
+        index = get_filter_index(self.pairs)
+        clear_filter_index()
+
+        self.assertIsNot(get_filter_index(self.pairs), index)
+
+        print("✅ Index clear OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
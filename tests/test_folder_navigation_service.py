@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+TESTY: FolderNavigationService - skanowanie folderów w tle przy nawigacji
+"""
+
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from conftest import touch
+from src.services.folder_navigation_service import FolderNavigationService
+from src.utils.path_utils import normalize_path
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestFolderNavigationService(unittest.TestCase):
+    """Testy nawigacji po folderach"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.folder_a = normalize_path(os.path.join(self.temp_dir, "a"))
+        self.folder_b = normalize_path(os.path.join(self.temp_dir, "b"))
+        touch(os.path.join(self.folder_a, "chair.zip"))
+        touch(os.path.join(self.folder_a, "chair.jpg"))
+        touch(os.path.join(self.folder_b, "lamp.rar"))
+        touch(os.path.join(self.folder_b, "lamp.png"))
+        touch(os.path.join(self.folder_b, "sofa.7z"))
+
+        self.service = FolderNavigationService()
+        self.cached = []
+        self.finished = []
+        self.service.cached_result_ready.connect(
+            lambda directory, result: self.cached.append((directory, result))
+        )
+        self.service.scan_finished.connect(
+            lambda directory, result: self.finished.append((directory, result))
+        )
+
+    def tearDown(self):
+        self.service.cancel()
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_scan_runs_in_background(self):
+        """Test skanowania w tle bez wyniku z cache przy pierwszej wizycie"""
+        self.assertFalse(self.service.navigate(self.folder_a))
+        self.assertTrue(self.service.is_scanning())
+
+        self.assertTrue(self._wait_for(lambda: self.finished))
+        directory, (pairs, _, _, _) = self.finished[0]
+        self.assertEqual(directory, self.folder_a)
+        self.assertEqual([p.get_base_name() for p in pairs], ["chair"])
+        self.assertEqual(self.cached, [])
+        self.assertFalse(self.service.is_scanning())
+
+        print("✅ Background scan OK")
+
+    def test_cached_result_shown_before_revalidation(self):
+        """Test wyniku z cache emitowanego od razu (stale-while-revalidate)"""
+        self.service.navigate(self.folder_a)
+        self.assertTrue(self._wait_for(lambda: self.finished))
+        first_pairs = self.finished[0][1][0]
+        self.finished.clear()
+
+        self.assertTrue(self.service.navigate(self.folder_a))
+        self.assertEqual(len(self.cached), 1)
+        self.assertIs(self.cached[0][1][0][0], first_pairs[0])
+
+        self.assertTrue(self._wait_for(lambda: self.finished))
+        self.assertIs(self.finished[0][1][0][0], first_pairs[0])
+
+        print("✅ Stale-while-revalidate OK")
+
+    def test_uncached_folder_streams_pairs(self):
+        """Test partii par przed wynikiem skanowania folderu bez cache"""
+        events = []
+        self.service.pairs_batch_ready.connect(
+            lambda directory, batch: events.append(("batch", directory, batch))
+        )
+        self.service.scan_finished.connect(
+            lambda directory, result: events.append(("finished", directory, result))
+        )
+
+        self.assertFalse(self.service.navigate(self.folder_a))
+        self.assertTrue(self._wait_for(lambda: self.finished))
+
+        self.assertEqual([event[0] for event in events], ["batch", "finished"])
+        _, directory, batch = events[0]
+        self.assertEqual(directory, self.folder_a)
+        self.assertEqual([p.get_base_name() for p in batch], ["chair"])
+        self.assertIs(batch[0], events[1][2][0][0])
+
+        # Wynik z cache jest już pokazany - bez strumieniowania
+        events.clear()
+        self.finished.clear()
+        self.assertTrue(self.service.navigate(self.folder_a))
+        self.assertTrue(self._wait_for(lambda: self.finished))
+        self.assertEqual([event[0] for event in events], ["finished"])
+
+        print("✅ Streamed navigation OK")
+
+    def test_new_navigation_cancels_previous(self):
+        """Test pominięcia wyniku skanowania poprzednio klikniętego folderu"""
+        self.service.navigate(self.folder_a)
+        self.service.navigate(self.folder_b)
+
+        self.assertTrue(self._wait_for(lambda: self.finished))
+        self._wait_for(lambda: len(self.finished) > 1, timeout=0.3)
+
+        self.assertEqual([d for d, _ in self.finished], [self.folder_b])
+        pairs, unpaired_archives, _, _ = self.finished[0][1]
+        self.assertEqual([p.get_base_name() for p in pairs], ["lamp"])
+        self.assertEqual(len(unpaired_archives), 1)
+
+        print("✅ Cancellation OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+TESTY: Wspólny silnik statystyk drzewa katalogów
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logic.folder_stats_engine import FolderStatsEngine
+from src.ui.directory_tree.data_classes import FolderStatistics
+from src.utils.path_utils import normalize_path
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+class TestFolderStatsEngine(unittest.TestCase):
+    """Testy silnika statystyk"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = normalize_path(self.temp_dir)
+        _write(os.path.join(self.root, "chair.zip"), 100)
+        _write(os.path.join(self.root, "chair.jpg"), 10)
+        _write(os.path.join(self.root, "a", "lamp.rar"), 200)
+        _write(os.path.join(self.root, "a", "lamp.png"), 20)
+        _write(os.path.join(self.root, "a", "b", "notes.txt"), 5)
+        _write(os.path.join(self.root, ".app_metadata", "cache.json"), 1000)
+        self.engine = FolderStatsEngine(max_workers=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_tree_aggregated_bottom_up(self):
+        """Test agregacji rozmiarów, plików i par od liści w górę"""
+        stats = self.engine.scan(self.root)
+
+        root_stats = stats[self.root]
+        self.assertEqual((root_stats.size, root_stats.files, root_stats.pairs), (110, 2, 1))
+        self.assertEqual(
+            (root_stats.total_size, root_stats.total_files, root_stats.total_pairs),
+            (335, 5, 2),
+        )
+        self.assertEqual(stats[self.root + "/a"].total_size, 225)
+        self.assertEqual(stats[self.root + "/a/b"].total_files, 1)
+        self.assertNotIn(self.root + "/.app_metadata", stats)
+
+        folder_stats = FolderStatistics.from_directory_stats(root_stats)
+        self.assertEqual((folder_stats.pairs_count, folder_stats.total_pairs), (1, 2))
+        self.assertEqual(folder_stats.total_files, 5)
+
+        print("✅ Bottom-up aggregation OK")
+
+    def test_unchanged_directories_not_listed_again(self):
+        """Test inkrementalnego przeliczenia na podstawie mtime katalogów"""
+        self.engine.scan(self.root)
+
+        _write(os.path.join(self.root, "a", "b", "sofa.zip"), 50)
+        with patch("src.logic.folder_stats_engine.os.scandir", wraps=os.scandir) as scandir:
+            stats = self.engine.scan(self.root)
+
+        listed = [normalize_path(call.args[0]) for call in scandir.call_args_list]
+        self.assertEqual(listed, [self.root + "/a/b"])
+        self.assertEqual(stats[self.root].total_size, 385)
+
+        shutil.rmtree(os.path.join(self.root, "a", "b"))
+        self.engine.scan(self.root)
+        self.assertIsNone(self.engine.get_stats(self.root + "/a/b"))
+        self.assertEqual(self.engine.get_total_size(self.root + "/a"), 220)
+
+        print("✅ Incremental stats OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+TESTY: GalleryItemView - galeria w trybie QListView + delegat
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QContextMenuEvent
+from PyQt6.QtWidgets import QApplication, QGridLayout, QScrollArea, QWidget
+
+from src.config.config_core import AppConfig
+from src.models.file_pair import FilePair
+from src.models.special_folder import SpecialFolder
+from src.ui.gallery_manager import GalleryManager
+from src.ui.widgets.gallery_item_view import (
+    GalleryItemRole,
+    GalleryItemView,
+    GallerySelectedRole,
+)
+
+
+def _gallery_config(view_mode):
+    config = AppConfig.get_instance()._config_properties._config
+    return patch.dict(config, {"gallery_view_mode": view_mode})
+
+
+class TestGalleryItemView(unittest.TestCase):
+    """Testy dla GalleryItemView i trybu item_view w GalleryManager"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.pairs = [
+            FilePair(f"/work/model_{i:06d}.zip", f"/work/model_{i:06d}.jpg", "/work")
+            for i in range(100000)
+        ]
+        self.folders = [SpecialFolder("tex", "/work/tex", is_virtual=True)]
+
+    def _create_manager(self):
+        main_window = MagicMock()
+        main_window.controller.selection_manager.selected_tiles = set()
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        tiles_container = QWidget()
+        scroll_area.setWidget(tiles_container)
+        with _gallery_config("item_view"):
+            manager = GalleryManager(
+                main_window, tiles_container, QGridLayout(tiles_container), scroll_area
+            )
+        self.addCleanup(scroll_area.deleteLater)
+        return manager, main_window
+
+    def test_large_gallery_without_tile_widgets(self):
+        """Test wyświetlenia 100k par bez tworzenia kafelków i miniatur"""
+        manager, _ = self._create_manager()
+        self.assertIs(manager.scroll_area.widget(), manager.item_view)
+
+        manager.special_folders_list = self.folders
+        manager.file_pairs_list = self.pairs
+        model = manager.item_view.gallery_model
+        with patch.object(model, "_start_pending_requests") as start_requests:
+            started = time.perf_counter()
+            manager.update_gallery_view()
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(model.rowCount(), len(self.pairs) + 1)
+        self.assertIs(model.index(0).data(GalleryItemRole), self.folders[0])
+        self.assertIs(model.index(1).data(GalleryItemRole), self.pairs[0])
+        self.assertIsNone(manager.create_tile_widget_for_pair(self.pairs[0], None))
+        self.assertEqual(manager.gallery_tile_widgets, {})
+        self.assertFalse(model._requested)
+        start_requests.assert_not_called()
+
+        print("✅ Large gallery OK")
+
+    def test_selection_and_stars_use_main_window_handlers(self):
+        """Test selekcji i gwiazdek przez te same handlery co kafelki"""
+        manager, main_window = self._create_manager()
+        selected = main_window.controller.selection_manager.selected_tiles
+        main_window._handle_tile_selection_changed.side_effect = (
+            lambda pair, is_selected: selected.add(pair)
+            if is_selected
+            else selected.discard(pair)
+        )
+        manager.file_pairs_list = self.pairs[:10]
+        manager.update_gallery_view()
+        view = manager.item_view
+        model = view.gallery_model
+
+        view.delegate.selection_toggled.emit(self.pairs[2])
+        self.assertTrue(model.index(2).data(GallerySelectedRole))
+        view.delegate.selection_toggled.emit(self.pairs[2])
+        self.assertFalse(model.index(2).data(GallerySelectedRole))
+
+        self.pairs[4].set_stars(3)
+        view.delegate.star_clicked.emit(self.pairs[4], 2)
+        view.delegate.star_clicked.emit(self.pairs[5], 4)
+        main_window._handle_stars_changed.assert_any_call(self.pairs[4], 0)
+        main_window._handle_stars_changed.assert_any_call(self.pairs[5], 5)
+
+        print("✅ Selection and stars OK")
+
+    def test_streamed_pairs_are_appended_without_reset(self):
+        """Test dokładania partii skanowania do modelu bez resetu i pełnego filtra"""
+        manager, _ = self._create_manager()
+        for i, pair in enumerate(self.pairs[:3000]):
+            pair.set_stars(i % 5)
+        criteria = {"min_stars": 2}
+        all_pairs = self.pairs[:1000]
+        manager.apply_filters_and_update_view(all_pairs, criteria)
+        model = manager.item_view.gallery_model
+        self.assertEqual(model.row_for_archive_path(all_pairs[2].archive_path), 0)
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+
+        with patch(
+            "src.controllers.gallery_controller.filter_file_pairs"
+        ) as full_filter:
+            for end in (2000, 3000):
+                appended_count = end - len(all_pairs)
+                all_pairs.extend(self.pairs[len(all_pairs) : end])
+                manager.append_filtered_pairs(all_pairs, appended_count, criteria)
+
+        full_filter.assert_not_called()
+        self.assertFalse(resets)
+        expected = [pair for pair in all_pairs if pair.get_stars() >= 2]
+        self.assertEqual(manager.file_pairs_list, expected)
+        self.assertEqual(model.rowCount(), len(expected))
+        self.assertIs(model.index(len(expected) - 1).data(GalleryItemRole), expected[-1])
+        self.assertEqual(
+            model.row_for_archive_path(expected[-1].archive_path), len(expected) - 1
+        )
+
+        print("✅ Streamed append OK")
+
+    def test_context_menu_for_pair_under_cursor(self):
+        """Test żądania menu kontekstowego dla pary pod kursorem"""
+        view = GalleryItemView()
+        view.resize(800, 600)
+        view.gallery_model.set_items([], self.pairs[:20])
+        requests = []
+        view.tile_context_menu_requested.connect(
+            lambda pair, widget, position: requests.append((pair, widget, position))
+        )
+
+        position = view.visualRect(view.gallery_model.index(1)).center()
+        view.contextMenuEvent(
+            QContextMenuEvent(QContextMenuEvent.Reason.Mouse, position)
+        )
+        view.contextMenuEvent(
+            QContextMenuEvent(QContextMenuEvent.Reason.Mouse, QPoint(-5, -5))
+        )
+
+        self.assertEqual(len(requests), 1)
+        self.assertIs(requests[0][0], self.pairs[1])
+        self.assertIs(requests[0][1], view.viewport())
+        self.assertEqual(requests[0][2], position)
+        view.deleteLater()
+
+        print("✅ Context menu OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+TESTY: Pula kafelków GalleryManager - recykling FileTileWidget przy przewijaniu
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication, QGridLayout, QScrollArea, QVBoxLayout, QWidget
+
+from src.models.file_pair import FilePair
+from src.ui.gallery_manager import GalleryManager
+from src.ui.widgets.tile_resource_manager import get_resource_manager
+
+
+class TestGalleryTilePool(unittest.TestCase):
+    """Testy puli kafelków galerii"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.main_window = MagicMock()
+        self.selected = set()
+        self.main_window.controller.selection_manager.selected_tiles = self.selected
+
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        scroll_content = QWidget()
+        tiles_container = QWidget()
+        QVBoxLayout(scroll_content).addWidget(tiles_container)
+        self.scroll_area.setWidget(scroll_content)
+        tiles_layout = QGridLayout(tiles_container)
+        tiles_layout.setSpacing(10)
+        self.scroll_area.resize(800, 600)
+        self.scroll_area.show()
+
+        self.manager = GalleryManager(
+            self.main_window, tiles_container, tiles_layout, self.scroll_area
+        )
+        self.manager.file_pairs_list = [
+            FilePair(f"/work/model_{i:05d}.zip", None, "/work") for i in range(3000)
+        ]
+        self.manager.update_gallery_view()
+        self.app.processEvents()
+
+    def tearDown(self):
+        self.manager.clear_gallery()
+        self.scroll_area.close()
+        self.scroll_area.deleteLater()
+
+    def _scroll_to(self, fraction):
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.setValue(int(scroll_bar.maximum() * fraction))
+        self.manager._update_visible_tiles()
+
+    def test_widget_count_stays_flat_while_scrolling(self):
+        """Test stałej liczby widgetów przy przewijaniu całej galerii"""
+        pool_limit = get_resource_manager().get_tile_pool_limit(
+            self.manager._tiles_per_screen
+        )
+        seen_tiles = set()
+        peak_bound = 0
+        for step in range(41):
+            self._scroll_to(step / 40)
+            bound = len(self.manager.gallery_tile_widgets)
+            peak_bound = max(peak_bound, bound)
+            self.assertLessEqual(len(self.manager._tile_pool), pool_limit)
+            seen_tiles.update(map(id, self.manager.gallery_tile_widgets.values()))
+            seen_tiles.update(map(id, self.manager._tile_pool))
+
+        self.assertGreater(peak_bound, 0)
+        self.assertLess(peak_bound, 200)
+        # Przewinięcie 3000 par nie tworzy kafelka na każdą parę
+        self.assertLess(len(seen_tiles), peak_bound + pool_limit + 1)
+
+        print("✅ Flat widget count OK")
+
+    def test_recycled_tile_is_rebound(self):
+        """Test ponownego wiązania kafelka z puli z nową parą i jej selekcją"""
+        self._scroll_to(1.0)
+        self.assertTrue(self.manager._tile_pool)
+        pooled = self.manager._tile_pool[-1]
+        target = self.manager.file_pairs_list[0]
+        self.selected.add(target)
+
+        self._scroll_to(0.0)
+        tile = self.manager.get_tile_for_path(target.get_archive_path())
+
+        self.assertIsNotNone(tile)
+        self.assertIs(tile.file_pair, target)
+        self.assertIn(target, self.selected)
+        self.assertTrue(tile.metadata_controls.selection_checkbox.isChecked())
+        self.assertNotIn(pooled, self.manager._tile_pool)
+
+        print("✅ Tile rebinding OK")
+
+    def test_rebound_tile_drops_previous_thumbnail(self):
+        """Test pustego podglądu kafelka z puli dla pary bez miniatury"""
+        first_pair = self.manager.file_pairs_list[0]
+        tile = self.manager.get_tile_for_path(first_pair.get_archive_path())
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(QColor("red"))
+        tile.thumbnail_label.setPixmap(pixmap)
+        self.manager._release_tile(first_pair.get_archive_path())
+        self.assertIs(self.manager._tile_pool[-1], tile)
+
+        new_pair = FilePair("/work/no_preview.zip", None, "/work")
+        rebound = self.manager.create_tile_widget_for_pair(
+            new_pair, self.manager.tiles_container
+        )
+
+        self.assertIs(rebound, tile)
+        self.assertIs(rebound.file_pair, new_pair)
+        self.assertTrue(rebound.thumbnail_label.pixmap().isNull())
+
+        print("✅ Rebound thumbnail reset OK")
+
+    def test_appended_pairs_keep_existing_tiles(self):
+        """Test dopisania par bez przebudowy widocznych kafelków"""
+        tiles_before = dict(self.manager.gallery_tile_widgets)
+        height_before = self.manager.tiles_container.minimumHeight()
+        new_pairs = [
+            FilePair(f"/work/extra_{i:05d}.zip", None, "/work") for i in range(600)
+        ]
+
+        self.manager.append_pairs(new_pairs)
+
+        self.assertEqual(self.manager.gallery_tile_widgets, tiles_before)
+        self.assertGreater(self.manager.tiles_container.minimumHeight(), height_before)
+        self.assertIs(self.manager.file_pairs_list[-1], new_pairs[-1])
+
+        self.app.processEvents()
+        self._scroll_to(1.0)
+        self.assertIsNotNone(
+            self.manager.get_tile_for_path(new_pairs[-1].get_archive_path())
+        )
+
+        print("✅ Appended pairs OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
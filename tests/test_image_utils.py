@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+TESTY: image_utils - konwersja PIL -> Qt i dekodowanie miniatur
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image, ImageChops, ImageDraw, ImageStat
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QApplication
+
+from src.utils import image_utils
+from src.utils.image_utils import (
+    crop_to_square,
+    pillow_image_to_qimage,
+    pillow_image_to_qpixmap,
+)
+
+
+class TestPillowToQt(unittest.TestCase):
+    """Testy konwersji PIL -> QImage/QPixmap"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_rgb_with_unaligned_stride(self):
+        """Test obrazu RGB o szerokości niewyrównanej do 4 bajtów"""
+        pil_image = Image.new("RGB", (7, 5), (10, 20, 30))
+        pil_image.putpixel((6, 4), (200, 100, 50))
+
+        q_image = pillow_image_to_qimage(pil_image)
+
+        self.assertEqual(q_image.format(), QImage.Format.Format_RGB888)
+        self.assertEqual((q_image.width(), q_image.height()), (7, 5))
+        self.assertEqual(q_image.pixelColor(0, 0), QColor(10, 20, 30))
+        self.assertEqual(q_image.pixelColor(6, 4), QColor(200, 100, 50))
+
+        print("✅ RGB stride OK")
+
+    def test_rgba_preserves_alpha(self):
+        """Test zachowania kanału alfa"""
+        pil_image = Image.new("RGBA", (4, 4), (255, 0, 0, 64))
+
+        q_image = pillow_image_to_qimage(pil_image)
+
+        self.assertEqual(q_image.format(), QImage.Format.Format_RGBA8888)
+        self.assertEqual(q_image.pixelColor(2, 2).alpha(), 64)
+
+        print("✅ RGBA alpha OK")
+
+    def test_alpha_flattened_on_white(self):
+        """Test kompozycji na białym tle bez przezroczystości"""
+        pil_image = Image.new("LA", (3, 3), (0, 0))
+
+        q_image = pillow_image_to_qimage(pil_image, preserve_transparency=False)
+
+        self.assertEqual(q_image.format(), QImage.Format.Format_RGB888)
+        self.assertEqual(q_image.pixelColor(1, 1), QColor(255, 255, 255))
+
+        print("✅ Alpha flattening OK")
+
+    def test_image_outlives_source_buffer(self):
+        """Test niezależności QImage od bufora PIL"""
+        pil_image = Image.new("L", (16, 16), 128)
+        q_image = pillow_image_to_qimage(pil_image)
+        del pil_image
+
+        self.assertEqual(q_image.pixelColor(15, 15), QColor(128, 128, 128))
+
+        print("✅ Buffer ownership OK")
+
+    def test_qpixmap(self):
+        """Test konwersji do QPixmap"""
+        pixmap = pillow_image_to_qpixmap(Image.new("RGB", (32, 16), "blue"))
+
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual((pixmap.width(), pixmap.height()), (32, 16))
+        self.assertEqual(pixmap.toImage().pixelColor(5, 5), QColor(0, 0, 255))
+
+        print("✅ QPixmap OK")
+
+
+class TestReducedDecode(unittest.TestCase):
+    """Testy dekodowania miniatur w zmniejszonej rozdzielczości"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.jpeg_path = os.path.join(self.temp_dir, "render.jpg")
+        # Szeroki obraz: lewy kwadrat czerwony, reszta niebieska
+        image = Image.new("RGB", (3000, 2000), "blue")
+        ImageDraw.Draw(image).rectangle((0, 0, 1999, 1999), fill="red")
+        image.save(self.jpeg_path, quality=95)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_draft_keeps_crop_semantics(self):
+        """Test identycznego kadru przy dekodowaniu ze skalowaniem DCT"""
+        with Image.open(self.jpeg_path) as img:
+            img.load()  # Pełna rozdzielczość - draft nie zadziała
+            full = crop_to_square(img, 200)
+        with Image.open(self.jpeg_path) as img:
+            reduced = crop_to_square(img, 200)
+            self.assertLess(img.size[0], 3000)
+
+        self.assertEqual(reduced.size, (200, 200))
+        difference = ImageStat.Stat(ImageChops.difference(full, reduced)).mean
+        self.assertLess(max(difference), 2.0)
+
+        print("✅ Draft crop OK")
+
+    def test_qt_backend(self):
+        """Test backendu QImageReader"""
+        square = image_utils._create_thumbnail_with_qt(self.jpeg_path, 100, 100)
+        fitted = image_utils._create_thumbnail_with_qt(self.jpeg_path, 300, 250)
+
+        self.assertEqual((square.width(), square.height()), (100, 100))
+        corner = square.toImage().pixelColor(95, 95)
+        self.assertGreater(corner.red(), 200)
+        self.assertLess(corner.blue(), 60)
+        self.assertEqual((fitted.width(), fitted.height()), (300, 200))
+
+        print("✅ Qt backend OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+TESTY: Konfiguracja logowania - zapis logów w osobnym wątku
+"""
+
+import logging
+import os
+import sys
+import threading
+import unittest
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import touch
+from src.logic import scanner_core
+from src.utils import logging_config
+from src.utils.arg_parser import parse_args
+from src.utils.path_utils import normalize_path
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestLoggingConfig(unittest.TestCase):
+    """Testy asynchronicznego logowania i logów w pętlach skanera"""
+
+    def setUp(self):
+        self.root_logger = logging.getLogger()
+        self.saved_handlers = list(self.root_logger.handlers)
+        self.saved_level = self.root_logger.level
+
+    def tearDown(self):
+        logging_config.stop_logging()
+        self.root_logger.handlers[:] = self.saved_handlers
+        self.root_logger.setLevel(self.saved_level)
+
+    def test_records_written_by_listener_thread(self):
+        """Test zapisu logów poza wątkiem logującym"""
+        emitting_threads = []
+
+        def record_thread(handler, record):
+            emitting_threads.append(threading.current_thread())
+
+        with patch.object(logging.StreamHandler, "emit", record_thread):
+            logging_config.setup_logging(log_to_file=False)
+            self.assertEqual(len(self.root_logger.handlers), 1)
+            self.assertIsInstance(self.root_logger.handlers[0], QueueHandler)
+
+            worker = threading.Thread(
+                target=lambda: logging.getLogger("test.worker").info("z workera")
+            )
+            worker.start()
+            worker.join()
+            logging_config.stop_logging()
+
+        self.assertEqual(len(emitting_threads), 1)
+        self.assertIsNot(emitting_threads[0], worker)
+        self.assertIsNot(emitting_threads[0], threading.main_thread())
+
+        print("✅ Listener thread OK")
+
+    def test_log_file_flushed_on_stop(self):
+        """Test zapisania rekordów z kolejki do pliku przy zatrzymaniu"""
+        log_dir = os.path.join(self.temp_dir, "logs")
+        with open(os.devnull, "w") as devnull, patch("sys.stderr", devnull):
+            logging_config.setup_logging(log_dir=log_dir)
+            for i in range(100):
+                logging.getLogger("test.file").info("rekord %d", i)
+            logging_config.stop_logging()
+
+        with open(os.path.join(log_dir, "app.log"), encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("rekord 0", content)
+        self.assertIn("rekord 99", content)
+
+        print("✅ Flush on stop OK")
+
+    def test_sync_mode_from_args(self):
+        """Test wyłączenia wątku logowania opcją --sync-log"""
+        with patch.object(sys, "argv", ["run_app.py", "--sync-log"]):
+            args = parse_args()
+        self.assertTrue(args.sync_log)
+
+        logging_config.setup_logging(log_to_file=False, use_queue=False)
+        self.assertFalse(
+            any(isinstance(h, QueueHandler) for h in self.root_logger.handlers)
+        )
+        self.assertTrue(logging_config.is_logging_configured())
+
+        print("✅ Sync mode OK")
+
+    def test_scanner_skips_per_directory_debug(self):
+        """Test braku komunikatów DEBUG per katalog przy poziomie INFO"""
+        self.root_logger.setLevel(logging.INFO)
+
+        def count_debug_calls(folder_count):
+            root = os.path.join(self.temp_dir, f"tree{folder_count}")
+            touch(os.path.join(root, "root.zip"))
+            for i in range(folder_count):
+                touch(os.path.join(root, f"sub{i}", f"model{i}.zip"))
+                touch(os.path.join(root, f"sub{i}", f"model{i}.jpg"))
+            with patch.object(scanner_core.logger, "debug") as debug:
+                scanner_core.scan_folder_for_pairs(normalize_path(root))
+            return debug.call_count
+
+        self.assertEqual(count_debug_calls(2), count_debug_calls(20))
+
+        print("✅ Scanner log gating OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
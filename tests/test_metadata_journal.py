@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+TESTY: Dziennik zmian metadanych - zapis pojedynczych par bez przepisywania metadata.json
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logic.metadata import metadata_io
+from src.logic.metadata.metadata_core import MetadataManager
+from src.models.file_pair import FilePair
+
+
+class TestMetadataJournal(unittest.TestCase):
+    """Testy dla dziennika zmian metadanych"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = MetadataManager(self.temp_dir)
+        self.pairs = []
+        for i in range(3):
+            pair = FilePair(os.path.join(self.temp_dir, f"model_{i}.zip"), None, self.temp_dir)
+            pair.set_stars(i)
+            self.pairs.append(pair)
+        self.manager.save_metadata(self.pairs, [], [])
+        self.manager.force_save()
+
+    def tearDown(self):
+        self.manager.cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _snapshot(self):
+        with open(self.manager.get_metadata_path(), "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_single_pair_save_appends_journal(self):
+        """Test zapisu pojedynczej pary jako wpisu dziennika"""
+        snapshot_before = self._snapshot()
+        self.pairs[1].set_stars(5)
+        self.pairs[1].set_color_tag("#FF0000")
+
+        self.assertTrue(self.manager.save_file_pair_metadata(self.pairs[1]))
+        self.manager.force_save()
+
+        self.assertEqual(self._snapshot(), snapshot_before)
+        with open(self.manager.io.get_journal_path(), "r", encoding="utf-8") as journal:
+            lines = journal.read().splitlines()
+        self.assertEqual(len(lines), 1)
+
+        metadata = self.manager.load_metadata()
+        self.assertEqual(
+            metadata["file_pairs"]["model_1.zip"], {"stars": 5, "color_tag": "#FF0000"}
+        )
+
+        print("✅ Journal append OK")
+
+    def test_remove_and_torn_line(self):
+        """Test usuwania wpisu i pomijania przerwanego zapisu dziennika"""
+        self.assertTrue(self.manager.remove_metadata_for_file("model_2.zip"))
+        self.manager.force_save()
+        with open(self.manager.io.get_journal_path(), "a", encoding="utf-8") as journal:
+            journal.write('{"op": "set", "path": "model_0.zip", "sta')
+
+        metadata = self.manager.load_metadata()
+
+        self.assertNotIn("model_2.zip", metadata["file_pairs"])
+        self.assertEqual(metadata["file_pairs"]["model_0.zip"]["stars"], 0)
+
+        print("✅ Remove and torn line OK")
+
+    def test_compaction(self):
+        """Test scalania dziennika z migawką po przekroczeniu progu"""
+        with patch.object(metadata_io, "JOURNAL_COMPACT_BYTES", 200):
+            for stars in range(1, 6):
+                self.pairs[0].set_stars(stars)
+                self.manager.save_file_pair_metadata(self.pairs[0])
+                self.manager.force_save()
+
+        with open(self.manager.io.get_journal_path(), "r", encoding="utf-8") as journal:
+            self.assertLess(len(journal.read().splitlines()), 5)
+        self.assertGreater(self._snapshot()["file_pairs"]["model_0.zip"]["stars"], 0)
+
+        self.assertTrue(self.manager.compact_metadata())
+        self.assertFalse(os.path.exists(self.manager.io.get_journal_path()))
+        self.assertEqual(self._snapshot()["file_pairs"]["model_0.zip"]["stars"], 5)
+
+        print("✅ Compaction OK")
+
+    def test_json_export_import(self):
+        """Test eksportu i importu metadanych w formacie JSON"""
+        self.pairs[2].set_color_tag("#00FF00")
+        self.manager.save_file_pair_metadata(self.pairs[2])
+        export_path = os.path.join(self.temp_dir, "export.json")
+
+        self.assertTrue(self.manager.export_metadata_json(export_path))
+        with open(export_path, "r", encoding="utf-8") as file:
+            exported = json.load(file)
+        self.assertEqual(exported["file_pairs"]["model_2.zip"]["color_tag"], "#00FF00")
+
+        other_dir = tempfile.mkdtemp()
+        try:
+            other = MetadataManager(other_dir)
+            self.assertTrue(other.import_metadata_json(export_path))
+            self.assertEqual(other.load_metadata()["file_pairs"], exported["file_pairs"])
+            other.cleanup()
+        finally:
+            shutil.rmtree(other_dir, ignore_errors=True)
+
+        print("✅ JSON export/import OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
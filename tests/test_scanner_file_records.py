@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+TESTY: Rekordy plików ze skanera - rozmiary i mtime bez ponownych wywołań stat
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import touch
+from src.controllers.statistics_controller import StatisticsController
+from src.logic import scanner_core
+from src.logic.file_pairing import create_file_pairs
+from src.logic.scanner_cache import cache
+from src.models.file_record import FileRecord, get_extension_id
+from src.utils.path_utils import normalize_path
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestScannerFileRecords(unittest.TestCase):
+    """Testy przenoszenia rekordów stat przez skaner i parowanie"""
+
+    def setUp(self):
+        self.root = normalize_path(self.temp_dir)
+        touch(os.path.join(self.temp_dir, "model1.zip"), b"x" * 100)
+        touch(os.path.join(self.temp_dir, "model1.jpg"), b"x" * 20)
+        touch(os.path.join(self.temp_dir, "model2.rar"), b"x" * 300)
+        touch(os.path.join(self.temp_dir, "orphan.png"), b"x" * 7)
+
+    def test_scan_fills_pair_sizes(self):
+        """Test rozmiarów par wypełnionych z rekordów skanera"""
+        with patch("src.models.file_pair.os.path.getsize") as getsize:
+            pairs, unpaired_archives, unpaired_previews, _ = (
+                scanner_core.scan_folder_for_pairs(self.root)
+            )
+            self.assertEqual(len(pairs), 1)
+            self.assertEqual(pairs[0].get_archive_size(), 100)
+            self.assertEqual(pairs[0].get_preview_size(), 20)
+        getsize.assert_not_called()
+
+        records = cache.get_file_records(self.root)
+        self.assertEqual(records[unpaired_archives[0]].size, 300)
+        self.assertEqual(records[unpaired_previews[0]].extension, ".png")
+
+        print("✅ Pair sizes from records OK")
+
+    def test_best_match_uses_record_mtime(self):
+        """Test strategii best_match bez wywołań getmtime"""
+        archive = os.path.join(self.root, "model")
+        file_map = {archive: [f"{archive}.zip", f"{archive}.jpg", f"{archive}.png"]}
+        records = {
+            path: FileRecord(path, 1, mtime, get_extension_id(path))
+            for path, mtime in zip(file_map[archive], (1.0, 1.0, 5e9))
+        }
+
+        with patch("src.logic.file_pairing.os.path.getmtime") as getmtime:
+            pairs, _ = create_file_pairs(
+                file_map, self.root, "best_match", file_records=records
+            )
+        getmtime.assert_not_called()
+        self.assertEqual(pairs[0].preview_path, f"{archive}.png")
+
+        print("✅ best_match mtime from records OK")
+
+    def test_statistics_without_stat_calls(self):
+        """Test sumy rozmiarów w statystykach bez ponownego stat"""
+        controller = StatisticsController()
+        with patch("os.path.getsize") as getsize:
+            stats = controller.calculate_folder_statistics(self.root)
+        getsize.assert_not_called()
+        self.assertEqual(stats.total_size_bytes, 427)
+
+        print("✅ Statistics without stat OK")
+
+    def test_statistics_skip_unreadable_sizes(self):
+        """Test pominięcia (nie odejmowania) rozmiarów niedostępnych plików"""
+        pairs, unpaired_archives, unpaired_previews, _ = (
+            scanner_core.scan_folder_for_pairs(self.root)
+        )
+        pairs[0].archive_size_bytes = None
+        os.remove(pairs[0].archive_path)
+
+        controller = StatisticsController()
+        with self.assertLogs(
+            "src.controllers.statistics_controller", level="WARNING"
+        ):
+            total = controller._calculate_total_size(
+                pairs, unpaired_archives, unpaired_previews
+            )
+        self.assertEqual(total, 20 + 300 + 7)
+
+        print("✅ Unreadable sizes OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
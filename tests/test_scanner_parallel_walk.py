@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+TESTY: Równoległe listowanie katalogów w collect_files_streaming
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import AppConfig
+from src.logic import scanner_core
+from src.logic.scanner_cache import ThreadSafeCache, cache
+from src.logic.scanner_core import ScanningInterrupted
+from src.utils.path_utils import normalize_path
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"data")
+
+
+def _scanner_config(walk_workers):
+    config = AppConfig.get_instance()._config_properties._config
+    return patch.dict(
+        config,
+        {
+            "scanner_walk_workers": walk_workers,
+            "scanner_use_directory_snapshot": False,
+        },
+    )
+
+
+class TestParallelWalk(unittest.TestCase):
+    """Testy równoległego walkera"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = normalize_path(self.temp_dir)
+        for i in range(4):
+            for j in range(3):
+                folder = os.path.join(self.temp_dir, f"cat{i}", f"sub{j}")
+                _touch(os.path.join(folder, f"model_{i}_{j}.zip"))
+                _touch(os.path.join(folder, f"model_{i}_{j}.jpg"))
+            _touch(os.path.join(self.temp_dir, f"cat{i}", f"root_{i}.rar"))
+        _touch(os.path.join(self.temp_dir, "top.zip"))
+        os.makedirs(os.path.join(self.temp_dir, "empty", "nested"))
+        cache.clear()
+        ThreadSafeCache().snapshots.clear()
+
+    def tearDown(self):
+        cache.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _collect(self, walk_workers, **kwargs):
+        with _scanner_config(walk_workers):
+            return scanner_core.collect_files_streaming(
+                self.root, force_refresh=True, **kwargs
+            )
+
+    def test_same_file_map_as_sequential(self):
+        """Test identycznej mapy plików (łącznie z kolejnością)"""
+        sequential = self._collect(1)
+        parallel = self._collect(8)
+
+        self.assertEqual(list(sequential.items()), list(parallel.items()))
+        self.assertEqual(len(parallel), 17)
+
+        print("✅ Parallel file_map OK")
+
+    def test_max_depth(self):
+        """Test respektowania limitu głębokości"""
+        sequential = self._collect(1, max_depth=1)
+        parallel = self._collect(8, max_depth=1)
+
+        self.assertEqual(list(sequential.items()), list(parallel.items()))
+        self.assertEqual(len(parallel), 5)
+
+        print("✅ Parallel max_depth OK")
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "Brak obsługi symlinków")
+    def test_symlink_loop(self):
+        """Test ochrony przed pętlą symlinków"""
+        os.symlink(self.temp_dir, os.path.join(self.temp_dir, "cat0", "loop"))
+
+        sequential = self._collect(1)
+        parallel = self._collect(8)
+
+        self.assertEqual(list(sequential.items()), list(parallel.items()))
+
+        print("✅ Parallel symlink loop OK")
+
+    def test_interrupt(self):
+        """Test przerwania skanowania"""
+        calls = []
+
+        def interrupt_check():
+            calls.append(1)
+            return len(calls) > 3
+
+        with self.assertRaises(ScanningInterrupted):
+            self._collect(8, interrupt_check=interrupt_check)
+
+        print("✅ Parallel interrupt OK")
+
+    def test_progress_is_monotonic(self):
+        """Test rosnącego postępu w trybie równoległym"""
+        reported = []
+        self._collect(8, progress_callback=lambda p, _: reported.append(p))
+
+        self.assertEqual(reported, sorted(reported))
+        self.assertEqual(reported[-1], 100)
+
+        print("✅ Parallel progress OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
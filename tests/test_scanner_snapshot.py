@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+TESTY: Inkrementalne skanowanie ze snapshotem katalogów
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from conftest import touch
+from src.logic import scanner_cache, scanner_core
+from src.logic.scanner_cache import (
+    DirectorySnapshot,
+    DirectorySnapshotEntry,
+    ThreadSafeCache,
+    cache,
+)
+from src.utils.path_utils import normalize_path
+
+
+def _age_tree(root, seconds=10):
+    """Cofa mtime katalogów poza okno 'racy' snapshotu."""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestDirectorySnapshot(unittest.TestCase):
+    """Testy dla DirectorySnapshot"""
+
+    def setUp(self):
+        self.snapshot_dir = tempfile.mkdtemp()
+        snapshot_dir_patch = patch.object(
+            scanner_cache, "get_snapshot_dir", return_value=self.snapshot_dir
+        )
+        snapshot_dir_patch.start()
+        self.addCleanup(snapshot_dir_patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.snapshot_dir, ignore_errors=True)
+
+    def test_save_and_load(self):
+        """Test zapisu i odczytu snapshotu"""
+        snapshot = DirectorySnapshot(self.temp_dir)
+        sub_dir = os.path.join(self.temp_dir, "sub")
+        entry = DirectorySnapshotEntry(12345, ["a.zip", "a.jpg"], ["x"], 3)
+        snapshot.set(sub_dir, entry)
+        self.assertTrue(snapshot.save())
+
+        reloaded = DirectorySnapshot(self.temp_dir)
+        self.assertEqual(reloaded.get(sub_dir, 12345), entry)
+        self.assertIsNone(reloaded.get(sub_dir, 99999))
+
+        print("✅ Snapshot save/load OK")
+
+    def test_snapshot_stored_outside_scanned_folder(self):
+        """Test zapisu snapshotu w katalogu danych aplikacji, per folder roboczy"""
+        other_dir = os.path.join(self.temp_dir, "other")
+        os.makedirs(other_dir)
+        snapshot = DirectorySnapshot(self.temp_dir)
+        snapshot.set(self.temp_dir, DirectorySnapshotEntry(12345, [], ["other"], 0))
+        self.assertTrue(snapshot.save())
+
+        self.assertEqual(os.listdir(self.temp_dir), ["other"])
+        self.assertEqual(
+            os.path.dirname(snapshot.get_snapshot_path()),
+            normalize_path(self.snapshot_dir),
+        )
+        self.assertNotEqual(
+            DirectorySnapshot(other_dir).get_snapshot_path(),
+            snapshot.get_snapshot_path(),
+        )
+        self.assertEqual(len(DirectorySnapshot(other_dir)), 0)
+
+        print("✅ Snapshot location OK")
+
+    def test_racy_entry_is_not_trusted(self):
+        """Test nieufania katalogom zmodyfikowanym tuż przed listowaniem"""
+        snapshot = DirectorySnapshot(self.temp_dir)
+        now_ns = time.time_ns()
+        snapshot.set(self.temp_dir, DirectorySnapshotEntry(now_ns, [], [], 0))
+
+        self.assertIsNone(snapshot.get(self.temp_dir, now_ns))
+
+        print("✅ Racy entry OK")
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestIncrementalScan(unittest.TestCase):
+    """Testy inkrementalnego skanowania"""
+
+    def setUp(self):
+        self.root = normalize_path(self.temp_dir)
+        touch(os.path.join(self.temp_dir, "model1.zip"))
+        touch(os.path.join(self.temp_dir, "model1.jpg"))
+        touch(os.path.join(self.temp_dir, "a", "model2.rar"))
+        touch(os.path.join(self.temp_dir, "a", "model2.png"))
+        touch(os.path.join(self.temp_dir, "a", "b", "model3.zip"))
+        touch(os.path.join(self.temp_dir, "a", "b", "model3.jpg"))
+        _age_tree(self.temp_dir)
+        self.snapshot_dir = tempfile.mkdtemp()
+        snapshot_dir_patch = patch.object(
+            scanner_cache, "get_snapshot_dir", return_value=self.snapshot_dir
+        )
+        snapshot_dir_patch.start()
+        self.addCleanup(snapshot_dir_patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.snapshot_dir, ignore_errors=True)
+
+    def _collect(self):
+        return scanner_core.collect_files_streaming(self.root, force_refresh=True)
+
+    def _prime_snapshot(self):
+        """Pierwsze skanowanie zapisuje snapshot, drugie korzysta z niego."""
+        self._collect()
+        _age_tree(self.temp_dir)
+        return self._collect()
+
+    def test_unchanged_tree_is_not_relisted(self):
+        """Test braku scandir dla niezmienionego drzewa"""
+        first_map = self._prime_snapshot()
+        ThreadSafeCache().snapshots.clear()  # symulacja restartu aplikacji
+
+        with patch.object(
+            scanner_core, "_list_directory", wraps=scanner_core._list_directory
+        ) as list_mock:
+            second_map = self._collect()
+
+        self.assertEqual(list_mock.call_count, 0)
+        self.assertEqual(dict(first_map), dict(second_map))
+
+        print("✅ Unchanged tree OK")
+
+    def test_only_changed_directory_is_relisted(self):
+        """Test listowania tylko zmienionego katalogu"""
+        self._prime_snapshot()
+        deep_dir = os.path.join(self.temp_dir, "a", "b")
+        touch(os.path.join(deep_dir, "model4.zip"))
+        touch(os.path.join(deep_dir, "model4.jpg"))
+        past = time.time() - 5
+        os.utime(deep_dir, (past, past))
+
+        with patch.object(
+            scanner_core, "_list_directory", wraps=scanner_core._list_directory
+        ) as list_mock:
+            file_map = self._collect()
+
+        self.assertEqual(list_mock.call_count, 1)
+        self.assertIn(os.path.join(normalize_path(deep_dir), "model4"), file_map)
+
+        print("✅ Changed directory OK")
+
+    def test_pairs_are_patched_in_place(self):
+        """Test łatania listy par bez ponownego tworzenia niezmienionych par"""
+        first_pairs = scanner_core.scan_folder_for_pairs(
+            self.root, force_refresh_cache=True
+        )[0]
+        touch(os.path.join(self.temp_dir, "model5.zip"))
+        touch(os.path.join(self.temp_dir, "model5.jpg"))
+        os.remove(os.path.join(self.temp_dir, "a", "model2.png"))
+        _age_tree(self.temp_dir)
+
+        second_pairs = scanner_core.scan_folder_for_pairs(
+            self.root, force_refresh_cache=True
+        )[0]
+        second_names = {p.get_base_name() for p in second_pairs}
+
+        self.assertEqual(second_names, {"model1", "model3", "model5"})
+        reused = {id(p) for p in first_pairs} & {id(p) for p in second_pairs}
+        self.assertEqual(len(reused), 2)
+
+        print("✅ Pair patching OK")
+
+    def test_snapshot_directories_keep_file_records(self):
+        """Test rekordów plików (rozmiarów) dla katalogów ze snapshotu"""
+        self._prime_snapshot()
+        ThreadSafeCache().snapshots.clear()  # symulacja restartu aplikacji
+
+        file_records = {}
+        with patch.object(
+            scanner_core, "_list_directory", wraps=scanner_core._list_directory
+        ) as list_mock:
+            scanner_core.collect_files_streaming(
+                self.root, force_refresh=True, file_records=file_records
+            )
+
+        self.assertEqual(list_mock.call_count, 0)
+        self.assertEqual(len(file_records), 6)
+        self.assertEqual({r.size for r in file_records.values()}, {4})
+        self.assertIn(self.root, cache.get_snapshot_record_directories(self.root))
+
+        print("✅ Snapshot file records OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+TESTY: Strumieniowe skanowanie - partie par emitowane w trakcie skanowania
+"""
+
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from conftest import touch
+from src.config import AppConfig
+from src.logic import scanner_core
+from src.ui.delegates.workers.scan_workers import ScanDirectoryWorker
+from src.utils.path_utils import normalize_path
+
+
+@pytest.mark.usefixtures("scan_temp_dir")
+class TestScannerStreaming(unittest.TestCase):
+    """Testy strumieniowego parowania katalogów"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.root = normalize_path(self.temp_dir)
+        touch(os.path.join(self.temp_dir, "chair.zip"))
+        touch(os.path.join(self.temp_dir, "chair.jpg"))
+        touch(os.path.join(self.temp_dir, "a", "lamp.rar"))
+        touch(os.path.join(self.temp_dir, "a", "lamp.png"))
+        touch(os.path.join(self.temp_dir, "a", "b", "sofa.7z"))
+        touch(os.path.join(self.temp_dir, "a", "b", "sofa.webp"))
+        touch(os.path.join(self.temp_dir, "a", "b", "table.zip"))
+
+    def _scan(self, **kwargs):
+        batches = []
+        result = scanner_core.scan_folder_for_pairs(
+            self.root, pairs_callback=batches.append, **kwargs
+        )
+        return batches, result
+
+    def test_batches_per_directory(self):
+        """Test partii par z każdego katalogu składających się na wynik"""
+        batches, (pairs, unpaired_archives, _, _) = self._scan()
+
+        self.assertEqual(
+            [[p.get_base_name() for p in batch] for batch in batches],
+            [["chair"], ["lamp"], ["sofa"]],
+        )
+        self.assertEqual([p for batch in batches for p in batch], pairs)
+        self.assertEqual(len(unpaired_archives), 1)
+
+        full_scan_pairs = scanner_core.scan_folder_for_pairs(
+            self.root, force_refresh_cache=True
+        )[0]
+        self.assertEqual(
+            [p.get_archive_path() for p in full_scan_pairs],
+            [p.get_archive_path() for p in pairs],
+        )
+
+        print("✅ Streamed batches OK")
+
+    def test_parallel_walk_streams_before_listing_finishes(self):
+        """Test pierwszej partii przed końcem równoległego listowania drzewa"""
+        events = []
+        first_batch = threading.Event()
+        deepest_dir = os.path.join(self.root, "a", "b")
+        list_directory = scanner_core._list_directory
+
+        def slow_list_directory(current_dir, *args):
+            if current_dir == deepest_dir:
+                first_batch.wait(timeout=5)
+            listing = list_directory(current_dir, *args)
+            events.append(("listed", current_dir))
+            return listing
+
+        def on_batch(batch):
+            events.append(("batch", batch[0].get_base_name()))
+            first_batch.set()
+
+        config = AppConfig.get_instance()._config_properties._config
+        with patch.dict(config, {"scanner_walk_workers": 8}), patch.object(
+            scanner_core, "_list_directory", side_effect=slow_list_directory
+        ):
+            pairs = scanner_core.scan_folder_for_pairs(
+                self.root, pairs_callback=on_batch
+            )[0]
+
+        self.assertEqual(events[-1], ("batch", "sofa"))
+        self.assertLess(
+            events.index(("batch", "chair")), events.index(("listed", deepest_dir))
+        )
+        self.assertEqual(
+            [p.get_base_name() for p in pairs], ["chair", "lamp", "sofa"]
+        )
+
+        print("✅ Parallel streaming OK")
+
+    def test_rescan_streams_reused_pairs(self):
+        """Test strumieniowania par przeniesionych z poprzedniego skanowania"""
+        _, (first_pairs, _, _, _) = self._scan()
+
+        batches, (pairs, _, _, _) = self._scan(force_refresh_cache=True)
+        streamed = [p for batch in batches for p in batch]
+        self.assertEqual(len(streamed), len(first_pairs))
+        for streamed_pair, first_pair in zip(streamed, first_pairs):
+            self.assertIs(streamed_pair, first_pair)
+        self.assertEqual(streamed, pairs)
+
+        print("✅ Streamed incremental rescan OK")
+
+    def test_cached_result_sent_as_one_batch(self):
+        """Test jednej partii przy wyniku z cache"""
+        _, (pairs, _, _, _) = self._scan()
+
+        batches, _ = self._scan()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0], pairs)
+
+        print("✅ Cached result batch OK")
+
+    def test_worker_emits_batches_before_result(self):
+        """Test partii emitowanych przez ScanDirectoryWorker przed wynikiem"""
+        events = []
+        worker = ScanDirectoryWorker(self.root)
+        worker.signals.pairs_batch_ready.connect(
+            lambda batch: events.append(("batch", list(batch)))
+        )
+        worker.signals.finished.connect(lambda result: events.append(("result", result)))
+        worker.run()
+
+        self.assertGreaterEqual(len(events), 2)
+        self.assertEqual(events[-1][0], "result")
+        scan_result = events[-1][1]
+        streamed = [p for kind, batch in events[:-1] for p in batch]
+        self.assertEqual(streamed, scan_result.file_pairs)
+        self.assertEqual(len(scan_result.unpaired_archives), 1)
+
+        print("✅ Worker batches OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
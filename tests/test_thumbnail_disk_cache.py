@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+TESTY: ThumbnailDiskCache - dyskowy cache miniaturek
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+from PyQt6.QtWidgets import QApplication
+
+from src.models.file_record import FileRecord, get_extension_id
+from src.ui.delegates.workers.processing_workers import ThumbnailGenerationWorker
+from src.ui.widgets.thumbnail_cache import ThumbnailCache
+from src.ui.widgets.thumbnail_disk_cache import ThumbnailDiskCache
+from src.utils.path_utils import normalize_path
+
+
+class TestThumbnailDiskCache(unittest.TestCase):
+    """Testy dla ThumbnailDiskCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.source_file = os.path.join(self.temp_dir, "preview.jpg")
+        with open(self.source_file, "wb") as f:
+            f.write(b"source image data")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _key(self, path=None, size=128):
+        return ThumbnailDiskCache.build_key(
+            path or self.source_file, size, size, "WEBP", 80
+        )
+
+    def test_put_and_get(self):
+        """Test zapisu i odczytu wpisu"""
+        cache = ThumbnailDiskCache(self.cache_dir, max_size_mb=16)
+        key = self._key()
+
+        self.assertIsNone(cache.get(key))
+        self.assertTrue(cache.put(key, b"encoded-thumbnail"))
+        self.assertEqual(cache.get(key), b"encoded-thumbnail")
+        self.assertEqual(cache.get_entry_count(), 1)
+
+        print("✅ Put/get OK")
+
+    def test_persistence_between_instances(self):
+        """Test trwałości cache po ponownym utworzeniu"""
+        cache = ThumbnailDiskCache(self.cache_dir, max_size_mb=16)
+        keys = [self._key(size=size) for size in (100, 200, 300)]
+        for i, key in enumerate(keys):
+            cache.put(key, f"thumb-{i}".encode())
+        cache.flush()
+
+        reopened = ThumbnailDiskCache(self.cache_dir, max_size_mb=16)
+        for i, key in enumerate(keys):
+            self.assertEqual(reopened.get(key), f"thumb-{i}".encode())
+
+        print("✅ Persistence OK")
+
+    def test_key_changes_with_source_file(self):
+        """Test unieważnienia klucza po zmianie pliku źródłowego"""
+        old_key = self._key()
+        self.assertEqual(old_key, self._key())
+        self.assertNotEqual(old_key, self._key(size=256))
+
+        time.sleep(0.01)
+        with open(self.source_file, "wb") as f:
+            f.write(b"modified source image data")
+
+        self.assertNotEqual(old_key, self._key())
+        self.assertIsNone(
+            ThumbnailDiskCache.build_key(
+                os.path.join(self.temp_dir, "missing.jpg"), 128, 128, "WEBP", 80
+            )
+        )
+
+        print("✅ Key invalidation OK")
+
+    def test_key_from_known_file_stat(self):
+        """Test klucza z rekordu skanera (rozmiar, mtime) bez os.stat"""
+        stat_result = os.stat(self.source_file)
+        known_stat = (stat_result.st_size, stat_result.st_mtime)
+
+        self.assertEqual(
+            self._key(),
+            ThumbnailDiskCache.build_key(
+                self.source_file, 128, 128, "WEBP", 80, known_stat
+            ),
+        )
+        missing = os.path.join(self.temp_dir, "missing.jpg")
+        self.assertIsNotNone(
+            ThumbnailDiskCache.build_key(missing, 128, 128, "WEBP", 80, known_stat)
+        )
+
+        print("✅ Key from known file stat OK")
+
+    def test_lru_eviction(self):
+        """Test eviction LRU przy przekroczeniu limitu rozmiaru"""
+        cache = ThumbnailDiskCache(self.cache_dir, max_size_mb=1)
+        payload = b"x" * (300 * 1024)
+        keys = [self._key(size=size) for size in range(100, 105)]
+
+        cache.put(keys[0], payload)
+        cache.put(keys[1], payload)
+        cache.put(keys[2], payload)
+        time.sleep(0.01)
+        cache.get(keys[0])  # keys[0] staje się najświeższy
+        cache.put(keys[3], payload)
+
+        self.assertLessEqual(cache.get_total_bytes(), 1024 * 1024)
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+
+        print("✅ LRU eviction OK")
+
+    def test_truncated_pack_is_ignored(self):
+        """Test odrzucania wpisów z obciętej paczki"""
+        cache = ThumbnailDiskCache(self.cache_dir, max_size_mb=16, shard_count=1)
+        key = self._key()
+        cache.put(key, b"encoded-thumbnail")
+        cache.flush()
+
+        pack_path = os.path.join(self.cache_dir, "00.pack")
+        with open(pack_path, "r+b") as f:
+            f.truncate(4)
+
+        reopened = ThumbnailDiskCache(self.cache_dir, max_size_mb=16, shard_count=1)
+        self.assertIsNone(reopened.get(key))
+        self.assertEqual(reopened.get_entry_count(), 0)
+
+        print("✅ Truncated pack handling OK")
+
+    def test_clear(self):
+        """Test czyszczenia cache"""
+        cache = ThumbnailDiskCache(self.cache_dir, max_size_mb=16)
+        key = self._key()
+        cache.put(key, b"encoded-thumbnail")
+        cache.clear()
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.get_total_bytes(), 0)
+
+        print("✅ Clear OK")
+
+
+class TestThumbnailCacheDiskTier(unittest.TestCase):
+    """Testy dyskowej warstwy ThumbnailCache"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ThumbnailCache.get_instance()
+        self.disk_cache = ThumbnailDiskCache(
+            os.path.join(self.temp_dir, "cache"), max_size_mb=16
+        )
+        disk_patch = patch.object(self.cache, "_disk_cache", self.disk_cache)
+        disk_patch.start()
+        self.addCleanup(disk_patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_disk_read_only_outside_gui_thread(self):
+        """Test braku odczytu z dysku w wątku GUI przy chybieniu pamięci"""
+        image_path = os.path.join(self.temp_dir, "render.png")
+        Image.new("RGB", (64, 64), (0, 128, 255)).save(image_path)
+        worker = ThumbnailGenerationWorker(image_path, 100, 100)
+        worker.run()
+        self.addCleanup(self.cache.remove_thumbnail, image_path, 100, 100)
+        self.cache.remove_thumbnail(image_path, 100, 100)
+        self.assertEqual(self.disk_cache.get_entry_count(), 1)
+
+        with patch.object(
+            self.disk_cache, "get", wraps=self.disk_cache.get
+        ) as disk_get:
+            self.assertIsNone(self.cache.get_thumbnail(image_path, 100, 100))
+            disk_get.assert_not_called()
+
+            results = []
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    self.cache.get_thumbnail(image_path, 100, 100)
+                )
+            )
+            thread.start()
+            thread.join()
+
+        self.assertEqual(disk_get.call_count, 1)
+        self.assertIsNotNone(results[0])
+        self.assertTrue(self.cache.contains(image_path, 100, 100))
+
+        print("✅ Disk tier off GUI thread OK")
+
+    def test_disk_key_from_passed_file_records(self):
+        """Test klucza dyskowego z rekordów przekazanych przez kontroler"""
+        image_path = normalize_path(os.path.join(self.temp_dir, "render.png"))
+        Image.new("RGB", (8, 8)).save(image_path)
+        records = {
+            image_path: FileRecord(image_path, 123, 456.0, get_extension_id(image_path))
+        }
+        cache_key = (image_path, 100, 100, "WEBP", 80)
+        self.addCleanup(self.cache.set_file_records, None)
+
+        self.cache.set_file_records(records)
+        with patch("os.stat", side_effect=AssertionError("os.stat")):
+            record_key = self.cache._disk_key(cache_key)
+        self.assertEqual(
+            record_key,
+            ThumbnailDiskCache.build_key(
+                image_path, 100, 100, "WEBP", 80, (123, 456.0)
+            ),
+        )
+
+        # Rekordy ze snapshotu katalogów - rozstrzyga os.stat
+        self.cache.set_file_records(records, frozenset({os.path.dirname(image_path)}))
+        self.assertEqual(
+            self.cache._disk_key(cache_key),
+            ThumbnailDiskCache.build_key(image_path, 100, 100, "WEBP", 80),
+        )
+        self.assertNotEqual(self.cache._disk_key(cache_key), record_key)
+
+        print("✅ Disk key from file records OK")
+
+    def test_error_placeholder_is_not_cached(self):
+        """Test braku placeholdera błędu w cache dla uszkodzonego pliku"""
+        broken_path = os.path.join(self.temp_dir, "broken.jpg")
+        with open(broken_path, "wb") as f:
+            f.write(b"not an image")
+        worker = ThumbnailGenerationWorker(broken_path, 100, 100)
+        finished, errors = [], []
+        worker.signals.thumbnail_finished.connect(lambda *args: finished.append(args))
+        worker.signals.thumbnail_error.connect(lambda *args: errors.append(args))
+
+        worker.run()
+
+        self.assertEqual(finished, [])
+        self.assertEqual(len(errors), 1)
+        self.assertFalse(self.cache.contains(broken_path, 100, 100))
+        self.assertEqual(self.disk_cache.get_entry_count(), 0)
+
+        print("✅ Error placeholder not cached OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
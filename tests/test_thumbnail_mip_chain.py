@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+TESTY: Łańcuch mip miniatur - zmiana rozmiaru bez ponownego dekodowania
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.delegates.workers.processing_workers import ThumbnailGenerationWorker
+from src.ui.widgets.thumbnail_cache import ThumbnailCache
+from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+from src.ui.widgets.tile_config import TileConfig
+from src.ui.widgets.tile_thumbnail_component import ThumbnailComponent
+
+
+class TestThumbnailMipChain(unittest.TestCase):
+    """Testy łańcucha mip w ThumbnailCache"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "render.png")
+        Image.new("RGB", (1600, 1600), (0, 128, 255)).save(self.image_path)
+        self.cache = ThumbnailCache.get_instance()
+
+    def tearDown(self):
+        for size in (128, 256, 300, 400, 512, 1024):
+            self.cache.remove_thumbnail(self.image_path, size, size)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_worker_stores_mip_chain(self):
+        """Test generowania miniatury raz na poziomie mip wraz z niższymi poziomami"""
+        worker = ThumbnailGenerationWorker(self.image_path, 300, 300)
+        results = []
+        worker.signals.thumbnail_finished.connect(
+            lambda pixmap, path, w, h: results.append(pixmap)
+        )
+        worker.run()
+
+        self.assertEqual(results[0].width(), 300)
+        for level in (128, 256, 512):
+            pixmap = self.cache.get_memory_thumbnail(self.image_path, level, level)
+            self.assertIsNotNone(pixmap, level)
+            self.assertEqual(pixmap.width(), level)
+        self.assertFalse(self.cache.contains(self.image_path, 1024, 1024))
+
+        print("✅ Mip chain generation OK")
+
+    def test_nearest_level_prefers_larger(self):
+        """Test wyboru najbliższego większego poziomu mip"""
+        self.assertEqual(ThumbnailCache.mip_level_for(300, 300), 512)
+        self.assertEqual(ThumbnailCache.mip_level_for(256, 256), 256)
+        self.assertIsNone(ThumbnailCache.mip_level_for(1200, 1200))
+        self.assertIsNone(ThumbnailCache.mip_level_for(200, 150))
+
+        worker = ThumbnailGenerationWorker(self.image_path, 300, 300)
+        worker.run()
+        self.cache.remove_thumbnail(self.image_path, 512, 512)
+
+        # Brak większego poziomu - obraz tymczasowy z największego dostępnego
+        pixmap = self.cache.get_nearest_thumbnail(self.image_path, 400, 400)
+        self.assertEqual(pixmap.width(), 400)
+        self.assertIsNone(self.cache.get_nearest_thumbnail("/none.png", 400, 400))
+
+        print("✅ Nearest level OK")
+
+    def test_size_change_served_without_decoding(self):
+        """Test zmiany rozmiaru kafelka obsłużonej z pamięci i doliczonej w tle"""
+        ThumbnailGenerationWorker(self.image_path, 300, 300).run()
+
+        component = ThumbnailComponent(TileConfig(thumbnail_size=(300, 300)), None)
+        loaded = []
+        component.thumbnail_loaded.connect(lambda path, pixmap: loaded.append(pixmap))
+        scheduler = MagicMock()
+        scheduler.request.return_value = True
+
+        with patch.object(
+            ThumbnailScheduler, "get_instance", return_value=scheduler
+        ), patch(
+            "src.ui.delegates.workers.processing_workers.create_thumbnail_from_file"
+        ) as create_thumbnail, patch.object(
+            self.cache, "_get_from_disk"
+        ) as disk_read:
+            component.load_thumbnail(self.image_path, (400, 400))
+
+        create_thumbnail.assert_not_called()
+        disk_read.assert_not_called()
+        self.assertEqual(loaded[-1].width(), 400)
+        scheduler.request.assert_called_once_with(self.image_path, 400, 400)
+
+        print("✅ Size change without decoding OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
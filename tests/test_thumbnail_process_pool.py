@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+TESTY: ThumbnailProcessPool - generowanie miniaturek w puli procesów
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+from PyQt6.QtGui import QImage
+
+from src.utils.thumbnail_process_pool import ThumbnailProcessPool
+
+
+class TestThumbnailProcessPool(unittest.TestCase):
+    """Testy dla ThumbnailProcessPool"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ThumbnailProcessPool(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.jpeg_path = os.path.join(self.temp_dir, "render.jpg")
+        self.png_path = os.path.join(self.temp_dir, "alpha.png")
+        Image.new("RGB", (800, 600), (0, 128, 255)).save(self.jpeg_path)
+        Image.new("RGBA", (300, 300), (255, 0, 0, 100)).save(self.png_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_generate_batch(self):
+        """Test generowania paczki miniaturek z błędem dla brakującego pliku"""
+        missing_path = os.path.join(self.temp_dir, "missing.jpg")
+        requests = [
+            (self.jpeg_path, 100, 100),
+            (self.jpeg_path, 200, 120),
+            (self.png_path, 64, 64),
+            (missing_path, 100, 100),
+        ]
+
+        results = {
+            (path, w, h): (image, error)
+            for path, w, h, image, error in self.pool.generate(requests, chunk_size=2)
+        }
+
+        self.assertEqual(set(results), set(requests))
+        square, _ = results[(self.jpeg_path, 100, 100)]
+        self.assertEqual((square.width(), square.height()), (100, 100))
+        self.assertEqual(square.pixelColor(50, 50).blue(), 255)
+        fitted, _ = results[(self.jpeg_path, 200, 120)]
+        self.assertEqual((fitted.width(), fitted.height()), (160, 120))
+        alpha, _ = results[(self.png_path, 64, 64)]
+        self.assertEqual(alpha.format(), QImage.Format.Format_RGBA8888)
+        image, error = results[(missing_path, 100, 100)]
+        self.assertIsNone(image)
+        self.assertTrue(error)
+
+        print("✅ Batch generation OK")
+
+    def test_flatten_transparency(self):
+        """Test kompozycji na białym tle gdy przezroczystość jest wyłączona"""
+        results = list(
+            self.pool.generate([(self.png_path, 32, 32)], preserve_transparency=False)
+        )
+
+        image = results[0][3]
+        self.assertEqual(image.format(), QImage.Format.Format_RGB888)
+
+        print("✅ Flatten transparency OK")
+
+    def test_interrupt(self):
+        """Test przerwania generowania"""
+        requests = [(self.jpeg_path, 50 + i, 50 + i) for i in range(20)]
+
+        results = list(
+            self.pool.generate(requests, chunk_size=1, interrupt_check=lambda: True)
+        )
+
+        self.assertLess(len(results), len(requests))
+
+        print("✅ Interrupt OK")
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "Wymaga /dev/shm")
+    def test_shared_memory_released(self):
+        """Test zwolnienia segmentów pamięci współdzielonej (także po przerwaniu)"""
+        segments_before = set(os.listdir("/dev/shm"))
+        pool = ThumbnailProcessPool(max_workers=2)
+        requests = [(self.jpeg_path, 50 + i, 50 + i) for i in range(8)]
+
+        list(pool.generate(requests, chunk_size=2))
+        list(pool.generate(requests, chunk_size=1, interrupt_check=lambda: True))
+        pool.shutdown()
+
+        self.assertEqual(set(os.listdir("/dev/shm")) - segments_before, set())
+
+        print("✅ Shared memory release OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
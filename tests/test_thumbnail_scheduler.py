@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+TESTY: ThumbnailScheduler - kolejka priorytetowa miniatur z anulowaniem
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication, QGridLayout, QScrollArea, QWidget
+
+from src.models.file_pair import FilePair
+from src.ui.gallery_manager import GalleryManager
+from src.ui.widgets.thumbnail_scheduler import ThumbnailScheduler
+
+
+class TestThumbnailScheduler(unittest.TestCase):
+    """Testy dla ThumbnailScheduler"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.scheduler = ThumbnailScheduler(max_in_flight=2)
+        self.started = []
+
+        def start_worker(key):
+            self.started.append(key)
+            self.scheduler._in_flight[key] = None
+
+        patcher = patch.object(self.scheduler, "_start_worker", side_effect=start_worker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dispatch_order_and_in_flight_limit(self):
+        """Test kolejności według priorytetu i limitu zadań w toku"""
+        self.scheduler.request("/p/far.jpg", 100, 100, priority=6)
+        self.scheduler.request("/p/near.jpg", 100, 100, priority=2)
+        self.scheduler.request("/p/visible.jpg", 100, 100, priority=0)
+        self.scheduler.request("/p/visible.jpg", 100, 100, priority=0)
+
+        self.scheduler._dispatch()
+        self.assertEqual(
+            self.started, [("/p/visible.jpg", 100, 100), ("/p/near.jpg", 100, 100)]
+        )
+        self.assertEqual(self.scheduler.get_statistics()["queued"], 1)
+
+        ready = []
+        self.scheduler.thumbnail_ready.connect(
+            lambda pixmap, path, w, h: ready.append(path)
+        )
+        self.scheduler._on_worker_finished(None, "/p/visible.jpg", 100, 100)
+        self.scheduler._dispatch()
+        self.assertEqual(ready, ["/p/visible.jpg"])
+        self.assertEqual(self.started[-1], ("/p/far.jpg", 100, 100))
+
+        print("✅ Dispatch order OK")
+
+    def test_reprioritize_cancels_stale_requests(self):
+        """Test anulowania żądań spoza widoku i zmiany priorytetów"""
+        for i in range(1000):
+            self.scheduler.request(f"/p/{i}.jpg", 100, 100)
+
+        # Użytkownik przewinął na koniec - aktualne są tylko ostatnie pary
+        self.scheduler.reprioritize({"/p/999.jpg": 0, "/p/998.jpg": 1})
+
+        self.assertFalse(self.scheduler.is_pending("/p/0.jpg", 100, 100))
+        self.assertEqual(self.scheduler.get_statistics()["queued"], 2)
+        self.scheduler._dispatch()
+        self.assertEqual(
+            self.started, [("/p/999.jpg", 100, 100), ("/p/998.jpg", 100, 100)]
+        )
+
+        print("✅ Stale request cancellation OK")
+
+    def test_gallery_prefetches_in_scroll_direction(self):
+        """Test prefetchu kolejnych wierszy w kierunku przewijania"""
+        scroll_area = QScrollArea()
+        tiles_container = QWidget()
+        scroll_area.setWidget(tiles_container)
+        self.addCleanup(scroll_area.deleteLater)
+        manager = GalleryManager(
+            MagicMock(), tiles_container, QGridLayout(tiles_container), scroll_area
+        )
+        pairs = [
+            FilePair(f"/w/m{i}.zip", f"/w/m{i}.jpg", "/w") for i in range(100)
+        ]
+        scheduler = MagicMock()
+
+        with patch.object(ThumbnailScheduler, "get_instance", return_value=scheduler):
+            manager._scroll_direction = 1
+            manager._schedule_thumbnails(
+                pairs.__getitem__, range(20, 40), len(pairs), 4, 6, 7
+            )
+            priorities = scheduler.reprioritize.call_args[0][0]
+            prefetched = [r[0] for r in scheduler.prefetch.call_args[0][0]]
+
+            self.assertEqual(priorities["/w/m24.jpg"], 0)
+            self.assertLess(priorities["/w/m32.jpg"], priorities["/w/m20.jpg"])
+            self.assertEqual(prefetched, [f"/w/m{i}.jpg" for i in range(40, 48)])
+
+            manager._scroll_direction = -1
+            manager._schedule_thumbnails(
+                pairs.__getitem__, range(20, 40), len(pairs), 4, 6, 7
+            )
+            prefetched = [r[0] for r in scheduler.prefetch.call_args[0][0]]
+            self.assertEqual(prefetched, [f"/w/m{i}.jpg" for i in range(12, 20)])
+
+        print("✅ Scroll-direction prefetch OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+TESTY: TileManager.refresh_existing_tiles - indeksowane odświeżanie kafelków
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.models.file_pair import FilePair
+from src.ui.widgets.file_tile_widget import FileTileWidget
+from src.ui.main_window import tile_manager as tile_manager_module
+from src.ui.main_window.tile_manager import TileManager
+
+
+class FakeTile:
+    """Kafelek zapamiętujący wyświetlane metadane."""
+
+    def __init__(self, file_pair):
+        self.file_pair = file_pair
+        self.shown = (file_pair.get_stars(), file_pair.get_color_tag() or "")
+        self.update_calls = 0
+
+    def needs_metadata_refresh(self, file_pair):
+        return self.file_pair is not file_pair or self.shown != (
+            file_pair.get_stars(),
+            file_pair.get_color_tag() or "",
+        )
+
+    def update_data(self, file_pair):
+        self.file_pair = file_pair
+        self.shown = (file_pair.get_stars(), file_pair.get_color_tag() or "")
+        self.update_calls += 1
+
+
+class TestRefreshExistingTiles(unittest.TestCase):
+    """Testy odświeżania kafelków po wczytaniu metadanych"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.pairs = [
+            FilePair(f"/work/model_{i}.zip", f"/work/model_{i}.jpg", "/work")
+            for i in range(600)
+        ]
+        self.tiles = {pair.get_archive_path(): FakeTile(pair) for pair in self.pairs}
+
+        main_window = MagicMock()
+        main_window.gallery_manager.get_tile_for_path.side_effect = self.tiles.get
+        self.manager = TileManager(main_window)
+
+    def _process_events(self, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.app.processEvents()
+
+    def test_only_changed_tiles_are_updated(self):
+        """Test aktualizacji tylko kafelków ze zmienionymi metadanymi"""
+        self.pairs[3].set_stars(4)
+        self.pairs[599].set_color_tag("#FF0000")
+
+        self.manager.refresh_existing_tiles(self.pairs)
+        self._process_events(0.2)
+
+        updated = [p for p, t in self.tiles.items() if t.update_calls]
+        self.assertEqual(
+            sorted(updated),
+            sorted([self.pairs[3].get_archive_path(), self.pairs[599].get_archive_path()]),
+        )
+
+        print("✅ Changed tiles only OK")
+
+    def test_refresh_is_chunked(self):
+        """Test podziału odświeżania na kroki pętli zdarzeń"""
+        for pair in self.pairs:
+            pair.set_stars(1)
+
+        self.manager.refresh_existing_tiles(self.pairs)
+        first_chunk = sum(t.update_calls for t in self.tiles.values())
+        self._process_events(0.2)
+        total = sum(t.update_calls for t in self.tiles.values())
+
+        self.assertEqual(first_chunk, tile_manager_module.TILE_REFRESH_CHUNK_SIZE)
+        self.assertEqual(total, len(self.pairs))
+
+        print("✅ Chunked refresh OK")
+
+    def test_newer_refresh_supersedes_older(self):
+        """Test przerwania starszego odświeżania przez nowsze"""
+        for pair in self.pairs:
+            pair.set_stars(2)
+
+        self.manager.refresh_existing_tiles(self.pairs)
+        self.manager.refresh_existing_tiles(self.pairs[:10])
+        self._process_events(0.2)
+
+        total = sum(t.update_calls for t in self.tiles.values())
+        self.assertEqual(total, tile_manager_module.TILE_REFRESH_CHUNK_SIZE)
+
+        print("✅ Superseded refresh OK")
+
+    def test_real_tile_is_refreshed_only_after_change(self):
+        """Test needs_metadata_refresh prawdziwego FileTileWidget"""
+        pair = self.pairs[7]
+        tile = FileTileWidget(pair, (150, 150))
+        self.addCleanup(tile.deleteLater)
+        self.tiles[pair.get_archive_path()] = tile
+        self.assertFalse(tile.needs_metadata_refresh(pair))
+
+        pair.set_stars(4)
+        pair.set_color_tag("#00FF00")
+        self.assertTrue(tile.needs_metadata_refresh(pair))
+
+        self.manager.refresh_existing_tiles([pair])
+        self._process_events(0.2)
+
+        self.assertFalse(tile.needs_metadata_refresh(pair))
+        self.assertEqual(tile._metadata_component.get_stars(), 4)
+        self.assertEqual(tile._metadata_component.get_color_tag(), "#00FF00")
+
+        print("✅ Real tile refresh OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
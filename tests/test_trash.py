@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+TESTY: Kosz Freedesktop - kosze per punkt montowania i partie .trashinfo
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.logic import trash as trash_module
+from src.logic.trash import FreedesktopTrash
+from src.models.file_pair import FilePair
+from src.services import file_operations_service
+from src.services.file_operations_service import FileOperationsService
+from src.ui.delegates.workers import bulk_workers
+from src.ui.delegates.workers.bulk_workers import BulkDeleteWorker
+
+
+def _write(path, content=b"data"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _read_info(trash_dir, name):
+    with open(os.path.join(trash_dir, "info", name + ".trashinfo")) as f:
+        return f.read().splitlines()
+
+
+@unittest.skipIf(sys.platform.startswith("win"), "Kosz Freedesktop tylko POSIX")
+class TestFreedesktopTrash(unittest.TestCase):
+    """Testy kosza Freedesktop"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.home_trash_dir = os.path.join(self.temp_dir, "home", "Trash")
+        self.volume = os.path.join(self.temp_dir, "volume")
+        self.trash = FreedesktopTrash(home_trash_dir=self.home_trash_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _simulate_other_volume(self):
+        """Pliki w self.volume traktowane jak osobny punkt montowania"""
+        self.trash._trash_dir_for(os.stat(self.temp_dir).st_dev, self.temp_dir)
+        self.trash._home_device = -1
+        real_ismount = os.path.ismount
+        return patch.object(
+            trash_module.os.path,
+            "ismount",
+            side_effect=lambda path: path == self.volume or real_ismount(path),
+        )
+
+    def test_home_trash_with_trashinfo(self):
+        """Test przeniesienia do kosza domowego z plikiem .trashinfo"""
+        source = os.path.join(self.temp_dir, "models", "chair 1.zip")
+        _write(source)
+
+        result = self.trash.trash([source])
+
+        target = os.path.join(self.home_trash_dir, "files", "chair 1.zip")
+        self.assertEqual(result.trashed, [(source, target)])
+        self.assertFalse(os.path.exists(source))
+        self.assertTrue(os.path.exists(target))
+        info = _read_info(self.home_trash_dir, "chair 1.zip")
+        self.assertEqual(info[0], "[Trash Info]")
+        self.assertEqual(info[1], "Path=" + source.replace(" ", "%20"))
+        self.assertRegex(info[2], r"^DeletionDate=\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d$")
+
+        print("✅ Home trash OK")
+
+    def test_name_collisions_get_unique_names(self):
+        """Test unikalnych nazw przy kolizji z koszem i wewnątrz partii"""
+        sources = [
+            os.path.join(self.temp_dir, folder, "chair.zip") for folder in "abc"
+        ]
+        for source in sources:
+            _write(source, source.encode())
+        # Plik w koszu bez .trashinfo (np. po awarii) też zajmuje nazwę
+        _write(os.path.join(self.home_trash_dir, "files", "chair.zip"), b"orphan")
+
+        result = self.trash.trash(sources)
+
+        self.assertEqual(len(result.trashed), 3)
+        names = [os.path.basename(target) for _, target in result.trashed]
+        self.assertEqual(len(set(names)), 3)
+        self.assertNotIn("chair.zip", names)
+        for source, target in result.trashed:
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), source.encode())
+            info = _read_info(self.home_trash_dir, os.path.basename(target))
+            self.assertEqual(info[1], "Path=" + source)
+
+        print("✅ Unique names OK")
+
+    def test_topdir_trash_created_per_volume(self):
+        """Test kosza $topdir/.Trash-$uid ze ścieżką względną w .trashinfo"""
+        source = os.path.join(self.volume, "models", "lamp.rar")
+        _write(source)
+
+        with self._simulate_other_volume():
+            result = self.trash.trash([source])
+
+        trash_dir = os.path.join(self.volume, f".Trash-{os.getuid()}")
+        self.assertEqual(
+            result.trashed, [(source, os.path.join(trash_dir, "files", "lamp.rar"))]
+        )
+        self.assertEqual(stat.S_IMODE(os.stat(trash_dir).st_mode), 0o700)
+        self.assertEqual(_read_info(trash_dir, "lamp.rar")[1], "Path=models/lamp.rar")
+        self.assertEqual(os.listdir(os.path.join(self.home_trash_dir, "files")), [])
+
+        print("✅ Topdir trash OK")
+
+    def test_shared_sticky_trash_preferred(self):
+        """Test użycia $topdir/.Trash/$uid gdy .Trash ma bit sticky"""
+        source = os.path.join(self.volume, "sofa.7z")
+        _write(source)
+        shared = os.path.join(self.volume, ".Trash")
+        os.mkdir(shared)
+        os.chmod(shared, 0o1777)
+
+        with self._simulate_other_volume():
+            result = self.trash.trash([source])
+
+        trash_dir = os.path.join(shared, str(os.getuid()))
+        self.assertEqual(
+            result.trashed, [(source, os.path.join(trash_dir, "files", "sofa.7z"))]
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.volume, f".Trash-{os.getuid()}"))
+        )
+
+        print("✅ Shared trash OK")
+
+    def test_directories_synced_once_per_batch(self):
+        """Test jednego fsync katalogów kosza na partię i brakujących plików"""
+        sources = [os.path.join(self.temp_dir, "many", f"m{i}.zip") for i in range(300)]
+        for source in sources:
+            _write(source)
+        missing = os.path.join(self.temp_dir, "many", "gone.zip")
+
+        with patch.object(trash_module, "_fsync_directory") as fsync_directory:
+            result = self.trash.trash(sources + [missing])
+
+        self.assertEqual(len(result.trashed), 300)
+        self.assertEqual(result.missing, [missing])
+        self.assertEqual(result.errors, [])
+        self.assertEqual(fsync_directory.call_count, 4)  # 2 partie x files/info
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.home_trash_dir, "info"))), 300
+        )
+
+        print("✅ Batched sync OK")
+
+    def test_bulk_delete_worker_reports_progress_per_batch(self):
+        """Test postępu BulkDeleteWorker po każdej partii kosza"""
+        pairs = []
+        for i in range(150):
+            archive = os.path.join(self.temp_dir, "work", f"m{i}.zip")
+            preview = os.path.join(self.temp_dir, "work", f"m{i}.jpg")
+            _write(archive)
+            _write(preview)
+            pairs.append(FilePair(archive, preview, os.path.dirname(archive)))
+
+        batches = []
+        trash_batch = self.trash._trash_batch
+        worker = BulkDeleteWorker(pairs)
+        worker._progress_interval_ms = 0
+        progress = []
+        worker.signals.progress.connect(
+            lambda percent, message: progress.append((percent, len(batches)))
+        )
+        with patch.object(
+            self.trash,
+            "_trash_batch",
+            side_effect=lambda paths, result: (
+                batches.append(len(paths)),
+                trash_batch(paths, result),
+            ),
+        ), patch.object(bulk_workers, "get_trash", return_value=self.trash):
+            worker.run()
+
+        self.assertEqual(batches, [256, 44])
+        # Postęp po pierwszej partii (256 z 300 plików), zanim zacznie się druga
+        self.assertIn((85, 1), progress)
+        self.assertEqual(progress[-1][0], 100)
+
+        print("✅ Trash progress OK")
+
+    def test_bulk_delete_worker_and_service_use_trash(self):
+        """Test BulkDeleteWorker i bulk_delete przenoszących pary do kosza"""
+        pairs = []
+        for name in ("chair", "lamp"):
+            archive = os.path.join(self.temp_dir, "work", f"{name}.zip")
+            preview = os.path.join(self.temp_dir, "work", f"{name}.jpg")
+            _write(archive)
+            _write(preview)
+            pairs.append(FilePair(archive, preview, os.path.dirname(archive)))
+
+        results = []
+        worker = BulkDeleteWorker(pairs[:1])
+        worker.signals.finished.connect(results.append)
+        with patch.object(bulk_workers, "get_trash", return_value=self.trash):
+            worker.run()
+        self.assertEqual(
+            results[0],
+            [("archive", pairs[0].archive_path), ("preview", pairs[0].preview_path)],
+        )
+
+        with patch.object(
+            file_operations_service, "get_trash", return_value=self.trash
+        ):
+            deleted, errors = FileOperationsService().bulk_delete(pairs[1:])
+        self.assertEqual(deleted, pairs[1:])
+        self.assertEqual(errors, [])
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.home_trash_dir, "files"))),
+            ["chair.jpg", "chair.zip", "lamp.jpg", "lamp.zip"],
+        )
+
+        print("✅ Bulk delete to trash OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+TESTY: UnpairedPreviewsGrid - wirtualizowana siatka niesparowanych podglądów
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.widgets.thumbnail_cache import ThumbnailCache
+from src.ui.widgets.unpaired_previews_grid import UnpairedPreviewsGrid
+
+
+class TestUnpairedPreviewsGrid(unittest.TestCase):
+    """Testy dla UnpairedPreviewsGrid"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.grid = UnpairedPreviewsGrid(MagicMock())
+        self.paths = [f"/work/previews/render_{i:05d}.jpg" for i in range(10000)]
+
+    def tearDown(self):
+        self.grid.deleteLater()
+
+    def test_large_list_is_instant(self):
+        """Test wczytania dużej listy bez tworzenia kafelków i miniatur"""
+        with patch.object(
+            self.grid.model, "_start_pending_requests"
+        ) as start_requests:
+            started = time.perf_counter()
+            self.grid.update_previews(list(reversed(self.paths)))
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(self.grid.model.rowCount(), len(self.paths))
+        self.assertEqual(self.grid.get_all_preview_paths(), self.paths)
+        self.assertFalse(self.grid.model._requested)
+        start_requests.assert_not_called()
+
+        print("✅ Instant population OK")
+
+    def test_thumbnails_are_requested_lazily(self):
+        """Test pobierania miniatury z cache i zlecania tylko żądanych"""
+        self.grid.update_previews(self.paths)
+        model = self.grid.model
+        dimension = model.thumbnail_dimension()
+        cached = QPixmap(dimension, dimension)
+        ThumbnailCache.get_instance().add_thumbnail(self.paths[0], dimension, dimension, cached)
+
+        with patch.object(model, "_start_pending_requests"):
+            first = model.data(model.index(0), Qt.ItemDataRole.DecorationRole)
+            second = model.data(model.index(1), Qt.ItemDataRole.DecorationRole)
+            model.data(model.index(1), Qt.ItemDataRole.DecorationRole)
+
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertEqual(model._pending, [self.paths[1]])
+
+        ThumbnailCache.get_instance().remove_thumbnail(self.paths[0], dimension, dimension)
+
+        print("✅ Lazy thumbnails OK")
+
+    def test_evicted_thumbnail_is_requested_again(self):
+        """Test ponownego zlecenia miniatury usuniętej z pamięci cache"""
+        self.grid.update_previews(self.paths[:5])
+        model = self.grid.model
+        dimension = model.thumbnail_dimension()
+        index = model.index(1)
+
+        with patch.object(model, "_start_pending_requests"):
+            model.data(index, Qt.ItemDataRole.DecorationRole)
+            model._pending.clear()
+            model._on_thumbnail_finished(
+                QPixmap(), self.paths[1], dimension, dimension
+            )
+            # Miniatura wypadła z LRU - widok prosi o nią ponownie
+            model.data(index, Qt.ItemDataRole.DecorationRole)
+            model._on_thumbnail_error("error", self.paths[2], dimension, dimension)
+            model.data(model.index(2), Qt.ItemDataRole.DecorationRole)
+
+        self.assertEqual(model._pending, [self.paths[1]])
+        self.assertEqual(model._requested, {self.paths[1]})
+        self.assertTrue(model.is_thumbnail_failed(self.paths[2]))
+
+        print("✅ Evicted thumbnail re-request OK")
+
+    def test_single_checked_preview(self):
+        """Test zaznaczania jednego podglądu i synchronizacji ukrytej listy"""
+        self.grid.update_previews(self.paths[:5])
+        changes = []
+        self.grid.selection_changed.connect(lambda: changes.append(True))
+
+        self.grid._on_preview_checkbox_toggled(self.paths[1])
+        self.grid._on_preview_checkbox_toggled(self.paths[3])
+
+        selected = self.grid.get_selected_items()
+        self.assertEqual(len(selected), 1)
+        self.assertEqual(selected[0].data(Qt.ItemDataRole.UserRole), self.paths[3])
+        self.assertEqual(self.grid.get_selected_preview_path(), self.paths[3])
+        self.assertEqual(len(changes), 2)
+
+        self.grid._on_preview_checkbox_toggled(self.paths[3])
+        self.assertEqual(self.grid.get_selected_items(), [])
+
+        print("✅ Single selection OK")
+
+
+if __name__ == "__main__":
+    unittest.main()